@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..confounds import ACompCor
+from ...testing import assert_spec_metadata
 
 
 def test_ACompCor_inputs():
@@ -55,11 +56,7 @@ def test_ACompCor_inputs():
             xor=["num_components"],
         ),
     )
-    inputs = ACompCor.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ACompCor.input_spec(), input_map)
 
 
 def test_ACompCor_outputs():
@@ -74,8 +71,4 @@ def test_ACompCor_outputs():
             extensions=None,
         ),
     )
-    outputs = ACompCor.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ACompCor.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..stats import ActivationCount
+from ...testing import assert_spec_metadata
 
 
 def test_ActivationCount_inputs():
@@ -11,11 +12,7 @@ def test_ActivationCount_inputs():
             mandatory=True,
         ),
     )
-    inputs = ActivationCount.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ActivationCount.input_spec(), input_map)
 
 
 def test_ActivationCount_outputs():
@@ -30,8 +27,4 @@ def test_ActivationCount_outputs():
             extensions=None,
         ),
     )
-    outputs = ActivationCount.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ActivationCount.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..rapidart import ArtifactDetect
+from ...testing import assert_spec_metadata
 
 
 def test_ArtifactDetect_inputs():
@@ -58,11 +59,7 @@ def test_ArtifactDetect_inputs():
             mandatory=True,
         ),
     )
-    inputs = ArtifactDetect.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ArtifactDetect.input_spec(), input_map)
 
 
 def test_ArtifactDetect_outputs():
@@ -75,8 +72,4 @@ def test_ArtifactDetect_outputs():
         plot_files=dict(),
         statistic_files=dict(),
     )
-    outputs = ArtifactDetect.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ArtifactDetect.output_spec(), output_map)
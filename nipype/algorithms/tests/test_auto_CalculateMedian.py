@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import CalculateMedian
+from ...testing import assert_spec_metadata
 
 
 def test_CalculateMedian_inputs():
@@ -10,19 +11,11 @@ def test_CalculateMedian_inputs():
             usedefault=True,
         ),
     )
-    inputs = CalculateMedian.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CalculateMedian.input_spec(), input_map)
 
 
 def test_CalculateMedian_outputs():
     output_map = dict(
         median_files=dict(),
     )
-    outputs = CalculateMedian.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CalculateMedian.output_spec(), output_map)
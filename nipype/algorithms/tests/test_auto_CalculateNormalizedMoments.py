@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import CalculateNormalizedMoments
+from ...testing import assert_spec_metadata
 
 
 def test_CalculateNormalizedMoments_inputs():
@@ -12,19 +13,11 @@ def test_CalculateNormalizedMoments_inputs():
             mandatory=True,
         ),
     )
-    inputs = CalculateNormalizedMoments.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CalculateNormalizedMoments.input_spec(), input_map)
 
 
 def test_CalculateNormalizedMoments_outputs():
     output_map = dict(
         moments=dict(),
     )
-    outputs = CalculateNormalizedMoments.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CalculateNormalizedMoments.output_spec(), output_map)
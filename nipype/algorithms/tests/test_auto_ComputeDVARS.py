@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..confounds import ComputeDVARS
+from ...testing import assert_spec_metadata
 
 
 def test_ComputeDVARS_inputs():
@@ -47,11 +48,7 @@ def test_ComputeDVARS_inputs():
             usedefault=True,
         ),
     )
-    inputs = ComputeDVARS.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeDVARS.input_spec(), input_map)
 
 
 def test_ComputeDVARS_outputs():
@@ -81,8 +78,4 @@ def test_ComputeDVARS_outputs():
             extensions=None,
         ),
     )
-    outputs = ComputeDVARS.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeDVARS.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..mesh import ComputeMeshWarp
+from ...testing import assert_spec_metadata
 
 
 def test_ComputeMeshWarp_inputs():
@@ -27,11 +28,7 @@ def test_ComputeMeshWarp_inputs():
             usedefault=True,
         ),
     )
-    inputs = ComputeMeshWarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeMeshWarp.input_spec(), input_map)
 
 
 def test_ComputeMeshWarp_outputs():
@@ -44,8 +41,4 @@ def test_ComputeMeshWarp_outputs():
             extensions=None,
         ),
     )
-    outputs = ComputeMeshWarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeMeshWarp.output_spec(), output_map)
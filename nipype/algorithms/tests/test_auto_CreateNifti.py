@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import CreateNifti
+from ...testing import assert_spec_metadata
 
 
 def test_CreateNifti_inputs():
@@ -14,11 +15,7 @@ def test_CreateNifti_inputs():
             mandatory=True,
         ),
     )
-    inputs = CreateNifti.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateNifti.input_spec(), input_map)
 
 
 def test_CreateNifti_outputs():
@@ -27,8 +24,4 @@ def test_CreateNifti_outputs():
             extensions=None,
         ),
     )
-    outputs = CreateNifti.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateNifti.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import Distance
+from ...testing import assert_spec_metadata
 
 
 def test_Distance_inputs():
@@ -19,11 +20,7 @@ def test_Distance_inputs():
             mandatory=True,
         ),
     )
-    inputs = Distance.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Distance.input_spec(), input_map)
 
 
 def test_Distance_outputs():
@@ -35,8 +32,4 @@ def test_Distance_outputs():
         point1=dict(),
         point2=dict(),
     )
-    outputs = Distance.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Distance.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..confounds import FramewiseDisplacement
+from ...testing import assert_spec_metadata
 
 
 def test_FramewiseDisplacement_inputs():
@@ -36,11 +37,7 @@ def test_FramewiseDisplacement_inputs():
         ),
         series_tr=dict(),
     )
-    inputs = FramewiseDisplacement.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FramewiseDisplacement.input_spec(), input_map)
 
 
 def test_FramewiseDisplacement_outputs():
@@ -53,8 +50,4 @@ def test_FramewiseDisplacement_outputs():
             extensions=None,
         ),
     )
-    outputs = FramewiseDisplacement.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FramewiseDisplacement.output_spec(), output_map)
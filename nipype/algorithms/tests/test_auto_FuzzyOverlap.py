@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import FuzzyOverlap
+from ...testing import assert_spec_metadata
 
 
 def test_FuzzyOverlap_inputs():
@@ -21,11 +22,7 @@ def test_FuzzyOverlap_inputs():
             usedefault=True,
         ),
     )
-    inputs = FuzzyOverlap.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FuzzyOverlap.input_spec(), input_map)
 
 
 def test_FuzzyOverlap_outputs():
@@ -35,8 +32,4 @@ def test_FuzzyOverlap_outputs():
         dice=dict(),
         jaccard=dict(),
     )
-    outputs = FuzzyOverlap.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FuzzyOverlap.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import Gunzip
+from ...testing import assert_spec_metadata
 
 
 def test_Gunzip_inputs():
@@ -12,11 +13,7 @@ def test_Gunzip_inputs():
             usedefault=True,
         ),
     )
-    inputs = Gunzip.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Gunzip.input_spec(), input_map)
 
 
 def test_Gunzip_outputs():
@@ -25,8 +22,4 @@ def test_Gunzip_outputs():
             extensions=None,
         ),
     )
-    outputs = Gunzip.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Gunzip.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import Gzip
+from ...testing import assert_spec_metadata
 
 
 def test_Gzip_inputs():
@@ -12,11 +13,7 @@ def test_Gzip_inputs():
             usedefault=True,
         ),
     )
-    inputs = Gzip.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Gzip.input_spec(), input_map)
 
 
 def test_Gzip_outputs():
@@ -25,8 +22,4 @@ def test_Gzip_outputs():
             extensions=None,
         ),
     )
-    outputs = Gzip.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Gzip.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..icc import ICC
+from ...testing import assert_spec_metadata
 
 
 def test_ICC_inputs():
@@ -12,11 +13,7 @@ def test_ICC_inputs():
             mandatory=True,
         ),
     )
-    inputs = ICC.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ICC.input_spec(), input_map)
 
 
 def test_ICC_outputs():
@@ -31,8 +28,4 @@ def test_ICC_outputs():
             extensions=None,
         ),
     )
-    outputs = ICC.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ICC.output_spec(), output_map)
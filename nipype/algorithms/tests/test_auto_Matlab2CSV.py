@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import Matlab2CSV
+from ...testing import assert_spec_metadata
 
 
 def test_Matlab2CSV_inputs():
@@ -12,19 +13,11 @@ def test_Matlab2CSV_inputs():
             usedefault=True,
         ),
     )
-    inputs = Matlab2CSV.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Matlab2CSV.input_spec(), input_map)
 
 
 def test_Matlab2CSV_outputs():
     output_map = dict(
         csv_files=dict(),
     )
-    outputs = Matlab2CSV.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Matlab2CSV.output_spec(), output_map)
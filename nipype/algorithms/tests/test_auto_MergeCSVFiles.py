@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import MergeCSVFiles
+from ...testing import assert_spec_metadata
 
 
 def test_MergeCSVFiles_inputs():
@@ -19,11 +20,7 @@ def test_MergeCSVFiles_inputs():
         ),
         row_headings=dict(),
     )
-    inputs = MergeCSVFiles.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeCSVFiles.input_spec(), input_map)
 
 
 def test_MergeCSVFiles_outputs():
@@ -32,8 +29,4 @@ def test_MergeCSVFiles_outputs():
             extensions=None,
         ),
     )
-    outputs = MergeCSVFiles.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeCSVFiles.output_spec(), output_map)
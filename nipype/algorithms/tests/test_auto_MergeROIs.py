@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import MergeROIs
+from ...testing import assert_spec_metadata
 
 
 def test_MergeROIs_inputs():
@@ -10,11 +11,7 @@ def test_MergeROIs_inputs():
             extensions=None,
         ),
     )
-    inputs = MergeROIs.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeROIs.input_spec(), input_map)
 
 
 def test_MergeROIs_outputs():
@@ -23,8 +20,4 @@ def test_MergeROIs_outputs():
             extensions=None,
         ),
     )
-    outputs = MergeROIs.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeROIs.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..mesh import MeshWarpMaths
+from ...testing import assert_spec_metadata
 
 
 def test_MeshWarpMaths_inputs():
@@ -25,11 +26,7 @@ def test_MeshWarpMaths_inputs():
             usedefault=True,
         ),
     )
-    inputs = MeshWarpMaths.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MeshWarpMaths.input_spec(), input_map)
 
 
 def test_MeshWarpMaths_outputs():
@@ -41,8 +38,4 @@ def test_MeshWarpMaths_outputs():
             extensions=None,
         ),
     )
-    outputs = MeshWarpMaths.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MeshWarpMaths.output_spec(), output_map)
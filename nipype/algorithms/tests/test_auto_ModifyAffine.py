@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import ModifyAffine
+from ...testing import assert_spec_metadata
 
 
 def test_ModifyAffine_inputs():
@@ -11,19 +12,11 @@ def test_ModifyAffine_inputs():
             mandatory=True,
         ),
     )
-    inputs = ModifyAffine.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ModifyAffine.input_spec(), input_map)
 
 
 def test_ModifyAffine_outputs():
     output_map = dict(
         transformed_volumes=dict(),
     )
-    outputs = ModifyAffine.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ModifyAffine.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..confounds import NonSteadyStateDetector
+from ...testing import assert_spec_metadata
 
 
 def test_NonSteadyStateDetector_inputs():
@@ -9,19 +10,11 @@ def test_NonSteadyStateDetector_inputs():
             mandatory=True,
         ),
     )
-    inputs = NonSteadyStateDetector.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NonSteadyStateDetector.input_spec(), input_map)
 
 
 def test_NonSteadyStateDetector_outputs():
     output_map = dict(
         n_volumes_to_discard=dict(),
     )
-    outputs = NonSteadyStateDetector.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NonSteadyStateDetector.output_spec(), output_map)
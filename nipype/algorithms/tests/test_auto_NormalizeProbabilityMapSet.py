@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import NormalizeProbabilityMapSet
+from ...testing import assert_spec_metadata
 
 
 def test_NormalizeProbabilityMapSet_inputs():
@@ -9,19 +10,11 @@ def test_NormalizeProbabilityMapSet_inputs():
             extensions=None,
         ),
     )
-    inputs = NormalizeProbabilityMapSet.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NormalizeProbabilityMapSet.input_spec(), input_map)
 
 
 def test_NormalizeProbabilityMapSet_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = NormalizeProbabilityMapSet.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NormalizeProbabilityMapSet.output_spec(), output_map)
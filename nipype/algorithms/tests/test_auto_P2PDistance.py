@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..mesh import P2PDistance
+from ...testing import assert_spec_metadata
 
 
 def test_P2PDistance_inputs():
@@ -27,11 +28,7 @@ def test_P2PDistance_inputs():
             usedefault=True,
         ),
     )
-    inputs = P2PDistance.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(P2PDistance.input_spec(), input_map)
 
 
 def test_P2PDistance_outputs():
@@ -44,8 +41,4 @@ def test_P2PDistance_outputs():
             extensions=None,
         ),
     )
-    outputs = P2PDistance.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(P2PDistance.output_spec(), output_map)
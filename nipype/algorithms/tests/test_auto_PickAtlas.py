@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import PickAtlas
+from ...testing import assert_spec_metadata
 
 
 def test_PickAtlas_inputs():
@@ -21,11 +22,7 @@ def test_PickAtlas_inputs():
             extensions=None,
         ),
     )
-    inputs = PickAtlas.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PickAtlas.input_spec(), input_map)
 
 
 def test_PickAtlas_outputs():
@@ -34,8 +31,4 @@ def test_PickAtlas_outputs():
             extensions=None,
         ),
     )
-    outputs = PickAtlas.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PickAtlas.output_spec(), output_map)
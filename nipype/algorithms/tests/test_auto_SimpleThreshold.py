@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import SimpleThreshold
+from ...testing import assert_spec_metadata
 
 
 def test_SimpleThreshold_inputs():
@@ -11,19 +12,11 @@ def test_SimpleThreshold_inputs():
             mandatory=True,
         ),
     )
-    inputs = SimpleThreshold.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimpleThreshold.input_spec(), input_map)
 
 
 def test_SimpleThreshold_outputs():
     output_map = dict(
         thresholded_volumes=dict(),
     )
-    outputs = SimpleThreshold.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimpleThreshold.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..modelgen import SpecifyModel
+from ...testing import assert_spec_metadata
 
 
 def test_SpecifyModel_inputs():
@@ -43,19 +44,11 @@ def test_SpecifyModel_inputs():
             mandatory=True,
         ),
     )
-    inputs = SpecifyModel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpecifyModel.input_spec(), input_map)
 
 
 def test_SpecifyModel_outputs():
     output_map = dict(
         session_info=dict(),
     )
-    outputs = SpecifyModel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpecifyModel.output_spec(), output_map)
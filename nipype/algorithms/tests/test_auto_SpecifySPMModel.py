@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..modelgen import SpecifySPMModel
+from ...testing import assert_spec_metadata
 
 
 def test_SpecifySPMModel_inputs():
@@ -49,19 +50,11 @@ def test_SpecifySPMModel_inputs():
             mandatory=True,
         ),
     )
-    inputs = SpecifySPMModel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpecifySPMModel.input_spec(), input_map)
 
 
 def test_SpecifySPMModel_outputs():
     output_map = dict(
         session_info=dict(),
     )
-    outputs = SpecifySPMModel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpecifySPMModel.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..modelgen import SpecifySparseModel
+from ...testing import assert_spec_metadata
 
 
 def test_SpecifySparseModel_inputs():
@@ -63,11 +64,7 @@ def test_SpecifySparseModel_inputs():
             usedefault=True,
         ),
     )
-    inputs = SpecifySparseModel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpecifySparseModel.input_spec(), input_map)
 
 
 def test_SpecifySparseModel_outputs():
@@ -80,8 +77,4 @@ def test_SpecifySparseModel_outputs():
             extensions=None,
         ),
     )
-    outputs = SpecifySparseModel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpecifySparseModel.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..misc import SplitROIs
+from ...testing import assert_spec_metadata
 
 
 def test_SplitROIs_inputs():
@@ -13,11 +14,7 @@ def test_SplitROIs_inputs():
         ),
         roi_size=dict(),
     )
-    inputs = SplitROIs.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SplitROIs.input_spec(), input_map)
 
 
 def test_SplitROIs_outputs():
@@ -26,8 +23,4 @@ def test_SplitROIs_outputs():
         out_index=dict(),
         out_masks=dict(),
     )
-    outputs = SplitROIs.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SplitROIs.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..rapidart import StimulusCorrelation
+from ...testing import assert_spec_metadata
 
 
 def test_StimulusCorrelation_inputs():
@@ -18,19 +19,11 @@ def test_StimulusCorrelation_inputs():
             mandatory=True,
         ),
     )
-    inputs = StimulusCorrelation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(StimulusCorrelation.input_spec(), input_map)
 
 
 def test_StimulusCorrelation_outputs():
     output_map = dict(
         stimcorr_files=dict(),
     )
-    outputs = StimulusCorrelation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(StimulusCorrelation.output_spec(), output_map)
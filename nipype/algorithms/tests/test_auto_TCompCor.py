@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..confounds import TCompCor
+from ...testing import assert_spec_metadata
 
 
 def test_TCompCor_inputs():
@@ -58,11 +59,7 @@ def test_TCompCor_inputs():
             xor=["num_components"],
         ),
     )
-    inputs = TCompCor.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCompCor.input_spec(), input_map)
 
 
 def test_TCompCor_outputs():
@@ -78,8 +75,4 @@ def test_TCompCor_outputs():
             extensions=None,
         ),
     )
-    outputs = TCompCor.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCompCor.output_spec(), output_map)
@@ -1,11 +1,8 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..mesh import TVTKBaseInterface
+from ...testing import assert_spec_metadata
 
 
 def test_TVTKBaseInterface_inputs():
     input_map = dict()
-    inputs = TVTKBaseInterface.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TVTKBaseInterface.input_spec(), input_map)
@@ -109,7 +109,6 @@ DATEUTIL_MIN_VERSION = "2.2"
 SIMPLEJSON_MIN_VERSION = "3.8.0"
 PROV_MIN_VERSION = "1.5.2"
 RDFLIB_MIN_VERSION = "5.0.0"
-CLICK_MIN_VERSION = "6.6.0"
 PYDOT_MIN_VERSION = "1.2.3"
 
 NAME = "nipype"
@@ -133,7 +132,6 @@ ISRELEASE = (
 VERSION = __version__
 PROVIDES = ["nipype"]
 REQUIRES = [
-    "click>=%s" % CLICK_MIN_VERSION,
     "networkx>=%s" % NETWORKX_MIN_VERSION,
     "nibabel>=%s" % NIBABEL_MIN_VERSION,
     "numpy>=%s" % NUMPY_MIN_VERSION,
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import AFNIPythonCommand
+from ....testing import assert_spec_metadata
 
 
 def test_AFNIPythonCommand_inputs():
@@ -23,8 +24,4 @@ def test_AFNIPythonCommand_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = AFNIPythonCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AFNIPythonCommand.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import AlignEpiAnatPy
+from ....testing import assert_spec_metadata
 
 
 def test_AlignEpiAnatPy_inputs():
@@ -56,11 +57,7 @@ def test_AlignEpiAnatPy_inputs():
             usedefault=True,
         ),
     )
-    inputs = AlignEpiAnatPy.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AlignEpiAnatPy.input_spec(), input_map)
 
 
 def test_AlignEpiAnatPy_outputs():
@@ -96,8 +93,4 @@ def test_AlignEpiAnatPy_outputs():
             extensions=None,
         ),
     )
-    outputs = AlignEpiAnatPy.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AlignEpiAnatPy.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Allineate
+from ....testing import assert_spec_metadata
 
 
 def test_Allineate_inputs():
@@ -195,11 +196,7 @@ def test_Allineate_inputs():
             argstr="-zclip",
         ),
     )
-    inputs = Allineate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Allineate.input_spec(), input_map)
 
 
 def test_Allineate_outputs():
@@ -220,8 +217,4 @@ def test_Allineate_outputs():
             extensions=None,
         ),
     )
-    outputs = Allineate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Allineate.output_spec(), output_map)
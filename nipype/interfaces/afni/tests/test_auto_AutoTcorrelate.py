@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import AutoTcorrelate
+from ....testing import assert_spec_metadata
 
 
 def test_AutoTcorrelate_inputs():
@@ -49,11 +50,7 @@ def test_AutoTcorrelate_inputs():
             argstr="-polort %d",
         ),
     )
-    inputs = AutoTcorrelate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AutoTcorrelate.input_spec(), input_map)
 
 
 def test_AutoTcorrelate_outputs():
@@ -62,8 +59,4 @@ def test_AutoTcorrelate_outputs():
             extensions=None,
         ),
     )
-    outputs = AutoTcorrelate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AutoTcorrelate.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Autobox
+from ....testing import assert_spec_metadata
 
 
 def test_Autobox_inputs():
@@ -35,11 +36,7 @@ def test_Autobox_inputs():
             argstr="-npad %d",
         ),
     )
-    inputs = Autobox.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Autobox.input_spec(), input_map)
 
 
 def test_Autobox_outputs():
@@ -54,8 +51,4 @@ def test_Autobox_outputs():
         z_max=dict(),
         z_min=dict(),
     )
-    outputs = Autobox.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Autobox.output_spec(), output_map)
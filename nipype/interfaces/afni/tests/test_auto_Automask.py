@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Automask
+from ....testing import assert_spec_metadata
 
 
 def test_Automask_inputs():
@@ -45,11 +46,7 @@ def test_Automask_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = Automask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Automask.input_spec(), input_map)
 
 
 def test_Automask_outputs():
@@ -61,8 +58,4 @@ def test_Automask_outputs():
             extensions=None,
         ),
     )
-    outputs = Automask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Automask.output_spec(), output_map)
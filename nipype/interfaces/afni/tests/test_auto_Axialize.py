@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Axialize
+from ....testing import assert_spec_metadata
 
 
 def test_Axialize_inputs():
@@ -48,11 +49,7 @@ def test_Axialize_inputs():
             argstr="-verb",
         ),
     )
-    inputs = Axialize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Axialize.input_spec(), input_map)
 
 
 def test_Axialize_outputs():
@@ -61,8 +58,4 @@ def test_Axialize_outputs():
             extensions=None,
         ),
     )
-    outputs = Axialize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Axialize.output_spec(), output_map)
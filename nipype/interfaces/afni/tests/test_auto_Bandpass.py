@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Bandpass
+from ....testing import assert_spec_metadata
 
 
 def test_Bandpass_inputs():
@@ -80,11 +81,7 @@ def test_Bandpass_inputs():
             argstr="-dt %f",
         ),
     )
-    inputs = Bandpass.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Bandpass.input_spec(), input_map)
 
 
 def test_Bandpass_outputs():
@@ -93,8 +90,4 @@ def test_Bandpass_outputs():
             extensions=None,
         ),
     )
-    outputs = Bandpass.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Bandpass.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import BlurInMask
+from ....testing import assert_spec_metadata
 
 
 def test_BlurInMask_inputs():
@@ -56,11 +57,7 @@ def test_BlurInMask_inputs():
             argstr="-preserve",
         ),
     )
-    inputs = BlurInMask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BlurInMask.input_spec(), input_map)
 
 
 def test_BlurInMask_outputs():
@@ -69,8 +66,4 @@ def test_BlurInMask_outputs():
             extensions=None,
         ),
     )
-    outputs = BlurInMask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BlurInMask.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import BlurToFWHM
+from ....testing import assert_spec_metadata
 
 
 def test_BlurToFWHM_inputs():
@@ -45,11 +46,7 @@ def test_BlurToFWHM_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = BlurToFWHM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BlurToFWHM.input_spec(), input_map)
 
 
 def test_BlurToFWHM_outputs():
@@ -58,8 +55,4 @@ def test_BlurToFWHM_outputs():
             extensions=None,
         ),
     )
-    outputs = BlurToFWHM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BlurToFWHM.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import BrickStat
+from ....testing import assert_spec_metadata
 
 
 def test_BrickStat_inputs():
@@ -45,19 +46,11 @@ def test_BrickStat_inputs():
             argstr="-var",
         ),
     )
-    inputs = BrickStat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BrickStat.input_spec(), input_map)
 
 
 def test_BrickStat_outputs():
     output_map = dict(
         min_val=dict(),
     )
-    outputs = BrickStat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BrickStat.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Calc
+from ....testing import assert_spec_metadata
 
 
 def test_Calc_inputs():
@@ -58,11 +59,7 @@ def test_Calc_inputs():
             requires=["start_idx"],
         ),
     )
-    inputs = Calc.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Calc.input_spec(), input_map)
 
 
 def test_Calc_outputs():
@@ -71,8 +68,4 @@ def test_Calc_outputs():
             extensions=None,
         ),
     )
-    outputs = Calc.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Calc.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Cat
+from ....testing import assert_spec_metadata
 
 
 def test_Cat_inputs():
@@ -64,11 +65,7 @@ def test_Cat_inputs():
             argstr="-stack",
         ),
     )
-    inputs = Cat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Cat.input_spec(), input_map)
 
 
 def test_Cat_outputs():
@@ -77,8 +74,4 @@ def test_Cat_outputs():
             extensions=None,
         ),
     )
-    outputs = Cat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Cat.output_spec(), output_map)
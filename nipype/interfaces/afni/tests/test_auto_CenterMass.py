@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import CenterMass
+from ....testing import assert_spec_metadata
 
 
 def test_CenterMass_inputs():
@@ -47,11 +48,7 @@ def test_CenterMass_inputs():
             argstr="-set %f %f %f",
         ),
     )
-    inputs = CenterMass.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CenterMass.input_spec(), input_map)
 
 
 def test_CenterMass_outputs():
@@ -64,8 +61,4 @@ def test_CenterMass_outputs():
             extensions=None,
         ),
     )
-    outputs = CenterMass.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CenterMass.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ClipLevel
+from ....testing import assert_spec_metadata
 
 
 def test_ClipLevel_inputs():
@@ -33,19 +34,11 @@ def test_ClipLevel_inputs():
             position=2,
         ),
     )
-    inputs = ClipLevel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ClipLevel.input_spec(), input_map)
 
 
 def test_ClipLevel_outputs():
     output_map = dict(
         clip_val=dict(),
     )
-    outputs = ClipLevel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ClipLevel.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ConvertDset
+from ....testing import assert_spec_metadata
 
 
 def test_ConvertDset_inputs():
@@ -34,11 +35,7 @@ def test_ConvertDset_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = ConvertDset.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConvertDset.input_spec(), input_map)
 
 
 def test_ConvertDset_outputs():
@@ -47,8 +44,4 @@ def test_ConvertDset_outputs():
             extensions=None,
         ),
     )
-    outputs = ConvertDset.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConvertDset.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Deconvolve
+from ....testing import assert_spec_metadata
 
 
 def test_Deconvolve_inputs():
@@ -168,11 +169,7 @@ def test_Deconvolve_inputs():
             argstr="-x1D_stop",
         ),
     )
-    inputs = Deconvolve.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Deconvolve.input_spec(), input_map)
 
 
 def test_Deconvolve_outputs():
@@ -190,8 +187,4 @@ def test_Deconvolve_outputs():
             extensions=None,
         ),
     )
-    outputs = Deconvolve.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Deconvolve.output_spec(), output_map)
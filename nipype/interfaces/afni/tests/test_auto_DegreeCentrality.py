@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import DegreeCentrality
+from ....testing import assert_spec_metadata
 
 
 def test_DegreeCentrality_inputs():
@@ -52,11 +53,7 @@ def test_DegreeCentrality_inputs():
             argstr="-thresh %f",
         ),
     )
-    inputs = DegreeCentrality.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DegreeCentrality.input_spec(), input_map)
 
 
 def test_DegreeCentrality_outputs():
@@ -68,8 +65,4 @@ def test_DegreeCentrality_outputs():
             extensions=None,
         ),
     )
-    outputs = DegreeCentrality.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DegreeCentrality.output_spec(), output_map)
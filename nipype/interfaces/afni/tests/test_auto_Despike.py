@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Despike
+from ....testing import assert_spec_metadata
 
 
 def test_Despike_inputs():
@@ -30,11 +31,7 @@ def test_Despike_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = Despike.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Despike.input_spec(), input_map)
 
 
 def test_Despike_outputs():
@@ -43,8 +40,4 @@ def test_Despike_outputs():
             extensions=None,
         ),
     )
-    outputs = Despike.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Despike.output_spec(), output_map)
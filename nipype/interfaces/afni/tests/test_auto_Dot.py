@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Dot
+from ....testing import assert_spec_metadata
 
 
 def test_Dot_inputs():
@@ -63,11 +64,7 @@ def test_Dot_inputs():
             argstr="-upper",
         ),
     )
-    inputs = Dot.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Dot.input_spec(), input_map)
 
 
 def test_Dot_outputs():
@@ -76,8 +73,4 @@ def test_Dot_outputs():
             extensions=None,
         ),
     )
-    outputs = Dot.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Dot.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ECM
+from ....testing import assert_spec_metadata
 
 
 def test_ECM_inputs():
@@ -70,11 +71,7 @@ def test_ECM_inputs():
             argstr="-thresh %f",
         ),
     )
-    inputs = ECM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ECM.input_spec(), input_map)
 
 
 def test_ECM_outputs():
@@ -83,8 +80,4 @@ def test_ECM_outputs():
             extensions=None,
         ),
     )
-    outputs = ECM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ECM.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Eval
+from ....testing import assert_spec_metadata
 
 
 def test_Eval_inputs():
@@ -58,11 +59,7 @@ def test_Eval_inputs():
             requires=["start_idx"],
         ),
     )
-    inputs = Eval.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Eval.input_spec(), input_map)
 
 
 def test_Eval_outputs():
@@ -71,8 +68,4 @@ def test_Eval_outputs():
             extensions=None,
         ),
     )
-    outputs = Eval.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Eval.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import FWHMx
+from ....testing import assert_spec_metadata
 
 
 def test_FWHMx_inputs():
@@ -77,11 +78,7 @@ def test_FWHMx_inputs():
             argstr="-unif",
         ),
     )
-    inputs = FWHMx.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FWHMx.input_spec(), input_map)
 
 
 def test_FWHMx_outputs():
@@ -101,8 +98,4 @@ def test_FWHMx_outputs():
             extensions=None,
         ),
     )
-    outputs = FWHMx.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FWHMx.output_spec(), output_map)
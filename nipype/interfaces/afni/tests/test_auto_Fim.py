@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Fim
+from ....testing import assert_spec_metadata
 
 
 def test_Fim_inputs():
@@ -44,11 +45,7 @@ def test_Fim_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = Fim.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Fim.input_spec(), input_map)
 
 
 def test_Fim_outputs():
@@ -57,8 +54,4 @@ def test_Fim_outputs():
             extensions=None,
         ),
     )
-    outputs = Fim.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Fim.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Fourier
+from ....testing import assert_spec_metadata
 
 
 def test_Fourier_inputs():
@@ -41,11 +42,7 @@ def test_Fourier_inputs():
             argstr="-retrend",
         ),
     )
-    inputs = Fourier.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Fourier.input_spec(), input_map)
 
 
 def test_Fourier_outputs():
@@ -54,8 +51,4 @@ def test_Fourier_outputs():
             extensions=None,
         ),
     )
-    outputs = Fourier.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Fourier.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import GCOR
+from ....testing import assert_spec_metadata
 
 
 def test_GCOR_inputs():
@@ -30,19 +31,11 @@ def test_GCOR_inputs():
             argstr="-no_demean",
         ),
     )
-    inputs = GCOR.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GCOR.input_spec(), input_map)
 
 
 def test_GCOR_outputs():
     output_map = dict(
         out=dict(),
     )
-    outputs = GCOR.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GCOR.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Hist
+from ....testing import assert_spec_metadata
 
 
 def test_Hist_inputs():
@@ -54,11 +55,7 @@ def test_Hist_inputs():
             usedefault=True,
         ),
     )
-    inputs = Hist.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Hist.input_spec(), input_map)
 
 
 def test_Hist_outputs():
@@ -70,8 +67,4 @@ def test_Hist_outputs():
             extensions=None,
         ),
     )
-    outputs = Hist.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Hist.output_spec(), output_map)
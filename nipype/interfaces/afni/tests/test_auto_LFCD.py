@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import LFCD
+from ....testing import assert_spec_metadata
 
 
 def test_LFCD_inputs():
@@ -46,11 +47,7 @@ def test_LFCD_inputs():
             argstr="-thresh %f",
         ),
     )
-    inputs = LFCD.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LFCD.input_spec(), input_map)
 
 
 def test_LFCD_outputs():
@@ -59,8 +56,4 @@ def test_LFCD_outputs():
             extensions=None,
         ),
     )
-    outputs = LFCD.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LFCD.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import LocalBistat
+from ....testing import assert_spec_metadata
 
 
 def test_LocalBistat_inputs():
@@ -58,11 +59,7 @@ def test_LocalBistat_inputs():
             xor=["automask"],
         ),
     )
-    inputs = LocalBistat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LocalBistat.input_spec(), input_map)
 
 
 def test_LocalBistat_outputs():
@@ -71,8 +68,4 @@ def test_LocalBistat_outputs():
             extensions=None,
         ),
     )
-    outputs = LocalBistat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LocalBistat.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Localstat
+from ....testing import assert_spec_metadata
 
 
 def test_Localstat_inputs():
@@ -71,11 +72,7 @@ def test_Localstat_inputs():
             mandatory=True,
         ),
     )
-    inputs = Localstat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Localstat.input_spec(), input_map)
 
 
 def test_Localstat_outputs():
@@ -84,8 +81,4 @@ def test_Localstat_outputs():
             extensions=None,
         ),
     )
-    outputs = Localstat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Localstat.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MaskTool
+from ....testing import assert_spec_metadata
 
 
 def test_MaskTool_inputs():
@@ -61,11 +62,7 @@ def test_MaskTool_inputs():
             argstr="-verb %s",
         ),
     )
-    inputs = MaskTool.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MaskTool.input_spec(), input_map)
 
 
 def test_MaskTool_outputs():
@@ -74,8 +71,4 @@ def test_MaskTool_outputs():
             extensions=None,
         ),
     )
-    outputs = MaskTool.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MaskTool.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Means
+from ....testing import assert_spec_metadata
 
 
 def test_Means_inputs():
@@ -61,11 +62,7 @@ def test_Means_inputs():
             argstr="-sum",
         ),
     )
-    inputs = Means.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Means.input_spec(), input_map)
 
 
 def test_Means_outputs():
@@ -74,8 +71,4 @@ def test_Means_outputs():
             extensions=None,
         ),
     )
-    outputs = Means.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Means.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import NetCorr
+from ....testing import assert_spec_metadata
 
 
 def test_NetCorr_inputs():
@@ -78,11 +79,7 @@ def test_NetCorr_inputs():
             extensions=None,
         ),
     )
-    inputs = NetCorr.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NetCorr.input_spec(), input_map)
 
 
 def test_NetCorr_outputs():
@@ -92,8 +89,4 @@ def test_NetCorr_outputs():
             extensions=None,
         ),
     )
-    outputs = NetCorr.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NetCorr.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Notes
+from ....testing import assert_spec_metadata
 
 
 def test_Notes_inputs():
@@ -45,11 +46,7 @@ def test_Notes_inputs():
             argstr="-ses",
         ),
     )
-    inputs = Notes.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Notes.input_spec(), input_map)
 
 
 def test_Notes_outputs():
@@ -58,8 +55,4 @@ def test_Notes_outputs():
             extensions=None,
         ),
     )
-    outputs = Notes.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Notes.output_spec(), output_map)
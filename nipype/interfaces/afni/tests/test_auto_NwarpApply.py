@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import NwarpApply
+from ....testing import assert_spec_metadata
 
 
 def test_NwarpApply_inputs():
@@ -51,11 +52,7 @@ def test_NwarpApply_inputs():
             mandatory=True,
         ),
     )
-    inputs = NwarpApply.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NwarpApply.input_spec(), input_map)
 
 
 def test_NwarpApply_outputs():
@@ -64,8 +61,4 @@ def test_NwarpApply_outputs():
             extensions=None,
         ),
     )
-    outputs = NwarpApply.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NwarpApply.output_spec(), output_map)
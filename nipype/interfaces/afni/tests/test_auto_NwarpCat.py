@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import NwarpCat
+from ....testing import assert_spec_metadata
 
 
 def test_NwarpCat_inputs():
@@ -44,11 +45,7 @@ def test_NwarpCat_inputs():
             argstr="-verb",
         ),
     )
-    inputs = NwarpCat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NwarpCat.input_spec(), input_map)
 
 
 def test_NwarpCat_outputs():
@@ -57,8 +54,4 @@ def test_NwarpCat_outputs():
             extensions=None,
         ),
     )
-    outputs = NwarpCat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NwarpCat.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import OneDToolPy
+from ....testing import assert_spec_metadata
 
 
 def test_OneDToolPy_inputs():
@@ -59,11 +60,7 @@ def test_OneDToolPy_inputs():
             argstr="-show_trs_uncensored %s",
         ),
     )
-    inputs = OneDToolPy.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(OneDToolPy.input_spec(), input_map)
 
 
 def test_OneDToolPy_outputs():
@@ -72,8 +69,4 @@ def test_OneDToolPy_outputs():
             extensions=None,
         ),
     )
-    outputs = OneDToolPy.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(OneDToolPy.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import OutlierCount
+from ....testing import assert_spec_metadata
 
 
 def test_OutlierCount_inputs():
@@ -69,11 +70,7 @@ def test_OutlierCount_inputs():
             usedefault=True,
         ),
     )
-    inputs = OutlierCount.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(OutlierCount.input_spec(), input_map)
 
 
 def test_OutlierCount_outputs():
@@ -85,8 +82,4 @@ def test_OutlierCount_outputs():
             extensions=None,
         ),
     )
-    outputs = OutlierCount.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(OutlierCount.output_spec(), output_map)
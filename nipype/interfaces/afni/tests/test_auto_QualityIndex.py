@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import QualityIndex
+from ....testing import assert_spec_metadata
 
 
 def test_QualityIndex_inputs():
@@ -56,11 +57,7 @@ def test_QualityIndex_inputs():
             usedefault=True,
         ),
     )
-    inputs = QualityIndex.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(QualityIndex.input_spec(), input_map)
 
 
 def test_QualityIndex_outputs():
@@ -69,8 +66,4 @@ def test_QualityIndex_outputs():
             extensions=None,
         ),
     )
-    outputs = QualityIndex.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(QualityIndex.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Qwarp
+from ....testing import assert_spec_metadata
 
 
 def test_Qwarp_inputs():
@@ -201,11 +202,7 @@ def test_Qwarp_inputs():
             xor=["boxopt", "ballopt"],
         ),
     )
-    inputs = Qwarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Qwarp.input_spec(), input_map)
 
 
 def test_Qwarp_outputs():
@@ -226,8 +223,4 @@ def test_Qwarp_outputs():
             extensions=None,
         ),
     )
-    outputs = Qwarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Qwarp.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import QwarpPlusMinus
+from ....testing import assert_spec_metadata
 
 
 def test_QwarpPlusMinus_inputs():
@@ -210,11 +211,7 @@ def test_QwarpPlusMinus_inputs():
             xor=["boxopt", "ballopt"],
         ),
     )
-    inputs = QwarpPlusMinus.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(QwarpPlusMinus.input_spec(), input_map)
 
 
 def test_QwarpPlusMinus_outputs():
@@ -235,8 +232,4 @@ def test_QwarpPlusMinus_outputs():
             extensions=None,
         ),
     )
-    outputs = QwarpPlusMinus.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(QwarpPlusMinus.output_spec(), output_map)
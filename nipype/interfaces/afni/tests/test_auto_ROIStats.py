@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ROIStats
+from ....testing import assert_spec_metadata
 
 
 def test_ROIStats_inputs():
@@ -74,11 +75,7 @@ def test_ROIStats_inputs():
             requires=["num_roi"],
         ),
     )
-    inputs = ROIStats.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ROIStats.input_spec(), input_map)
 
 
 def test_ROIStats_outputs():
@@ -87,8 +84,4 @@ def test_ROIStats_outputs():
             extensions=None,
         ),
     )
-    outputs = ROIStats.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ROIStats.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ReHo
+from ....testing import assert_spec_metadata
 
 
 def test_ReHo_inputs():
@@ -52,11 +53,7 @@ def test_ReHo_inputs():
             xor=["neighborhood", "ellipsoid"],
         ),
     )
-    inputs = ReHo.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ReHo.input_spec(), input_map)
 
 
 def test_ReHo_outputs():
@@ -68,8 +65,4 @@ def test_ReHo_outputs():
             extensions=None,
         ),
     )
-    outputs = ReHo.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ReHo.output_spec(), output_map)
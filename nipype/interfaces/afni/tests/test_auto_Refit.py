@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Refit
+from ....testing import assert_spec_metadata
 
 
 def test_Refit_inputs():
@@ -68,11 +69,7 @@ def test_Refit_inputs():
             argstr="-zorigin %s",
         ),
     )
-    inputs = Refit.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Refit.input_spec(), input_map)
 
 
 def test_Refit_outputs():
@@ -81,8 +78,4 @@ def test_Refit_outputs():
             extensions=None,
         ),
     )
-    outputs = Refit.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Refit.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Remlfit
+from ....testing import assert_spec_metadata
 
 
 def test_Remlfit_inputs():
@@ -155,11 +156,7 @@ def test_Remlfit_inputs():
             extensions=None,
         ),
     )
-    inputs = Remlfit.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Remlfit.input_spec(), input_map)
 
 
 def test_Remlfit_outputs():
@@ -204,8 +201,4 @@ def test_Remlfit_outputs():
             extensions=None,
         ),
     )
-    outputs = Remlfit.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Remlfit.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Resample
+from ....testing import assert_spec_metadata
 
 
 def test_Resample_inputs():
@@ -43,11 +44,7 @@ def test_Resample_inputs():
             argstr="-dxyz %f %f %f",
         ),
     )
-    inputs = Resample.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Resample.input_spec(), input_map)
 
 
 def test_Resample_outputs():
@@ -56,8 +53,4 @@ def test_Resample_outputs():
             extensions=None,
         ),
     )
-    outputs = Resample.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Resample.output_spec(), output_map)
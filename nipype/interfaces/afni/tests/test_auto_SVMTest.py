@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..svm import SVMTest
+from ....testing import assert_spec_metadata
 
 
 def test_SVMTest_inputs():
@@ -50,11 +51,7 @@ def test_SVMTest_inputs():
             extensions=None,
         ),
     )
-    inputs = SVMTest.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SVMTest.input_spec(), input_map)
 
 
 def test_SVMTest_outputs():
@@ -63,8 +60,4 @@ def test_SVMTest_outputs():
             extensions=None,
         ),
     )
-    outputs = SVMTest.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SVMTest.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..svm import SVMTrain
+from ....testing import assert_spec_metadata
 
 
 def test_SVMTrain_inputs():
@@ -77,11 +78,7 @@ def test_SVMTrain_inputs():
             argstr="-wout",
         ),
     )
-    inputs = SVMTrain.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SVMTrain.input_spec(), input_map)
 
 
 def test_SVMTrain_outputs():
@@ -96,8 +93,4 @@ def test_SVMTrain_outputs():
             extensions=None,
         ),
     )
-    outputs = SVMTrain.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SVMTrain.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Seg
+from ....testing import assert_spec_metadata
 
 
 def test_Seg_inputs():
@@ -51,11 +52,7 @@ def test_Seg_inputs():
             argstr="-prefix %s",
         ),
     )
-    inputs = Seg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Seg.input_spec(), input_map)
 
 
 def test_Seg_outputs():
@@ -64,8 +61,4 @@ def test_Seg_outputs():
             extensions=None,
         ),
     )
-    outputs = Seg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Seg.output_spec(), output_map)
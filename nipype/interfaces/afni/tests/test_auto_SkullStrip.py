@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import SkullStrip
+from ....testing import assert_spec_metadata
 
 
 def test_SkullStrip_inputs():
@@ -30,11 +31,7 @@ def test_SkullStrip_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = SkullStrip.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SkullStrip.input_spec(), input_map)
 
 
 def test_SkullStrip_outputs():
@@ -43,8 +40,4 @@ def test_SkullStrip_outputs():
             extensions=None,
         ),
     )
-    outputs = SkullStrip.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SkullStrip.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Synthesize
+from ....testing import assert_spec_metadata
 
 
 def test_Synthesize_inputs():
@@ -47,11 +48,7 @@ def test_Synthesize_inputs():
             mandatory=True,
         ),
     )
-    inputs = Synthesize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Synthesize.input_spec(), input_map)
 
 
 def test_Synthesize_outputs():
@@ -60,8 +57,4 @@ def test_Synthesize_outputs():
             extensions=None,
         ),
     )
-    outputs = Synthesize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Synthesize.output_spec(), output_map)
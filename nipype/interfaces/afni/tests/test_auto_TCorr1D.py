@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import TCorr1D
+from ....testing import assert_spec_metadata
 
 
 def test_TCorr1D_inputs():
@@ -57,11 +58,7 @@ def test_TCorr1D_inputs():
             position=-1,
         ),
     )
-    inputs = TCorr1D.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCorr1D.input_spec(), input_map)
 
 
 def test_TCorr1D_outputs():
@@ -70,8 +67,4 @@ def test_TCorr1D_outputs():
             extensions=None,
         ),
     )
-    outputs = TCorr1D.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCorr1D.output_spec(), output_map)
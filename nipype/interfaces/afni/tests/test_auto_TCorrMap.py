@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import TCorrMap
+from ....testing import assert_spec_metadata
 
 
 def test_TCorrMap_inputs():
@@ -155,11 +156,7 @@ def test_TCorrMap_inputs():
             suffix="_zmean",
         ),
     )
-    inputs = TCorrMap.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCorrMap.input_spec(), input_map)
 
 
 def test_TCorrMap_outputs():
@@ -204,8 +201,4 @@ def test_TCorrMap_outputs():
             extensions=None,
         ),
     )
-    outputs = TCorrMap.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCorrMap.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import TCorrelate
+from ....testing import assert_spec_metadata
 
 
 def test_TCorrelate_inputs():
@@ -43,11 +44,7 @@ def test_TCorrelate_inputs():
             position=-1,
         ),
     )
-    inputs = TCorrelate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCorrelate.input_spec(), input_map)
 
 
 def test_TCorrelate_outputs():
@@ -56,8 +53,4 @@ def test_TCorrelate_outputs():
             extensions=None,
         ),
     )
-    outputs = TCorrelate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCorrelate.output_spec(), output_map)
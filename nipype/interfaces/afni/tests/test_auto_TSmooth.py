@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import TSmooth
+from ....testing import assert_spec_metadata
 
 
 def test_TSmooth_inputs():
@@ -58,11 +59,7 @@ def test_TSmooth_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = TSmooth.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TSmooth.input_spec(), input_map)
 
 
 def test_TSmooth_outputs():
@@ -71,8 +68,4 @@ def test_TSmooth_outputs():
             extensions=None,
         ),
     )
-    outputs = TSmooth.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TSmooth.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TStat
+from ....testing import assert_spec_metadata
 
 
 def test_TStat_inputs():
@@ -37,11 +38,7 @@ def test_TStat_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = TStat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TStat.input_spec(), input_map)
 
 
 def test_TStat_outputs():
@@ -50,8 +47,4 @@ def test_TStat_outputs():
             extensions=None,
         ),
     )
-    outputs = TStat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TStat.output_spec(), output_map)
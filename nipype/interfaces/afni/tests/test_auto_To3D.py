@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import To3D
+from ....testing import assert_spec_metadata
 
 
 def test_To3D_inputs():
@@ -43,11 +44,7 @@ def test_To3D_inputs():
             argstr="-skip_outliers",
         ),
     )
-    inputs = To3D.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(To3D.input_spec(), input_map)
 
 
 def test_To3D_outputs():
@@ -56,8 +53,4 @@ def test_To3D_outputs():
             extensions=None,
         ),
     )
-    outputs = To3D.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(To3D.output_spec(), output_map)
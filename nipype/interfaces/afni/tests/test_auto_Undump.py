@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Undump
+from ....testing import assert_spec_metadata
 
 
 def test_Undump_inputs():
@@ -54,11 +55,7 @@ def test_Undump_inputs():
             argstr="-srad %f",
         ),
     )
-    inputs = Undump.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Undump.input_spec(), input_map)
 
 
 def test_Undump_outputs():
@@ -67,8 +64,4 @@ def test_Undump_outputs():
             extensions=None,
         ),
     )
-    outputs = Undump.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Undump.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Unifize
+from ....testing import assert_spec_metadata
 
 
 def test_Unifize_inputs():
@@ -63,11 +64,7 @@ def test_Unifize_inputs():
             argstr="-Urad %s",
         ),
     )
-    inputs = Unifize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Unifize.input_spec(), input_map)
 
 
 def test_Unifize_outputs():
@@ -79,8 +76,4 @@ def test_Unifize_outputs():
             extensions=None,
         ),
     )
-    outputs = Unifize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Unifize.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Volreg
+from ....testing import assert_spec_metadata
 
 
 def test_Volreg_inputs():
@@ -76,11 +77,7 @@ def test_Volreg_inputs():
             position=-5,
         ),
     )
-    inputs = Volreg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Volreg.input_spec(), input_map)
 
 
 def test_Volreg_outputs():
@@ -98,8 +95,4 @@ def test_Volreg_outputs():
             extensions=None,
         ),
     )
-    outputs = Volreg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Volreg.output_spec(), output_map)
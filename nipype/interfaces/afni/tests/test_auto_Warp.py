@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Warp
+from ....testing import assert_spec_metadata
 
 
 def test_Warp_inputs():
@@ -67,11 +68,7 @@ def test_Warp_inputs():
             argstr="-zpad %d",
         ),
     )
-    inputs = Warp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Warp.input_spec(), input_map)
 
 
 def test_Warp_outputs():
@@ -83,8 +80,4 @@ def test_Warp_outputs():
             extensions=None,
         ),
     )
-    outputs = Warp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Warp.output_spec(), output_map)
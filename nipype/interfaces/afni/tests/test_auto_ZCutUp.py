@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ZCutUp
+from ....testing import assert_spec_metadata
 
 
 def test_ZCutUp_inputs():
@@ -33,11 +34,7 @@ def test_ZCutUp_inputs():
         ),
         outputtype=dict(),
     )
-    inputs = ZCutUp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ZCutUp.input_spec(), input_map)
 
 
 def test_ZCutUp_outputs():
@@ -46,8 +43,4 @@ def test_ZCutUp_outputs():
             extensions=None,
         ),
     )
-    outputs = ZCutUp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ZCutUp.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Zeropad
+from ....testing import assert_spec_metadata
 
 
 def test_Zeropad_inputs():
@@ -78,11 +79,7 @@ def test_Zeropad_inputs():
             xor=["master"],
         ),
     )
-    inputs = Zeropad.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Zeropad.input_spec(), input_map)
 
 
 def test_Zeropad_outputs():
@@ -91,8 +88,4 @@ def test_Zeropad_outputs():
             extensions=None,
         ),
     )
-    outputs = Zeropad.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Zeropad.output_spec(), output_map)
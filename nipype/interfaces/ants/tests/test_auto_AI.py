@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import AI
+from ....testing import assert_spec_metadata
 
 
 def test_AI_inputs():
@@ -70,11 +71,7 @@ def test_AI_inputs():
             usedefault=True,
         ),
     )
-    inputs = AI.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AI.input_spec(), input_map)
 
 
 def test_AI_outputs():
@@ -83,8 +80,4 @@ def test_AI_outputs():
             extensions=None,
         ),
     )
-    outputs = AI.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AI.output_spec(), output_map)
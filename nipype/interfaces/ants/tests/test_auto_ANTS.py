@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import ANTS
+from ....testing import assert_spec_metadata
 
 
 def test_ANTS_inputs():
@@ -96,11 +97,7 @@ def test_ANTS_inputs():
             usedefault=True,
         ),
     )
-    inputs = ANTS.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ANTS.input_spec(), input_map)
 
 
 def test_ANTS_outputs():
@@ -121,8 +118,4 @@ def test_ANTS_outputs():
             extensions=None,
         ),
     )
-    outputs = ANTS.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ANTS.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import ANTSCommand
+from ....testing import assert_spec_metadata
 
 
 def test_ANTSCommand_inputs():
@@ -16,8 +17,4 @@ def test_ANTSCommand_inputs():
             usedefault=True,
         ),
     )
-    inputs = ANTSCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ANTSCommand.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..resampling import ApplyTransformsToPoints
+from ....testing import assert_spec_metadata
 
 
 def test_ApplyTransformsToPoints_inputs():
@@ -35,11 +36,7 @@ def test_ApplyTransformsToPoints_inputs():
             mandatory=True,
         ),
     )
-    inputs = ApplyTransformsToPoints.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyTransformsToPoints.input_spec(), input_map)
 
 
 def test_ApplyTransformsToPoints_outputs():
@@ -48,8 +45,4 @@ def test_ApplyTransformsToPoints_outputs():
             extensions=None,
         ),
     )
-    outputs = ApplyTransformsToPoints.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyTransformsToPoints.output_spec(), output_map)
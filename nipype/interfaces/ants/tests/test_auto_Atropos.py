@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import Atropos
+from ....testing import assert_spec_metadata
 
 
 def test_Atropos_inputs():
@@ -84,11 +85,7 @@ def test_Atropos_inputs():
             usedefault=True,
         ),
     )
-    inputs = Atropos.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Atropos.input_spec(), input_map)
 
 
 def test_Atropos_outputs():
@@ -98,8 +95,4 @@ def test_Atropos_outputs():
         ),
         posteriors=dict(),
     )
-    outputs = Atropos.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Atropos.output_spec(), output_map)
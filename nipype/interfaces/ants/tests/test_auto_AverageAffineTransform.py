@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import AverageAffineTransform
+from ....testing import assert_spec_metadata
 
 
 def test_AverageAffineTransform_inputs():
@@ -32,11 +33,7 @@ def test_AverageAffineTransform_inputs():
             position=3,
         ),
     )
-    inputs = AverageAffineTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AverageAffineTransform.input_spec(), input_map)
 
 
 def test_AverageAffineTransform_outputs():
@@ -45,8 +42,4 @@ def test_AverageAffineTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = AverageAffineTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AverageAffineTransform.output_spec(), output_map)
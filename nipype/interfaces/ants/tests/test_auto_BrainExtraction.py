@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import BrainExtraction
+from ....testing import assert_spec_metadata
 
 
 def test_BrainExtraction_inputs():
@@ -60,11 +61,7 @@ def test_BrainExtraction_inputs():
             argstr="-u %d",
         ),
     )
-    inputs = BrainExtraction.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BrainExtraction.input_spec(), input_map)
 
 
 def test_BrainExtraction_outputs():
@@ -124,8 +121,4 @@ def test_BrainExtraction_outputs():
             extensions=None,
         ),
     )
-    outputs = BrainExtraction.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BrainExtraction.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import CompositeTransformUtil
+from ....testing import assert_spec_metadata
 
 
 def test_CompositeTransformUtil_inputs():
@@ -36,11 +37,7 @@ def test_CompositeTransformUtil_inputs():
             usedefault=True,
         ),
     )
-    inputs = CompositeTransformUtil.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CompositeTransformUtil.input_spec(), input_map)
 
 
 def test_CompositeTransformUtil_outputs():
@@ -55,8 +52,4 @@ def test_CompositeTransformUtil_outputs():
             extensions=None,
         ),
     )
-    outputs = CompositeTransformUtil.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CompositeTransformUtil.output_spec(), output_map)
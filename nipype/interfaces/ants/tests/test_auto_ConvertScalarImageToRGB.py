@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..visualization import ConvertScalarImageToRGB
+from ....testing import assert_spec_metadata
 
 
 def test_ConvertScalarImageToRGB_inputs():
@@ -68,11 +69,7 @@ def test_ConvertScalarImageToRGB_inputs():
             usedefault=True,
         ),
     )
-    inputs = ConvertScalarImageToRGB.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConvertScalarImageToRGB.input_spec(), input_map)
 
 
 def test_ConvertScalarImageToRGB_outputs():
@@ -81,8 +78,4 @@ def test_ConvertScalarImageToRGB_outputs():
             extensions=None,
         ),
     )
-    outputs = ConvertScalarImageToRGB.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConvertScalarImageToRGB.output_spec(), output_map)
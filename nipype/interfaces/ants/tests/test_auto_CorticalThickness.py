@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import CorticalThickness
+from ....testing import assert_spec_metadata
 
 
 def test_CorticalThickness_inputs():
@@ -93,11 +94,7 @@ def test_CorticalThickness_inputs():
             argstr="-u %d",
         ),
     )
-    inputs = CorticalThickness.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CorticalThickness.input_spec(), input_map)
 
 
 def test_CorticalThickness_outputs():
@@ -140,8 +137,4 @@ def test_CorticalThickness_outputs():
             extensions=None,
         ),
     )
-    outputs = CorticalThickness.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CorticalThickness.output_spec(), output_map)
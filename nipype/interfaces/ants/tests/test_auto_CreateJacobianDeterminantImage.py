@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import CreateJacobianDeterminantImage
+from ....testing import assert_spec_metadata
 
 
 def test_CreateJacobianDeterminantImage_inputs():
@@ -41,11 +42,7 @@ def test_CreateJacobianDeterminantImage_inputs():
             position=4,
         ),
     )
-    inputs = CreateJacobianDeterminantImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateJacobianDeterminantImage.input_spec(), input_map)
 
 
 def test_CreateJacobianDeterminantImage_outputs():
@@ -54,8 +51,4 @@ def test_CreateJacobianDeterminantImage_outputs():
             extensions=None,
         ),
     )
-    outputs = CreateJacobianDeterminantImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateJacobianDeterminantImage.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..visualization import CreateTiledMosaic
+from ....testing import assert_spec_metadata
 
 
 def test_CreateTiledMosaic_inputs():
@@ -55,11 +56,7 @@ def test_CreateTiledMosaic_inputs():
             argstr="-t %s",
         ),
     )
-    inputs = CreateTiledMosaic.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateTiledMosaic.input_spec(), input_map)
 
 
 def test_CreateTiledMosaic_outputs():
@@ -68,8 +65,4 @@ def test_CreateTiledMosaic_outputs():
             extensions=None,
         ),
     )
-    outputs = CreateTiledMosaic.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateTiledMosaic.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import DenoiseImage
+from ....testing import assert_spec_metadata
 
 
 def test_DenoiseImage_inputs():
@@ -55,11 +56,7 @@ def test_DenoiseImage_inputs():
             argstr="-v",
         ),
     )
-    inputs = DenoiseImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DenoiseImage.input_spec(), input_map)
 
 
 def test_DenoiseImage_outputs():
@@ -71,8 +68,4 @@ def test_DenoiseImage_outputs():
             extensions=None,
         ),
     )
-    outputs = DenoiseImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DenoiseImage.output_spec(), output_map)
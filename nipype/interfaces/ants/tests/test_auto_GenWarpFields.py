@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..legacy import GenWarpFields
+from ....testing import assert_spec_metadata
 
 
 def test_GenWarpFields_inputs():
@@ -60,11 +61,7 @@ def test_GenWarpFields_inputs():
             usedefault=True,
         ),
     )
-    inputs = GenWarpFields.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenWarpFields.input_spec(), input_map)
 
 
 def test_GenWarpFields_outputs():
@@ -85,8 +82,4 @@ def test_GenWarpFields_outputs():
             extensions=None,
         ),
     )
-    outputs = GenWarpFields.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenWarpFields.output_spec(), output_map)
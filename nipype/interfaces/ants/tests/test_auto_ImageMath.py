@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ImageMath
+from ....testing import assert_spec_metadata
 
 
 def test_ImageMath_inputs():
@@ -48,11 +49,7 @@ def test_ImageMath_inputs():
             position=2,
         ),
     )
-    inputs = ImageMath.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageMath.input_spec(), input_map)
 
 
 def test_ImageMath_outputs():
@@ -61,8 +58,4 @@ def test_ImageMath_outputs():
             extensions=None,
         ),
     )
-    outputs = ImageMath.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageMath.output_spec(), output_map)
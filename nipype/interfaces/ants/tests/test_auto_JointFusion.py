@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import JointFusion
+from ....testing import assert_spec_metadata
 
 
 def test_JointFusion_inputs():
@@ -92,11 +93,7 @@ def test_JointFusion_inputs():
             argstr="-v",
         ),
     )
-    inputs = JointFusion.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JointFusion.input_spec(), input_map)
 
 
 def test_JointFusion_outputs():
@@ -108,8 +105,4 @@ def test_JointFusion_outputs():
         ),
         out_label_post_prob=dict(),
     )
-    outputs = JointFusion.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JointFusion.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import KellyKapowski
+from ....testing import assert_spec_metadata
 
 
 def test_KellyKapowski_inputs():
@@ -89,11 +90,7 @@ def test_KellyKapowski_inputs():
             extensions=None,
         ),
     )
-    inputs = KellyKapowski.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(KellyKapowski.input_spec(), input_map)
 
 
 def test_KellyKapowski_outputs():
@@ -105,8 +102,4 @@ def test_KellyKapowski_outputs():
             extensions=None,
         ),
     )
-    outputs = KellyKapowski.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(KellyKapowski.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import LabelGeometry
+from ....testing import assert_spec_metadata
 
 
 def test_LabelGeometry_inputs():
@@ -40,11 +41,7 @@ def test_LabelGeometry_inputs():
             position=3,
         ),
     )
-    inputs = LabelGeometry.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LabelGeometry.input_spec(), input_map)
 
 
 def test_LabelGeometry_outputs():
@@ -53,8 +50,4 @@ def test_LabelGeometry_outputs():
             extensions=None,
         ),
     )
-    outputs = LabelGeometry.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LabelGeometry.output_spec(), output_map)
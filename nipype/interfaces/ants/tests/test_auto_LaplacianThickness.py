@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import LaplacianThickness
+from ....testing import assert_spec_metadata
 
 
 def test_LaplacianThickness_inputs():
@@ -62,11 +63,7 @@ def test_LaplacianThickness_inputs():
             requires=["sulcus_prior"],
         ),
     )
-    inputs = LaplacianThickness.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LaplacianThickness.input_spec(), input_map)
 
 
 def test_LaplacianThickness_outputs():
@@ -75,8 +72,4 @@ def test_LaplacianThickness_outputs():
             extensions=None,
         ),
     )
-    outputs = LaplacianThickness.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LaplacianThickness.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import MeasureImageSimilarity
+from ....testing import assert_spec_metadata
 
 
 def test_MeasureImageSimilarity_inputs():
@@ -56,19 +57,11 @@ def test_MeasureImageSimilarity_inputs():
             usedefault=True,
         ),
     )
-    inputs = MeasureImageSimilarity.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MeasureImageSimilarity.input_spec(), input_map)
 
 
 def test_MeasureImageSimilarity_outputs():
     output_map = dict(
         similarity=dict(),
     )
-    outputs = MeasureImageSimilarity.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MeasureImageSimilarity.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import N4BiasFieldCorrection
+from ....testing import assert_spec_metadata
 
 
 def test_N4BiasFieldCorrection_inputs():
@@ -76,11 +77,7 @@ def test_N4BiasFieldCorrection_inputs():
             extensions=None,
         ),
     )
-    inputs = N4BiasFieldCorrection.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(N4BiasFieldCorrection.input_spec(), input_map)
 
 
 def test_N4BiasFieldCorrection_outputs():
@@ -92,8 +89,4 @@ def test_N4BiasFieldCorrection_outputs():
             extensions=None,
         ),
     )
-    outputs = N4BiasFieldCorrection.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(N4BiasFieldCorrection.output_spec(), output_map)
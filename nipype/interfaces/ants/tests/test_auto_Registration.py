@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import Registration
+from ....testing import assert_spec_metadata
 
 
 def test_Registration_inputs():
@@ -174,11 +175,7 @@ def test_Registration_inputs():
             usedefault=True,
         ),
     )
-    inputs = Registration.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Registration.input_spec(), input_map)
 
 
 def test_Registration_outputs():
@@ -207,8 +204,4 @@ def test_Registration_outputs():
             extensions=None,
         ),
     )
-    outputs = Registration.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Registration.output_spec(), output_map)
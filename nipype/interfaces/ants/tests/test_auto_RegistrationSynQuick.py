@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import RegistrationSynQuick
+from ....testing import assert_spec_metadata
 
 
 def test_RegistrationSynQuick_inputs():
@@ -55,11 +56,7 @@ def test_RegistrationSynQuick_inputs():
             argstr="-j %d",
         ),
     )
-    inputs = RegistrationSynQuick.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegistrationSynQuick.input_spec(), input_map)
 
 
 def test_RegistrationSynQuick_outputs():
@@ -80,8 +77,4 @@ def test_RegistrationSynQuick_outputs():
             extensions=None,
         ),
     )
-    outputs = RegistrationSynQuick.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegistrationSynQuick.output_spec(), output_map)
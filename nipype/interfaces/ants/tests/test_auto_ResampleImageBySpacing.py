@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ResampleImageBySpacing
+from ....testing import assert_spec_metadata
 
 
 def test_ResampleImageBySpacing_inputs():
@@ -54,11 +55,7 @@ def test_ResampleImageBySpacing_inputs():
             position=3,
         ),
     )
-    inputs = ResampleImageBySpacing.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResampleImageBySpacing.input_spec(), input_map)
 
 
 def test_ResampleImageBySpacing_outputs():
@@ -67,8 +64,4 @@ def test_ResampleImageBySpacing_outputs():
             extensions=None,
         ),
     )
-    outputs = ResampleImageBySpacing.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResampleImageBySpacing.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ThresholdImage
+from ....testing import assert_spec_metadata
 
 
 def test_ThresholdImage_inputs():
@@ -74,11 +75,7 @@ def test_ThresholdImage_inputs():
             xor=["mode"],
         ),
     )
-    inputs = ThresholdImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ThresholdImage.input_spec(), input_map)
 
 
 def test_ThresholdImage_outputs():
@@ -87,8 +84,4 @@ def test_ThresholdImage_outputs():
             extensions=None,
         ),
     )
-    outputs = ThresholdImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ThresholdImage.output_spec(), output_map)
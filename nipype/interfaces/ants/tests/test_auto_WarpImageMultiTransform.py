@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..resampling import WarpImageMultiTransform
+from ....testing import assert_spec_metadata
 
 
 def test_WarpImageMultiTransform_inputs():
@@ -65,11 +66,7 @@ def test_WarpImageMultiTransform_inputs():
             argstr="--use-NN",
         ),
     )
-    inputs = WarpImageMultiTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpImageMultiTransform.input_spec(), input_map)
 
 
 def test_WarpImageMultiTransform_outputs():
@@ -78,8 +75,4 @@ def test_WarpImageMultiTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = WarpImageMultiTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpImageMultiTransform.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..resampling import WarpTimeSeriesImageMultiTransform
+from ....testing import assert_spec_metadata
 
 
 def test_WarpTimeSeriesImageMultiTransform_inputs():
@@ -55,11 +56,7 @@ def test_WarpTimeSeriesImageMultiTransform_inputs():
             argstr="--use-NN",
         ),
     )
-    inputs = WarpTimeSeriesImageMultiTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpTimeSeriesImageMultiTransform.input_spec(), input_map)
 
 
 def test_WarpTimeSeriesImageMultiTransform_outputs():
@@ -68,8 +65,4 @@ def test_WarpTimeSeriesImageMultiTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = WarpTimeSeriesImageMultiTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpTimeSeriesImageMultiTransform.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..legacy import buildtemplateparallel
+from ....testing import assert_spec_metadata
 
 
 def test_buildtemplateparallel_inputs():
@@ -63,11 +64,7 @@ def test_buildtemplateparallel_inputs():
         ),
         use_first_as_target=dict(),
     )
-    inputs = buildtemplateparallel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(buildtemplateparallel.input_spec(), input_map)
 
 
 def test_buildtemplateparallel_outputs():
@@ -78,8 +75,4 @@ def test_buildtemplateparallel_outputs():
         subject_outfiles=dict(),
         template_files=dict(),
     )
-    outputs = buildtemplateparallel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(buildtemplateparallel.output_spec(), output_map)
@@ -17,7 +17,7 @@ from packaging.version import Version
 from traits.trait_errors import TraitError
 from traits.trait_dict_object import TraitDictObject
 from traits.trait_list_object import TraitListObject
-from ...utils.filemanip import md5, hash_infile, hash_timestamp
+from ...utils.filemanip import md5, hash_infile, hash_timestamp, get_file_hasher
 from .traits_extension import (
     traits,
     File,
@@ -214,7 +214,7 @@ class BaseTraitedSpec(traits.HasTraits):
         """
         return has_metadata(self.trait(name).trait_type, metadata, value, recursive)
 
-    def get_hashval(self, hash_method=None):
+    def get_hashval(self, hash_method=None, hash_algorithm=None):
         """Return a dictionary of our items with hashes for each file.
 
         Searches through dictionary items and if an item is a file, it
@@ -225,6 +225,9 @@ class BaseTraitedSpec(traits.HasTraits):
         value of a file. The path and name of the file are not used in
         the overall hash calculation.
 
+        File contents are hashed with ``hash_algorithm`` when given, and
+        with the ``execution.hash_algorithm`` configuration option otherwise.
+
         Returns
         -------
         list_withhash : dict
@@ -236,6 +239,7 @@ class BaseTraitedSpec(traits.HasTraits):
         """
         list_withhash = []
         list_nofilename = []
+        crypto = get_file_hasher(hash_algorithm)
         for name, val in sorted(self.trait_get().items()):
             if not isdefined(val) or self.has_metadata(name, "nohash", True):
                 # skip undefined traits and traits with nohash=True
@@ -248,7 +252,10 @@ class BaseTraitedSpec(traits.HasTraits):
                 (
                     name,
                     self._get_sorteddict(
-                        val, hash_method=hash_method, hash_files=hash_files
+                        val,
+                        hash_method=hash_method,
+                        hash_files=hash_files,
+                        crypto=crypto,
                     ),
                 )
             )
@@ -256,14 +263,23 @@ class BaseTraitedSpec(traits.HasTraits):
                 (
                     name,
                     self._get_sorteddict(
-                        val, True, hash_method=hash_method, hash_files=hash_files
+                        val,
+                        True,
+                        hash_method=hash_method,
+                        hash_files=hash_files,
+                        crypto=crypto,
                     ),
                 )
             )
         return list_withhash, md5(str(list_nofilename).encode()).hexdigest()
 
     def _get_sorteddict(
-        self, objekt, dictwithhash=False, hash_method=None, hash_files=True
+        self,
+        objekt,
+        dictwithhash=False,
+        hash_method=None,
+        hash_files=True,
+        crypto=None,
     ):
         if isinstance(objekt, dict):
             out = []
@@ -277,6 +293,7 @@ class BaseTraitedSpec(traits.HasTraits):
                                 dictwithhash,
                                 hash_method=hash_method,
                                 hash_files=hash_files,
+                                crypto=crypto,
                             ),
                         )
                     )
@@ -290,6 +307,7 @@ class BaseTraitedSpec(traits.HasTraits):
                             dictwithhash,
                             hash_method=hash_method,
                             hash_files=hash_files,
+                            crypto=crypto,
                         )
                     )
             if isinstance(objekt, tuple):
@@ -306,9 +324,9 @@ class BaseTraitedSpec(traits.HasTraits):
                         hash_method = config.get("execution", "hash_method")
 
                     if hash_method.lower() == "timestamp":
-                        hash = hash_timestamp(objekt)
+                        hash = hash_timestamp(objekt, crypto=crypto)
                     elif hash_method.lower() == "content":
-                        hash = hash_infile(objekt)
+                        hash = hash_infile(objekt, crypto=crypto)
                     else:
                         raise Exception("Unknown hash method: %s" % hash_method)
                     if dictwithhash:
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..core import CommandLine
+from ....testing import assert_spec_metadata
 
 
 def test_CommandLine_inputs():
@@ -12,8 +13,4 @@ def test_CommandLine_inputs():
             usedefault=True,
         ),
     )
-    inputs = CommandLine.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CommandLine.input_spec(), input_map)
@@ -1,11 +1,8 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..core import SimpleInterface
+from ....testing import assert_spec_metadata
 
 
 def test_SimpleInterface_inputs():
     input_map = dict()
-    inputs = SimpleInterface.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimpleInterface.input_spec(), input_map)
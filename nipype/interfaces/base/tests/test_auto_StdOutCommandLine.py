@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..core import StdOutCommandLine
+from ....testing import assert_spec_metadata
 
 
 def test_StdOutCommandLine_inputs():
@@ -18,8 +19,4 @@ def test_StdOutCommandLine_inputs():
             position=-1,
         ),
     )
-    inputs = StdOutCommandLine.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(StdOutCommandLine.input_spec(), input_map)
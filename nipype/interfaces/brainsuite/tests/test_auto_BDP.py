@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import BDP
+from ....testing import assert_spec_metadata
 
 
 def test_BDP_inputs():
@@ -178,8 +179,4 @@ def test_BDP_inputs():
             extensions=None,
         ),
     )
-    inputs = BDP.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BDP.input_spec(), input_map)
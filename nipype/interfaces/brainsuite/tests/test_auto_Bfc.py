@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import Bfc
+from ....testing import assert_spec_metadata
 
 
 def test_Bfc_inputs():
@@ -95,11 +96,7 @@ def test_Bfc_inputs():
             argstr="-v %d",
         ),
     )
-    inputs = Bfc.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Bfc.input_spec(), input_map)
 
 
 def test_Bfc_outputs():
@@ -117,8 +114,4 @@ def test_Bfc_outputs():
             extensions=None,
         ),
     )
-    outputs = Bfc.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Bfc.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import Bse
+from ....testing import assert_spec_metadata
 
 
 def test_Bse_inputs():
@@ -83,11 +84,7 @@ def test_Bse_inputs():
             usedefault=True,
         ),
     )
-    inputs = Bse.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Bse.input_spec(), input_map)
 
 
 def test_Bse_outputs():
@@ -111,8 +108,4 @@ def test_Bse_outputs():
             extensions=None,
         ),
     )
-    outputs = Bse.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Bse.output_spec(), output_map)
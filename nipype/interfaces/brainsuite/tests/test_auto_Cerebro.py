@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import Cerebro
+from ....testing import assert_spec_metadata
 
 
 def test_Cerebro_inputs():
@@ -79,11 +80,7 @@ def test_Cerebro_inputs():
             argstr="--warplevel %d",
         ),
     )
-    inputs = Cerebro.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Cerebro.input_spec(), input_map)
 
 
 def test_Cerebro_outputs():
@@ -101,8 +98,4 @@ def test_Cerebro_outputs():
             extensions=None,
         ),
     )
-    outputs = Cerebro.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Cerebro.output_spec(), output_map)
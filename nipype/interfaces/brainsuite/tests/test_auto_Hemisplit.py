@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import Hemisplit
+from ....testing import assert_spec_metadata
 
 
 def test_Hemisplit_inputs():
@@ -52,11 +53,7 @@ def test_Hemisplit_inputs():
             argstr="-v %d",
         ),
     )
-    inputs = Hemisplit.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Hemisplit.input_spec(), input_map)
 
 
 def test_Hemisplit_outputs():
@@ -74,8 +71,4 @@ def test_Hemisplit_outputs():
             extensions=None,
         ),
     )
-    outputs = Hemisplit.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Hemisplit.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import Pialmesh
+from ....testing import assert_spec_metadata
 
 
 def test_Pialmesh_inputs():
@@ -79,11 +80,7 @@ def test_Pialmesh_inputs():
             argstr="-v %d",
         ),
     )
-    inputs = Pialmesh.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Pialmesh.input_spec(), input_map)
 
 
 def test_Pialmesh_outputs():
@@ -92,8 +89,4 @@ def test_Pialmesh_outputs():
             extensions=None,
         ),
     )
-    outputs = Pialmesh.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Pialmesh.output_spec(), output_map)
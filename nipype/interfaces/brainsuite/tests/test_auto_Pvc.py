@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import Pvc
+from ....testing import assert_spec_metadata
 
 
 def test_Pvc_inputs():
@@ -43,11 +44,7 @@ def test_Pvc_inputs():
             argstr="-v %d",
         ),
     )
-    inputs = Pvc.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Pvc.input_spec(), input_map)
 
 
 def test_Pvc_outputs():
@@ -59,8 +56,4 @@ def test_Pvc_outputs():
             extensions=None,
         ),
     )
-    outputs = Pvc.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Pvc.output_spec(), output_map)
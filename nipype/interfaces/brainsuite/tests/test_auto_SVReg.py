@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import SVReg
+from ....testing import assert_spec_metadata
 
 
 def test_SVReg_inputs():
@@ -81,8 +82,4 @@ def test_SVReg_inputs():
             xor=("verbosity0", "verbosity1", "verbosity2"),
         ),
     )
-    inputs = SVReg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SVReg.input_spec(), input_map)
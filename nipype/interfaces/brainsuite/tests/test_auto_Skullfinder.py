@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import Skullfinder
+from ....testing import assert_spec_metadata
 
 
 def test_Skullfinder_inputs():
@@ -57,11 +58,7 @@ def test_Skullfinder_inputs():
             argstr="-v %d",
         ),
     )
-    inputs = Skullfinder.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Skullfinder.input_spec(), input_map)
 
 
 def test_Skullfinder_outputs():
@@ -70,8 +67,4 @@ def test_Skullfinder_outputs():
             extensions=None,
         ),
     )
-    outputs = Skullfinder.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Skullfinder.output_spec(), output_map)
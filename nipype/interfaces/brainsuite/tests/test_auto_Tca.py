@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsuite import Tca
+from ....testing import assert_spec_metadata
 
 
 def test_Tca_inputs():
@@ -39,11 +40,7 @@ def test_Tca_inputs():
             argstr="-v %d",
         ),
     )
-    inputs = Tca.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Tca.input_spec(), input_map)
 
 
 def test_Tca_outputs():
@@ -52,8 +49,4 @@ def test_Tca_outputs():
             extensions=None,
         ),
     )
-    outputs = Tca.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Tca.output_spec(), output_map)
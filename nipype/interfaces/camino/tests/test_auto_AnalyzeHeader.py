@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import AnalyzeHeader
+from ....testing import assert_spec_metadata
 
 
 def test_AnalyzeHeader_inputs():
@@ -108,11 +109,7 @@ def test_AnalyzeHeader_inputs():
             units="mm",
         ),
     )
-    inputs = AnalyzeHeader.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AnalyzeHeader.input_spec(), input_map)
 
 
 def test_AnalyzeHeader_outputs():
@@ -121,8 +118,4 @@ def test_AnalyzeHeader_outputs():
             extensions=None,
         ),
     )
-    outputs = AnalyzeHeader.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AnalyzeHeader.output_spec(), output_map)
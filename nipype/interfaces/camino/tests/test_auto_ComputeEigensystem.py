@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import ComputeEigensystem
+from ....testing import assert_spec_metadata
 
 
 def test_ComputeEigensystem_inputs():
@@ -38,11 +39,7 @@ def test_ComputeEigensystem_inputs():
             usedefault=True,
         ),
     )
-    inputs = ComputeEigensystem.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeEigensystem.input_spec(), input_map)
 
 
 def test_ComputeEigensystem_outputs():
@@ -51,8 +48,4 @@ def test_ComputeEigensystem_outputs():
             extensions=None,
         ),
     )
-    outputs = ComputeEigensystem.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeEigensystem.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import ComputeMeanDiffusivity
+from ....testing import assert_spec_metadata
 
 
 def test_ComputeMeanDiffusivity_inputs():
@@ -38,11 +39,7 @@ def test_ComputeMeanDiffusivity_inputs():
             position=2,
         ),
     )
-    inputs = ComputeMeanDiffusivity.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeMeanDiffusivity.input_spec(), input_map)
 
 
 def test_ComputeMeanDiffusivity_outputs():
@@ -51,8 +48,4 @@ def test_ComputeMeanDiffusivity_outputs():
             extensions=None,
         ),
     )
-    outputs = ComputeMeanDiffusivity.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeMeanDiffusivity.output_spec(), output_map)
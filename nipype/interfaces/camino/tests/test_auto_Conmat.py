@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..connectivity import Conmat
+from ....testing import assert_spec_metadata
 
 
 def test_Conmat_inputs():
@@ -47,11 +48,7 @@ def test_Conmat_inputs():
             xor=["tract_prop"],
         ),
     )
-    inputs = Conmat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Conmat.input_spec(), input_map)
 
 
 def test_Conmat_outputs():
@@ -63,8 +60,4 @@ def test_Conmat_outputs():
             extensions=None,
         ),
     )
-    outputs = Conmat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Conmat.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import DT2NIfTI
+from ....testing import assert_spec_metadata
 
 
 def test_DT2NIfTI_inputs():
@@ -30,11 +31,7 @@ def test_DT2NIfTI_inputs():
             position=2,
         ),
     )
-    inputs = DT2NIfTI.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DT2NIfTI.input_spec(), input_map)
 
 
 def test_DT2NIfTI_outputs():
@@ -49,8 +46,4 @@ def test_DT2NIfTI_outputs():
             extensions=None,
         ),
     )
-    outputs = DT2NIfTI.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DT2NIfTI.output_spec(), output_map)
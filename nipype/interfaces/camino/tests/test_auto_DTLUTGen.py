@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import DTLUTGen
+from ....testing import assert_spec_metadata
 
 
 def test_DTLUTGen_inputs():
@@ -63,11 +64,7 @@ def test_DTLUTGen_inputs():
             argstr="-watson",
         ),
     )
-    inputs = DTLUTGen.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTLUTGen.input_spec(), input_map)
 
 
 def test_DTLUTGen_outputs():
@@ -76,8 +73,4 @@ def test_DTLUTGen_outputs():
             extensions=None,
         ),
     )
-    outputs = DTLUTGen.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTLUTGen.output_spec(), output_map)
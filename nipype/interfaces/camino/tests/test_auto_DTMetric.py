@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import DTMetric
+from ....testing import assert_spec_metadata
 
 
 def test_DTMetric_inputs():
@@ -38,11 +39,7 @@ def test_DTMetric_inputs():
             genfile=True,
         ),
     )
-    inputs = DTMetric.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTMetric.input_spec(), input_map)
 
 
 def test_DTMetric_outputs():
@@ -51,8 +48,4 @@ def test_DTMetric_outputs():
             extensions=None,
         ),
     )
-    outputs = DTMetric.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTMetric.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import FSL2Scheme
+from ....testing import assert_spec_metadata
 
 
 def test_FSL2Scheme_inputs():
@@ -57,11 +58,7 @@ def test_FSL2Scheme_inputs():
             argstr="-usegradmod",
         ),
     )
-    inputs = FSL2Scheme.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FSL2Scheme.input_spec(), input_map)
 
 
 def test_FSL2Scheme_outputs():
@@ -70,8 +67,4 @@ def test_FSL2Scheme_outputs():
             extensions=None,
         ),
     )
-    outputs = FSL2Scheme.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FSL2Scheme.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import Image2Voxel
+from ....testing import assert_spec_metadata
 
 
 def test_Image2Voxel_inputs():
@@ -29,11 +30,7 @@ def test_Image2Voxel_inputs():
             usedefault=True,
         ),
     )
-    inputs = Image2Voxel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Image2Voxel.input_spec(), input_map)
 
 
 def test_Image2Voxel_outputs():
@@ -42,8 +39,4 @@ def test_Image2Voxel_outputs():
             extensions=None,
         ),
     )
-    outputs = Image2Voxel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Image2Voxel.output_spec(), output_map)
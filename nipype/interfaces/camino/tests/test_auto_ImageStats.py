@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ImageStats
+from ....testing import assert_spec_metadata
 
 
 def test_ImageStats_inputs():
@@ -31,11 +32,7 @@ def test_ImageStats_inputs():
             units="NA",
         ),
     )
-    inputs = ImageStats.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageStats.input_spec(), input_map)
 
 
 def test_ImageStats_outputs():
@@ -44,8 +41,4 @@ def test_ImageStats_outputs():
             extensions=None,
         ),
     )
-    outputs = ImageStats.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageStats.output_spec(), output_map)
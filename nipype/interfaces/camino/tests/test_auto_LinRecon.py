@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..odf import LinRecon
+from ....testing import assert_spec_metadata
 
 
 def test_LinRecon_inputs():
@@ -46,11 +47,7 @@ def test_LinRecon_inputs():
             position=2,
         ),
     )
-    inputs = LinRecon.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LinRecon.input_spec(), input_map)
 
 
 def test_LinRecon_outputs():
@@ -59,8 +56,4 @@ def test_LinRecon_outputs():
             extensions=None,
         ),
     )
-    outputs = LinRecon.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LinRecon.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..odf import MESD
+from ....testing import assert_spec_metadata
 
 
 def test_MESD_inputs():
@@ -55,11 +56,7 @@ def test_MESD_inputs():
             mandatory=True,
         ),
     )
-    inputs = MESD.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MESD.input_spec(), input_map)
 
 
 def test_MESD_outputs():
@@ -68,8 +65,4 @@ def test_MESD_outputs():
             extensions=None,
         ),
     )
-    outputs = MESD.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MESD.output_spec(), output_map)
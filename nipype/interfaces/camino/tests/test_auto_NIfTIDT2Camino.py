@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import NIfTIDT2Camino
+from ....testing import assert_spec_metadata
 
 
 def test_NIfTIDT2Camino_inputs():
@@ -45,11 +46,7 @@ def test_NIfTIDT2Camino_inputs():
             argstr="-uppertriangular %s",
         ),
     )
-    inputs = NIfTIDT2Camino.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NIfTIDT2Camino.input_spec(), input_map)
 
 
 def test_NIfTIDT2Camino_outputs():
@@ -58,8 +55,4 @@ def test_NIfTIDT2Camino_outputs():
             extensions=None,
         ),
     )
-    outputs = NIfTIDT2Camino.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NIfTIDT2Camino.output_spec(), output_map)
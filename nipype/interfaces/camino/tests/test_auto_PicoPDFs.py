@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import PicoPDFs
+from ....testing import assert_spec_metadata
 
 
 def test_PicoPDFs_inputs():
@@ -49,11 +50,7 @@ def test_PicoPDFs_inputs():
             usedefault=True,
         ),
     )
-    inputs = PicoPDFs.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PicoPDFs.input_spec(), input_map)
 
 
 def test_PicoPDFs_outputs():
@@ -62,8 +59,4 @@ def test_PicoPDFs_outputs():
             extensions=None,
         ),
     )
-    outputs = PicoPDFs.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PicoPDFs.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import ProcStreamlines
+from ....testing import assert_spec_metadata
 
 
 def test_ProcStreamlines_inputs():
@@ -137,11 +138,7 @@ def test_ProcStreamlines_inputs():
             extensions=None,
         ),
     )
-    inputs = ProcStreamlines.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProcStreamlines.input_spec(), input_map)
 
 
 def test_ProcStreamlines_outputs():
@@ -151,8 +148,4 @@ def test_ProcStreamlines_outputs():
             extensions=None,
         ),
     )
-    outputs = ProcStreamlines.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProcStreamlines.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..calib import SFLUTGen
+from ....testing import assert_spec_metadata
 
 
 def test_SFLUTGen_inputs():
@@ -51,11 +52,7 @@ def test_SFLUTGen_inputs():
             usedefault=True,
         ),
     )
-    inputs = SFLUTGen.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SFLUTGen.input_spec(), input_map)
 
 
 def test_SFLUTGen_outputs():
@@ -67,8 +64,4 @@ def test_SFLUTGen_outputs():
             extensions=None,
         ),
     )
-    outputs = SFLUTGen.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SFLUTGen.output_spec(), output_map)
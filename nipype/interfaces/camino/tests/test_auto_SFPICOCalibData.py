@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..calib import SFPICOCalibData
+from ....testing import assert_spec_metadata
 
 
 def test_SFPICOCalibData_inputs():
@@ -74,11 +75,7 @@ def test_SFPICOCalibData_inputs():
             units="NA",
         ),
     )
-    inputs = SFPICOCalibData.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SFPICOCalibData.input_spec(), input_map)
 
 
 def test_SFPICOCalibData_outputs():
@@ -90,8 +87,4 @@ def test_SFPICOCalibData_outputs():
             extensions=None,
         ),
     )
-    outputs = SFPICOCalibData.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SFPICOCalibData.output_spec(), output_map)
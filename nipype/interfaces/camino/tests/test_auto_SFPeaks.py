@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..odf import SFPeaks
+from ....testing import assert_spec_metadata
 
 
 def test_SFPeaks_inputs():
@@ -70,11 +71,7 @@ def test_SFPeaks_inputs():
             units="NA",
         ),
     )
-    inputs = SFPeaks.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SFPeaks.input_spec(), input_map)
 
 
 def test_SFPeaks_outputs():
@@ -83,8 +80,4 @@ def test_SFPeaks_outputs():
             extensions=None,
         ),
     )
-    outputs = SFPeaks.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SFPeaks.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import Shredder
+from ....testing import assert_spec_metadata
 
 
 def test_Shredder_inputs():
@@ -39,11 +40,7 @@ def test_Shredder_inputs():
             units="NA",
         ),
     )
-    inputs = Shredder.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Shredder.input_spec(), input_map)
 
 
 def test_Shredder_outputs():
@@ -52,8 +49,4 @@ def test_Shredder_outputs():
             extensions=None,
         ),
     )
-    outputs = Shredder.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Shredder.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import TrackBallStick
+from ....testing import assert_spec_metadata
 
 
 def test_TrackBallStick_inputs():
@@ -90,11 +91,7 @@ def test_TrackBallStick_inputs():
             units="mm",
         ),
     )
-    inputs = TrackBallStick.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBallStick.input_spec(), input_map)
 
 
 def test_TrackBallStick_outputs():
@@ -103,8 +100,4 @@ def test_TrackBallStick_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackBallStick.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBallStick.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import TrackBayesDirac
+from ....testing import assert_spec_metadata
 
 
 def test_TrackBayesDirac_inputs():
@@ -121,11 +122,7 @@ def test_TrackBayesDirac_inputs():
             units="mm",
         ),
     )
-    inputs = TrackBayesDirac.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBayesDirac.input_spec(), input_map)
 
 
 def test_TrackBayesDirac_outputs():
@@ -134,8 +131,4 @@ def test_TrackBayesDirac_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackBayesDirac.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBayesDirac.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import TrackBedpostxDeter
+from ....testing import assert_spec_metadata
 
 
 def test_TrackBedpostxDeter_inputs():
@@ -98,11 +99,7 @@ def test_TrackBedpostxDeter_inputs():
             units="mm",
         ),
     )
-    inputs = TrackBedpostxDeter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBedpostxDeter.input_spec(), input_map)
 
 
 def test_TrackBedpostxDeter_outputs():
@@ -111,8 +108,4 @@ def test_TrackBedpostxDeter_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackBedpostxDeter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBedpostxDeter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import TrackBedpostxProba
+from ....testing import assert_spec_metadata
 
 
 def test_TrackBedpostxProba_inputs():
@@ -102,11 +103,7 @@ def test_TrackBedpostxProba_inputs():
             units="mm",
         ),
     )
-    inputs = TrackBedpostxProba.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBedpostxProba.input_spec(), input_map)
 
 
 def test_TrackBedpostxProba_outputs():
@@ -115,8 +112,4 @@ def test_TrackBedpostxProba_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackBedpostxProba.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBedpostxProba.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import TrackBootstrap
+from ....testing import assert_spec_metadata
 
 
 def test_TrackBootstrap_inputs():
@@ -110,11 +111,7 @@ def test_TrackBootstrap_inputs():
             units="mm",
         ),
     )
-    inputs = TrackBootstrap.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBootstrap.input_spec(), input_map)
 
 
 def test_TrackBootstrap_outputs():
@@ -123,8 +120,4 @@ def test_TrackBootstrap_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackBootstrap.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackBootstrap.output_spec(), output_map)
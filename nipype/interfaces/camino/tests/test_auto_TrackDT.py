@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import TrackDT
+from ....testing import assert_spec_metadata
 
 
 def test_TrackDT_inputs():
@@ -90,11 +91,7 @@ def test_TrackDT_inputs():
             units="mm",
         ),
     )
-    inputs = TrackDT.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackDT.input_spec(), input_map)
 
 
 def test_TrackDT_outputs():
@@ -103,8 +100,4 @@ def test_TrackDT_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackDT.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackDT.output_spec(), output_map)
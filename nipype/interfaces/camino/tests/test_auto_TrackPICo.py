@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import TrackPICo
+from ....testing import assert_spec_metadata
 
 
 def test_TrackPICo_inputs():
@@ -97,11 +98,7 @@ def test_TrackPICo_inputs():
             units="mm",
         ),
     )
-    inputs = TrackPICo.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackPICo.input_spec(), input_map)
 
 
 def test_TrackPICo_outputs():
@@ -110,8 +107,4 @@ def test_TrackPICo_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackPICo.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackPICo.output_spec(), output_map)
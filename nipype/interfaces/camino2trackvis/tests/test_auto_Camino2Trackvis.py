@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import Camino2Trackvis
+from ....testing import assert_spec_metadata
 
 
 def test_Camino2Trackvis_inputs():
@@ -52,11 +53,7 @@ def test_Camino2Trackvis_inputs():
             position=6,
         ),
     )
-    inputs = Camino2Trackvis.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Camino2Trackvis.input_spec(), input_map)
 
 
 def test_Camino2Trackvis_outputs():
@@ -65,8 +62,4 @@ def test_Camino2Trackvis_outputs():
             extensions=None,
         ),
     )
-    outputs = Camino2Trackvis.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Camino2Trackvis.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import Trackvis2Camino
+from ....testing import assert_spec_metadata
 
 
 def test_Trackvis2Camino_inputs():
@@ -29,11 +30,7 @@ def test_Trackvis2Camino_inputs():
             position=2,
         ),
     )
-    inputs = Trackvis2Camino.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Trackvis2Camino.input_spec(), input_map)
 
 
 def test_Trackvis2Camino_outputs():
@@ -42,8 +39,4 @@ def test_Trackvis2Camino_outputs():
             extensions=None,
         ),
     )
-    outputs = Trackvis2Camino.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Trackvis2Camino.output_spec(), output_map)
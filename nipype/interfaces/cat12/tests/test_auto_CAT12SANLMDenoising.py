@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import CAT12SANLMDenoising
+from ....testing import assert_spec_metadata
 
 
 def test_CAT12SANLMDenoising_inputs():
@@ -52,11 +53,7 @@ def test_CAT12SANLMDenoising_inputs():
             usedefault=True,
         ),
     )
-    inputs = CAT12SANLMDenoising.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CAT12SANLMDenoising.input_spec(), input_map)
 
 
 def test_CAT12SANLMDenoising_outputs():
@@ -65,8 +62,4 @@ def test_CAT12SANLMDenoising_outputs():
             extensions=None,
         ),
     )
-    outputs = CAT12SANLMDenoising.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CAT12SANLMDenoising.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import CAT12Segment
+from ....testing import assert_spec_metadata
 
 
 def test_CAT12Segment_inputs():
@@ -205,11 +206,7 @@ def test_CAT12Segment_inputs():
             usedefault=True,
         ),
     )
-    inputs = CAT12Segment.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CAT12Segment.input_spec(), input_map)
 
 
 def test_CAT12Segment_outputs():
@@ -270,8 +267,4 @@ def test_CAT12Segment_outputs():
             extensions=None,
         ),
     )
-    outputs = CAT12Segment.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CAT12Segment.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..surface import ExtractAdditionalSurfaceParameters
+from ....testing import assert_spec_metadata
 
 
 def test_ExtractAdditionalSurfaceParameters_inputs():
@@ -44,11 +45,7 @@ def test_ExtractAdditionalSurfaceParameters_inputs():
             usedefault=True,
         ),
     )
-    inputs = ExtractAdditionalSurfaceParameters.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractAdditionalSurfaceParameters.input_spec(), input_map)
 
 
 def test_ExtractAdditionalSurfaceParameters_outputs():
@@ -66,8 +63,4 @@ def test_ExtractAdditionalSurfaceParameters_outputs():
         rh_gmv=dict(),
         rh_gyrification=dict(),
     )
-    outputs = ExtractAdditionalSurfaceParameters.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractAdditionalSurfaceParameters.output_spec(), output_map)
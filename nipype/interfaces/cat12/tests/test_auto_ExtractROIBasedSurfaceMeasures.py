@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..surface import ExtractROIBasedSurfaceMeasures
+from ....testing import assert_spec_metadata
 
 
 def test_ExtractROIBasedSurfaceMeasures_inputs():
@@ -37,19 +38,11 @@ def test_ExtractROIBasedSurfaceMeasures_inputs():
             usedefault=True,
         ),
     )
-    inputs = ExtractROIBasedSurfaceMeasures.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractROIBasedSurfaceMeasures.input_spec(), input_map)
 
 
 def test_ExtractROIBasedSurfaceMeasures_outputs():
     output_map = dict(
         label_files=dict(),
     )
-    outputs = ExtractROIBasedSurfaceMeasures.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractROIBasedSurfaceMeasures.output_spec(), output_map)
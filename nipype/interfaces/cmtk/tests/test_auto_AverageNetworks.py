@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..nx import AverageNetworks
+from ....testing import assert_spec_metadata
 
 
 def test_AverageNetworks_inputs():
@@ -20,11 +21,7 @@ def test_AverageNetworks_inputs():
             extensions=None,
         ),
     )
-    inputs = AverageNetworks.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AverageNetworks.input_spec(), input_map)
 
 
 def test_AverageNetworks_outputs():
@@ -37,8 +34,4 @@ def test_AverageNetworks_outputs():
         ),
         matlab_groupavgs=dict(),
     )
-    outputs = AverageNetworks.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AverageNetworks.output_spec(), output_map)
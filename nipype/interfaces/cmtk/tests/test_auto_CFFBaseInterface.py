@@ -1,11 +1,8 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import CFFBaseInterface
+from ....testing import assert_spec_metadata
 
 
 def test_CFFBaseInterface_inputs():
     input_map = dict()
-    inputs = CFFBaseInterface.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CFFBaseInterface.input_spec(), input_map)
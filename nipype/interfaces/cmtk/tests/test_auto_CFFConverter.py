@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import CFFConverter
+from ....testing import assert_spec_metadata
 
 
 def test_CFFConverter_inputs():
@@ -32,11 +33,7 @@ def test_CFFConverter_inputs():
         title=dict(),
         tract_files=dict(),
     )
-    inputs = CFFConverter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CFFConverter.input_spec(), input_map)
 
 
 def test_CFFConverter_outputs():
@@ -45,8 +42,4 @@ def test_CFFConverter_outputs():
             extensions=None,
         ),
     )
-    outputs = CFFConverter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CFFConverter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..cmtk import CreateMatrix
+from ....testing import assert_spec_metadata
 
 
 def test_CreateMatrix_inputs():
@@ -48,11 +49,7 @@ def test_CreateMatrix_inputs():
             mandatory=True,
         ),
     )
-    inputs = CreateMatrix.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateMatrix.input_spec(), input_map)
 
 
 def test_CreateMatrix_outputs():
@@ -106,8 +103,4 @@ def test_CreateMatrix_outputs():
             extensions=None,
         ),
     )
-    outputs = CreateMatrix.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateMatrix.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..cmtk import CreateNodes
+from ....testing import assert_spec_metadata
 
 
 def test_CreateNodes_inputs():
@@ -17,11 +18,7 @@ def test_CreateNodes_inputs():
             mandatory=True,
         ),
     )
-    inputs = CreateNodes.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateNodes.input_spec(), input_map)
 
 
 def test_CreateNodes_outputs():
@@ -30,8 +27,4 @@ def test_CreateNodes_outputs():
             extensions=None,
         ),
     )
-    outputs = CreateNodes.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateNodes.output_spec(), output_map)
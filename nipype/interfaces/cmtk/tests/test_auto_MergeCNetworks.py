@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import MergeCNetworks
+from ....testing import assert_spec_metadata
 
 
 def test_MergeCNetworks_inputs():
@@ -12,11 +13,7 @@ def test_MergeCNetworks_inputs():
             usedefault=True,
         ),
     )
-    inputs = MergeCNetworks.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeCNetworks.input_spec(), input_map)
 
 
 def test_MergeCNetworks_outputs():
@@ -25,8 +22,4 @@ def test_MergeCNetworks_outputs():
             extensions=None,
         ),
     )
-    outputs = MergeCNetworks.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeCNetworks.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..nbs import NetworkBasedStatistic
+from ....testing import assert_spec_metadata
 
 
 def test_NetworkBasedStatistic_inputs():
@@ -32,11 +33,7 @@ def test_NetworkBasedStatistic_inputs():
             usedefault=True,
         ),
     )
-    inputs = NetworkBasedStatistic.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NetworkBasedStatistic.input_spec(), input_map)
 
 
 def test_NetworkBasedStatistic_outputs():
@@ -49,8 +46,4 @@ def test_NetworkBasedStatistic_outputs():
         ),
         network_files=dict(),
     )
-    outputs = NetworkBasedStatistic.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NetworkBasedStatistic.output_spec(), output_map)
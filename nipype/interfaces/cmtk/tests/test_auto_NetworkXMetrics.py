@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..nx import NetworkXMetrics
+from ....testing import assert_spec_metadata
 
 
 def test_NetworkXMetrics_inputs():
@@ -43,11 +44,7 @@ def test_NetworkXMetrics_inputs():
             usedefault=True,
         ),
     )
-    inputs = NetworkXMetrics.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NetworkXMetrics.input_spec(), input_map)
 
 
 def test_NetworkXMetrics_outputs():
@@ -80,8 +77,4 @@ def test_NetworkXMetrics_outputs():
             extensions=None,
         ),
     )
-    outputs = NetworkXMetrics.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NetworkXMetrics.output_spec(), output_map)
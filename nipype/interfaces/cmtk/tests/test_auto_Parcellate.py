@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..parcellation import Parcellate
+from ....testing import assert_spec_metadata
 
 
 def test_Parcellate_inputs():
@@ -20,11 +21,7 @@ def test_Parcellate_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = Parcellate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Parcellate.input_spec(), input_map)
 
 
 def test_Parcellate_outputs():
@@ -54,8 +51,4 @@ def test_Parcellate_outputs():
             extensions=None,
         ),
     )
-    outputs = Parcellate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Parcellate.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..cmtk import ROIGen
+from ....testing import assert_spec_metadata
 
 
 def test_ROIGen_inputs():
@@ -27,11 +28,7 @@ def test_ROIGen_inputs():
             xor=["LUT_file"],
         ),
     )
-    inputs = ROIGen.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ROIGen.input_spec(), input_map)
 
 
 def test_ROIGen_outputs():
@@ -43,8 +40,4 @@ def test_ROIGen_outputs():
             extensions=None,
         ),
     )
-    outputs = ROIGen.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ROIGen.output_spec(), output_map)
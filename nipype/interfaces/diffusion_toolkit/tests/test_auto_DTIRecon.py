@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import DTIRecon
+from ....testing import assert_spec_metadata
 
 
 def test_DTIRecon_inputs():
@@ -48,11 +49,7 @@ def test_DTIRecon_inputs():
             usedefault=True,
         ),
     )
-    inputs = DTIRecon.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTIRecon.input_spec(), input_map)
 
 
 def test_DTIRecon_outputs():
@@ -94,8 +91,4 @@ def test_DTIRecon_outputs():
             extensions=None,
         ),
     )
-    outputs = DTIRecon.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTIRecon.output_spec(), output_map)
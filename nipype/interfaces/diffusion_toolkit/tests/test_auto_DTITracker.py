@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import DTITracker
+from ....testing import assert_spec_metadata
 
 
 def test_DTITracker_inputs():
@@ -86,11 +87,7 @@ def test_DTITracker_inputs():
             argstr="-%s",
         ),
     )
-    inputs = DTITracker.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTITracker.input_spec(), input_map)
 
 
 def test_DTITracker_outputs():
@@ -102,8 +99,4 @@ def test_DTITracker_outputs():
             extensions=None,
         ),
     )
-    outputs = DTITracker.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTITracker.output_spec(), output_map)
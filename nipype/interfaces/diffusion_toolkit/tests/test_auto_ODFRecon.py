@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..odf import ODFRecon
+from ....testing import assert_spec_metadata
 
 
 def test_ODFRecon_inputs():
@@ -67,11 +68,7 @@ def test_ODFRecon_inputs():
             argstr="-bg",
         ),
     )
-    inputs = ODFRecon.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ODFRecon.input_spec(), input_map)
 
 
 def test_ODFRecon_outputs():
@@ -92,8 +89,4 @@ def test_ODFRecon_outputs():
             extensions=None,
         ),
     )
-    outputs = ODFRecon.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ODFRecon.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..odf import ODFTracker
+from ....testing import assert_spec_metadata
 
 
 def test_ODFTracker_inputs():
@@ -100,11 +101,7 @@ def test_ODFTracker_inputs():
             argstr="-vorder %s",
         ),
     )
-    inputs = ODFTracker.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ODFTracker.input_spec(), input_map)
 
 
 def test_ODFTracker_outputs():
@@ -113,8 +110,4 @@ def test_ODFTracker_outputs():
             extensions=None,
         ),
     )
-    outputs = ODFTracker.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ODFTracker.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..postproc import TrackMerge
+from ....testing import assert_spec_metadata
 
 
 def test_TrackMerge_inputs():
@@ -23,11 +24,7 @@ def test_TrackMerge_inputs():
             position=0,
         ),
     )
-    inputs = TrackMerge.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackMerge.input_spec(), input_map)
 
 
 def test_TrackMerge_outputs():
@@ -36,8 +33,4 @@ def test_TrackMerge_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackMerge.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackMerge.output_spec(), output_map)
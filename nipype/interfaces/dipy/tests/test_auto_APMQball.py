@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..anisotropic_power import APMQball
+from ....testing import assert_spec_metadata
 
 
 def test_APMQball_inputs():
@@ -24,11 +25,7 @@ def test_APMQball_inputs():
         ),
         out_prefix=dict(),
     )
-    inputs = APMQball.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(APMQball.input_spec(), input_map)
 
 
 def test_APMQball_outputs():
@@ -37,8 +34,4 @@ def test_APMQball_outputs():
             extensions=None,
         ),
     )
-    outputs = APMQball.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(APMQball.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reconstruction import CSD
+from ....testing import assert_spec_metadata
 
 
 def test_CSD_inputs():
@@ -36,11 +37,7 @@ def test_CSD_inputs():
             usedefault=True,
         ),
     )
-    inputs = CSD.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CSD.input_spec(), input_map)
 
 
 def test_CSD_outputs():
@@ -52,8 +49,4 @@ def test_CSD_outputs():
             extensions=None,
         ),
     )
-    outputs = CSD.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CSD.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tensors import DTI
+from ....testing import assert_spec_metadata
 
 
 def test_DTI_inputs():
@@ -24,11 +25,7 @@ def test_DTI_inputs():
         ),
         out_prefix=dict(),
     )
-    inputs = DTI.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTI.input_spec(), input_map)
 
 
 def test_DTI_outputs():
@@ -52,8 +49,4 @@ def test_DTI_outputs():
             extensions=None,
         ),
     )
-    outputs = DTI.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTI.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import DipyDiffusionInterface
+from ....testing import assert_spec_metadata
 
 
 def test_DipyDiffusionInterface_inputs():
@@ -21,8 +22,4 @@ def test_DipyDiffusionInterface_inputs():
         ),
         out_prefix=dict(),
     )
-    inputs = DipyDiffusionInterface.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DipyDiffusionInterface.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reconstruction import EstimateResponseSH
+from ....testing import assert_spec_metadata
 
 
 def test_EstimateResponseSH_inputs():
@@ -48,11 +49,7 @@ def test_EstimateResponseSH_inputs():
             usedefault=True,
         ),
     )
-    inputs = EstimateResponseSH.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateResponseSH.input_spec(), input_map)
 
 
 def test_EstimateResponseSH_outputs():
@@ -64,8 +61,4 @@ def test_EstimateResponseSH_outputs():
             extensions=None,
         ),
     )
-    outputs = EstimateResponseSH.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateResponseSH.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reconstruction import RESTORE
+from ....testing import assert_spec_metadata
 
 
 def test_RESTORE_inputs():
@@ -27,11 +28,7 @@ def test_RESTORE_inputs():
         ),
         out_prefix=dict(),
     )
-    inputs = RESTORE.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RESTORE.input_spec(), input_map)
 
 
 def test_RESTORE_outputs():
@@ -58,8 +55,4 @@ def test_RESTORE_outputs():
             extensions=None,
         ),
     )
-    outputs = RESTORE.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RESTORE.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..simulate import SimulateMultiTensor
+from ....testing import assert_spec_metadata
 
 
 def test_SimulateMultiTensor_inputs():
@@ -64,11 +65,7 @@ def test_SimulateMultiTensor_inputs():
             usedefault=True,
         ),
     )
-    inputs = SimulateMultiTensor.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimulateMultiTensor.input_spec(), input_map)
 
 
 def test_SimulateMultiTensor_outputs():
@@ -86,8 +83,4 @@ def test_SimulateMultiTensor_outputs():
             extensions=None,
         ),
     )
-    outputs = SimulateMultiTensor.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimulateMultiTensor.output_spec(), output_map)
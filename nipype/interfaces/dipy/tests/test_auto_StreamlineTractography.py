@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracks import StreamlineTractography
+from ....testing import assert_spec_metadata
 
 
 def test_StreamlineTractography_inputs():
@@ -49,11 +50,7 @@ def test_StreamlineTractography_inputs():
             extensions=None,
         ),
     )
-    inputs = StreamlineTractography.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(StreamlineTractography.input_spec(), input_map)
 
 
 def test_StreamlineTractography_outputs():
@@ -71,8 +68,4 @@ def test_StreamlineTractography_outputs():
             extensions=None,
         ),
     )
-    outputs = StreamlineTractography.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(StreamlineTractography.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tensors import TensorMode
+from ....testing import assert_spec_metadata
 
 
 def test_TensorMode_inputs():
@@ -24,11 +25,7 @@ def test_TensorMode_inputs():
         ),
         out_prefix=dict(),
     )
-    inputs = TensorMode.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TensorMode.input_spec(), input_map)
 
 
 def test_TensorMode_outputs():
@@ -37,8 +34,4 @@ def test_TensorMode_outputs():
             extensions=None,
         ),
     )
-    outputs = TensorMode.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TensorMode.output_spec(), output_map)
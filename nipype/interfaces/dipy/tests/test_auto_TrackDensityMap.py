@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracks import TrackDensityMap
+from ....testing import assert_spec_metadata
 
 
 def test_TrackDensityMap_inputs():
@@ -21,11 +22,7 @@ def test_TrackDensityMap_inputs():
         ),
         voxel_dims=dict(),
     )
-    inputs = TrackDensityMap.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackDensityMap.input_spec(), input_map)
 
 
 def test_TrackDensityMap_outputs():
@@ -34,8 +31,4 @@ def test_TrackDensityMap_outputs():
             extensions=None,
         ),
     )
-    outputs = TrackDensityMap.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrackDensityMap.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import AffScalarVol
+from ....testing import assert_spec_metadata
 
 
 def test_AffScalarVol_inputs():
@@ -50,11 +51,7 @@ def test_AffScalarVol_inputs():
             xor=["transform"],
         ),
     )
-    inputs = AffScalarVol.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AffScalarVol.input_spec(), input_map)
 
 
 def test_AffScalarVol_outputs():
@@ -63,8 +60,4 @@ def test_AffScalarVol_outputs():
             extensions=None,
         ),
     )
-    outputs = AffScalarVol.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AffScalarVol.output_spec(), output_map)
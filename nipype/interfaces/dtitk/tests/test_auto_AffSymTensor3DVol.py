@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import AffSymTensor3DVol
+from ....testing import assert_spec_metadata
 
 
 def test_AffSymTensor3DVol_inputs():
@@ -54,11 +55,7 @@ def test_AffSymTensor3DVol_inputs():
             xor=["transform"],
         ),
     )
-    inputs = AffSymTensor3DVol.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AffSymTensor3DVol.input_spec(), input_map)
 
 
 def test_AffSymTensor3DVol_outputs():
@@ -67,8 +64,4 @@ def test_AffSymTensor3DVol_outputs():
             extensions=None,
         ),
     )
-    outputs = AffSymTensor3DVol.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AffSymTensor3DVol.output_spec(), output_map)
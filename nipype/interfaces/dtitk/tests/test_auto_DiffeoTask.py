@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import DiffeoTask
+from ....testing import assert_spec_metadata
 
 
 def test_DiffeoTask_inputs():
@@ -46,11 +47,7 @@ def test_DiffeoTask_inputs():
             usedefault=True,
         ),
     )
-    inputs = DiffeoTask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DiffeoTask.input_spec(), input_map)
 
 
 def test_DiffeoTask_outputs():
@@ -62,8 +59,4 @@ def test_DiffeoTask_outputs():
             extensions=None,
         ),
     )
-    outputs = DiffeoTask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DiffeoTask.output_spec(), output_map)
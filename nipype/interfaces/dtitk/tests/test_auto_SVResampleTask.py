@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SVResampleTask
+from ....testing import assert_spec_metadata
 
 
 def test_SVResampleTask_inputs():
@@ -44,11 +45,7 @@ def test_SVResampleTask_inputs():
             xor=["target_file"],
         ),
     )
-    inputs = SVResampleTask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SVResampleTask.input_spec(), input_map)
 
 
 def test_SVResampleTask_outputs():
@@ -57,8 +54,4 @@ def test_SVResampleTask_outputs():
             extensions=None,
         ),
     )
-    outputs = SVResampleTask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SVResampleTask.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TVAdjustVoxSp
+from ....testing import assert_spec_metadata
 
 
 def test_TVAdjustVoxSp_inputs():
@@ -37,11 +38,7 @@ def test_TVAdjustVoxSp_inputs():
             xor=["target_file"],
         ),
     )
-    inputs = TVAdjustVoxSp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TVAdjustVoxSp.input_spec(), input_map)
 
 
 def test_TVAdjustVoxSp_outputs():
@@ -50,8 +47,4 @@ def test_TVAdjustVoxSp_outputs():
             extensions=None,
         ),
     )
-    outputs = TVAdjustVoxSp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TVAdjustVoxSp.output_spec(), output_map)
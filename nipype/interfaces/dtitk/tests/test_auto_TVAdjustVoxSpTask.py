@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TVAdjustVoxSpTask
+from ....testing import assert_spec_metadata
 
 
 def test_TVAdjustVoxSpTask_inputs():
@@ -37,11 +38,7 @@ def test_TVAdjustVoxSpTask_inputs():
             xor=["target_file"],
         ),
     )
-    inputs = TVAdjustVoxSpTask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TVAdjustVoxSpTask.input_spec(), input_map)
 
 
 def test_TVAdjustVoxSpTask_outputs():
@@ -50,8 +47,4 @@ def test_TVAdjustVoxSpTask_outputs():
             extensions=None,
         ),
     )
-    outputs = TVAdjustVoxSpTask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TVAdjustVoxSpTask.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TVResampleTask
+from ....testing import assert_spec_metadata
 
 
 def test_TVResampleTask_inputs():
@@ -47,11 +48,7 @@ def test_TVResampleTask_inputs():
             xor=["target_file"],
         ),
     )
-    inputs = TVResampleTask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TVResampleTask.input_spec(), input_map)
 
 
 def test_TVResampleTask_outputs():
@@ -60,8 +57,4 @@ def test_TVResampleTask_outputs():
             extensions=None,
         ),
     )
-    outputs = TVResampleTask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TVResampleTask.output_spec(), output_map)
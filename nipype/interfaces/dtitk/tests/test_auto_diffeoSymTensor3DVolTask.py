@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import diffeoSymTensor3DVolTask
+from ....testing import assert_spec_metadata
 
 
 def test_diffeoSymTensor3DVolTask_inputs():
@@ -56,11 +57,7 @@ def test_diffeoSymTensor3DVolTask_inputs():
             xor=["target"],
         ),
     )
-    inputs = diffeoSymTensor3DVolTask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(diffeoSymTensor3DVolTask.input_spec(), input_map)
 
 
 def test_diffeoSymTensor3DVolTask_outputs():
@@ -69,8 +66,4 @@ def test_diffeoSymTensor3DVolTask_outputs():
             extensions=None,
         ),
     )
-    outputs = diffeoSymTensor3DVolTask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(diffeoSymTensor3DVolTask.output_spec(), output_map)
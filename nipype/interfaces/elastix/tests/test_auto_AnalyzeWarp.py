@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import AnalyzeWarp
+from ....testing import assert_spec_metadata
 
 
 def test_AnalyzeWarp_inputs():
@@ -44,11 +45,7 @@ def test_AnalyzeWarp_inputs():
             mandatory=True,
         ),
     )
-    inputs = AnalyzeWarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AnalyzeWarp.input_spec(), input_map)
 
 
 def test_AnalyzeWarp_outputs():
@@ -63,8 +60,4 @@ def test_AnalyzeWarp_outputs():
             extensions=None,
         ),
     )
-    outputs = AnalyzeWarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AnalyzeWarp.output_spec(), output_map)
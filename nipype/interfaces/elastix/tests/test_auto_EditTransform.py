@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import EditTransform
+from ....testing import assert_spec_metadata
 
 
 def test_EditTransform_inputs():
@@ -25,11 +26,7 @@ def test_EditTransform_inputs():
             mandatory=True,
         ),
     )
-    inputs = EditTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EditTransform.input_spec(), input_map)
 
 
 def test_EditTransform_outputs():
@@ -38,8 +35,4 @@ def test_EditTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = EditTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EditTransform.output_spec(), output_map)
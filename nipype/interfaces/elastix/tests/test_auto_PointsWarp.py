@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import PointsWarp
+from ....testing import assert_spec_metadata
 
 
 def test_PointsWarp_inputs():
@@ -32,11 +33,7 @@ def test_PointsWarp_inputs():
             mandatory=True,
         ),
     )
-    inputs = PointsWarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PointsWarp.input_spec(), input_map)
 
 
 def test_PointsWarp_outputs():
@@ -45,8 +42,4 @@ def test_PointsWarp_outputs():
             extensions=None,
         ),
     )
-    outputs = PointsWarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PointsWarp.output_spec(), output_map)
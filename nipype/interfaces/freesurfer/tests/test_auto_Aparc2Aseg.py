@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Aparc2Aseg
+from ....testing import assert_spec_metadata
 
 
 def test_Aparc2Aseg_inputs():
@@ -86,11 +87,7 @@ def test_Aparc2Aseg_inputs():
             argstr="--volmask",
         ),
     )
-    inputs = Aparc2Aseg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Aparc2Aseg.input_spec(), input_map)
 
 
 def test_Aparc2Aseg_outputs():
@@ -100,8 +97,4 @@ def test_Aparc2Aseg_outputs():
             extensions=None,
         ),
     )
-    outputs = Aparc2Aseg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Aparc2Aseg.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Apas2Aseg
+from ....testing import assert_spec_metadata
 
 
 def test_Apas2Aseg_inputs():
@@ -23,11 +24,7 @@ def test_Apas2Aseg_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = Apas2Aseg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Apas2Aseg.input_spec(), input_map)
 
 
 def test_Apas2Aseg_outputs():
@@ -37,8 +34,4 @@ def test_Apas2Aseg_outputs():
             extensions=None,
         ),
     )
-    outputs = Apas2Aseg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Apas2Aseg.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ApplyMask
+from ....testing import assert_spec_metadata
 
 
 def test_ApplyMask_inputs():
@@ -61,11 +62,7 @@ def test_ApplyMask_inputs():
             extensions=None,
         ),
     )
-    inputs = ApplyMask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyMask.input_spec(), input_map)
 
 
 def test_ApplyMask_outputs():
@@ -74,8 +71,4 @@ def test_ApplyMask_outputs():
             extensions=None,
         ),
     )
-    outputs = ApplyMask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyMask.output_spec(), output_map)
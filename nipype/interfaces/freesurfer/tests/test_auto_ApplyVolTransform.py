@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ApplyVolTransform
+from ....testing import assert_spec_metadata
 
 
 def test_ApplyVolTransform_inputs():
@@ -182,11 +183,7 @@ def test_ApplyVolTransform_inputs():
             ),
         ),
     )
-    inputs = ApplyVolTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyVolTransform.input_spec(), input_map)
 
 
 def test_ApplyVolTransform_outputs():
@@ -195,8 +192,4 @@ def test_ApplyVolTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = ApplyVolTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyVolTransform.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Binarize
+from ....testing import assert_spec_metadata
 
 
 def test_Binarize_inputs():
@@ -101,11 +102,7 @@ def test_Binarize_inputs():
             argstr="--zero-slice-edges",
         ),
     )
-    inputs = Binarize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Binarize.input_spec(), input_map)
 
 
 def test_Binarize_outputs():
@@ -117,8 +114,4 @@ def test_Binarize_outputs():
             extensions=None,
         ),
     )
-    outputs = Binarize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Binarize.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import CALabel
+from ....testing import assert_spec_metadata
 
 
 def test_CALabel_inputs():
@@ -66,11 +67,7 @@ def test_CALabel_inputs():
             position=-3,
         ),
     )
-    inputs = CALabel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CALabel.input_spec(), input_map)
 
 
 def test_CALabel_outputs():
@@ -79,8 +76,4 @@ def test_CALabel_outputs():
             extensions=None,
         ),
     )
-    outputs = CALabel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CALabel.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import CANormalize
+from ....testing import assert_spec_metadata
 
 
 def test_CANormalize_inputs():
@@ -52,11 +53,7 @@ def test_CANormalize_inputs():
             position=-2,
         ),
     )
-    inputs = CANormalize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CANormalize.input_spec(), input_map)
 
 
 def test_CANormalize_outputs():
@@ -68,8 +65,4 @@ def test_CANormalize_outputs():
             extensions=None,
         ),
     )
-    outputs = CANormalize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CANormalize.output_spec(), output_map)
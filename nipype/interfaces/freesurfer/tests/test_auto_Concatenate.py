@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Concatenate
+from ....testing import assert_spec_metadata
 
 
 def test_Concatenate_inputs():
@@ -69,11 +70,7 @@ def test_Concatenate_inputs():
             argstr="--vote",
         ),
     )
-    inputs = Concatenate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Concatenate.input_spec(), input_map)
 
 
 def test_Concatenate_outputs():
@@ -82,8 +79,4 @@ def test_Concatenate_outputs():
             extensions=None,
         ),
     )
-    outputs = Concatenate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Concatenate.output_spec(), output_map)
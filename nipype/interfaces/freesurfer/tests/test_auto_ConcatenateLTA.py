@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ConcatenateLTA
+from ....testing import assert_spec_metadata
 
 
 def test_ConcatenateLTA_inputs():
@@ -60,11 +61,7 @@ def test_ConcatenateLTA_inputs():
             requires=["tal_source_file"],
         ),
     )
-    inputs = ConcatenateLTA.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConcatenateLTA.input_spec(), input_map)
 
 
 def test_ConcatenateLTA_outputs():
@@ -73,8 +70,4 @@ def test_ConcatenateLTA_outputs():
             extensions=None,
         ),
     )
-    outputs = ConcatenateLTA.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConcatenateLTA.output_spec(), output_map)
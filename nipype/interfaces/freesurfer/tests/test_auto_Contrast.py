@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Contrast
+from ....testing import assert_spec_metadata
 
 
 def test_Contrast_inputs():
@@ -47,11 +48,7 @@ def test_Contrast_inputs():
             mandatory=True,
         ),
     )
-    inputs = Contrast.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Contrast.input_spec(), input_map)
 
 
 def test_Contrast_outputs():
@@ -66,8 +63,4 @@ def test_Contrast_outputs():
             extensions=None,
         ),
     )
-    outputs = Contrast.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Contrast.output_spec(), output_map)
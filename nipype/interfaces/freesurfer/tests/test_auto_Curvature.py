@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Curvature
+from ....testing import assert_spec_metadata
 
 
 def test_Curvature_inputs():
@@ -36,11 +37,7 @@ def test_Curvature_inputs():
             argstr="-thresh %.3f",
         ),
     )
-    inputs = Curvature.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Curvature.input_spec(), input_map)
 
 
 def test_Curvature_outputs():
@@ -52,8 +49,4 @@ def test_Curvature_outputs():
             extensions=None,
         ),
     )
-    outputs = Curvature.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Curvature.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import DICOMConvert
+from ....testing import assert_spec_metadata
 
 
 def test_DICOMConvert_inputs():
@@ -36,8 +37,4 @@ def test_DICOMConvert_inputs():
         subject_id=dict(),
         subjects_dir=dict(),
     )
-    inputs = DICOMConvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DICOMConvert.input_spec(), input_map)
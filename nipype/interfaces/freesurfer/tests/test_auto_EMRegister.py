@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import EMRegister
+from ....testing import assert_spec_metadata
 
 
 def test_EMRegister_inputs():
@@ -49,11 +50,7 @@ def test_EMRegister_inputs():
             extensions=None,
         ),
     )
-    inputs = EMRegister.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EMRegister.input_spec(), input_map)
 
 
 def test_EMRegister_outputs():
@@ -62,8 +59,4 @@ def test_EMRegister_outputs():
             extensions=None,
         ),
     )
-    outputs = EMRegister.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EMRegister.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import EulerNumber
+from ....testing import assert_spec_metadata
 
 
 def test_EulerNumber_inputs():
@@ -19,11 +20,7 @@ def test_EulerNumber_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = EulerNumber.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EulerNumber.input_spec(), input_map)
 
 
 def test_EulerNumber_outputs():
@@ -31,8 +28,4 @@ def test_EulerNumber_outputs():
         defects=dict(),
         euler=dict(),
     )
-    outputs = EulerNumber.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EulerNumber.output_spec(), output_map)
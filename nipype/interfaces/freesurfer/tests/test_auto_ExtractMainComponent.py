@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ExtractMainComponent
+from ....testing import assert_spec_metadata
 
 
 def test_ExtractMainComponent_inputs():
@@ -25,11 +26,7 @@ def test_ExtractMainComponent_inputs():
             position=2,
         ),
     )
-    inputs = ExtractMainComponent.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractMainComponent.input_spec(), input_map)
 
 
 def test_ExtractMainComponent_outputs():
@@ -38,8 +35,4 @@ def test_ExtractMainComponent_outputs():
             extensions=None,
         ),
     )
-    outputs = ExtractMainComponent.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractMainComponent.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import FSCommandOpenMP
+from ....testing import assert_spec_metadata
 
 
 def test_FSCommandOpenMP_inputs():
@@ -14,8 +15,4 @@ def test_FSCommandOpenMP_inputs():
         num_threads=dict(),
         subjects_dir=dict(),
     )
-    inputs = FSCommandOpenMP.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FSCommandOpenMP.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import FSScriptCommand
+from ....testing import assert_spec_metadata
 
 
 def test_FSScriptCommand_inputs():
@@ -13,8 +14,4 @@ def test_FSScriptCommand_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = FSScriptCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FSScriptCommand.input_spec(), input_map)
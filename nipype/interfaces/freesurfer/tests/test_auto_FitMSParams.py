@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import FitMSParams
+from ....testing import assert_spec_metadata
 
 
 def test_FitMSParams_inputs():
@@ -27,11 +28,7 @@ def test_FitMSParams_inputs():
         tr_list=dict(),
         xfm_list=dict(),
     )
-    inputs = FitMSParams.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitMSParams.input_spec(), input_map)
 
 
 def test_FitMSParams_outputs():
@@ -46,8 +43,4 @@ def test_FitMSParams_outputs():
             extensions=None,
         ),
     )
-    outputs = FitMSParams.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitMSParams.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import GLMFit
+from ....testing import assert_spec_metadata
 
 
 def test_GLMFit_inputs():
@@ -219,11 +220,7 @@ def test_GLMFit_inputs():
             xor=("weight_file", "weight_inv", "weight_sqrt"),
         ),
     )
-    inputs = GLMFit.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GLMFit.input_spec(), input_map)
 
 
 def test_GLMFit_outputs():
@@ -276,8 +273,4 @@ def test_GLMFit_outputs():
             extensions=None,
         ),
     )
-    outputs = GLMFit.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GLMFit.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..petsurfer import GTMPVC
+from ....testing import assert_spec_metadata
 
 
 def test_GTMPVC_inputs():
@@ -198,11 +199,7 @@ def test_GTMPVC_inputs():
             argstr="--y",
         ),
     )
-    inputs = GTMPVC.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GTMPVC.input_spec(), input_map)
 
 
 def test_GTMPVC_outputs():
@@ -284,8 +281,4 @@ def test_GTMPVC_outputs():
             extensions=None,
         ),
     )
-    outputs = GTMPVC.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GTMPVC.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..petsurfer import GTMSeg
+from ....testing import assert_spec_metadata
 
 
 def test_GTMSeg_inputs():
@@ -68,11 +69,7 @@ def test_GTMSeg_inputs():
             argstr="--xcerseg",
         ),
     )
-    inputs = GTMSeg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GTMSeg.input_spec(), input_map)
 
 
 def test_GTMSeg_outputs():
@@ -81,8 +78,4 @@ def test_GTMSeg_outputs():
             extensions=None,
         ),
     )
-    outputs = GTMSeg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GTMSeg.output_spec(), output_map)
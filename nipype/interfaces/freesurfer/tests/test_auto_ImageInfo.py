@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ImageInfo
+from ....testing import assert_spec_metadata
 
 
 def test_ImageInfo_inputs():
@@ -18,11 +19,7 @@ def test_ImageInfo_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = ImageInfo.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageInfo.input_spec(), input_map)
 
 
 def test_ImageInfo_outputs():
@@ -41,8 +38,4 @@ def test_ImageInfo_outputs():
         ph_enc_dir=dict(),
         vox_sizes=dict(),
     )
-    outputs = ImageInfo.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageInfo.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import LTAConvert
+from ....testing import assert_spec_metadata
 
 
 def test_LTAConvert_inputs():
@@ -80,11 +81,7 @@ def test_LTAConvert_inputs():
             extensions=None,
         ),
     )
-    inputs = LTAConvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LTAConvert.input_spec(), input_map)
 
 
 def test_LTAConvert_outputs():
@@ -105,8 +102,4 @@ def test_LTAConvert_outputs():
             extensions=None,
         ),
     )
-    outputs = LTAConvert.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LTAConvert.output_spec(), output_map)
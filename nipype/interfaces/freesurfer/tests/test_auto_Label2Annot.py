@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Label2Annot
+from ....testing import assert_spec_metadata
 
 
 def test_Label2Annot_inputs():
@@ -45,11 +46,7 @@ def test_Label2Annot_inputs():
             argstr="--noverbose",
         ),
     )
-    inputs = Label2Annot.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Label2Annot.input_spec(), input_map)
 
 
 def test_Label2Annot_outputs():
@@ -58,8 +55,4 @@ def test_Label2Annot_outputs():
             extensions=None,
         ),
     )
-    outputs = Label2Annot.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Label2Annot.output_spec(), output_map)
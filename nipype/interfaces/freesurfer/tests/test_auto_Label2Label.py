@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Label2Label
+from ....testing import assert_spec_metadata
 
 
 def test_Label2Label_inputs():
@@ -60,11 +61,7 @@ def test_Label2Label_inputs():
             mandatory=True,
         ),
     )
-    inputs = Label2Label.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Label2Label.input_spec(), input_map)
 
 
 def test_Label2Label_outputs():
@@ -73,8 +70,4 @@ def test_Label2Label_outputs():
             extensions=None,
         ),
     )
-    outputs = Label2Label.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Label2Label.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Label2Vol
+from ....testing import assert_spec_metadata
 
 
 def test_Label2Vol_inputs():
@@ -96,11 +97,7 @@ def test_Label2Vol_inputs():
             genfile=True,
         ),
     )
-    inputs = Label2Vol.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Label2Vol.input_spec(), input_map)
 
 
 def test_Label2Vol_outputs():
@@ -109,8 +106,4 @@ def test_Label2Vol_outputs():
             extensions=None,
         ),
     )
-    outputs = Label2Vol.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Label2Vol.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..petsurfer import Logan
+from ....testing import assert_spec_metadata
 
 
 def test_Logan_inputs():
@@ -220,11 +221,7 @@ def test_Logan_inputs():
             xor=("weight_file", "weight_inv", "weight_sqrt"),
         ),
     )
-    inputs = Logan.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Logan.input_spec(), input_map)
 
 
 def test_Logan_outputs():
@@ -277,8 +274,4 @@ def test_Logan_outputs():
             extensions=None,
         ),
     )
-    outputs = Logan.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Logan.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MNIBiasCorrection
+from ....testing import assert_spec_metadata
 
 
 def test_MNIBiasCorrection_inputs():
@@ -53,11 +54,7 @@ def test_MNIBiasCorrection_inputs():
             extensions=None,
         ),
     )
-    inputs = MNIBiasCorrection.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MNIBiasCorrection.input_spec(), input_map)
 
 
 def test_MNIBiasCorrection_outputs():
@@ -66,8 +63,4 @@ def test_MNIBiasCorrection_outputs():
             extensions=None,
         ),
     )
-    outputs = MNIBiasCorrection.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MNIBiasCorrection.output_spec(), output_map)
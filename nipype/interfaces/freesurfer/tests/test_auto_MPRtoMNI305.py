@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import MPRtoMNI305
+from ....testing import assert_spec_metadata
 
 
 def test_MPRtoMNI305_inputs():
@@ -26,11 +27,7 @@ def test_MPRtoMNI305_inputs():
             usedefault=True,
         ),
     )
-    inputs = MPRtoMNI305.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MPRtoMNI305.input_spec(), input_map)
 
 
 def test_MPRtoMNI305_outputs():
@@ -43,8 +40,4 @@ def test_MPRtoMNI305_outputs():
             extensions=None,
         ),
     )
-    outputs = MPRtoMNI305.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MPRtoMNI305.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MRIConvert
+from ....testing import assert_spec_metadata
 
 
 def test_MRIConvert_inputs():
@@ -276,19 +277,11 @@ def test_MRIConvert_inputs():
             argstr="--zero_outlines",
         ),
     )
-    inputs = MRIConvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIConvert.input_spec(), input_map)
 
 
 def test_MRIConvert_outputs():
     output_map = dict(
         out_file=dict(),
     )
-    outputs = MRIConvert.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIConvert.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import MRICoreg
+from ....testing import assert_spec_metadata
 
 
 def test_MRICoreg_inputs():
@@ -117,11 +118,7 @@ def test_MRICoreg_inputs():
             argstr="--sd %s",
         ),
     )
-    inputs = MRICoreg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRICoreg.input_spec(), input_map)
 
 
 def test_MRICoreg_outputs():
@@ -136,8 +133,4 @@ def test_MRICoreg_outputs():
             extensions=None,
         ),
     )
-    outputs = MRICoreg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRICoreg.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRIFill
+from ....testing import assert_spec_metadata
 
 
 def test_MRIFill_inputs():
@@ -37,11 +38,7 @@ def test_MRIFill_inputs():
             extensions=None,
         ),
     )
-    inputs = MRIFill.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIFill.input_spec(), input_map)
 
 
 def test_MRIFill_outputs():
@@ -53,8 +50,4 @@ def test_MRIFill_outputs():
             extensions=None,
         ),
     )
-    outputs = MRIFill.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIFill.output_spec(), output_map)
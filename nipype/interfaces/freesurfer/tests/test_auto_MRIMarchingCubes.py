@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRIMarchingCubes
+from ....testing import assert_spec_metadata
 
 
 def test_MRIMarchingCubes_inputs():
@@ -35,11 +36,7 @@ def test_MRIMarchingCubes_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = MRIMarchingCubes.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIMarchingCubes.input_spec(), input_map)
 
 
 def test_MRIMarchingCubes_outputs():
@@ -48,8 +45,4 @@ def test_MRIMarchingCubes_outputs():
             extensions=None,
         ),
     )
-    outputs = MRIMarchingCubes.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIMarchingCubes.output_spec(), output_map)
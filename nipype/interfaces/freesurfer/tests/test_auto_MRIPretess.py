@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRIPretess
+from ....testing import assert_spec_metadata
 
 
 def test_MRIPretess_inputs():
@@ -48,11 +49,7 @@ def test_MRIPretess_inputs():
             argstr="-test",
         ),
     )
-    inputs = MRIPretess.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIPretess.input_spec(), input_map)
 
 
 def test_MRIPretess_outputs():
@@ -61,8 +58,4 @@ def test_MRIPretess_outputs():
             extensions=None,
         ),
     )
-    outputs = MRIPretess.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIPretess.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import MRISPreproc
+from ....testing import assert_spec_metadata
 
 
 def test_MRISPreproc_inputs():
@@ -83,11 +84,7 @@ def test_MRISPreproc_inputs():
             argstr="--iv %s %s...",
         ),
     )
-    inputs = MRISPreproc.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRISPreproc.input_spec(), input_map)
 
 
 def test_MRISPreproc_outputs():
@@ -96,8 +93,4 @@ def test_MRISPreproc_outputs():
             extensions=None,
         ),
     )
-    outputs = MRISPreproc.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRISPreproc.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import MRISPreprocReconAll
+from ....testing import assert_spec_metadata
 
 
 def test_MRISPreprocReconAll_inputs():
@@ -102,11 +103,7 @@ def test_MRISPreprocReconAll_inputs():
             argstr="--iv %s %s...",
         ),
     )
-    inputs = MRISPreprocReconAll.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRISPreprocReconAll.input_spec(), input_map)
 
 
 def test_MRISPreprocReconAll_outputs():
@@ -115,8 +112,4 @@ def test_MRISPreprocReconAll_outputs():
             extensions=None,
         ),
     )
-    outputs = MRISPreprocReconAll.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRISPreprocReconAll.output_spec(), output_map)
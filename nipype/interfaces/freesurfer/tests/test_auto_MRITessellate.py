@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRITessellate
+from ....testing import assert_spec_metadata
 
 
 def test_MRITessellate_inputs():
@@ -36,11 +37,7 @@ def test_MRITessellate_inputs():
             argstr="-n",
         ),
     )
-    inputs = MRITessellate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRITessellate.input_spec(), input_map)
 
 
 def test_MRITessellate_outputs():
@@ -49,8 +46,4 @@ def test_MRITessellate_outputs():
             extensions=None,
         ),
     )
-    outputs = MRITessellate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRITessellate.output_spec(), output_map)
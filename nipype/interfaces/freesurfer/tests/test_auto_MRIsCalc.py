@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRIsCalc
+from ....testing import assert_spec_metadata
 
 
 def test_MRIsCalc_inputs():
@@ -45,11 +46,7 @@ def test_MRIsCalc_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = MRIsCalc.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsCalc.input_spec(), input_map)
 
 
 def test_MRIsCalc_outputs():
@@ -58,8 +55,4 @@ def test_MRIsCalc_outputs():
             extensions=None,
         ),
     )
-    outputs = MRIsCalc.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsCalc.output_spec(), output_map)
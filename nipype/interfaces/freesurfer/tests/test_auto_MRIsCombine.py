@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRIsCombine
+from ....testing import assert_spec_metadata
 
 
 def test_MRIsCombine_inputs():
@@ -25,11 +26,7 @@ def test_MRIsCombine_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = MRIsCombine.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsCombine.input_spec(), input_map)
 
 
 def test_MRIsCombine_outputs():
@@ -38,8 +35,4 @@ def test_MRIsCombine_outputs():
             extensions=None,
         ),
     )
-    outputs = MRIsCombine.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsCombine.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRIsConvert
+from ....testing import assert_spec_metadata
 
 
 def test_MRIsConvert_inputs():
@@ -88,11 +89,7 @@ def test_MRIsConvert_inputs():
             argstr="-a",
         ),
     )
-    inputs = MRIsConvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsConvert.input_spec(), input_map)
 
 
 def test_MRIsConvert_outputs():
@@ -101,8 +98,4 @@ def test_MRIsConvert_outputs():
             extensions=None,
         ),
     )
-    outputs = MRIsConvert.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsConvert.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRIsExpand
+from ....testing import assert_spec_metadata
 
 
 def test_MRIsExpand_inputs():
@@ -60,11 +61,7 @@ def test_MRIsExpand_inputs():
             argstr="-W %d",
         ),
     )
-    inputs = MRIsExpand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsExpand.input_spec(), input_map)
 
 
 def test_MRIsExpand_outputs():
@@ -73,8 +70,4 @@ def test_MRIsExpand_outputs():
             extensions=None,
         ),
     )
-    outputs = MRIsExpand.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsExpand.output_spec(), output_map)
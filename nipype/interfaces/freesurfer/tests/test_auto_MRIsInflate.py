@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRIsInflate
+from ....testing import assert_spec_metadata
 
 
 def test_MRIsInflate_inputs():
@@ -37,11 +38,7 @@ def test_MRIsInflate_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = MRIsInflate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsInflate.input_spec(), input_map)
 
 
 def test_MRIsInflate_outputs():
@@ -53,8 +50,4 @@ def test_MRIsInflate_outputs():
             extensions=None,
         ),
     )
-    outputs = MRIsInflate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRIsInflate.output_spec(), output_map)
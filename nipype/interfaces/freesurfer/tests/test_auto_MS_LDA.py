@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import MS_LDA
+from ....testing import assert_spec_metadata
 
 
 def test_MS_LDA_inputs():
@@ -51,11 +52,7 @@ def test_MS_LDA_inputs():
             mandatory=True,
         ),
     )
-    inputs = MS_LDA.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MS_LDA.input_spec(), input_map)
 
 
 def test_MS_LDA_outputs():
@@ -67,8 +64,4 @@ def test_MS_LDA_outputs():
             extensions=None,
         ),
     )
-    outputs = MS_LDA.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MS_LDA.output_spec(), output_map)
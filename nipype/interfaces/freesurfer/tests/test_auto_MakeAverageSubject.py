@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MakeAverageSubject
+from ....testing import assert_spec_metadata
 
 
 def test_MakeAverageSubject_inputs():
@@ -23,19 +24,11 @@ def test_MakeAverageSubject_inputs():
             sep=" ",
         ),
     )
-    inputs = MakeAverageSubject.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MakeAverageSubject.input_spec(), input_map)
 
 
 def test_MakeAverageSubject_outputs():
     output_map = dict(
         average_subject_name=dict(),
     )
-    outputs = MakeAverageSubject.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MakeAverageSubject.output_spec(), output_map)
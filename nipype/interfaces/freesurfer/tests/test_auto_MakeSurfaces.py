@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MakeSurfaces
+from ....testing import assert_spec_metadata
 
 
 def test_MakeSurfaces_inputs():
@@ -87,11 +88,7 @@ def test_MakeSurfaces_inputs():
             argstr="-whiteonly",
         ),
     )
-    inputs = MakeSurfaces.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MakeSurfaces.input_spec(), input_map)
 
 
 def test_MakeSurfaces_outputs():
@@ -115,8 +112,4 @@ def test_MakeSurfaces_outputs():
             extensions=None,
         ),
     )
-    outputs = MakeSurfaces.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MakeSurfaces.output_spec(), output_map)
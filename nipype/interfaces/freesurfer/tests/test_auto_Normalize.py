@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Normalize
+from ....testing import assert_spec_metadata
 
 
 def test_Normalize_inputs():
@@ -42,11 +43,7 @@ def test_Normalize_inputs():
             extensions=None,
         ),
     )
-    inputs = Normalize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Normalize.input_spec(), input_map)
 
 
 def test_Normalize_outputs():
@@ -55,8 +52,4 @@ def test_Normalize_outputs():
             extensions=None,
         ),
     )
-    outputs = Normalize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Normalize.output_spec(), output_map)
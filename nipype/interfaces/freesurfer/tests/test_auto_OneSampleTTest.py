@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import OneSampleTTest
+from ....testing import assert_spec_metadata
 
 
 def test_OneSampleTTest_inputs():
@@ -219,11 +220,7 @@ def test_OneSampleTTest_inputs():
             xor=("weight_file", "weight_inv", "weight_sqrt"),
         ),
     )
-    inputs = OneSampleTTest.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(OneSampleTTest.input_spec(), input_map)
 
 
 def test_OneSampleTTest_outputs():
@@ -276,8 +273,4 @@ def test_OneSampleTTest_outputs():
             extensions=None,
         ),
     )
-    outputs = OneSampleTTest.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(OneSampleTTest.output_spec(), output_map)
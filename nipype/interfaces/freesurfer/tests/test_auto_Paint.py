@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import Paint
+from ....testing import assert_spec_metadata
 
 
 def test_Paint_inputs():
@@ -38,11 +39,7 @@ def test_Paint_inputs():
         ),
         template_param=dict(),
     )
-    inputs = Paint.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Paint.input_spec(), input_map)
 
 
 def test_Paint_outputs():
@@ -51,8 +48,4 @@ def test_Paint_outputs():
             extensions=None,
         ),
     )
-    outputs = Paint.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Paint.output_spec(), output_map)
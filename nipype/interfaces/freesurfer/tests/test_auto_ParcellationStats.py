@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ParcellationStats
+from ....testing import assert_spec_metadata
 
 
 def test_ParcellationStats_inputs():
@@ -108,11 +109,7 @@ def test_ParcellationStats_inputs():
             mandatory=True,
         ),
     )
-    inputs = ParcellationStats.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ParcellationStats.input_spec(), input_map)
 
 
 def test_ParcellationStats_outputs():
@@ -124,8 +121,4 @@ def test_ParcellationStats_outputs():
             extensions=None,
         ),
     )
-    outputs = ParcellationStats.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ParcellationStats.output_spec(), output_map)
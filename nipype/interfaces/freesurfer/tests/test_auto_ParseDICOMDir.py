@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ParseDICOMDir
+from ....testing import assert_spec_metadata
 
 
 def test_ParseDICOMDir_inputs():
@@ -28,11 +29,7 @@ def test_ParseDICOMDir_inputs():
             argstr="--summarize",
         ),
     )
-    inputs = ParseDICOMDir.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ParseDICOMDir.input_spec(), input_map)
 
 
 def test_ParseDICOMDir_outputs():
@@ -41,8 +38,4 @@ def test_ParseDICOMDir_outputs():
             extensions=None,
         ),
     )
-    outputs = ParseDICOMDir.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ParseDICOMDir.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ReconAll
+from ....testing import assert_spec_metadata
 
 
 def test_ReconAll_inputs():
@@ -193,11 +194,7 @@ def test_ReconAll_inputs():
             argstr="-xopts-%s",
         ),
     )
-    inputs = ReconAll.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ReconAll.input_spec(), input_map)
 
 
 def test_ReconAll_outputs():
@@ -342,8 +339,4 @@ def test_ReconAll_outputs():
             loc="stats",
         ),
     )
-    outputs = ReconAll.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ReconAll.output_spec(), output_map)
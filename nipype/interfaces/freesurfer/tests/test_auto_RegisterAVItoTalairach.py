@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import RegisterAVItoTalairach
+from ....testing import assert_spec_metadata
 
 
 def test_RegisterAVItoTalairach_inputs():
@@ -37,11 +38,7 @@ def test_RegisterAVItoTalairach_inputs():
             position=2,
         ),
     )
-    inputs = RegisterAVItoTalairach.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegisterAVItoTalairach.input_spec(), input_map)
 
 
 def test_RegisterAVItoTalairach_outputs():
@@ -54,8 +51,4 @@ def test_RegisterAVItoTalairach_outputs():
             extensions=None,
         ),
     )
-    outputs = RegisterAVItoTalairach.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegisterAVItoTalairach.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import RelabelHypointensities
+from ....testing import assert_spec_metadata
 
 
 def test_RelabelHypointensities_inputs():
@@ -43,11 +44,7 @@ def test_RelabelHypointensities_inputs():
             usedefault=True,
         ),
     )
-    inputs = RelabelHypointensities.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RelabelHypointensities.input_spec(), input_map)
 
 
 def test_RelabelHypointensities_outputs():
@@ -57,8 +54,4 @@ def test_RelabelHypointensities_outputs():
             extensions=None,
         ),
     )
-    outputs = RelabelHypointensities.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RelabelHypointensities.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import RemoveIntersection
+from ....testing import assert_spec_metadata
 
 
 def test_RemoveIntersection_inputs():
@@ -29,11 +30,7 @@ def test_RemoveIntersection_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = RemoveIntersection.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RemoveIntersection.input_spec(), input_map)
 
 
 def test_RemoveIntersection_outputs():
@@ -42,8 +39,4 @@ def test_RemoveIntersection_outputs():
             extensions=None,
         ),
     )
-    outputs = RemoveIntersection.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RemoveIntersection.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import RemoveNeck
+from ....testing import assert_spec_metadata
 
 
 def test_RemoveNeck_inputs():
@@ -43,11 +44,7 @@ def test_RemoveNeck_inputs():
             position=-3,
         ),
     )
-    inputs = RemoveNeck.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RemoveNeck.input_spec(), input_map)
 
 
 def test_RemoveNeck_outputs():
@@ -56,8 +53,4 @@ def test_RemoveNeck_outputs():
             extensions=None,
         ),
     )
-    outputs = RemoveNeck.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RemoveNeck.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Resample
+from ....testing import assert_spec_metadata
 
 
 def test_Resample_inputs():
@@ -29,11 +30,7 @@ def test_Resample_inputs():
             mandatory=True,
         ),
     )
-    inputs = Resample.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Resample.input_spec(), input_map)
 
 
 def test_Resample_outputs():
@@ -42,8 +39,4 @@ def test_Resample_outputs():
             extensions=None,
         ),
     )
-    outputs = Resample.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Resample.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import RobustRegister
+from ....testing import assert_spec_metadata
 
 
 def test_RobustRegister_inputs():
@@ -112,11 +113,7 @@ def test_RobustRegister_inputs():
             argstr="--vox2vox",
         ),
     )
-    inputs = RobustRegister.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobustRegister.input_spec(), input_map)
 
 
 def test_RobustRegister_outputs():
@@ -146,8 +143,4 @@ def test_RobustRegister_outputs():
             extensions=None,
         ),
     )
-    outputs = RobustRegister.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobustRegister.output_spec(), output_map)
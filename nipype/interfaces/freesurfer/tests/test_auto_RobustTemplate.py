@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..longitudinal import RobustTemplate
+from ....testing import assert_spec_metadata
 
 
 def test_RobustTemplate_inputs():
@@ -64,11 +65,7 @@ def test_RobustTemplate_inputs():
             argstr="--lta %s",
         ),
     )
-    inputs = RobustTemplate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobustTemplate.input_spec(), input_map)
 
 
 def test_RobustTemplate_outputs():
@@ -79,8 +76,4 @@ def test_RobustTemplate_outputs():
         scaled_intensity_outputs=dict(),
         transform_outputs=dict(),
     )
-    outputs = RobustTemplate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobustTemplate.output_spec(), output_map)
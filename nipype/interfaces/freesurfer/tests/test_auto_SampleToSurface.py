@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SampleToSurface
+from ....testing import assert_spec_metadata
 
 
 def test_SampleToSurface_inputs():
@@ -138,11 +139,7 @@ def test_SampleToSurface_inputs():
             argstr="--nvox %s",
         ),
     )
-    inputs = SampleToSurface.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SampleToSurface.input_spec(), input_map)
 
 
 def test_SampleToSurface_outputs():
@@ -157,8 +154,4 @@ def test_SampleToSurface_outputs():
             extensions=None,
         ),
     )
-    outputs = SampleToSurface.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SampleToSurface.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import SegStats
+from ....testing import assert_spec_metadata
 
 
 def test_SegStats_inputs():
@@ -150,11 +151,7 @@ def test_SegStats_inputs():
             argstr="--surf-wm-vol",
         ),
     )
-    inputs = SegStats.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SegStats.input_spec(), input_map)
 
 
 def test_SegStats_outputs():
@@ -172,8 +169,4 @@ def test_SegStats_outputs():
             extensions=None,
         ),
     )
-    outputs = SegStats.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SegStats.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import SegStatsReconAll
+from ....testing import assert_spec_metadata
 
 
 def test_SegStatsReconAll_inputs():
@@ -194,11 +195,7 @@ def test_SegStatsReconAll_inputs():
             argstr="--surf-wm-vol",
         ),
     )
-    inputs = SegStatsReconAll.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SegStatsReconAll.input_spec(), input_map)
 
 
 def test_SegStatsReconAll_outputs():
@@ -216,8 +213,4 @@ def test_SegStatsReconAll_outputs():
             extensions=None,
         ),
     )
-    outputs = SegStatsReconAll.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SegStatsReconAll.output_spec(), output_map)
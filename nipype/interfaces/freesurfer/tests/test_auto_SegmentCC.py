@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import SegmentCC
+from ....testing import assert_spec_metadata
 
 
 def test_SegmentCC_inputs():
@@ -42,11 +43,7 @@ def test_SegmentCC_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = SegmentCC.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SegmentCC.input_spec(), input_map)
 
 
 def test_SegmentCC_outputs():
@@ -58,8 +55,4 @@ def test_SegmentCC_outputs():
             extensions=None,
         ),
     )
-    outputs = SegmentCC.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SegmentCC.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import SegmentWM
+from ....testing import assert_spec_metadata
 
 
 def test_SegmentWM_inputs():
@@ -25,11 +26,7 @@ def test_SegmentWM_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = SegmentWM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SegmentWM.input_spec(), input_map)
 
 
 def test_SegmentWM_outputs():
@@ -38,8 +35,4 @@ def test_SegmentWM_outputs():
             extensions=None,
         ),
     )
-    outputs = SegmentWM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SegmentWM.output_spec(), output_map)
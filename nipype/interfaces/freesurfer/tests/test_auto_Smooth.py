@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Smooth
+from ....testing import assert_spec_metadata
 
 
 def test_Smooth_inputs():
@@ -50,11 +51,7 @@ def test_Smooth_inputs():
             argstr="--vol-fwhm %f",
         ),
     )
-    inputs = Smooth.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Smooth.input_spec(), input_map)
 
 
 def test_Smooth_outputs():
@@ -63,8 +60,4 @@ def test_Smooth_outputs():
             extensions=None,
         ),
     )
-    outputs = Smooth.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Smooth.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SmoothTessellation
+from ....testing import assert_spec_metadata
 
 
 def test_SmoothTessellation_inputs():
@@ -64,11 +65,7 @@ def test_SmoothTessellation_inputs():
             argstr="-m",
         ),
     )
-    inputs = SmoothTessellation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SmoothTessellation.input_spec(), input_map)
 
 
 def test_SmoothTessellation_outputs():
@@ -77,8 +74,4 @@ def test_SmoothTessellation_outputs():
             extensions=None,
         ),
     )
-    outputs = SmoothTessellation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SmoothTessellation.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Sphere
+from ....testing import assert_spec_metadata
 
 
 def test_Sphere_inputs():
@@ -39,11 +40,7 @@ def test_Sphere_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = Sphere.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Sphere.input_spec(), input_map)
 
 
 def test_Sphere_outputs():
@@ -52,8 +49,4 @@ def test_Sphere_outputs():
             extensions=None,
         ),
     )
-    outputs = Sphere.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Sphere.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import SphericalAverage
+from ....testing import assert_spec_metadata
 
 
 def test_SphericalAverage_inputs():
@@ -59,11 +60,7 @@ def test_SphericalAverage_inputs():
             position=-6,
         ),
     )
-    inputs = SphericalAverage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SphericalAverage.input_spec(), input_map)
 
 
 def test_SphericalAverage_outputs():
@@ -72,8 +69,4 @@ def test_SphericalAverage_outputs():
             extensions=None,
         ),
     )
-    outputs = SphericalAverage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SphericalAverage.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Surface2VolTransform
+from ....testing import assert_spec_metadata
 
 
 def test_Surface2VolTransform_inputs():
@@ -64,11 +65,7 @@ def test_Surface2VolTransform_inputs():
             name_template="%s_asVol_vertex.nii",
         ),
     )
-    inputs = Surface2VolTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Surface2VolTransform.input_spec(), input_map)
 
 
 def test_Surface2VolTransform_outputs():
@@ -80,8 +77,4 @@ def test_Surface2VolTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = Surface2VolTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Surface2VolTransform.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SurfaceSmooth
+from ....testing import assert_spec_metadata
 
 
 def test_SurfaceSmooth_inputs():
@@ -46,11 +47,7 @@ def test_SurfaceSmooth_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = SurfaceSmooth.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SurfaceSmooth.input_spec(), input_map)
 
 
 def test_SurfaceSmooth_outputs():
@@ -59,8 +56,4 @@ def test_SurfaceSmooth_outputs():
             extensions=None,
         ),
     )
-    outputs = SurfaceSmooth.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SurfaceSmooth.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SurfaceSnapshots
+from ....testing import assert_spec_metadata
 
 
 def test_SurfaceSnapshots_inputs():
@@ -126,19 +127,11 @@ def test_SurfaceSnapshots_inputs():
             argstr="-truncphaseflag 1",
         ),
     )
-    inputs = SurfaceSnapshots.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SurfaceSnapshots.input_spec(), input_map)
 
 
 def test_SurfaceSnapshots_outputs():
     output_map = dict(
         snapshots=dict(),
     )
-    outputs = SurfaceSnapshots.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SurfaceSnapshots.output_spec(), output_map)
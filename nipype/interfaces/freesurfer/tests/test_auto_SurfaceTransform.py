@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SurfaceTransform
+from ....testing import assert_spec_metadata
 
 
 def test_SurfaceTransform_inputs():
@@ -58,11 +59,7 @@ def test_SurfaceTransform_inputs():
             argstr="--tfmt %s",
         ),
     )
-    inputs = SurfaceTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SurfaceTransform.input_spec(), input_map)
 
 
 def test_SurfaceTransform_outputs():
@@ -71,8 +68,4 @@ def test_SurfaceTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = SurfaceTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SurfaceTransform.output_spec(), output_map)
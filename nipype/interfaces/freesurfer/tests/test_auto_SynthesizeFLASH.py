@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import SynthesizeFLASH
+from ....testing import assert_spec_metadata
 
 
 def test_SynthesizeFLASH_inputs():
@@ -49,11 +50,7 @@ def test_SynthesizeFLASH_inputs():
             position=2,
         ),
     )
-    inputs = SynthesizeFLASH.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SynthesizeFLASH.input_spec(), input_map)
 
 
 def test_SynthesizeFLASH_outputs():
@@ -62,8 +59,4 @@ def test_SynthesizeFLASH_outputs():
             extensions=None,
         ),
     )
-    outputs = SynthesizeFLASH.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SynthesizeFLASH.output_spec(), output_map)
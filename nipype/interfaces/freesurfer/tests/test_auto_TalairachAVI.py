@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TalairachAVI
+from ....testing import assert_spec_metadata
 
 
 def test_TalairachAVI_inputs():
@@ -26,11 +27,7 @@ def test_TalairachAVI_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = TalairachAVI.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TalairachAVI.input_spec(), input_map)
 
 
 def test_TalairachAVI_outputs():
@@ -45,8 +42,4 @@ def test_TalairachAVI_outputs():
             extensions=None,
         ),
     )
-    outputs = TalairachAVI.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TalairachAVI.output_spec(), output_map)
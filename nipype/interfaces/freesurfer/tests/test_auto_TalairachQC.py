@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TalairachQC
+from ....testing import assert_spec_metadata
 
 
 def test_TalairachQC_inputs():
@@ -19,11 +20,7 @@ def test_TalairachQC_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = TalairachQC.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TalairachQC.input_spec(), input_map)
 
 
 def test_TalairachQC_outputs():
@@ -33,8 +30,4 @@ def test_TalairachQC_outputs():
             usedefault=True,
         ),
     )
-    outputs = TalairachQC.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TalairachQC.output_spec(), output_map)
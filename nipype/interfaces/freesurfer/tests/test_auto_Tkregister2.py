@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Tkregister2
+from ....testing import assert_spec_metadata
 
 
 def test_Tkregister2_inputs():
@@ -75,11 +76,7 @@ def test_Tkregister2_inputs():
             extensions=None,
         ),
     )
-    inputs = Tkregister2.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Tkregister2.input_spec(), input_map)
 
 
 def test_Tkregister2_outputs():
@@ -94,8 +91,4 @@ def test_Tkregister2_outputs():
             extensions=None,
         ),
     )
-    outputs = Tkregister2.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Tkregister2.output_spec(), output_map)
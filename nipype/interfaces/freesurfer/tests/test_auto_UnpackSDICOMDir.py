@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import UnpackSDICOMDir
+from ....testing import assert_spec_metadata
 
 
 def test_UnpackSDICOMDir_inputs():
@@ -57,8 +58,4 @@ def test_UnpackSDICOMDir_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = UnpackSDICOMDir.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(UnpackSDICOMDir.input_spec(), input_map)
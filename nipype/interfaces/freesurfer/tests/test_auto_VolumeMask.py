@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import VolumeMask
+from ....testing import assert_spec_metadata
 
 
 def test_VolumeMask_inputs():
@@ -64,11 +65,7 @@ def test_VolumeMask_inputs():
         ),
         subjects_dir=dict(),
     )
-    inputs = VolumeMask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(VolumeMask.input_spec(), input_map)
 
 
 def test_VolumeMask_outputs():
@@ -83,8 +80,4 @@ def test_VolumeMask_outputs():
             extensions=None,
         ),
     )
-    outputs = VolumeMask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(VolumeMask.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import WatershedSkullStrip
+from ....testing import assert_spec_metadata
 
 
 def test_WatershedSkullStrip_inputs():
@@ -39,11 +40,7 @@ def test_WatershedSkullStrip_inputs():
             position=-3,
         ),
     )
-    inputs = WatershedSkullStrip.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WatershedSkullStrip.input_spec(), input_map)
 
 
 def test_WatershedSkullStrip_outputs():
@@ -52,8 +49,4 @@ def test_WatershedSkullStrip_outputs():
             extensions=None,
         ),
     )
-    outputs = WatershedSkullStrip.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(WatershedSkullStrip.output_spec(), output_map)
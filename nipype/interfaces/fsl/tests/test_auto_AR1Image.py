@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import AR1Image
+from ....testing import assert_spec_metadata
 
 
 def test_AR1Image_inputs():
@@ -43,11 +44,7 @@ def test_AR1Image_inputs():
         ),
         output_type=dict(),
     )
-    inputs = AR1Image.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AR1Image.input_spec(), input_map)
 
 
 def test_AR1Image_outputs():
@@ -56,8 +53,4 @@ def test_AR1Image_outputs():
             extensions=None,
         ),
     )
-    outputs = AR1Image.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AR1Image.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..fix import AccuracyTester
+from ....testing import assert_spec_metadata
 
 
 def test_AccuracyTester_inputs():
@@ -29,11 +30,7 @@ def test_AccuracyTester_inputs():
             position=1,
         ),
     )
-    inputs = AccuracyTester.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AccuracyTester.input_spec(), input_map)
 
 
 def test_AccuracyTester_outputs():
@@ -43,8 +40,4 @@ def test_AccuracyTester_outputs():
             position=1,
         ),
     )
-    outputs = AccuracyTester.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AccuracyTester.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..epi import ApplyTOPUP
+from ....testing import assert_spec_metadata
 
 
 def test_ApplyTOPUP_inputs():
@@ -53,11 +54,7 @@ def test_ApplyTOPUP_inputs():
         ),
         output_type=dict(),
     )
-    inputs = ApplyTOPUP.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyTOPUP.input_spec(), input_map)
 
 
 def test_ApplyTOPUP_outputs():
@@ -66,8 +63,4 @@ def test_ApplyTOPUP_outputs():
             extensions=None,
         ),
     )
-    outputs = ApplyTOPUP.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyTOPUP.output_spec(), output_map)
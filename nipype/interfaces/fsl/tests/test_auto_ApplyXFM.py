@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ApplyXFM
+from ....testing import assert_spec_metadata
 
 
 def test_ApplyXFM_inputs():
@@ -201,11 +202,7 @@ def test_ApplyXFM_inputs():
             min_ver="5.0.0",
         ),
     )
-    inputs = ApplyXFM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyXFM.input_spec(), input_map)
 
 
 def test_ApplyXFM_outputs():
@@ -220,8 +217,4 @@ def test_ApplyXFM_outputs():
             extensions=None,
         ),
     )
-    outputs = ApplyXFM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyXFM.output_spec(), output_map)
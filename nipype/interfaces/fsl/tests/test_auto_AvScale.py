@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import AvScale
+from ....testing import assert_spec_metadata
 
 
 def test_AvScale_inputs():
@@ -25,11 +26,7 @@ def test_AvScale_inputs():
             position=-1,
         ),
     )
-    inputs = AvScale.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AvScale.input_spec(), input_map)
 
 
 def test_AvScale_outputs():
@@ -45,8 +42,4 @@ def test_AvScale_outputs():
         skews=dict(),
         translations=dict(),
     )
-    outputs = AvScale.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AvScale.output_spec(), output_map)
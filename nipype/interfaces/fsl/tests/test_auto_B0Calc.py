@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..possum import B0Calc
+from ....testing import assert_spec_metadata
 
 
 def test_B0Calc_inputs():
@@ -78,11 +79,7 @@ def test_B0Calc_inputs():
             usedefault=True,
         ),
     )
-    inputs = B0Calc.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(B0Calc.input_spec(), input_map)
 
 
 def test_B0Calc_outputs():
@@ -91,8 +88,4 @@ def test_B0Calc_outputs():
             extensions=None,
         ),
     )
-    outputs = B0Calc.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(B0Calc.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import BEDPOSTX5
+from ....testing import assert_spec_metadata
 
 
 def test_BEDPOSTX5_inputs():
@@ -114,11 +115,7 @@ def test_BEDPOSTX5_inputs():
         ),
         use_gpu=dict(),
     )
-    inputs = BEDPOSTX5.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BEDPOSTX5.input_spec(), input_map)
 
 
 def test_BEDPOSTX5_outputs():
@@ -138,8 +135,4 @@ def test_BEDPOSTX5_outputs():
         merged_phsamples=dict(),
         merged_thsamples=dict(),
     )
-    outputs = BEDPOSTX5.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BEDPOSTX5.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import BET
+from ....testing import assert_spec_metadata
 
 
 def test_BET_inputs():
@@ -144,11 +145,7 @@ def test_BET_inputs():
             argstr="-g %.2f",
         ),
     )
-    inputs = BET.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BET.input_spec(), input_map)
 
 
 def test_BET_outputs():
@@ -190,8 +187,4 @@ def test_BET_outputs():
             extensions=None,
         ),
     )
-    outputs = BET.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BET.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..fix import Classifier
+from ....testing import assert_spec_metadata
 
 
 def test_Classifier_inputs():
@@ -32,11 +33,7 @@ def test_Classifier_inputs():
             position=2,
         ),
     )
-    inputs = Classifier.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Classifier.input_spec(), input_map)
 
 
 def test_Classifier_outputs():
@@ -45,8 +42,4 @@ def test_Classifier_outputs():
             extensions=None,
         ),
     )
-    outputs = Classifier.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Classifier.output_spec(), output_map)
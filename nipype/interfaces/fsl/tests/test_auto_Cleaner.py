@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..fix import Cleaner
+from ....testing import assert_spec_metadata
 
 
 def test_Cleaner_inputs():
@@ -46,11 +47,7 @@ def test_Cleaner_inputs():
             usedefault=True,
         ),
     )
-    inputs = Cleaner.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Cleaner.input_spec(), input_map)
 
 
 def test_Cleaner_outputs():
@@ -59,8 +56,4 @@ def test_Cleaner_outputs():
             extensions=None,
         ),
     )
-    outputs = Cleaner.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Cleaner.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Cluster
+from ....testing import assert_spec_metadata
 
 
 def test_Cluster_inputs():
@@ -109,11 +110,7 @@ def test_Cluster_inputs():
             extensions=None,
         ),
     )
-    inputs = Cluster.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Cluster.input_spec(), input_map)
 
 
 def test_Cluster_outputs():
@@ -143,8 +140,4 @@ def test_Cluster_outputs():
             extensions=None,
         ),
     )
-    outputs = Cluster.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Cluster.output_spec(), output_map)
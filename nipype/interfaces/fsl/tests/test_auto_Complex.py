@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Complex
+from ....testing import assert_spec_metadata
 
 
 def test_Complex_inputs():
@@ -204,11 +205,7 @@ def test_Complex_inputs():
             position=-2,
         ),
     )
-    inputs = Complex.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Complex.input_spec(), input_map)
 
 
 def test_Complex_outputs():
@@ -229,8 +226,4 @@ def test_Complex_outputs():
             extensions=None,
         ),
     )
-    outputs = Complex.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Complex.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import ContrastMgr
+from ....testing import assert_spec_metadata
 
 
 def test_ContrastMgr_inputs():
@@ -52,11 +53,7 @@ def test_ContrastMgr_inputs():
             position=-1,
         ),
     )
-    inputs = ContrastMgr.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ContrastMgr.input_spec(), input_map)
 
 
 def test_ContrastMgr_outputs():
@@ -69,8 +66,4 @@ def test_ContrastMgr_outputs():
         zfstats=dict(),
         zstats=dict(),
     )
-    outputs = ContrastMgr.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ContrastMgr.output_spec(), output_map)
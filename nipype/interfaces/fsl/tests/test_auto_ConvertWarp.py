@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ConvertWarp
+from ....testing import assert_spec_metadata
 
 
 def test_ConvertWarp_inputs():
@@ -80,11 +81,7 @@ def test_ConvertWarp_inputs():
             extensions=None,
         ),
     )
-    inputs = ConvertWarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConvertWarp.input_spec(), input_map)
 
 
 def test_ConvertWarp_outputs():
@@ -93,8 +90,4 @@ def test_ConvertWarp_outputs():
             extensions=None,
         ),
     )
-    outputs = ConvertWarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConvertWarp.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import DTIFit
+from ....testing import assert_spec_metadata
 
 
 def test_DTIFit_inputs():
@@ -77,11 +78,7 @@ def test_DTIFit_inputs():
             argstr="--sse",
         ),
     )
-    inputs = DTIFit.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTIFit.input_spec(), input_map)
 
 
 def test_DTIFit_outputs():
@@ -123,8 +120,4 @@ def test_DTIFit_outputs():
             extensions=None,
         ),
     )
-    outputs = DTIFit.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTIFit.output_spec(), output_map)
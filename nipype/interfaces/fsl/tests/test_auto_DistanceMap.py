@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import DistanceMap
+from ....testing import assert_spec_metadata
 
 
 def test_DistanceMap_inputs():
@@ -35,11 +36,7 @@ def test_DistanceMap_inputs():
         ),
         output_type=dict(),
     )
-    inputs = DistanceMap.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DistanceMap.input_spec(), input_map)
 
 
 def test_DistanceMap_outputs():
@@ -51,8 +48,4 @@ def test_DistanceMap_outputs():
             extensions=None,
         ),
     )
-    outputs = DistanceMap.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DistanceMap.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import DualRegression
+from ....testing import assert_spec_metadata
 
 
 def test_DualRegression_inputs():
@@ -55,19 +56,11 @@ def test_DualRegression_inputs():
         ),
         output_type=dict(),
     )
-    inputs = DualRegression.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DualRegression.input_spec(), input_map)
 
 
 def test_DualRegression_outputs():
     output_map = dict(
         out_dir=dict(),
     )
-    outputs = DualRegression.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DualRegression.output_spec(), output_map)
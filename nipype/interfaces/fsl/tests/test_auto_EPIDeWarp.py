@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..epi import EPIDeWarp
+from ....testing import assert_spec_metadata
 
 
 def test_EPIDeWarp_inputs():
@@ -67,11 +68,7 @@ def test_EPIDeWarp_inputs():
             genfile=True,
         ),
     )
-    inputs = EPIDeWarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EPIDeWarp.input_spec(), input_map)
 
 
 def test_EPIDeWarp_outputs():
@@ -89,8 +86,4 @@ def test_EPIDeWarp_outputs():
             extensions=None,
         ),
     )
-    outputs = EPIDeWarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EPIDeWarp.output_spec(), output_map)
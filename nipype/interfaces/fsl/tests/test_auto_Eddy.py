@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..epi import Eddy
+from ....testing import assert_spec_metadata
 
 
 def test_Eddy_inputs():
@@ -216,11 +217,7 @@ def test_Eddy_inputs():
         ),
         use_cuda=dict(),
     )
-    inputs = Eddy.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Eddy.input_spec(), input_map)
 
 
 def test_Eddy_outputs():
@@ -271,8 +268,4 @@ def test_Eddy_outputs():
             extensions=None,
         ),
     )
-    outputs = Eddy.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Eddy.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..epi import EddyCorrect
+from ....testing import assert_spec_metadata
 
 
 def test_EddyCorrect_inputs():
@@ -33,11 +34,7 @@ def test_EddyCorrect_inputs():
             usedefault=True,
         ),
     )
-    inputs = EddyCorrect.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EddyCorrect.input_spec(), input_map)
 
 
 def test_EddyCorrect_outputs():
@@ -46,8 +43,4 @@ def test_EddyCorrect_outputs():
             extensions=None,
         ),
     )
-    outputs = EddyCorrect.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EddyCorrect.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..epi import EddyQuad
+from ....testing import assert_spec_metadata
 
 
 def test_EddyQuad_inputs():
@@ -58,11 +59,7 @@ def test_EddyQuad_inputs():
             argstr="--verbose",
         ),
     )
-    inputs = EddyQuad.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EddyQuad.input_spec(), input_map)
 
 
 def test_EddyQuad_outputs():
@@ -86,8 +83,4 @@ def test_EddyQuad_outputs():
             extensions=None,
         ),
     )
-    outputs = EddyQuad.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EddyQuad.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..epi import EpiReg
+from ....testing import assert_spec_metadata
 
 
 def test_EpiReg_inputs():
@@ -69,11 +70,7 @@ def test_EpiReg_inputs():
             extensions=None,
         ),
     )
-    inputs = EpiReg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EpiReg.input_spec(), input_map)
 
 
 def test_EpiReg_outputs():
@@ -121,8 +118,4 @@ def test_EpiReg_outputs():
             extensions=None,
         ),
     )
-    outputs = EpiReg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EpiReg.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import ErodeImage
+from ....testing import assert_spec_metadata
 
 
 def test_ErodeImage_inputs():
@@ -58,11 +59,7 @@ def test_ErodeImage_inputs():
         ),
         output_type=dict(),
     )
-    inputs = ErodeImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ErodeImage.input_spec(), input_map)
 
 
 def test_ErodeImage_outputs():
@@ -71,8 +68,4 @@ def test_ErodeImage_outputs():
             extensions=None,
         ),
     )
-    outputs = ErodeImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ErodeImage.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ExtractROI
+from ....testing import assert_spec_metadata
 
 
 def test_ExtractROI_inputs():
@@ -72,11 +73,7 @@ def test_ExtractROI_inputs():
             position=7,
         ),
     )
-    inputs = ExtractROI.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractROI.input_spec(), input_map)
 
 
 def test_ExtractROI_outputs():
@@ -85,8 +82,4 @@ def test_ExtractROI_outputs():
             extensions=None,
         ),
     )
-    outputs = ExtractROI.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractROI.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import FAST
+from ....testing import assert_spec_metadata
 
 
 def test_FAST_inputs():
@@ -86,11 +87,7 @@ def test_FAST_inputs():
             argstr="-v",
         ),
     )
-    inputs = FAST.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FAST.input_spec(), input_map)
 
 
 def test_FAST_outputs():
@@ -110,8 +107,4 @@ def test_FAST_outputs():
             extensions=None,
         ),
     )
-    outputs = FAST.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FAST.output_spec(), output_map)
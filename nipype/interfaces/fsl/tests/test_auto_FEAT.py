@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import FEAT
+from ....testing import assert_spec_metadata
 
 
 def test_FEAT_inputs():
@@ -19,19 +20,11 @@ def test_FEAT_inputs():
         ),
         output_type=dict(),
     )
-    inputs = FEAT.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FEAT.input_spec(), input_map)
 
 
 def test_FEAT_outputs():
     output_map = dict(
         feat_dir=dict(),
     )
-    outputs = FEAT.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FEAT.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import FEATModel
+from ....testing import assert_spec_metadata
 
 
 def test_FEATModel_inputs():
@@ -26,11 +27,7 @@ def test_FEATModel_inputs():
         ),
         output_type=dict(),
     )
-    inputs = FEATModel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FEATModel.input_spec(), input_map)
 
 
 def test_FEATModel_outputs():
@@ -51,8 +48,4 @@ def test_FEATModel_outputs():
             extensions=None,
         ),
     )
-    outputs = FEATModel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FEATModel.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import FEATRegister
+from ....testing import assert_spec_metadata
 
 
 def test_FEATRegister_inputs():
@@ -15,11 +16,7 @@ def test_FEATRegister_inputs():
             mandatory=True,
         ),
     )
-    inputs = FEATRegister.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FEATRegister.input_spec(), input_map)
 
 
 def test_FEATRegister_outputs():
@@ -28,8 +25,4 @@ def test_FEATRegister_outputs():
             extensions=None,
         ),
     )
-    outputs = FEATRegister.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FEATRegister.output_spec(), output_map)
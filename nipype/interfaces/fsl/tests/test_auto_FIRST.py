@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import FIRST
+from ....testing import assert_spec_metadata
 
 
 def test_FIRST_inputs():
@@ -60,11 +61,7 @@ def test_FIRST_inputs():
             position=1,
         ),
     )
-    inputs = FIRST.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FIRST.input_spec(), input_map)
 
 
 def test_FIRST_outputs():
@@ -78,8 +75,4 @@ def test_FIRST_outputs():
         ),
         vtk_surfaces=dict(),
     )
-    outputs = FIRST.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FIRST.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import FLAMEO
+from ....testing import assert_spec_metadata
 
 
 def test_FLAMEO_inputs():
@@ -82,11 +83,7 @@ def test_FLAMEO_inputs():
             extensions=None,
         ),
     )
-    inputs = FLAMEO.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FLAMEO.input_spec(), input_map)
 
 
 def test_FLAMEO_outputs():
@@ -104,8 +101,4 @@ def test_FLAMEO_outputs():
         zfstats=dict(),
         zstats=dict(),
     )
-    outputs = FLAMEO.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FLAMEO.output_spec(), output_map)
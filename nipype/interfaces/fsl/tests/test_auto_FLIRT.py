@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import FLIRT
+from ....testing import assert_spec_metadata
 
 
 def test_FLIRT_inputs():
@@ -200,11 +201,7 @@ def test_FLIRT_inputs():
             min_ver="5.0.0",
         ),
     )
-    inputs = FLIRT.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FLIRT.input_spec(), input_map)
 
 
 def test_FLIRT_outputs():
@@ -219,8 +216,4 @@ def test_FLIRT_outputs():
             extensions=None,
         ),
     )
-    outputs = FLIRT.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FLIRT.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import FNIRT
+from ....testing import assert_spec_metadata
 
 
 def test_FNIRT_inputs():
@@ -169,11 +170,7 @@ def test_FNIRT_inputs():
             hash_files=False,
         ),
     )
-    inputs = FNIRT.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FNIRT.input_spec(), input_map)
 
 
 def test_FNIRT_outputs():
@@ -198,8 +195,4 @@ def test_FNIRT_outputs():
             extensions=None,
         ),
     )
-    outputs = FNIRT.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FNIRT.output_spec(), output_map)
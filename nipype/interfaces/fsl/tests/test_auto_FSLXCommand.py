@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import FSLXCommand
+from ....testing import assert_spec_metadata
 
 
 def test_FSLXCommand_inputs():
@@ -106,11 +107,7 @@ def test_FSLXCommand_inputs():
             usedefault=True,
         ),
     )
-    inputs = FSLXCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FSLXCommand.input_spec(), input_map)
 
 
 def test_FSLXCommand_outputs():
@@ -130,8 +127,4 @@ def test_FSLXCommand_outputs():
         phsamples=dict(),
         thsamples=dict(),
     )
-    outputs = FSLXCommand.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FSLXCommand.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import FUGUE
+from ....testing import assert_spec_metadata
 
 
 def test_FUGUE_inputs():
@@ -126,11 +127,7 @@ def test_FUGUE_inputs():
             xor=["unwarped_file"],
         ),
     )
-    inputs = FUGUE.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FUGUE.input_spec(), input_map)
 
 
 def test_FUGUE_outputs():
@@ -148,8 +145,4 @@ def test_FUGUE_outputs():
             extensions=None,
         ),
     )
-    outputs = FUGUE.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FUGUE.output_spec(), output_map)
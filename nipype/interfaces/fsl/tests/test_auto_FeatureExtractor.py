@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..fix import FeatureExtractor
+from ....testing import assert_spec_metadata
 
 
 def test_FeatureExtractor_inputs():
@@ -17,11 +18,7 @@ def test_FeatureExtractor_inputs():
             position=-1,
         ),
     )
-    inputs = FeatureExtractor.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FeatureExtractor.input_spec(), input_map)
 
 
 def test_FeatureExtractor_outputs():
@@ -32,8 +29,4 @@ def test_FeatureExtractor_outputs():
             position=-1,
         ),
     )
-    outputs = FeatureExtractor.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FeatureExtractor.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import FilterRegressor
+from ....testing import assert_spec_metadata
 
 
 def test_FilterRegressor_inputs():
@@ -54,11 +55,7 @@ def test_FilterRegressor_inputs():
             argstr="--vn",
         ),
     )
-    inputs = FilterRegressor.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FilterRegressor.input_spec(), input_map)
 
 
 def test_FilterRegressor_outputs():
@@ -67,8 +64,4 @@ def test_FilterRegressor_outputs():
             extensions=None,
         ),
     )
-    outputs = FilterRegressor.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FilterRegressor.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import FindTheBiggest
+from ....testing import assert_spec_metadata
 
 
 def test_FindTheBiggest_inputs():
@@ -25,11 +26,7 @@ def test_FindTheBiggest_inputs():
         ),
         output_type=dict(),
     )
-    inputs = FindTheBiggest.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FindTheBiggest.input_spec(), input_map)
 
 
 def test_FindTheBiggest_outputs():
@@ -39,8 +36,4 @@ def test_FindTheBiggest_outputs():
             extensions=None,
         ),
     )
-    outputs = FindTheBiggest.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FindTheBiggest.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import GLM
+from ....testing import assert_spec_metadata
 
 
 def test_GLM_inputs():
@@ -100,11 +101,7 @@ def test_GLM_inputs():
             argstr="--vn",
         ),
     )
-    inputs = GLM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GLM.input_spec(), input_map)
 
 
 def test_GLM_outputs():
@@ -124,8 +121,4 @@ def test_GLM_outputs():
         out_vnscales=dict(),
         out_z=dict(),
     )
-    outputs = GLM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GLM.output_spec(), output_map)
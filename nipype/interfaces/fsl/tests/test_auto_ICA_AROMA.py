@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..aroma import ICA_AROMA
+from ....testing import assert_spec_metadata
 
 
 def test_ICA_AROMA_inputs():
@@ -63,11 +64,7 @@ def test_ICA_AROMA_inputs():
             usedefault=True,
         ),
     )
-    inputs = ICA_AROMA.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ICA_AROMA.input_spec(), input_map)
 
 
 def test_ICA_AROMA_outputs():
@@ -80,8 +77,4 @@ def test_ICA_AROMA_outputs():
         ),
         out_dir=dict(),
     )
-    outputs = ICA_AROMA.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ICA_AROMA.output_spec(), output_map)
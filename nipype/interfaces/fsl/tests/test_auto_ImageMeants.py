@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ImageMeants
+from ....testing import assert_spec_metadata
 
 
 def test_ImageMeants_inputs():
@@ -51,11 +52,7 @@ def test_ImageMeants_inputs():
             argstr="--usemm",
         ),
     )
-    inputs = ImageMeants.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageMeants.input_spec(), input_map)
 
 
 def test_ImageMeants_outputs():
@@ -64,8 +61,4 @@ def test_ImageMeants_outputs():
             extensions=None,
         ),
     )
-    outputs = ImageMeants.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageMeants.output_spec(), output_map)
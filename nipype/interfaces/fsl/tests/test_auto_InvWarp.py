@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import InvWarp
+from ....testing import assert_spec_metadata
 
 
 def test_InvWarp_inputs():
@@ -53,11 +54,7 @@ def test_InvWarp_inputs():
             mandatory=True,
         ),
     )
-    inputs = InvWarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(InvWarp.input_spec(), input_map)
 
 
 def test_InvWarp_outputs():
@@ -66,8 +63,4 @@ def test_InvWarp_outputs():
             extensions=None,
         ),
     )
-    outputs = InvWarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(InvWarp.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import L2Model
+from ....testing import assert_spec_metadata
 
 
 def test_L2Model_inputs():
@@ -8,11 +9,7 @@ def test_L2Model_inputs():
             mandatory=True,
         ),
     )
-    inputs = L2Model.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(L2Model.input_spec(), input_map)
 
 
 def test_L2Model_outputs():
@@ -27,8 +24,4 @@ def test_L2Model_outputs():
             extensions=None,
         ),
     )
-    outputs = L2Model.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(L2Model.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Level1Design
+from ....testing import assert_spec_metadata
 
 
 def test_Level1Design_inputs():
@@ -21,11 +22,7 @@ def test_Level1Design_inputs():
             mandatory=True,
         ),
     )
-    inputs = Level1Design.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Level1Design.input_spec(), input_map)
 
 
 def test_Level1Design_outputs():
@@ -33,8 +30,4 @@ def test_Level1Design_outputs():
         ev_files=dict(),
         fsf_files=dict(),
     )
-    outputs = Level1Design.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Level1Design.output_spec(), output_map)
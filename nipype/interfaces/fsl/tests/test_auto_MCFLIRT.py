@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MCFLIRT
+from ....testing import assert_spec_metadata
 
 
 def test_MCFLIRT_inputs():
@@ -81,11 +82,7 @@ def test_MCFLIRT_inputs():
             argstr="-gdt",
         ),
     )
-    inputs = MCFLIRT.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MCFLIRT.input_spec(), input_map)
 
 
 def test_MCFLIRT_outputs():
@@ -108,8 +105,4 @@ def test_MCFLIRT_outputs():
             extensions=None,
         ),
     )
-    outputs = MCFLIRT.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MCFLIRT.output_spec(), output_map)
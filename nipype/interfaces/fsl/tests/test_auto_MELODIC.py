@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import MELODIC
+from ....testing import assert_spec_metadata
 
 
 def test_MELODIC_inputs():
@@ -170,11 +171,7 @@ def test_MELODIC_inputs():
             argstr="--vn",
         ),
     )
-    inputs = MELODIC.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MELODIC.input_spec(), input_map)
 
 
 def test_MELODIC_outputs():
@@ -182,8 +179,4 @@ def test_MELODIC_outputs():
         out_dir=dict(),
         report_dir=dict(),
     )
-    outputs = MELODIC.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MELODIC.output_spec(), output_map)
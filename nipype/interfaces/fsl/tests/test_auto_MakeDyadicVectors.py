@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import MakeDyadicVectors
+from ....testing import assert_spec_metadata
 
 
 def test_MakeDyadicVectors_inputs():
@@ -41,11 +42,7 @@ def test_MakeDyadicVectors_inputs():
             position=0,
         ),
     )
-    inputs = MakeDyadicVectors.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MakeDyadicVectors.input_spec(), input_map)
 
 
 def test_MakeDyadicVectors_outputs():
@@ -57,8 +54,4 @@ def test_MakeDyadicVectors_outputs():
             extensions=None,
         ),
     )
-    outputs = MakeDyadicVectors.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MakeDyadicVectors.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import MathsCommand
+from ....testing import assert_spec_metadata
 
 
 def test_MathsCommand_inputs():
@@ -38,11 +39,7 @@ def test_MathsCommand_inputs():
         ),
         output_type=dict(),
     )
-    inputs = MathsCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MathsCommand.input_spec(), input_map)
 
 
 def test_MathsCommand_outputs():
@@ -51,8 +48,4 @@ def test_MathsCommand_outputs():
             extensions=None,
         ),
     )
-    outputs = MathsCommand.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MathsCommand.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import MinImage
+from ....testing import assert_spec_metadata
 
 
 def test_MinImage_inputs():
@@ -43,11 +44,7 @@ def test_MinImage_inputs():
         ),
         output_type=dict(),
     )
-    inputs = MinImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MinImage.input_spec(), input_map)
 
 
 def test_MinImage_outputs():
@@ -56,8 +53,4 @@ def test_MinImage_outputs():
             extensions=None,
         ),
     )
-    outputs = MinImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MinImage.output_spec(), output_map)
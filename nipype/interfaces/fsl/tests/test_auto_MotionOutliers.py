@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MotionOutliers
+from ....testing import assert_spec_metadata
 
 
 def test_MotionOutliers_inputs():
@@ -58,11 +59,7 @@ def test_MotionOutliers_inputs():
             argstr="--thresh=%g",
         ),
     )
-    inputs = MotionOutliers.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MotionOutliers.input_spec(), input_map)
 
 
 def test_MotionOutliers_outputs():
@@ -77,8 +74,4 @@ def test_MotionOutliers_outputs():
             extensions=None,
         ),
     )
-    outputs = MotionOutliers.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MotionOutliers.output_spec(), output_map)
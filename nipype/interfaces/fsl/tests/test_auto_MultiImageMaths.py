@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import MultiImageMaths
+from ....testing import assert_spec_metadata
 
 
 def test_MultiImageMaths_inputs():
@@ -46,11 +47,7 @@ def test_MultiImageMaths_inputs():
         ),
         output_type=dict(),
     )
-    inputs = MultiImageMaths.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultiImageMaths.input_spec(), input_map)
 
 
 def test_MultiImageMaths_outputs():
@@ -59,8 +56,4 @@ def test_MultiImageMaths_outputs():
             extensions=None,
         ),
     )
-    outputs = MultiImageMaths.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultiImageMaths.output_spec(), output_map)
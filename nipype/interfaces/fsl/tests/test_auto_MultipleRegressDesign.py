@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import MultipleRegressDesign
+from ....testing import assert_spec_metadata
 
 
 def test_MultipleRegressDesign_inputs():
@@ -12,11 +13,7 @@ def test_MultipleRegressDesign_inputs():
             mandatory=True,
         ),
     )
-    inputs = MultipleRegressDesign.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultipleRegressDesign.input_spec(), input_map)
 
 
 def test_MultipleRegressDesign_outputs():
@@ -34,8 +31,4 @@ def test_MultipleRegressDesign_outputs():
             extensions=None,
         ),
     )
-    outputs = MultipleRegressDesign.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultipleRegressDesign.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Overlay
+from ....testing import assert_spec_metadata
 
 
 def test_Overlay_inputs():
@@ -84,11 +85,7 @@ def test_Overlay_inputs():
             position=3,
         ),
     )
-    inputs = Overlay.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Overlay.input_spec(), input_map)
 
 
 def test_Overlay_outputs():
@@ -97,8 +94,4 @@ def test_Overlay_outputs():
             extensions=None,
         ),
     )
-    outputs = Overlay.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Overlay.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import PRELUDE
+from ....testing import assert_spec_metadata
 
 
 def test_PRELUDE_inputs():
@@ -82,11 +83,7 @@ def test_PRELUDE_inputs():
             hash_files=False,
         ),
     )
-    inputs = PRELUDE.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PRELUDE.input_spec(), input_map)
 
 
 def test_PRELUDE_outputs():
@@ -95,8 +92,4 @@ def test_PRELUDE_outputs():
             extensions=None,
         ),
     )
-    outputs = PRELUDE.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PRELUDE.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import PercentileImage
+from ....testing import assert_spec_metadata
 
 
 def test_PercentileImage_inputs():
@@ -47,11 +48,7 @@ def test_PercentileImage_inputs():
             position=5,
         ),
     )
-    inputs = PercentileImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PercentileImage.input_spec(), input_map)
 
 
 def test_PercentileImage_outputs():
@@ -60,8 +57,4 @@ def test_PercentileImage_outputs():
             extensions=None,
         ),
     )
-    outputs = PercentileImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PercentileImage.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import PlotTimeSeries
+from ....testing import assert_spec_metadata
 
 
 def test_PlotTimeSeries_inputs():
@@ -71,11 +72,7 @@ def test_PlotTimeSeries_inputs():
             xor=("y_min", "y_max"),
         ),
     )
-    inputs = PlotTimeSeries.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PlotTimeSeries.input_spec(), input_map)
 
 
 def test_PlotTimeSeries_outputs():
@@ -84,8 +81,4 @@ def test_PlotTimeSeries_outputs():
             extensions=None,
         ),
     )
-    outputs = PlotTimeSeries.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PlotTimeSeries.output_spec(), output_map)
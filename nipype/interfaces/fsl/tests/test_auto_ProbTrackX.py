@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import ProbTrackX
+from ....testing import assert_spec_metadata
 
 
 def test_ProbTrackX_inputs():
@@ -138,11 +139,7 @@ def test_ProbTrackX_inputs():
             extensions=None,
         ),
     )
-    inputs = ProbTrackX.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProbTrackX.input_spec(), input_map)
 
 
 def test_ProbTrackX_outputs():
@@ -157,8 +154,4 @@ def test_ProbTrackX_outputs():
             extensions=None,
         ),
     )
-    outputs = ProbTrackX.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProbTrackX.output_spec(), output_map)
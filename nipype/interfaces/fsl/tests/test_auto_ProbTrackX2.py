@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import ProbTrackX2
+from ....testing import assert_spec_metadata
 
 
 def test_ProbTrackX2_inputs():
@@ -185,11 +186,7 @@ def test_ProbTrackX2_inputs():
             extensions=None,
         ),
     )
-    inputs = ProbTrackX2.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProbTrackX2.input_spec(), input_map)
 
 
 def test_ProbTrackX2_outputs():
@@ -219,8 +216,4 @@ def test_ProbTrackX2_outputs():
             extensions=None,
         ),
     )
-    outputs = ProbTrackX2.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProbTrackX2.output_spec(), output_map)
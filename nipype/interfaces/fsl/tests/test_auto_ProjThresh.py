@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import ProjThresh
+from ....testing import assert_spec_metadata
 
 
 def test_ProjThresh_inputs():
@@ -23,19 +24,11 @@ def test_ProjThresh_inputs():
             position=1,
         ),
     )
-    inputs = ProjThresh.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProjThresh.input_spec(), input_map)
 
 
 def test_ProjThresh_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = ProjThresh.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProjThresh.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Randomise
+from ....testing import assert_spec_metadata
 
 
 def test_Randomise_inputs():
@@ -106,11 +107,7 @@ def test_Randomise_inputs():
             extensions=None,
         ),
     )
-    inputs = Randomise.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Randomise.input_spec(), input_map)
 
 
 def test_Randomise_outputs():
@@ -122,8 +119,4 @@ def test_Randomise_outputs():
         t_p_files=dict(),
         tstat_files=dict(),
     )
-    outputs = Randomise.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Randomise.output_spec(), output_map)
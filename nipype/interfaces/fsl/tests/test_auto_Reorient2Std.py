@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Reorient2Std
+from ....testing import assert_spec_metadata
 
 
 def test_Reorient2Std_inputs():
@@ -24,11 +25,7 @@ def test_Reorient2Std_inputs():
         ),
         output_type=dict(),
     )
-    inputs = Reorient2Std.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Reorient2Std.input_spec(), input_map)
 
 
 def test_Reorient2Std_outputs():
@@ -37,8 +34,4 @@ def test_Reorient2Std_outputs():
             extensions=None,
         ),
     )
-    outputs = Reorient2Std.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Reorient2Std.output_spec(), output_map)
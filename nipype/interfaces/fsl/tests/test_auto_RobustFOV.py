@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import RobustFOV
+from ....testing import assert_spec_metadata
 
 
 def test_RobustFOV_inputs():
@@ -36,11 +37,7 @@ def test_RobustFOV_inputs():
         ),
         output_type=dict(),
     )
-    inputs = RobustFOV.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobustFOV.input_spec(), input_map)
 
 
 def test_RobustFOV_outputs():
@@ -52,8 +49,4 @@ def test_RobustFOV_outputs():
             extensions=None,
         ),
     )
-    outputs = RobustFOV.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobustFOV.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import SMM
+from ....testing import assert_spec_metadata
 
 
 def test_SMM_inputs():
@@ -31,11 +32,7 @@ def test_SMM_inputs():
             position=0,
         ),
     )
-    inputs = SMM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SMM.input_spec(), input_map)
 
 
 def test_SMM_outputs():
@@ -50,8 +47,4 @@ def test_SMM_outputs():
             extensions=None,
         ),
     )
-    outputs = SMM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SMM.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SigLoss
+from ....testing import assert_spec_metadata
 
 
 def test_SigLoss_inputs():
@@ -33,11 +34,7 @@ def test_SigLoss_inputs():
             argstr="-d %s",
         ),
     )
-    inputs = SigLoss.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SigLoss.input_spec(), input_map)
 
 
 def test_SigLoss_outputs():
@@ -46,8 +43,4 @@ def test_SigLoss_outputs():
             extensions=None,
         ),
     )
-    outputs = SigLoss.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SigLoss.output_spec(), output_map)
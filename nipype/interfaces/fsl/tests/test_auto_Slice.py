@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Slice
+from ....testing import assert_spec_metadata
 
 
 def test_Slice_inputs():
@@ -24,19 +25,11 @@ def test_Slice_inputs():
         ),
         output_type=dict(),
     )
-    inputs = Slice.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Slice.input_spec(), input_map)
 
 
 def test_Slice_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = Slice.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Slice.output_spec(), output_map)
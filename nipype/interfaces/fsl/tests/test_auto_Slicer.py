@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Slicer
+from ....testing import assert_spec_metadata
 
 
 def test_Slicer_inputs():
@@ -97,11 +98,7 @@ def test_Slicer_inputs():
             position=6,
         ),
     )
-    inputs = Slicer.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Slicer.input_spec(), input_map)
 
 
 def test_Slicer_outputs():
@@ -110,8 +107,4 @@ def test_Slicer_outputs():
             extensions=None,
         ),
     )
-    outputs = Slicer.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Slicer.output_spec(), output_map)
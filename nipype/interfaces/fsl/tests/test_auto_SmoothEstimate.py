@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import SmoothEstimate
+from ....testing import assert_spec_metadata
 
 
 def test_SmoothEstimate_inputs():
@@ -33,11 +34,7 @@ def test_SmoothEstimate_inputs():
             xor=["dof"],
         ),
     )
-    inputs = SmoothEstimate.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SmoothEstimate.input_spec(), input_map)
 
 
 def test_SmoothEstimate_outputs():
@@ -46,8 +43,4 @@ def test_SmoothEstimate_outputs():
         resels=dict(),
         volume=dict(),
     )
-    outputs = SmoothEstimate.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SmoothEstimate.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import SpatialFilter
+from ....testing import assert_spec_metadata
 
 
 def test_SpatialFilter_inputs():
@@ -58,11 +59,7 @@ def test_SpatialFilter_inputs():
         ),
         output_type=dict(),
     )
-    inputs = SpatialFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpatialFilter.input_spec(), input_map)
 
 
 def test_SpatialFilter_outputs():
@@ -71,8 +68,4 @@ def test_SpatialFilter_outputs():
             extensions=None,
         ),
     )
-    outputs = SpatialFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpatialFilter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Split
+from ....testing import assert_spec_metadata
 
 
 def test_Split_inputs():
@@ -28,19 +29,11 @@ def test_Split_inputs():
         ),
         output_type=dict(),
     )
-    inputs = Split.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Split.input_spec(), input_map)
 
 
 def test_Split_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = Split.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Split.output_spec(), output_map)
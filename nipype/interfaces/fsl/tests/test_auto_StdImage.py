@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import StdImage
+from ....testing import assert_spec_metadata
 
 
 def test_StdImage_inputs():
@@ -43,11 +44,7 @@ def test_StdImage_inputs():
         ),
         output_type=dict(),
     )
-    inputs = StdImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(StdImage.input_spec(), input_map)
 
 
 def test_StdImage_outputs():
@@ -56,8 +53,4 @@ def test_StdImage_outputs():
             extensions=None,
         ),
     )
-    outputs = StdImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(StdImage.output_spec(), output_map)
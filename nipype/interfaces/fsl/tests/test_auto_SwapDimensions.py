@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SwapDimensions
+from ....testing import assert_spec_metadata
 
 
 def test_SwapDimensions_inputs():
@@ -29,11 +30,7 @@ def test_SwapDimensions_inputs():
         ),
         output_type=dict(),
     )
-    inputs = SwapDimensions.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SwapDimensions.input_spec(), input_map)
 
 
 def test_SwapDimensions_outputs():
@@ -42,8 +39,4 @@ def test_SwapDimensions_outputs():
             extensions=None,
         ),
     )
-    outputs = SwapDimensions.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SwapDimensions.output_spec(), output_map)
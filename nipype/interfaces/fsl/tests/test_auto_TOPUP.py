@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..epi import TOPUP
+from ....testing import assert_spec_metadata
 
 
 def test_TOPUP_inputs():
@@ -125,11 +126,7 @@ def test_TOPUP_inputs():
             argstr="--warpres=%f",
         ),
     )
-    inputs = TOPUP.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TOPUP.input_spec(), input_map)
 
 
 def test_TOPUP_outputs():
@@ -156,8 +153,4 @@ def test_TOPUP_outputs():
         ),
         out_warps=dict(),
     )
-    outputs = TOPUP.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TOPUP.output_spec(), output_map)
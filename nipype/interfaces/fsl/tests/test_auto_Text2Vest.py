@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Text2Vest
+from ....testing import assert_spec_metadata
 
 
 def test_Text2Vest_inputs():
@@ -25,11 +26,7 @@ def test_Text2Vest_inputs():
         ),
         output_type=dict(),
     )
-    inputs = Text2Vest.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Text2Vest.input_spec(), input_map)
 
 
 def test_Text2Vest_outputs():
@@ -38,8 +35,4 @@ def test_Text2Vest_outputs():
             extensions=None,
         ),
     )
-    outputs = Text2Vest.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Text2Vest.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import Threshold
+from ....testing import assert_spec_metadata
 
 
 def test_Threshold_inputs():
@@ -50,11 +51,7 @@ def test_Threshold_inputs():
         ),
         use_robust_range=dict(),
     )
-    inputs = Threshold.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Threshold.input_spec(), input_map)
 
 
 def test_Threshold_outputs():
@@ -63,8 +60,4 @@ def test_Threshold_outputs():
             extensions=None,
         ),
     )
-    outputs = Threshold.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Threshold.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import TractSkeleton
+from ....testing import assert_spec_metadata
 
 
 def test_TractSkeleton_inputs():
@@ -51,11 +52,7 @@ def test_TractSkeleton_inputs():
             xor=["search_mask_file"],
         ),
     )
-    inputs = TractSkeleton.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TractSkeleton.input_spec(), input_map)
 
 
 def test_TractSkeleton_outputs():
@@ -67,8 +64,4 @@ def test_TractSkeleton_outputs():
             extensions=None,
         ),
     )
-    outputs = TractSkeleton.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TractSkeleton.output_spec(), output_map)
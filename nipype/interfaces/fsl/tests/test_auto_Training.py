@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..fix import Training
+from ....testing import assert_spec_metadata
 
 
 def test_Training_inputs():
@@ -25,11 +26,7 @@ def test_Training_inputs():
             position=1,
         ),
     )
-    inputs = Training.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Training.input_spec(), input_map)
 
 
 def test_Training_outputs():
@@ -38,8 +35,4 @@ def test_Training_outputs():
             extensions=None,
         ),
     )
-    outputs = Training.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Training.output_spec(), output_map)
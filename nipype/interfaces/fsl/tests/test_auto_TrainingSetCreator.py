@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..fix import TrainingSetCreator
+from ....testing import assert_spec_metadata
 
 
 def test_TrainingSetCreator_inputs():
@@ -10,11 +11,7 @@ def test_TrainingSetCreator_inputs():
             position=-1,
         ),
     )
-    inputs = TrainingSetCreator.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrainingSetCreator.input_spec(), input_map)
 
 
 def test_TrainingSetCreator_outputs():
@@ -25,8 +22,4 @@ def test_TrainingSetCreator_outputs():
             position=-1,
         ),
     )
-    outputs = TrainingSetCreator.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TrainingSetCreator.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import VecReg
+from ....testing import assert_spec_metadata
 
 
 def test_VecReg_inputs():
@@ -56,11 +57,7 @@ def test_VecReg_inputs():
             extensions=None,
         ),
     )
-    inputs = VecReg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(VecReg.input_spec(), input_map)
 
 
 def test_VecReg_outputs():
@@ -69,8 +66,4 @@ def test_VecReg_outputs():
             extensions=None,
         ),
     )
-    outputs = VecReg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(VecReg.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import WarpPoints
+from ....testing import assert_spec_metadata
 
 
 def test_WarpPoints_inputs():
@@ -52,11 +53,7 @@ def test_WarpPoints_inputs():
             xor=["warp_file"],
         ),
     )
-    inputs = WarpPoints.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpPoints.input_spec(), input_map)
 
 
 def test_WarpPoints_outputs():
@@ -65,8 +62,4 @@ def test_WarpPoints_outputs():
             extensions=None,
         ),
     )
-    outputs = WarpPoints.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpPoints.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import WarpPointsFromStd
+from ....testing import assert_spec_metadata
 
 
 def test_WarpPointsFromStd_inputs():
@@ -46,11 +47,7 @@ def test_WarpPointsFromStd_inputs():
             xor=["warp_file"],
         ),
     )
-    inputs = WarpPointsFromStd.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpPointsFromStd.input_spec(), input_map)
 
 
 def test_WarpPointsFromStd_outputs():
@@ -59,8 +56,4 @@ def test_WarpPointsFromStd_outputs():
             extensions=None,
         ),
     )
-    outputs = WarpPointsFromStd.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpPointsFromStd.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import WarpPointsToStd
+from ....testing import assert_spec_metadata
 
 
 def test_WarpPointsToStd_inputs():
@@ -56,11 +57,7 @@ def test_WarpPointsToStd_inputs():
             xor=["warp_file"],
         ),
     )
-    inputs = WarpPointsToStd.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpPointsToStd.input_spec(), input_map)
 
 
 def test_WarpPointsToStd_outputs():
@@ -69,8 +66,4 @@ def test_WarpPointsToStd_outputs():
             extensions=None,
         ),
     )
-    outputs = WarpPointsToStd.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpPointsToStd.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import WarpUtils
+from ....testing import assert_spec_metadata
 
 
 def test_WarpUtils_inputs():
@@ -50,11 +51,7 @@ def test_WarpUtils_inputs():
             usedefault=True,
         ),
     )
-    inputs = WarpUtils.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpUtils.input_spec(), input_map)
 
 
 def test_WarpUtils_outputs():
@@ -66,8 +63,4 @@ def test_WarpUtils_outputs():
             extensions=None,
         ),
     )
-    outputs = WarpUtils.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(WarpUtils.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dti import XFibres5
+from ....testing import assert_spec_metadata
 
 
 def test_XFibres5_inputs():
@@ -110,11 +111,7 @@ def test_XFibres5_inputs():
             usedefault=True,
         ),
     )
-    inputs = XFibres5.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(XFibres5.input_spec(), input_map)
 
 
 def test_XFibres5_outputs():
@@ -134,8 +131,4 @@ def test_XFibres5_outputs():
         phsamples=dict(),
         thsamples=dict(),
     )
-    outputs = XFibres5.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(XFibres5.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Average
+from ....testing import assert_spec_metadata
 
 
 def test_Average_inputs():
@@ -233,11 +234,7 @@ def test_Average_inputs():
             requires=("avgdim",),
         ),
     )
-    inputs = Average.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Average.input_spec(), input_map)
 
 
 def test_Average_outputs():
@@ -246,8 +243,4 @@ def test_Average_outputs():
             extensions=None,
         ),
     )
-    outputs = Average.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Average.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import BBox
+from ....testing import assert_spec_metadata
 
 
 def test_BBox_inputs():
@@ -52,11 +53,7 @@ def test_BBox_inputs():
             xor=("one_line", "two_lines"),
         ),
     )
-    inputs = BBox.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BBox.input_spec(), input_map)
 
 
 def test_BBox_outputs():
@@ -65,8 +62,4 @@ def test_BBox_outputs():
             extensions=None,
         ),
     )
-    outputs = BBox.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BBox.output_spec(), output_map)
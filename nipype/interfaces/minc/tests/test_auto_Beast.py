@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Beast
+from ....testing import assert_spec_metadata
 
 
 def test_Beast_inputs():
@@ -92,11 +93,7 @@ def test_Beast_inputs():
             usedefault=True,
         ),
     )
-    inputs = Beast.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Beast.input_spec(), input_map)
 
 
 def test_Beast_outputs():
@@ -105,8 +102,4 @@ def test_Beast_outputs():
             extensions=None,
         ),
     )
-    outputs = Beast.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Beast.output_spec(), output_map)
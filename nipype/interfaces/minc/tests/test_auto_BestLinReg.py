@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import BestLinReg
+from ....testing import assert_spec_metadata
 
 
 def test_BestLinReg_inputs():
@@ -51,11 +52,7 @@ def test_BestLinReg_inputs():
             argstr="-verbose",
         ),
     )
-    inputs = BestLinReg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BestLinReg.input_spec(), input_map)
 
 
 def test_BestLinReg_outputs():
@@ -67,8 +64,4 @@ def test_BestLinReg_outputs():
             extensions=None,
         ),
     )
-    outputs = BestLinReg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BestLinReg.output_spec(), output_map)
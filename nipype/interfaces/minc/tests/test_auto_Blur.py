@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Blur
+from ....testing import assert_spec_metadata
 
 
 def test_Blur_inputs():
@@ -62,11 +63,7 @@ def test_Blur_inputs():
             xor=("fwhm", "fwhm3d", "standard_dev"),
         ),
     )
-    inputs = Blur.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Blur.input_spec(), input_map)
 
 
 def test_Blur_outputs():
@@ -90,8 +87,4 @@ def test_Blur_outputs():
             extensions=None,
         ),
     )
-    outputs = Blur.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Blur.output_spec(), output_map)
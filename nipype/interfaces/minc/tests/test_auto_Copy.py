@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Copy
+from ....testing import assert_spec_metadata
 
 
 def test_Copy_inputs():
@@ -35,11 +36,7 @@ def test_Copy_inputs():
             xor=("pixel_values", "real_values"),
         ),
     )
-    inputs = Copy.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Copy.input_spec(), input_map)
 
 
 def test_Copy_outputs():
@@ -48,8 +45,4 @@ def test_Copy_outputs():
             extensions=None,
         ),
     )
-    outputs = Copy.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Copy.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Dump
+from ....testing import assert_spec_metadata
 
 
 def test_Dump_inputs():
@@ -61,11 +62,7 @@ def test_Dump_inputs():
             sep=",",
         ),
     )
-    inputs = Dump.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Dump.input_spec(), input_map)
 
 
 def test_Dump_outputs():
@@ -74,8 +71,4 @@ def test_Dump_outputs():
             extensions=None,
         ),
     )
-    outputs = Dump.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Dump.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Extract
+from ....testing import assert_spec_metadata
 
 
 def test_Extract_inputs():
@@ -233,11 +234,7 @@ def test_Extract_inputs():
             xor=("write_signed", "write_unsigned"),
         ),
     )
-    inputs = Extract.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Extract.input_spec(), input_map)
 
 
 def test_Extract_outputs():
@@ -246,8 +243,4 @@ def test_Extract_outputs():
             extensions=None,
         ),
     )
-    outputs = Extract.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Extract.output_spec(), output_map)
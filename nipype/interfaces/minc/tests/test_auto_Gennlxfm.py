@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Gennlxfm
+from ....testing import assert_spec_metadata
 
 
 def test_Gennlxfm_inputs():
@@ -38,11 +39,7 @@ def test_Gennlxfm_inputs():
             argstr="-verbose",
         ),
     )
-    inputs = Gennlxfm.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Gennlxfm.input_spec(), input_map)
 
 
 def test_Gennlxfm_outputs():
@@ -54,8 +51,4 @@ def test_Gennlxfm_outputs():
             extensions=None,
         ),
     )
-    outputs = Gennlxfm.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Gennlxfm.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Math
+from ....testing import assert_spec_metadata
 
 
 def test_Math_inputs():
@@ -298,11 +299,7 @@ def test_Math_inputs():
             argstr="-range %d %d",
         ),
     )
-    inputs = Math.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Math.input_spec(), input_map)
 
 
 def test_Math_outputs():
@@ -311,8 +308,4 @@ def test_Math_outputs():
             extensions=None,
         ),
     )
-    outputs = Math.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Math.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import NlpFit
+from ....testing import assert_spec_metadata
 
 
 def test_NlpFit_inputs():
@@ -53,11 +54,7 @@ def test_NlpFit_inputs():
             argstr="-verbose",
         ),
     )
-    inputs = NlpFit.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NlpFit.input_spec(), input_map)
 
 
 def test_NlpFit_outputs():
@@ -69,8 +66,4 @@ def test_NlpFit_outputs():
             extensions=None,
         ),
     )
-    outputs = NlpFit.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NlpFit.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Norm
+from ....testing import assert_spec_metadata
 
 
 def test_Norm_inputs():
@@ -73,11 +74,7 @@ def test_Norm_inputs():
             argstr="-upper %s",
         ),
     )
-    inputs = Norm.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Norm.input_spec(), input_map)
 
 
 def test_Norm_outputs():
@@ -89,8 +86,4 @@ def test_Norm_outputs():
             extensions=None,
         ),
     )
-    outputs = Norm.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Norm.output_spec(), output_map)
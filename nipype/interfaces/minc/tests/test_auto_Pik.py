@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Pik
+from ....testing import assert_spec_metadata
 
 
 def test_Pik_inputs():
@@ -107,11 +108,7 @@ def test_Pik_inputs():
             argstr="--width %s",
         ),
     )
-    inputs = Pik.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Pik.input_spec(), input_map)
 
 
 def test_Pik_outputs():
@@ -120,8 +117,4 @@ def test_Pik_outputs():
             extensions=None,
         ),
     )
-    outputs = Pik.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Pik.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Reshape
+from ....testing import assert_spec_metadata
 
 
 def test_Reshape_inputs():
@@ -37,11 +38,7 @@ def test_Reshape_inputs():
             argstr="-short",
         ),
     )
-    inputs = Reshape.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Reshape.input_spec(), input_map)
 
 
 def test_Reshape_outputs():
@@ -50,8 +47,4 @@ def test_Reshape_outputs():
             extensions=None,
         ),
     )
-    outputs = Reshape.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Reshape.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import ToEcat
+from ....testing import assert_spec_metadata
 
 
 def test_ToEcat_inputs():
@@ -52,11 +53,7 @@ def test_ToEcat_inputs():
             argstr="-label",
         ),
     )
-    inputs = ToEcat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ToEcat.input_spec(), input_map)
 
 
 def test_ToEcat_outputs():
@@ -65,8 +62,4 @@ def test_ToEcat_outputs():
             extensions=None,
         ),
     )
-    outputs = ToEcat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ToEcat.output_spec(), output_map)
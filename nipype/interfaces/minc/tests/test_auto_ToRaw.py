@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import ToRaw
+from ....testing import assert_spec_metadata
 
 
 def test_ToRaw_inputs():
@@ -117,11 +118,7 @@ def test_ToRaw_inputs():
             xor=("write_signed", "write_unsigned"),
         ),
     )
-    inputs = ToRaw.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ToRaw.input_spec(), input_map)
 
 
 def test_ToRaw_outputs():
@@ -130,8 +127,4 @@ def test_ToRaw_outputs():
             extensions=None,
         ),
     )
-    outputs = ToRaw.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ToRaw.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import VolSymm
+from ....testing import assert_spec_metadata
 
 
 def test_VolSymm_inputs():
@@ -67,11 +68,7 @@ def test_VolSymm_inputs():
             argstr="-z",
         ),
     )
-    inputs = VolSymm.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(VolSymm.input_spec(), input_map)
 
 
 def test_VolSymm_outputs():
@@ -86,8 +83,4 @@ def test_VolSymm_outputs():
             extensions=None,
         ),
     )
-    outputs = VolSymm.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(VolSymm.output_spec(), output_map)
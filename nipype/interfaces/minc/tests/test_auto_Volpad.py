@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import Volpad
+from ....testing import assert_spec_metadata
 
 
 def test_Volpad_inputs():
@@ -49,11 +50,7 @@ def test_Volpad_inputs():
             argstr="-verbose",
         ),
     )
-    inputs = Volpad.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Volpad.input_spec(), input_map)
 
 
 def test_Volpad_outputs():
@@ -62,8 +59,4 @@ def test_Volpad_outputs():
             extensions=None,
         ),
     )
-    outputs = Volpad.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Volpad.output_spec(), output_map)
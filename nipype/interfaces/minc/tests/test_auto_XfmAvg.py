@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import XfmAvg
+from ....testing import assert_spec_metadata
 
 
 def test_XfmAvg_inputs():
@@ -44,11 +45,7 @@ def test_XfmAvg_inputs():
             argstr="-verbose",
         ),
     )
-    inputs = XfmAvg.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(XfmAvg.input_spec(), input_map)
 
 
 def test_XfmAvg_outputs():
@@ -60,8 +57,4 @@ def test_XfmAvg_outputs():
             extensions=None,
         ),
     )
-    outputs = XfmAvg.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(XfmAvg.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import XfmConcat
+from ....testing import assert_spec_metadata
 
 
 def test_XfmConcat_inputs():
@@ -35,11 +36,7 @@ def test_XfmConcat_inputs():
             argstr="-verbose",
         ),
     )
-    inputs = XfmConcat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(XfmConcat.input_spec(), input_map)
 
 
 def test_XfmConcat_outputs():
@@ -49,8 +46,4 @@ def test_XfmConcat_outputs():
         ),
         output_grids=dict(),
     )
-    outputs = XfmConcat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(XfmConcat.output_spec(), output_map)
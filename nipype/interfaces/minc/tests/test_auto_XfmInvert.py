@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..minc import XfmInvert
+from ....testing import assert_spec_metadata
 
 
 def test_XfmInvert_inputs():
@@ -31,11 +32,7 @@ def test_XfmInvert_inputs():
             argstr="-verbose",
         ),
     )
-    inputs = XfmInvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(XfmInvert.input_spec(), input_map)
 
 
 def test_XfmInvert_outputs():
@@ -47,8 +44,4 @@ def test_XfmInvert_outputs():
             extensions=None,
         ),
     )
-    outputs = XfmInvert.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(XfmInvert.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistBrainMgdmSegmentation
+from ....testing import assert_spec_metadata
 
 
 def test_JistBrainMgdmSegmentation_inputs():
@@ -95,11 +96,7 @@ def test_JistBrainMgdmSegmentation_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistBrainMgdmSegmentation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistBrainMgdmSegmentation.input_spec(), input_map)
 
 
 def test_JistBrainMgdmSegmentation_outputs():
@@ -117,8 +114,4 @@ def test_JistBrainMgdmSegmentation_outputs():
             extensions=None,
         ),
     )
-    outputs = JistBrainMgdmSegmentation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistBrainMgdmSegmentation.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistBrainMp2rageDuraEstimation
+from ....testing import assert_spec_metadata
 
 
 def test_JistBrainMp2rageDuraEstimation_inputs():
@@ -43,11 +44,7 @@ def test_JistBrainMp2rageDuraEstimation_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistBrainMp2rageDuraEstimation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistBrainMp2rageDuraEstimation.input_spec(), input_map)
 
 
 def test_JistBrainMp2rageDuraEstimation_outputs():
@@ -56,8 +53,4 @@ def test_JistBrainMp2rageDuraEstimation_outputs():
             extensions=None,
         ),
     )
-    outputs = JistBrainMp2rageDuraEstimation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistBrainMp2rageDuraEstimation.output_spec(), output_map)
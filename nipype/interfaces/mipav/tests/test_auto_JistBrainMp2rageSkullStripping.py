@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistBrainMp2rageSkullStripping
+from ....testing import assert_spec_metadata
 
 
 def test_JistBrainMp2rageSkullStripping_inputs():
@@ -60,11 +61,7 @@ def test_JistBrainMp2rageSkullStripping_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistBrainMp2rageSkullStripping.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistBrainMp2rageSkullStripping.input_spec(), input_map)
 
 
 def test_JistBrainMp2rageSkullStripping_outputs():
@@ -82,8 +79,4 @@ def test_JistBrainMp2rageSkullStripping_outputs():
             extensions=None,
         ),
     )
-    outputs = JistBrainMp2rageSkullStripping.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistBrainMp2rageSkullStripping.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistBrainPartialVolumeFilter
+from ....testing import assert_spec_metadata
 
 
 def test_JistBrainPartialVolumeFilter_inputs():
@@ -39,11 +40,7 @@ def test_JistBrainPartialVolumeFilter_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistBrainPartialVolumeFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistBrainPartialVolumeFilter.input_spec(), input_map)
 
 
 def test_JistBrainPartialVolumeFilter_outputs():
@@ -52,8 +49,4 @@ def test_JistBrainPartialVolumeFilter_outputs():
             extensions=None,
         ),
     )
-    outputs = JistBrainPartialVolumeFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistBrainPartialVolumeFilter.output_spec(), output_map)
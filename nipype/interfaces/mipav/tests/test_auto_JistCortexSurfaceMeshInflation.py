@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistCortexSurfaceMeshInflation
+from ....testing import assert_spec_metadata
 
 
 def test_JistCortexSurfaceMeshInflation_inputs():
@@ -55,11 +56,7 @@ def test_JistCortexSurfaceMeshInflation_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistCortexSurfaceMeshInflation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistCortexSurfaceMeshInflation.input_spec(), input_map)
 
 
 def test_JistCortexSurfaceMeshInflation_outputs():
@@ -71,8 +68,4 @@ def test_JistCortexSurfaceMeshInflation_outputs():
             extensions=None,
         ),
     )
-    outputs = JistCortexSurfaceMeshInflation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistCortexSurfaceMeshInflation.output_spec(), output_map)
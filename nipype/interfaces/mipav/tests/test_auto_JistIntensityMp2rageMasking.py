@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistIntensityMp2rageMasking
+from ....testing import assert_spec_metadata
 
 
 def test_JistIntensityMp2rageMasking_inputs():
@@ -62,11 +63,7 @@ def test_JistIntensityMp2rageMasking_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistIntensityMp2rageMasking.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistIntensityMp2rageMasking.input_spec(), input_map)
 
 
 def test_JistIntensityMp2rageMasking_outputs():
@@ -84,8 +81,4 @@ def test_JistIntensityMp2rageMasking_outputs():
             extensions=None,
         ),
     )
-    outputs = JistIntensityMp2rageMasking.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistIntensityMp2rageMasking.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistLaminarProfileGeometry
+from ....testing import assert_spec_metadata
 
 
 def test_JistLaminarProfileGeometry_inputs():
@@ -45,11 +46,7 @@ def test_JistLaminarProfileGeometry_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistLaminarProfileGeometry.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistLaminarProfileGeometry.input_spec(), input_map)
 
 
 def test_JistLaminarProfileGeometry_outputs():
@@ -58,8 +55,4 @@ def test_JistLaminarProfileGeometry_outputs():
             extensions=None,
         ),
     )
-    outputs = JistLaminarProfileGeometry.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistLaminarProfileGeometry.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistLaminarProfileSampling
+from ....testing import assert_spec_metadata
 
 
 def test_JistLaminarProfileSampling_inputs():
@@ -45,11 +46,7 @@ def test_JistLaminarProfileSampling_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistLaminarProfileSampling.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistLaminarProfileSampling.input_spec(), input_map)
 
 
 def test_JistLaminarProfileSampling_outputs():
@@ -61,8 +58,4 @@ def test_JistLaminarProfileSampling_outputs():
             extensions=None,
         ),
     )
-    outputs = JistLaminarProfileSampling.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistLaminarProfileSampling.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistLaminarROIAveraging
+from ....testing import assert_spec_metadata
 
 
 def test_JistLaminarROIAveraging_inputs():
@@ -44,11 +45,7 @@ def test_JistLaminarROIAveraging_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistLaminarROIAveraging.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistLaminarROIAveraging.input_spec(), input_map)
 
 
 def test_JistLaminarROIAveraging_outputs():
@@ -57,8 +54,4 @@ def test_JistLaminarROIAveraging_outputs():
             extensions=None,
         ),
     )
-    outputs = JistLaminarROIAveraging.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistLaminarROIAveraging.output_spec(), output_map)
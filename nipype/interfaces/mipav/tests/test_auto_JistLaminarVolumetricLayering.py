@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import JistLaminarVolumetricLayering
+from ....testing import assert_spec_metadata
 
 
 def test_JistLaminarVolumetricLayering_inputs():
@@ -72,11 +73,7 @@ def test_JistLaminarVolumetricLayering_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = JistLaminarVolumetricLayering.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistLaminarVolumetricLayering.input_spec(), input_map)
 
 
 def test_JistLaminarVolumetricLayering_outputs():
@@ -91,8 +88,4 @@ def test_JistLaminarVolumetricLayering_outputs():
             extensions=None,
         ),
     )
-    outputs = JistLaminarVolumetricLayering.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JistLaminarVolumetricLayering.output_spec(), output_map)
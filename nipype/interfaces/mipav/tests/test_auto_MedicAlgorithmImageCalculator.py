@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import MedicAlgorithmImageCalculator
+from ....testing import assert_spec_metadata
 
 
 def test_MedicAlgorithmImageCalculator_inputs():
@@ -40,11 +41,7 @@ def test_MedicAlgorithmImageCalculator_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = MedicAlgorithmImageCalculator.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmImageCalculator.input_spec(), input_map)
 
 
 def test_MedicAlgorithmImageCalculator_outputs():
@@ -53,8 +50,4 @@ def test_MedicAlgorithmImageCalculator_outputs():
             extensions=None,
         ),
     )
-    outputs = MedicAlgorithmImageCalculator.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmImageCalculator.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import MedicAlgorithmLesionToads
+from ....testing import assert_spec_metadata
 
 
 def test_MedicAlgorithmLesionToads_inputs():
@@ -130,11 +131,7 @@ def test_MedicAlgorithmLesionToads_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = MedicAlgorithmLesionToads.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmLesionToads.input_spec(), input_map)
 
 
 def test_MedicAlgorithmLesionToads_outputs():
@@ -167,8 +164,4 @@ def test_MedicAlgorithmLesionToads_outputs():
             extensions=None,
         ),
     )
-    outputs = MedicAlgorithmLesionToads.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmLesionToads.output_spec(), output_map)
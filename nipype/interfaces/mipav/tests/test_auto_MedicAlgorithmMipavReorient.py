@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import MedicAlgorithmMipavReorient
+from ....testing import assert_spec_metadata
 
 
 def test_MedicAlgorithmMipavReorient_inputs():
@@ -58,17 +59,9 @@ def test_MedicAlgorithmMipavReorient_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = MedicAlgorithmMipavReorient.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmMipavReorient.input_spec(), input_map)
 
 
 def test_MedicAlgorithmMipavReorient_outputs():
     output_map = dict()
-    outputs = MedicAlgorithmMipavReorient.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmMipavReorient.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import MedicAlgorithmN3
+from ....testing import assert_spec_metadata
 
 
 def test_MedicAlgorithmN3_inputs():
@@ -61,11 +62,7 @@ def test_MedicAlgorithmN3_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = MedicAlgorithmN3.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmN3.input_spec(), input_map)
 
 
 def test_MedicAlgorithmN3_outputs():
@@ -77,8 +74,4 @@ def test_MedicAlgorithmN3_outputs():
             extensions=None,
         ),
     )
-    outputs = MedicAlgorithmN3.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmN3.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import MedicAlgorithmSPECTRE2010
+from ....testing import assert_spec_metadata
 
 
 def test_MedicAlgorithmSPECTRE2010_inputs():
@@ -165,11 +166,7 @@ def test_MedicAlgorithmSPECTRE2010_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = MedicAlgorithmSPECTRE2010.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmSPECTRE2010.input_spec(), input_map)
 
 
 def test_MedicAlgorithmSPECTRE2010_outputs():
@@ -202,8 +199,4 @@ def test_MedicAlgorithmSPECTRE2010_outputs():
             extensions=None,
         ),
     )
-    outputs = MedicAlgorithmSPECTRE2010.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmSPECTRE2010.output_spec(), output_map)
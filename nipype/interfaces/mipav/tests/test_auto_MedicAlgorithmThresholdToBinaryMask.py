@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import MedicAlgorithmThresholdToBinaryMask
+from ....testing import assert_spec_metadata
 
 
 def test_MedicAlgorithmThresholdToBinaryMask_inputs():
@@ -42,17 +43,9 @@ def test_MedicAlgorithmThresholdToBinaryMask_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = MedicAlgorithmThresholdToBinaryMask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmThresholdToBinaryMask.input_spec(), input_map)
 
 
 def test_MedicAlgorithmThresholdToBinaryMask_outputs():
     output_map = dict()
-    outputs = MedicAlgorithmThresholdToBinaryMask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedicAlgorithmThresholdToBinaryMask.output_spec(), output_map)
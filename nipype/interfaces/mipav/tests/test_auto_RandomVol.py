@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..developer import RandomVol
+from ....testing import assert_spec_metadata
 
 
 def test_RandomVol_inputs():
@@ -56,11 +57,7 @@ def test_RandomVol_inputs():
             argstr="--xPrefExt %s",
         ),
     )
-    inputs = RandomVol.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RandomVol.input_spec(), input_map)
 
 
 def test_RandomVol_outputs():
@@ -69,8 +66,4 @@ def test_RandomVol_outputs():
             extensions=None,
         ),
     )
-    outputs = RandomVol.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RandomVol.output_spec(), output_map)
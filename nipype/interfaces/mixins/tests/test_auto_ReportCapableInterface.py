@@ -1,11 +1,8 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reporting import ReportCapableInterface
+from ....testing import assert_spec_metadata
 
 
 def test_ReportCapableInterface_inputs():
     input_map = dict()
-    inputs = ReportCapableInterface.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ReportCapableInterface.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import WatershedBEM
+from ....testing import assert_spec_metadata
 
 
 def test_WatershedBEM_inputs():
@@ -31,11 +32,7 @@ def test_WatershedBEM_inputs():
             usedefault=True,
         ),
     )
-    inputs = WatershedBEM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WatershedBEM.input_spec(), input_map)
 
 
 def test_WatershedBEM_outputs():
@@ -67,8 +64,4 @@ def test_WatershedBEM_outputs():
             loc="bem/watershed",
         ),
     )
-    outputs = WatershedBEM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(WatershedBEM.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tensors import ConstrainedSphericalDeconvolution
+from ....testing import assert_spec_metadata
 
 
 def test_ConstrainedSphericalDeconvolution_inputs():
@@ -69,11 +70,7 @@ def test_ConstrainedSphericalDeconvolution_inputs():
             argstr="-threshold %s",
         ),
     )
-    inputs = ConstrainedSphericalDeconvolution.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConstrainedSphericalDeconvolution.input_spec(), input_map)
 
 
 def test_ConstrainedSphericalDeconvolution_outputs():
@@ -82,8 +79,4 @@ def test_ConstrainedSphericalDeconvolution_outputs():
             extensions=None,
         ),
     )
-    outputs = ConstrainedSphericalDeconvolution.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConstrainedSphericalDeconvolution.output_spec(), output_map)
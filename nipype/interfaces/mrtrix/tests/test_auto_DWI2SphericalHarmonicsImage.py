@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tensors import DWI2SphericalHarmonicsImage
+from ....testing import assert_spec_metadata
 
 
 def test_DWI2SphericalHarmonicsImage_inputs():
@@ -37,11 +38,7 @@ def test_DWI2SphericalHarmonicsImage_inputs():
             position=-1,
         ),
     )
-    inputs = DWI2SphericalHarmonicsImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWI2SphericalHarmonicsImage.input_spec(), input_map)
 
 
 def test_DWI2SphericalHarmonicsImage_outputs():
@@ -50,8 +47,4 @@ def test_DWI2SphericalHarmonicsImage_outputs():
             extensions=None,
         ),
     )
-    outputs = DWI2SphericalHarmonicsImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWI2SphericalHarmonicsImage.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import DWI2Tensor
+from ....testing import assert_spec_metadata
 
 
 def test_DWI2Tensor_inputs():
@@ -52,11 +53,7 @@ def test_DWI2Tensor_inputs():
             position=1,
         ),
     )
-    inputs = DWI2Tensor.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWI2Tensor.input_spec(), input_map)
 
 
 def test_DWI2Tensor_outputs():
@@ -65,8 +62,4 @@ def test_DWI2Tensor_outputs():
             extensions=None,
         ),
     )
-    outputs = DWI2Tensor.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWI2Tensor.output_spec(), output_map)
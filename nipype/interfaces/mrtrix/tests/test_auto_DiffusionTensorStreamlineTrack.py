@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracking import DiffusionTensorStreamlineTrack
+from ....testing import assert_spec_metadata
 
 
 def test_DiffusionTensorStreamlineTrack_inputs():
@@ -131,11 +132,7 @@ def test_DiffusionTensorStreamlineTrack_inputs():
             argstr="-unidirectional",
         ),
     )
-    inputs = DiffusionTensorStreamlineTrack.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DiffusionTensorStreamlineTrack.input_spec(), input_map)
 
 
 def test_DiffusionTensorStreamlineTrack_outputs():
@@ -144,8 +141,4 @@ def test_DiffusionTensorStreamlineTrack_outputs():
             extensions=None,
         ),
     )
-    outputs = DiffusionTensorStreamlineTrack.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DiffusionTensorStreamlineTrack.output_spec(), output_map)
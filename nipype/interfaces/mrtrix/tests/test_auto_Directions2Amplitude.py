@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tensors import Directions2Amplitude
+from ....testing import assert_spec_metadata
 
 
 def test_Directions2Amplitude_inputs():
@@ -47,11 +48,7 @@ def test_Directions2Amplitude_inputs():
             argstr="-quiet",
         ),
     )
-    inputs = Directions2Amplitude.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Directions2Amplitude.input_spec(), input_map)
 
 
 def test_Directions2Amplitude_outputs():
@@ -60,8 +57,4 @@ def test_Directions2Amplitude_outputs():
             extensions=None,
         ),
     )
-    outputs = Directions2Amplitude.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Directions2Amplitude.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tensors import EstimateResponseForSH
+from ....testing import assert_spec_metadata
 
 
 def test_EstimateResponseForSH_inputs():
@@ -48,11 +49,7 @@ def test_EstimateResponseForSH_inputs():
             argstr="-quiet",
         ),
     )
-    inputs = EstimateResponseForSH.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateResponseForSH.input_spec(), input_map)
 
 
 def test_EstimateResponseForSH_outputs():
@@ -61,8 +58,4 @@ def test_EstimateResponseForSH_outputs():
             extensions=None,
         ),
     )
-    outputs = EstimateResponseForSH.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateResponseForSH.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tensors import FSL2MRTrix
+from ....testing import assert_spec_metadata
 
 
 def test_FSL2MRTrix_inputs():
@@ -26,11 +27,7 @@ def test_FSL2MRTrix_inputs():
             genfile=True,
         ),
     )
-    inputs = FSL2MRTrix.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FSL2MRTrix.input_spec(), input_map)
 
 
 def test_FSL2MRTrix_outputs():
@@ -39,8 +36,4 @@ def test_FSL2MRTrix_outputs():
             extensions=None,
         ),
     )
-    outputs = FSL2MRTrix.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FSL2MRTrix.output_spec(), output_map)
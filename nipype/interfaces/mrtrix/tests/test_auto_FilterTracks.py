@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracking import FilterTracks
+from ....testing import assert_spec_metadata
 
 
 def test_FilterTracks_inputs():
@@ -68,11 +69,7 @@ def test_FilterTracks_inputs():
             position=1,
         ),
     )
-    inputs = FilterTracks.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FilterTracks.input_spec(), input_map)
 
 
 def test_FilterTracks_outputs():
@@ -81,8 +78,4 @@ def test_FilterTracks_outputs():
             extensions=None,
         ),
     )
-    outputs = FilterTracks.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FilterTracks.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tensors import GenerateDirections
+from ....testing import assert_spec_metadata
 
 
 def test_GenerateDirections_inputs():
@@ -40,11 +41,7 @@ def test_GenerateDirections_inputs():
             argstr="-quiet",
         ),
     )
-    inputs = GenerateDirections.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateDirections.input_spec(), input_map)
 
 
 def test_GenerateDirections_outputs():
@@ -53,8 +50,4 @@ def test_GenerateDirections_outputs():
             extensions=None,
         ),
     )
-    outputs = GenerateDirections.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateDirections.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import GenerateWhiteMatterMask
+from ....testing import assert_spec_metadata
 
 
 def test_GenerateWhiteMatterMask_inputs():
@@ -39,11 +40,7 @@ def test_GenerateWhiteMatterMask_inputs():
             position=-1,
         ),
     )
-    inputs = GenerateWhiteMatterMask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateWhiteMatterMask.input_spec(), input_map)
 
 
 def test_GenerateWhiteMatterMask_outputs():
@@ -52,8 +49,4 @@ def test_GenerateWhiteMatterMask_outputs():
             extensions=None,
         ),
     )
-    outputs = GenerateWhiteMatterMask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateWhiteMatterMask.output_spec(), output_map)
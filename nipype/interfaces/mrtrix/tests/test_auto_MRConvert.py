@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MRConvert
+from ....testing import assert_spec_metadata
 
 
 def test_MRConvert_inputs():
@@ -68,11 +69,7 @@ def test_MRConvert_inputs():
             sep=",",
         ),
     )
-    inputs = MRConvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRConvert.input_spec(), input_map)
 
 
 def test_MRConvert_outputs():
@@ -81,8 +78,4 @@ def test_MRConvert_outputs():
             extensions=None,
         ),
     )
-    outputs = MRConvert.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRConvert.output_spec(), output_map)
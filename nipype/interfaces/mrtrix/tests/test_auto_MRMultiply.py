@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MRMultiply
+from ....testing import assert_spec_metadata
 
 
 def test_MRMultiply_inputs():
@@ -31,11 +32,7 @@ def test_MRMultiply_inputs():
             position=1,
         ),
     )
-    inputs = MRMultiply.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRMultiply.input_spec(), input_map)
 
 
 def test_MRMultiply_outputs():
@@ -44,8 +41,4 @@ def test_MRMultiply_outputs():
             extensions=None,
         ),
     )
-    outputs = MRMultiply.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRMultiply.output_spec(), output_map)
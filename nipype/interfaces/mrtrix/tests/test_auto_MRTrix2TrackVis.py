@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..convert import MRTrix2TrackVis
+from ....testing import assert_spec_metadata
 
 
 def test_MRTrix2TrackVis_inputs():
@@ -23,11 +24,7 @@ def test_MRTrix2TrackVis_inputs():
             extensions=None,
         ),
     )
-    inputs = MRTrix2TrackVis.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRTrix2TrackVis.input_spec(), input_map)
 
 
 def test_MRTrix2TrackVis_outputs():
@@ -36,8 +33,4 @@ def test_MRTrix2TrackVis_outputs():
             extensions=None,
         ),
     )
-    outputs = MRTrix2TrackVis.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRTrix2TrackVis.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MRTrixInfo
+from ....testing import assert_spec_metadata
 
 
 def test_MRTrixInfo_inputs():
@@ -18,17 +19,9 @@ def test_MRTrixInfo_inputs():
             position=-2,
         ),
     )
-    inputs = MRTrixInfo.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRTrixInfo.input_spec(), input_map)
 
 
 def test_MRTrixInfo_outputs():
     output_map = dict()
-    outputs = MRTrixInfo.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRTrixInfo.output_spec(), output_map)
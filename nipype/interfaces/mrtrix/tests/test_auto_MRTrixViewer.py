@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MRTrixViewer
+from ....testing import assert_spec_metadata
 
 
 def test_MRTrixViewer_inputs():
@@ -25,17 +26,9 @@ def test_MRTrixViewer_inputs():
             position=1,
         ),
     )
-    inputs = MRTrixViewer.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRTrixViewer.input_spec(), input_map)
 
 
 def test_MRTrixViewer_outputs():
     output_map = dict()
-    outputs = MRTrixViewer.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRTrixViewer.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MedianFilter3D
+from ....testing import assert_spec_metadata
 
 
 def test_MedianFilter3D_inputs():
@@ -32,11 +33,7 @@ def test_MedianFilter3D_inputs():
             position=1,
         ),
     )
-    inputs = MedianFilter3D.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedianFilter3D.input_spec(), input_map)
 
 
 def test_MedianFilter3D_outputs():
@@ -45,8 +42,4 @@ def test_MedianFilter3D_outputs():
             extensions=None,
         ),
     )
-    outputs = MedianFilter3D.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedianFilter3D.output_spec(), output_map)
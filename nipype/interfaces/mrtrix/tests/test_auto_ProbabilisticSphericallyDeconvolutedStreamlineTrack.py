@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracking import ProbabilisticSphericallyDeconvolutedStreamlineTrack
+from ....testing import assert_spec_metadata
 
 
 def test_ProbabilisticSphericallyDeconvolutedStreamlineTrack_inputs():
@@ -128,11 +129,9 @@ def test_ProbabilisticSphericallyDeconvolutedStreamlineTrack_inputs():
             argstr="-unidirectional",
         ),
     )
-    inputs = ProbabilisticSphericallyDeconvolutedStreamlineTrack.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(
+        ProbabilisticSphericallyDeconvolutedStreamlineTrack.input_spec(), input_map
+    )
 
 
 def test_ProbabilisticSphericallyDeconvolutedStreamlineTrack_outputs():
@@ -141,8 +140,6 @@ def test_ProbabilisticSphericallyDeconvolutedStreamlineTrack_outputs():
             extensions=None,
         ),
     )
-    outputs = ProbabilisticSphericallyDeconvolutedStreamlineTrack.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(
+        ProbabilisticSphericallyDeconvolutedStreamlineTrack.output_spec(), output_map
+    )
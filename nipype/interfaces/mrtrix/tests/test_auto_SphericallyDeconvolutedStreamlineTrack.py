@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracking import SphericallyDeconvolutedStreamlineTrack
+from ....testing import assert_spec_metadata
 
 
 def test_SphericallyDeconvolutedStreamlineTrack_inputs():
@@ -125,11 +126,7 @@ def test_SphericallyDeconvolutedStreamlineTrack_inputs():
             argstr="-unidirectional",
         ),
     )
-    inputs = SphericallyDeconvolutedStreamlineTrack.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SphericallyDeconvolutedStreamlineTrack.input_spec(), input_map)
 
 
 def test_SphericallyDeconvolutedStreamlineTrack_outputs():
@@ -138,8 +135,6 @@ def test_SphericallyDeconvolutedStreamlineTrack_outputs():
             extensions=None,
         ),
     )
-    outputs = SphericallyDeconvolutedStreamlineTrack.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(
+        SphericallyDeconvolutedStreamlineTrack.output_spec(), output_map
+    )
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracking import StreamlineTrack
+from ....testing import assert_spec_metadata
 
 
 def test_StreamlineTrack_inputs():
@@ -125,11 +126,7 @@ def test_StreamlineTrack_inputs():
             argstr="-unidirectional",
         ),
     )
-    inputs = StreamlineTrack.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(StreamlineTrack.input_spec(), input_map)
 
 
 def test_StreamlineTrack_outputs():
@@ -138,8 +135,4 @@ def test_StreamlineTrack_outputs():
             extensions=None,
         ),
     )
-    outputs = StreamlineTrack.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(StreamlineTrack.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracking import Tracks2Prob
+from ....testing import assert_spec_metadata
 
 
 def test_Tracks2Prob_inputs():
@@ -51,11 +52,7 @@ def test_Tracks2Prob_inputs():
             sep=",",
         ),
     )
-    inputs = Tracks2Prob.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Tracks2Prob.input_spec(), input_map)
 
 
 def test_Tracks2Prob_outputs():
@@ -64,8 +61,4 @@ def test_Tracks2Prob_outputs():
             extensions=None,
         ),
     )
-    outputs = Tracks2Prob.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Tracks2Prob.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ACTPrepareFSL
+from ....testing import assert_spec_metadata
 
 
 def test_ACTPrepareFSL_inputs():
@@ -25,11 +26,7 @@ def test_ACTPrepareFSL_inputs():
             usedefault=True,
         ),
     )
-    inputs = ACTPrepareFSL.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ACTPrepareFSL.input_spec(), input_map)
 
 
 def test_ACTPrepareFSL_outputs():
@@ -38,8 +35,4 @@ def test_ACTPrepareFSL_outputs():
             extensions=None,
         ),
     )
-    outputs = ACTPrepareFSL.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ACTPrepareFSL.output_spec(), output_map)
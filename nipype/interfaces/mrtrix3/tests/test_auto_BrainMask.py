@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import BrainMask
+from ....testing import assert_spec_metadata
 
 
 def test_BrainMask_inputs():
@@ -55,11 +56,7 @@ def test_BrainMask_inputs():
             usedefault=True,
         ),
     )
-    inputs = BrainMask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BrainMask.input_spec(), input_map)
 
 
 def test_BrainMask_outputs():
@@ -68,8 +65,4 @@ def test_BrainMask_outputs():
             extensions=None,
         ),
     )
-    outputs = BrainMask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BrainMask.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..connectivity import BuildConnectome
+from ....testing import assert_spec_metadata
 
 
 def test_BuildConnectome_inputs():
@@ -63,11 +64,7 @@ def test_BuildConnectome_inputs():
             argstr="-zero_diagonal",
         ),
     )
-    inputs = BuildConnectome.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BuildConnectome.input_spec(), input_map)
 
 
 def test_BuildConnectome_outputs():
@@ -76,8 +73,4 @@ def test_BuildConnectome_outputs():
             extensions=None,
         ),
     )
-    outputs = BuildConnectome.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BuildConnectome.output_spec(), output_map)
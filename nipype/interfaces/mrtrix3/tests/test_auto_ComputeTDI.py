@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ComputeTDI
+from ....testing import assert_spec_metadata
 
 
 def test_ComputeTDI_inputs():
@@ -81,11 +82,7 @@ def test_ComputeTDI_inputs():
             sep=",",
         ),
     )
-    inputs = ComputeTDI.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeTDI.input_spec(), input_map)
 
 
 def test_ComputeTDI_outputs():
@@ -94,8 +91,4 @@ def test_ComputeTDI_outputs():
             extensions=None,
         ),
     )
-    outputs = ComputeTDI.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ComputeTDI.output_spec(), output_map)
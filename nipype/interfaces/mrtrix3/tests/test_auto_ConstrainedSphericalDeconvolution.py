@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reconst import ConstrainedSphericalDeconvolution
+from ....testing import assert_spec_metadata
 
 
 def test_ConstrainedSphericalDeconvolution_inputs():
@@ -106,11 +107,7 @@ def test_ConstrainedSphericalDeconvolution_inputs():
             position=-6,
         ),
     )
-    inputs = ConstrainedSphericalDeconvolution.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConstrainedSphericalDeconvolution.input_spec(), input_map)
 
 
 def test_ConstrainedSphericalDeconvolution_outputs():
@@ -131,8 +128,4 @@ def test_ConstrainedSphericalDeconvolution_outputs():
             extensions=None,
         ),
     )
-    outputs = ConstrainedSphericalDeconvolution.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ConstrainedSphericalDeconvolution.output_spec(), output_map)
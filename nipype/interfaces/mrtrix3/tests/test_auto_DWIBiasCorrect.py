@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import DWIBiasCorrect
+from ....testing import assert_spec_metadata
 
 
 def test_DWIBiasCorrect_inputs():
@@ -77,11 +78,7 @@ def test_DWIBiasCorrect_inputs():
             xor=["use_ants"],
         ),
     )
-    inputs = DWIBiasCorrect.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIBiasCorrect.input_spec(), input_map)
 
 
 def test_DWIBiasCorrect_outputs():
@@ -93,8 +90,4 @@ def test_DWIBiasCorrect_outputs():
             extensions=None,
         ),
     )
-    outputs = DWIBiasCorrect.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIBiasCorrect.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import DWIDenoise
+from ....testing import assert_spec_metadata
 
 
 def test_DWIDenoise_inputs():
@@ -71,11 +72,7 @@ def test_DWIDenoise_inputs():
             position=-1,
         ),
     )
-    inputs = DWIDenoise.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIDenoise.input_spec(), input_map)
 
 
 def test_DWIDenoise_outputs():
@@ -87,8 +84,4 @@ def test_DWIDenoise_outputs():
             extensions=None,
         ),
     )
-    outputs = DWIDenoise.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIDenoise.output_spec(), output_map)
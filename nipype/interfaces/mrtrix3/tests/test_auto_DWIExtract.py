@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import DWIExtract
+from ....testing import assert_spec_metadata
 
 
 def test_DWIExtract_inputs():
@@ -67,11 +68,7 @@ def test_DWIExtract_inputs():
             argstr="-singleshell",
         ),
     )
-    inputs = DWIExtract.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIExtract.input_spec(), input_map)
 
 
 def test_DWIExtract_outputs():
@@ -80,8 +77,4 @@ def test_DWIExtract_outputs():
             extensions=None,
         ),
     )
-    outputs = DWIExtract.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIExtract.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import DWIPreproc
+from ....testing import assert_spec_metadata
 
 
 def test_DWIPreproc_inputs():
@@ -104,11 +105,7 @@ def test_DWIPreproc_inputs():
             argstr='-topup_options "%s"',
         ),
     )
-    inputs = DWIPreproc.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIPreproc.input_spec(), input_map)
 
 
 def test_DWIPreproc_outputs():
@@ -133,8 +130,4 @@ def test_DWIPreproc_outputs():
             usedefault=True,
         ),
     )
-    outputs = DWIPreproc.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIPreproc.output_spec(), output_map)
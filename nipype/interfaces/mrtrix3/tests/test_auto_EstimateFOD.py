@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reconst import EstimateFOD
+from ....testing import assert_spec_metadata
 
 
 def test_EstimateFOD_inputs():
@@ -109,11 +110,7 @@ def test_EstimateFOD_inputs():
             position=-6,
         ),
     )
-    inputs = EstimateFOD.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateFOD.input_spec(), input_map)
 
 
 def test_EstimateFOD_outputs():
@@ -134,8 +131,4 @@ def test_EstimateFOD_outputs():
             extensions=None,
         ),
     )
-    outputs = EstimateFOD.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateFOD.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reconst import FitTensor
+from ....testing import assert_spec_metadata
 
 
 def test_FitTensor_inputs():
@@ -70,11 +71,7 @@ def test_FitTensor_inputs():
             max_ver="0.3.13",
         ),
     )
-    inputs = FitTensor.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitTensor.input_spec(), input_map)
 
 
 def test_FitTensor_outputs():
@@ -86,8 +83,4 @@ def test_FitTensor_outputs():
             extensions=None,
         ),
     )
-    outputs = FitTensor.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitTensor.output_spec(), output_map)
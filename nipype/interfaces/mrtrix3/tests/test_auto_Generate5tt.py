@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Generate5tt
+from ....testing import assert_spec_metadata
 
 
 def test_Generate5tt_inputs():
@@ -89,11 +90,7 @@ def test_Generate5tt_inputs():
             argstr="-white_stem",
         ),
     )
-    inputs = Generate5tt.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Generate5tt.input_spec(), input_map)
 
 
 def test_Generate5tt_outputs():
@@ -102,8 +99,4 @@ def test_Generate5tt_outputs():
             extensions=None,
         ),
     )
-    outputs = Generate5tt.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Generate5tt.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Generate5tt2gmwmi
+from ....testing import assert_spec_metadata
 
 
 def test_Generate5tt2gmwmi_inputs():
@@ -59,11 +60,7 @@ def test_Generate5tt2gmwmi_inputs():
             extensions=None,
         ),
     )
-    inputs = Generate5tt2gmwmi.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Generate5tt2gmwmi.input_spec(), input_map)
 
 
 def test_Generate5tt2gmwmi_outputs():
@@ -72,8 +69,4 @@ def test_Generate5tt2gmwmi_outputs():
             extensions=None,
         ),
     )
-    outputs = Generate5tt2gmwmi.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Generate5tt2gmwmi.output_spec(), output_map)
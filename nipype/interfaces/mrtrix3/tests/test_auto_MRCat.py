@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRCat
+from ....testing import assert_spec_metadata
 
 
 def test_MRCat_inputs():
@@ -60,11 +61,7 @@ def test_MRCat_inputs():
             usedefault=True,
         ),
     )
-    inputs = MRCat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRCat.input_spec(), input_map)
 
 
 def test_MRCat_outputs():
@@ -73,8 +70,4 @@ def test_MRCat_outputs():
             extensions=None,
         ),
     )
-    outputs = MRCat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRCat.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MRDeGibbs
+from ....testing import assert_spec_metadata
 
 
 def test_MRDeGibbs_inputs():
@@ -73,11 +74,7 @@ def test_MRDeGibbs_inputs():
             position=-1,
         ),
     )
-    inputs = MRDeGibbs.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRDeGibbs.input_spec(), input_map)
 
 
 def test_MRDeGibbs_outputs():
@@ -86,8 +83,4 @@ def test_MRDeGibbs_outputs():
             extensions=None,
         ),
     )
-    outputs = MRDeGibbs.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRDeGibbs.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRMath
+from ....testing import assert_spec_metadata
 
 
 def test_MRMath_inputs():
@@ -62,11 +63,7 @@ def test_MRMath_inputs():
             position=-1,
         ),
     )
-    inputs = MRMath.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRMath.input_spec(), input_map)
 
 
 def test_MRMath_outputs():
@@ -75,8 +72,4 @@ def test_MRMath_outputs():
             extensions=None,
         ),
     )
-    outputs = MRMath.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRMath.output_spec(), output_map)
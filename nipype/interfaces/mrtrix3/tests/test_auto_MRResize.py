@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRResize
+from ....testing import assert_spec_metadata
 
 
 def test_MRResize_inputs():
@@ -75,11 +76,7 @@ def test_MRResize_inputs():
             xor=["image_size", "scale_factor"],
         ),
     )
-    inputs = MRResize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRResize.input_spec(), input_map)
 
 
 def test_MRResize_outputs():
@@ -88,8 +85,4 @@ def test_MRResize_outputs():
             extensions=None,
         ),
     )
-    outputs = MRResize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRResize.output_spec(), output_map)
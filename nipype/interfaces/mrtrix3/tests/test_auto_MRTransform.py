@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MRTransform
+from ....testing import assert_spec_metadata
 
 
 def test_MRTransform_inputs():
@@ -84,11 +85,7 @@ def test_MRTransform_inputs():
             extensions=None,
         ),
     )
-    inputs = MRTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRTransform.input_spec(), input_map)
 
 
 def test_MRTransform_outputs():
@@ -97,8 +94,4 @@ def test_MRTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = MRTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MRTransform.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MTNormalise
+from ....testing import assert_spec_metadata
 
 
 def test_MTNormalise_inputs():
@@ -77,11 +78,7 @@ def test_MTNormalise_inputs():
             position=1,
         ),
     )
-    inputs = MTNormalise.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MTNormalise.input_spec(), input_map)
 
 
 def test_MTNormalise_outputs():
@@ -96,8 +93,4 @@ def test_MTNormalise_outputs():
             extensions=None,
         ),
     )
-    outputs = MTNormalise.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MTNormalise.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import MaskFilter
+from ....testing import assert_spec_metadata
 
 
 def test_MaskFilter_inputs():
@@ -34,11 +35,7 @@ def test_MaskFilter_inputs():
             position=-1,
         ),
     )
-    inputs = MaskFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MaskFilter.input_spec(), input_map)
 
 
 def test_MaskFilter_outputs():
@@ -47,8 +44,4 @@ def test_MaskFilter_outputs():
             extensions=None,
         ),
     )
-    outputs = MaskFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MaskFilter.output_spec(), output_map)
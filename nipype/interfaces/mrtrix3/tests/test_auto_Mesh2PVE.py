@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Mesh2PVE
+from ....testing import assert_spec_metadata
 
 
 def test_Mesh2PVE_inputs():
@@ -35,11 +36,7 @@ def test_Mesh2PVE_inputs():
             position=-2,
         ),
     )
-    inputs = Mesh2PVE.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Mesh2PVE.input_spec(), input_map)
 
 
 def test_Mesh2PVE_outputs():
@@ -48,8 +45,4 @@ def test_Mesh2PVE_outputs():
             extensions=None,
         ),
     )
-    outputs = Mesh2PVE.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Mesh2PVE.output_spec(), output_map)
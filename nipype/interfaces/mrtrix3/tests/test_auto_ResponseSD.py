@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ResponseSD
+from ....testing import assert_spec_metadata
 
 
 def test_ResponseSD_inputs():
@@ -82,11 +83,7 @@ def test_ResponseSD_inputs():
             usedefault=True,
         ),
     )
-    inputs = ResponseSD.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResponseSD.input_spec(), input_map)
 
 
 def test_ResponseSD_outputs():
@@ -104,8 +101,4 @@ def test_ResponseSD_outputs():
             extensions=None,
         ),
     )
-    outputs = ResponseSD.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResponseSD.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import SH2Amp
+from ....testing import assert_spec_metadata
 
 
 def test_SH2Amp_inputs():
@@ -35,11 +36,7 @@ def test_SH2Amp_inputs():
             usedefault=True,
         ),
     )
-    inputs = SH2Amp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SH2Amp.input_spec(), input_map)
 
 
 def test_SH2Amp_outputs():
@@ -48,8 +45,4 @@ def test_SH2Amp_outputs():
             extensions=None,
         ),
     )
-    outputs = SH2Amp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SH2Amp.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TCK2VTK
+from ....testing import assert_spec_metadata
 
 
 def test_TCK2VTK_inputs():
@@ -36,11 +37,7 @@ def test_TCK2VTK_inputs():
             extensions=None,
         ),
     )
-    inputs = TCK2VTK.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCK2VTK.input_spec(), input_map)
 
 
 def test_TCK2VTK_outputs():
@@ -49,8 +46,4 @@ def test_TCK2VTK_outputs():
             extensions=None,
         ),
     )
-    outputs = TCK2VTK.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TCK2VTK.output_spec(), output_map)
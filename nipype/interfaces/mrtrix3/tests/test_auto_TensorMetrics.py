@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TensorMetrics
+from ....testing import assert_spec_metadata
 
 
 def test_TensorMetrics_inputs():
@@ -96,11 +97,7 @@ def test_TensorMetrics_inputs():
             extensions=None,
         ),
     )
-    inputs = TensorMetrics.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TensorMetrics.input_spec(), input_map)
 
 
 def test_TensorMetrics_outputs():
@@ -133,8 +130,4 @@ def test_TensorMetrics_outputs():
             extensions=None,
         ),
     )
-    outputs = TensorMetrics.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TensorMetrics.output_spec(), output_map)
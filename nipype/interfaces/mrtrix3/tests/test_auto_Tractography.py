@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..tracking import Tractography
+from ....testing import assert_spec_metadata
 
 
 def test_Tractography_inputs():
@@ -174,11 +175,7 @@ def test_Tractography_inputs():
             argstr="-rk4",
         ),
     )
-    inputs = Tractography.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Tractography.input_spec(), input_map)
 
 
 def test_Tractography_outputs():
@@ -190,8 +187,4 @@ def test_Tractography_outputs():
             extensions=None,
         ),
     )
-    outputs = Tractography.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Tractography.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import TransformFSLConvert
+from ....testing import assert_spec_metadata
 
 
 def test_TransformFSLConvert_inputs():
@@ -73,11 +74,7 @@ def test_TransformFSLConvert_inputs():
             position=2,
         ),
     )
-    inputs = TransformFSLConvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TransformFSLConvert.input_spec(), input_map)
 
 
 def test_TransformFSLConvert_outputs():
@@ -86,8 +83,4 @@ def test_TransformFSLConvert_outputs():
             extensions=None,
         ),
     )
-    outputs = TransformFSLConvert.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TransformFSLConvert.output_spec(), output_map)
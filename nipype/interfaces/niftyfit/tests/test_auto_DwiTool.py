@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dwi import DwiTool
+from ....testing import assert_spec_metadata
 
 
 def test_DwiTool_inputs():
@@ -192,11 +193,7 @@ def test_DwiTool_inputs():
             name_template="%s_v1map.nii.gz",
         ),
     )
-    inputs = DwiTool.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DwiTool.input_spec(), input_map)
 
 
 def test_DwiTool_outputs():
@@ -223,8 +220,4 @@ def test_DwiTool_outputs():
             extensions=None,
         ),
     )
-    outputs = DwiTool.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DwiTool.output_spec(), output_map)
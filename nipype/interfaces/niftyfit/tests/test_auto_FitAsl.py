@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..asl import FitAsl
+from ....testing import assert_spec_metadata
 
 
 def test_FitAsl_inputs():
@@ -143,11 +144,7 @@ def test_FitAsl_inputs():
             argstr="-wmTTT %f",
         ),
     )
-    inputs = FitAsl.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitAsl.input_spec(), input_map)
 
 
 def test_FitAsl_outputs():
@@ -162,8 +159,4 @@ def test_FitAsl_outputs():
             extensions=None,
         ),
     )
-    outputs = FitAsl.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitAsl.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dwi import FitDwi
+from ....testing import assert_spec_metadata
 
 
 def test_FitDwi_inputs():
@@ -270,11 +271,7 @@ def test_FitDwi_inputs():
             argstr="-wmT2 %f",
         ),
     )
-    inputs = FitDwi.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitDwi.input_spec(), input_map)
 
 
 def test_FitDwi_outputs():
@@ -316,8 +313,4 @@ def test_FitDwi_outputs():
             extensions=None,
         ),
     )
-    outputs = FitDwi.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitDwi.output_spec(), output_map)
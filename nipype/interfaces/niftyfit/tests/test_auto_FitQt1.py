@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..qt1 import FitQt1
+from ....testing import assert_spec_metadata
 
 
 def test_FitQt1_inputs():
@@ -157,11 +158,7 @@ def test_FitQt1_inputs():
             position=10,
         ),
     )
-    inputs = FitQt1.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitQt1.input_spec(), input_map)
 
 
 def test_FitQt1_outputs():
@@ -188,8 +185,4 @@ def test_FitQt1_outputs():
             extensions=None,
         ),
     )
-    outputs = FitQt1.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitQt1.output_spec(), output_map)
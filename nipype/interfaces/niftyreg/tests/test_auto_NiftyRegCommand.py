@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import NiftyRegCommand
+from ....testing import assert_spec_metadata
 
 
 def test_NiftyRegCommand_inputs():
@@ -16,8 +17,4 @@ def test_NiftyRegCommand_inputs():
             usedefault=True,
         ),
     )
-    inputs = NiftyRegCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NiftyRegCommand.input_spec(), input_map)
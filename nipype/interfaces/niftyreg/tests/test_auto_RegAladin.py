@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reg import RegAladin
+from ....testing import assert_spec_metadata
 
 
 def test_RegAladin_inputs():
@@ -107,11 +108,7 @@ def test_RegAladin_inputs():
             argstr="-voff",
         ),
     )
-    inputs = RegAladin.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegAladin.input_spec(), input_map)
 
 
 def test_RegAladin_outputs():
@@ -124,8 +121,4 @@ def test_RegAladin_outputs():
             extensions=None,
         ),
     )
-    outputs = RegAladin.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegAladin.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..regutils import RegAverage
+from ....testing import assert_spec_metadata
 
 
 def test_RegAverage_inputs():
@@ -106,11 +107,7 @@ def test_RegAverage_inputs():
             xor=["avg_files", "avg_lts_files"],
         ),
     )
-    inputs = RegAverage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegAverage.input_spec(), input_map)
 
 
 def test_RegAverage_outputs():
@@ -119,8 +116,4 @@ def test_RegAverage_outputs():
             extensions=None,
         ),
     )
-    outputs = RegAverage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegAverage.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..reg import RegF3D
+from ....testing import assert_spec_metadata
 
 
 def test_RegF3D_inputs():
@@ -180,11 +181,7 @@ def test_RegF3D_inputs():
             argstr="-voff",
         ),
     )
-    inputs = RegF3D.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegF3D.input_spec(), input_map)
 
 
 def test_RegF3D_outputs():
@@ -203,8 +200,4 @@ def test_RegF3D_outputs():
             extensions=None,
         ),
     )
-    outputs = RegF3D.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegF3D.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..regutils import RegJacobian
+from ....testing import assert_spec_metadata
 
 
 def test_RegJacobian_inputs():
@@ -37,11 +38,7 @@ def test_RegJacobian_inputs():
             usedefault=True,
         ),
     )
-    inputs = RegJacobian.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegJacobian.input_spec(), input_map)
 
 
 def test_RegJacobian_outputs():
@@ -50,8 +47,4 @@ def test_RegJacobian_outputs():
             extensions=None,
         ),
     )
-    outputs = RegJacobian.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegJacobian.output_spec(), output_map)
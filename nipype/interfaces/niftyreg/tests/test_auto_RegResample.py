@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..regutils import RegResample
+from ....testing import assert_spec_metadata
 
 
 def test_RegResample_inputs():
@@ -60,11 +61,7 @@ def test_RegResample_inputs():
             argstr="-voff",
         ),
     )
-    inputs = RegResample.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegResample.input_spec(), input_map)
 
 
 def test_RegResample_outputs():
@@ -73,8 +70,4 @@ def test_RegResample_outputs():
             extensions=None,
         ),
     )
-    outputs = RegResample.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegResample.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..regutils import RegTools
+from ....testing import assert_spec_metadata
 
 
 def test_RegTools_inputs():
@@ -74,11 +75,7 @@ def test_RegTools_inputs():
             argstr="-thr %f",
         ),
     )
-    inputs = RegTools.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegTools.input_spec(), input_map)
 
 
 def test_RegTools_outputs():
@@ -87,8 +84,4 @@ def test_RegTools_outputs():
             extensions=None,
         ),
     )
-    outputs = RegTools.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegTools.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..regutils import RegTransform
+from ....testing import assert_spec_metadata
 
 
 def test_RegTransform_inputs():
@@ -230,11 +231,7 @@ def test_RegTransform_inputs():
             requires=["upd_s_form_input"],
         ),
     )
-    inputs = RegTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegTransform.input_spec(), input_map)
 
 
 def test_RegTransform_outputs():
@@ -243,8 +240,4 @@ def test_RegTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = RegTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RegTransform.output_spec(), output_map)
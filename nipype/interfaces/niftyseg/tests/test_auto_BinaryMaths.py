@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import BinaryMaths
+from ....testing import assert_spec_metadata
 
 
 def test_BinaryMaths_inputs():
@@ -53,11 +54,7 @@ def test_BinaryMaths_inputs():
             position=-3,
         ),
     )
-    inputs = BinaryMaths.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BinaryMaths.input_spec(), input_map)
 
 
 def test_BinaryMaths_outputs():
@@ -66,8 +63,4 @@ def test_BinaryMaths_outputs():
             extensions=None,
         ),
     )
-    outputs = BinaryMaths.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BinaryMaths.output_spec(), output_map)
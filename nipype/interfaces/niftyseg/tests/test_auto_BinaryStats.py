@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..stats import BinaryStats
+from ....testing import assert_spec_metadata
 
 
 def test_BinaryStats_inputs():
@@ -45,19 +46,11 @@ def test_BinaryStats_inputs():
             position=4,
         ),
     )
-    inputs = BinaryStats.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BinaryStats.input_spec(), input_map)
 
 
 def test_BinaryStats_outputs():
     output_map = dict(
         output=dict(),
     )
-    outputs = BinaryStats.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BinaryStats.output_spec(), output_map)
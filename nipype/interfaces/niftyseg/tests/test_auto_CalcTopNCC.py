@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..label_fusion import CalcTopNCC
+from ....testing import assert_spec_metadata
 
 
 def test_CalcTopNCC_inputs():
@@ -37,19 +38,11 @@ def test_CalcTopNCC_inputs():
             position=4,
         ),
     )
-    inputs = CalcTopNCC.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CalcTopNCC.input_spec(), input_map)
 
 
 def test_CalcTopNCC_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = CalcTopNCC.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CalcTopNCC.output_spec(), output_map)
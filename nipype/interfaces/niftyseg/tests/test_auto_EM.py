@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..em import EM
+from ....testing import assert_spec_metadata
 
 
 def test_EM_inputs():
@@ -84,11 +85,7 @@ def test_EM_inputs():
             argstr="-rf %s %s",
         ),
     )
-    inputs = EM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EM.input_spec(), input_map)
 
 
 def test_EM_outputs():
@@ -103,8 +100,4 @@ def test_EM_outputs():
             extensions=None,
         ),
     )
-    outputs = EM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EM.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..lesions import FillLesions
+from ....testing import assert_spec_metadata
 
 
 def test_FillLesions_inputs():
@@ -68,11 +69,7 @@ def test_FillLesions_inputs():
             argstr="-v",
         ),
     )
-    inputs = FillLesions.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FillLesions.input_spec(), input_map)
 
 
 def test_FillLesions_outputs():
@@ -81,8 +78,4 @@ def test_FillLesions_outputs():
             extensions=None,
         ),
     )
-    outputs = FillLesions.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FillLesions.output_spec(), output_map)
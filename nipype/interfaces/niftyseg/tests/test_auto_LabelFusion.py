@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..label_fusion import LabelFusion
+from ....testing import assert_spec_metadata
 
 
 def test_LabelFusion_inputs():
@@ -78,11 +79,7 @@ def test_LabelFusion_inputs():
             argstr="-v %s",
         ),
     )
-    inputs = LabelFusion.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LabelFusion.input_spec(), input_map)
 
 
 def test_LabelFusion_outputs():
@@ -91,8 +88,4 @@ def test_LabelFusion_outputs():
             extensions=None,
         ),
     )
-    outputs = LabelFusion.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LabelFusion.output_spec(), output_map)
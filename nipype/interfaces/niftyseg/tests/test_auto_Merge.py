@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import Merge
+from ....testing import assert_spec_metadata
 
 
 def test_Merge_inputs():
@@ -37,11 +38,7 @@ def test_Merge_inputs():
             position=-3,
         ),
     )
-    inputs = Merge.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Merge.input_spec(), input_map)
 
 
 def test_Merge_outputs():
@@ -50,8 +47,4 @@ def test_Merge_outputs():
             extensions=None,
         ),
     )
-    outputs = Merge.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Merge.output_spec(), output_map)
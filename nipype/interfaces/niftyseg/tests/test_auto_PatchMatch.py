@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..patchmatch import PatchMatch
+from ....testing import assert_spec_metadata
 
 
 def test_PatchMatch_inputs():
@@ -52,11 +53,7 @@ def test_PatchMatch_inputs():
             argstr="-pm %i",
         ),
     )
-    inputs = PatchMatch.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PatchMatch.input_spec(), input_map)
 
 
 def test_PatchMatch_outputs():
@@ -65,8 +62,4 @@ def test_PatchMatch_outputs():
             extensions=None,
         ),
     )
-    outputs = PatchMatch.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PatchMatch.output_spec(), output_map)
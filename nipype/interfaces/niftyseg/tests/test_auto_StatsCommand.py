@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..stats import StatsCommand
+from ....testing import assert_spec_metadata
 
 
 def test_StatsCommand_inputs():
@@ -27,19 +28,11 @@ def test_StatsCommand_inputs():
             position=-2,
         ),
     )
-    inputs = StatsCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(StatsCommand.input_spec(), input_map)
 
 
 def test_StatsCommand_outputs():
     output_map = dict(
         output=dict(),
     )
-    outputs = StatsCommand.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(StatsCommand.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maths import TupleMaths
+from ....testing import assert_spec_metadata
 
 
 def test_TupleMaths_inputs():
@@ -60,11 +61,7 @@ def test_TupleMaths_inputs():
             position=-3,
         ),
     )
-    inputs = TupleMaths.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TupleMaths.input_spec(), input_map)
 
 
 def test_TupleMaths_outputs():
@@ -73,8 +70,4 @@ def test_TupleMaths_outputs():
             extensions=None,
         ),
     )
-    outputs = TupleMaths.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TupleMaths.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..stats import UnaryStats
+from ....testing import assert_spec_metadata
 
 
 def test_UnaryStats_inputs():
@@ -32,19 +33,11 @@ def test_UnaryStats_inputs():
             position=4,
         ),
     )
-    inputs = UnaryStats.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(UnaryStats.input_spec(), input_map)
 
 
 def test_UnaryStats_outputs():
     output_map = dict(
         output=dict(),
     )
-    outputs = UnaryStats.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(UnaryStats.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import EstimateContrast
+from ....testing import assert_spec_metadata
 
 
 def test_EstimateContrast_inputs():
@@ -34,11 +35,7 @@ def test_EstimateContrast_inputs():
             mandatory=True,
         ),
     )
-    inputs = EstimateContrast.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateContrast.input_spec(), input_map)
 
 
 def test_EstimateContrast_outputs():
@@ -47,8 +44,4 @@ def test_EstimateContrast_outputs():
         stat_maps=dict(),
         z_maps=dict(),
     )
-    outputs = EstimateContrast.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateContrast.output_spec(), output_map)
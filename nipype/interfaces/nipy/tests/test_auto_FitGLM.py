@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import FitGLM
+from ....testing import assert_spec_metadata
 
 
 def test_FitGLM_inputs():
@@ -35,11 +36,7 @@ def test_FitGLM_inputs():
             mandatory=True,
         ),
     )
-    inputs = FitGLM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitGLM.input_spec(), input_map)
 
 
 def test_FitGLM_outputs():
@@ -62,8 +59,4 @@ def test_FitGLM_outputs():
             extensions=None,
         ),
     )
-    outputs = FitGLM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FitGLM.output_spec(), output_map)
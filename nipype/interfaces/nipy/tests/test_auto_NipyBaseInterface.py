@@ -1,11 +1,8 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import NipyBaseInterface
+from ....testing import assert_spec_metadata
 
 
 def test_NipyBaseInterface_inputs():
     input_map = dict()
-    inputs = NipyBaseInterface.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NipyBaseInterface.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Similarity
+from ....testing import assert_spec_metadata
 
 
 def test_Similarity_inputs():
@@ -22,19 +23,11 @@ def test_Similarity_inputs():
             mandatory=True,
         ),
     )
-    inputs = Similarity.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Similarity.input_spec(), input_map)
 
 
 def test_Similarity_outputs():
     output_map = dict(
         similarity=dict(),
     )
-    outputs = Similarity.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Similarity.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import SpaceTimeRealigner
+from ....testing import assert_spec_metadata
 
 
 def test_SpaceTimeRealigner_inputs():
@@ -16,11 +17,7 @@ def test_SpaceTimeRealigner_inputs():
             requires=["slice_times"],
         ),
     )
-    inputs = SpaceTimeRealigner.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpaceTimeRealigner.input_spec(), input_map)
 
 
 def test_SpaceTimeRealigner_outputs():
@@ -28,8 +25,4 @@ def test_SpaceTimeRealigner_outputs():
         out_file=dict(),
         par_file=dict(),
     )
-    outputs = SpaceTimeRealigner.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SpaceTimeRealigner.output_spec(), output_map)
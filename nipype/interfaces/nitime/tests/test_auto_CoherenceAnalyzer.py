@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..analysis import CoherenceAnalyzer
+from ....testing import assert_spec_metadata
 
 
 def test_CoherenceAnalyzer_inputs():
@@ -29,11 +30,7 @@ def test_CoherenceAnalyzer_inputs():
             extensions=None,
         ),
     )
-    inputs = CoherenceAnalyzer.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CoherenceAnalyzer.input_spec(), input_map)
 
 
 def test_CoherenceAnalyzer_outputs():
@@ -53,8 +50,4 @@ def test_CoherenceAnalyzer_outputs():
             extensions=None,
         ),
     )
-    outputs = CoherenceAnalyzer.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CoherenceAnalyzer.output_spec(), output_map)
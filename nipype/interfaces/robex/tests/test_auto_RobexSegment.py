@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import RobexSegment
+from ....testing import assert_spec_metadata
 
 
 def test_RobexSegment_inputs():
@@ -40,11 +41,7 @@ def test_RobexSegment_inputs():
             position=3,
         ),
     )
-    inputs = RobexSegment.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobexSegment.input_spec(), input_map)
 
 
 def test_RobexSegment_outputs():
@@ -56,8 +53,4 @@ def test_RobexSegment_outputs():
             extensions=None,
         ),
     )
-    outputs = RobexSegment.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobexSegment.output_spec(), output_map)
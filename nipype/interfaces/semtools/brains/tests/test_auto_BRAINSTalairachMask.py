@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import BRAINSTalairachMask
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSTalairachMask_inputs():
@@ -34,11 +35,7 @@ def test_BRAINSTalairachMask_inputs():
             extensions=None,
         ),
     )
-    inputs = BRAINSTalairachMask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSTalairachMask.input_spec(), input_map)
 
 
 def test_BRAINSTalairachMask_outputs():
@@ -47,8 +44,4 @@ def test_BRAINSTalairachMask_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSTalairachMask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSTalairachMask.output_spec(), output_map)
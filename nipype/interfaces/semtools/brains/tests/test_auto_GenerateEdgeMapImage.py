@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utilities import GenerateEdgeMapImage
+from .....testing import assert_spec_metadata
 
 
 def test_GenerateEdgeMapImage_inputs():
@@ -42,11 +43,7 @@ def test_GenerateEdgeMapImage_inputs():
             argstr="--upperPercentileMatching %f",
         ),
     )
-    inputs = GenerateEdgeMapImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateEdgeMapImage.input_spec(), input_map)
 
 
 def test_GenerateEdgeMapImage_outputs():
@@ -58,8 +55,4 @@ def test_GenerateEdgeMapImage_outputs():
             extensions=None,
         ),
     )
-    outputs = GenerateEdgeMapImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateEdgeMapImage.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utilities import GeneratePurePlugMask
+from .....testing import assert_spec_metadata
 
 
 def test_GeneratePurePlugMask_inputs():
@@ -26,11 +27,7 @@ def test_GeneratePurePlugMask_inputs():
             argstr="--threshold %f",
         ),
     )
-    inputs = GeneratePurePlugMask.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GeneratePurePlugMask.input_spec(), input_map)
 
 
 def test_GeneratePurePlugMask_outputs():
@@ -39,8 +36,4 @@ def test_GeneratePurePlugMask_outputs():
             extensions=None,
         ),
     )
-    outputs = GeneratePurePlugMask.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GeneratePurePlugMask.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utilities import HistogramMatchingFilter
+from .....testing import assert_spec_metadata
 
 
 def test_HistogramMatchingFilter_inputs():
@@ -47,11 +48,7 @@ def test_HistogramMatchingFilter_inputs():
             argstr="--writeHistogram %s",
         ),
     )
-    inputs = HistogramMatchingFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(HistogramMatchingFilter.input_spec(), input_map)
 
 
 def test_HistogramMatchingFilter_outputs():
@@ -60,8 +57,4 @@ def test_HistogramMatchingFilter_outputs():
             extensions=None,
         ),
     )
-    outputs = HistogramMatchingFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(HistogramMatchingFilter.output_spec(), output_map)
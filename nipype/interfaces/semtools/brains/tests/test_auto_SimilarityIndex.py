@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import SimilarityIndex
+from .....testing import assert_spec_metadata
 
 
 def test_SimilarityIndex_inputs():
@@ -27,17 +28,9 @@ def test_SimilarityIndex_inputs():
             argstr="--thresholdInterval %f",
         ),
     )
-    inputs = SimilarityIndex.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimilarityIndex.input_spec(), input_map)
 
 
 def test_SimilarityIndex_outputs():
     output_map = dict()
-    outputs = SimilarityIndex.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimilarityIndex.output_spec(), output_map)
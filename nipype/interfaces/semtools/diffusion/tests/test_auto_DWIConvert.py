@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import DWIConvert
+from .....testing import assert_spec_metadata
 
 
 def test_DWIConvert_inputs():
@@ -75,11 +76,7 @@ def test_DWIConvert_inputs():
             argstr="--writeProtocolGradientsFile ",
         ),
     )
-    inputs = DWIConvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIConvert.input_spec(), input_map)
 
 
 def test_DWIConvert_outputs():
@@ -98,8 +95,4 @@ def test_DWIConvert_outputs():
             extensions=None,
         ),
     )
-    outputs = DWIConvert.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIConvert.output_spec(), output_map)
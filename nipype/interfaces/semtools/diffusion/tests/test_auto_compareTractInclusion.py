@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import compareTractInclusion
+from .....testing import assert_spec_metadata
 
 
 def test_compareTractInclusion_inputs():
@@ -38,17 +39,9 @@ def test_compareTractInclusion_inputs():
             argstr="--writeXMLPolyDataFile ",
         ),
     )
-    inputs = compareTractInclusion.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(compareTractInclusion.input_spec(), input_map)
 
 
 def test_compareTractInclusion_outputs():
     output_map = dict()
-    outputs = compareTractInclusion.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(compareTractInclusion.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import dtiaverage
+from .....testing import assert_spec_metadata
 
 
 def test_dtiaverage_inputs():
@@ -25,11 +26,7 @@ def test_dtiaverage_inputs():
             argstr="--verbose ",
         ),
     )
-    inputs = dtiaverage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(dtiaverage.input_spec(), input_map)
 
 
 def test_dtiaverage_outputs():
@@ -38,8 +35,4 @@ def test_dtiaverage_outputs():
             extensions=None,
         ),
     )
-    outputs = dtiaverage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(dtiaverage.output_spec(), output_map)
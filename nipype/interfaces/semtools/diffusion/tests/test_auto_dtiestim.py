@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import dtiestim
+from .....testing import assert_spec_metadata
 
 
 def test_dtiestim_inputs():
@@ -74,11 +75,7 @@ def test_dtiestim_inputs():
             argstr="--weight_iterations %d",
         ),
     )
-    inputs = dtiestim.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(dtiestim.input_spec(), input_map)
 
 
 def test_dtiestim_outputs():
@@ -96,8 +93,4 @@ def test_dtiestim_outputs():
             extensions=None,
         ),
     )
-    outputs = dtiestim.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(dtiestim.output_spec(), output_map)
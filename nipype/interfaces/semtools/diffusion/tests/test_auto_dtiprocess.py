@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import dtiprocess
+from .....testing import assert_spec_metadata
 
 
 def test_dtiprocess_inputs():
@@ -120,11 +121,7 @@ def test_dtiprocess_inputs():
             argstr="--verbose ",
         ),
     )
-    inputs = dtiprocess.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(dtiprocess.input_spec(), input_map)
 
 
 def test_dtiprocess_outputs():
@@ -175,8 +172,4 @@ def test_dtiprocess_outputs():
             extensions=None,
         ),
     )
-    outputs = dtiprocess.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(dtiprocess.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractAnisotropyMap
+from .....testing import assert_spec_metadata
 
 
 def test_gtractAnisotropyMap_inputs():
@@ -26,11 +27,7 @@ def test_gtractAnisotropyMap_inputs():
             hash_files=False,
         ),
     )
-    inputs = gtractAnisotropyMap.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractAnisotropyMap.input_spec(), input_map)
 
 
 def test_gtractAnisotropyMap_outputs():
@@ -39,8 +36,4 @@ def test_gtractAnisotropyMap_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractAnisotropyMap.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractAnisotropyMap.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractAverageBvalues
+from .....testing import assert_spec_metadata
 
 
 def test_gtractAverageBvalues_inputs():
@@ -29,11 +30,7 @@ def test_gtractAverageBvalues_inputs():
             hash_files=False,
         ),
     )
-    inputs = gtractAverageBvalues.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractAverageBvalues.input_spec(), input_map)
 
 
 def test_gtractAverageBvalues_outputs():
@@ -42,8 +39,4 @@ def test_gtractAverageBvalues_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractAverageBvalues.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractAverageBvalues.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractClipAnisotropy
+from .....testing import assert_spec_metadata
 
 
 def test_gtractClipAnisotropy_inputs():
@@ -29,11 +30,7 @@ def test_gtractClipAnisotropy_inputs():
             hash_files=False,
         ),
     )
-    inputs = gtractClipAnisotropy.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractClipAnisotropy.input_spec(), input_map)
 
 
 def test_gtractClipAnisotropy_outputs():
@@ -42,8 +39,4 @@ def test_gtractClipAnisotropy_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractClipAnisotropy.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractClipAnisotropy.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractCoRegAnatomy
+from .....testing import assert_spec_metadata
 
 
 def test_gtractCoRegAnatomy_inputs():
@@ -89,11 +90,7 @@ def test_gtractCoRegAnatomy_inputs():
             argstr="--vectorIndex %d",
         ),
     )
-    inputs = gtractCoRegAnatomy.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractCoRegAnatomy.input_spec(), input_map)
 
 
 def test_gtractCoRegAnatomy_outputs():
@@ -102,8 +99,4 @@ def test_gtractCoRegAnatomy_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractCoRegAnatomy.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractCoRegAnatomy.output_spec(), output_map)
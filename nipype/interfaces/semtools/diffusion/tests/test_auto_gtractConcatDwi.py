@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractConcatDwi
+from .....testing import assert_spec_metadata
 
 
 def test_gtractConcatDwi_inputs():
@@ -25,11 +26,7 @@ def test_gtractConcatDwi_inputs():
             hash_files=False,
         ),
     )
-    inputs = gtractConcatDwi.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractConcatDwi.input_spec(), input_map)
 
 
 def test_gtractConcatDwi_outputs():
@@ -38,8 +35,4 @@ def test_gtractConcatDwi_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractConcatDwi.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractConcatDwi.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractCoregBvalues
+from .....testing import assert_spec_metadata
 
 
 def test_gtractCoregBvalues_inputs():
@@ -64,11 +65,7 @@ def test_gtractCoregBvalues_inputs():
             argstr="--spatialScale %f",
         ),
     )
-    inputs = gtractCoregBvalues.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractCoregBvalues.input_spec(), input_map)
 
 
 def test_gtractCoregBvalues_outputs():
@@ -80,8 +77,4 @@ def test_gtractCoregBvalues_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractCoregBvalues.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractCoregBvalues.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractCostFastMarching
+from .....testing import assert_spec_metadata
 
 
 def test_gtractCostFastMarching_inputs():
@@ -47,11 +48,7 @@ def test_gtractCostFastMarching_inputs():
             argstr="--stoppingValue %f",
         ),
     )
-    inputs = gtractCostFastMarching.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractCostFastMarching.input_spec(), input_map)
 
 
 def test_gtractCostFastMarching_outputs():
@@ -63,8 +60,4 @@ def test_gtractCostFastMarching_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractCostFastMarching.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractCostFastMarching.output_spec(), output_map)
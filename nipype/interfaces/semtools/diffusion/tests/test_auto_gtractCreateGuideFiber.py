@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractCreateGuideFiber
+from .....testing import assert_spec_metadata
 
 
 def test_gtractCreateGuideFiber_inputs():
@@ -29,11 +30,7 @@ def test_gtractCreateGuideFiber_inputs():
             argstr="--writeXMLPolyDataFile ",
         ),
     )
-    inputs = gtractCreateGuideFiber.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractCreateGuideFiber.input_spec(), input_map)
 
 
 def test_gtractCreateGuideFiber_outputs():
@@ -42,8 +39,4 @@ def test_gtractCreateGuideFiber_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractCreateGuideFiber.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractCreateGuideFiber.output_spec(), output_map)
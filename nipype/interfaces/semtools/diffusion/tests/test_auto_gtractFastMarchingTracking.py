@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractFastMarchingTracking
+from .....testing import assert_spec_metadata
 
 
 def test_gtractFastMarchingTracking_inputs():
@@ -59,11 +60,7 @@ def test_gtractFastMarchingTracking_inputs():
             argstr="--writeXMLPolyDataFile ",
         ),
     )
-    inputs = gtractFastMarchingTracking.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractFastMarchingTracking.input_spec(), input_map)
 
 
 def test_gtractFastMarchingTracking_outputs():
@@ -72,8 +69,4 @@ def test_gtractFastMarchingTracking_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractFastMarchingTracking.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractFastMarchingTracking.output_spec(), output_map)
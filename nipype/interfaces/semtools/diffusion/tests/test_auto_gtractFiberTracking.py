@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractFiberTracking
+from .....testing import assert_spec_metadata
 
 
 def test_gtractFiberTracking_inputs():
@@ -102,11 +103,7 @@ def test_gtractFiberTracking_inputs():
             argstr="--writeXMLPolyDataFile ",
         ),
     )
-    inputs = gtractFiberTracking.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractFiberTracking.input_spec(), input_map)
 
 
 def test_gtractFiberTracking_outputs():
@@ -115,8 +112,4 @@ def test_gtractFiberTracking_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractFiberTracking.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractFiberTracking.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractInvertBSplineTransform
+from .....testing import assert_spec_metadata
 
 
 def test_gtractInvertBSplineTransform_inputs():
@@ -31,11 +32,7 @@ def test_gtractInvertBSplineTransform_inputs():
             hash_files=False,
         ),
     )
-    inputs = gtractInvertBSplineTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractInvertBSplineTransform.input_spec(), input_map)
 
 
 def test_gtractInvertBSplineTransform_outputs():
@@ -44,8 +41,4 @@ def test_gtractInvertBSplineTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractInvertBSplineTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractInvertBSplineTransform.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractResampleAnisotropy
+from .....testing import assert_spec_metadata
 
 
 def test_gtractResampleAnisotropy_inputs():
@@ -34,11 +35,7 @@ def test_gtractResampleAnisotropy_inputs():
             argstr="--transformType %s",
         ),
     )
-    inputs = gtractResampleAnisotropy.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractResampleAnisotropy.input_spec(), input_map)
 
 
 def test_gtractResampleAnisotropy_outputs():
@@ -47,8 +44,4 @@ def test_gtractResampleAnisotropy_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractResampleAnisotropy.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractResampleAnisotropy.output_spec(), output_map)
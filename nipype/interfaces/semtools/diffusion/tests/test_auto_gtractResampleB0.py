@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractResampleB0
+from .....testing import assert_spec_metadata
 
 
 def test_gtractResampleB0_inputs():
@@ -37,11 +38,7 @@ def test_gtractResampleB0_inputs():
             argstr="--vectorIndex %d",
         ),
     )
-    inputs = gtractResampleB0.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractResampleB0.input_spec(), input_map)
 
 
 def test_gtractResampleB0_outputs():
@@ -50,8 +47,4 @@ def test_gtractResampleB0_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractResampleB0.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractResampleB0.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractResampleCodeImage
+from .....testing import assert_spec_metadata
 
 
 def test_gtractResampleCodeImage_inputs():
@@ -34,11 +35,7 @@ def test_gtractResampleCodeImage_inputs():
             argstr="--transformType %s",
         ),
     )
-    inputs = gtractResampleCodeImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractResampleCodeImage.input_spec(), input_map)
 
 
 def test_gtractResampleCodeImage_outputs():
@@ -47,8 +44,4 @@ def test_gtractResampleCodeImage_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractResampleCodeImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractResampleCodeImage.output_spec(), output_map)
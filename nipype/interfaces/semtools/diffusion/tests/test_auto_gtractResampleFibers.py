@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractResampleFibers
+from .....testing import assert_spec_metadata
 
 
 def test_gtractResampleFibers_inputs():
@@ -34,11 +35,7 @@ def test_gtractResampleFibers_inputs():
             argstr="--writeXMLPolyDataFile ",
         ),
     )
-    inputs = gtractResampleFibers.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractResampleFibers.input_spec(), input_map)
 
 
 def test_gtractResampleFibers_outputs():
@@ -47,8 +44,4 @@ def test_gtractResampleFibers_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractResampleFibers.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractResampleFibers.output_spec(), output_map)
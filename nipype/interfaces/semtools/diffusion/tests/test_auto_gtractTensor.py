@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..gtract import gtractTensor
+from .....testing import assert_spec_metadata
 
 
 def test_gtractTensor_inputs():
@@ -53,11 +54,7 @@ def test_gtractTensor_inputs():
             argstr="--size %f",
         ),
     )
-    inputs = gtractTensor.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractTensor.input_spec(), input_map)
 
 
 def test_gtractTensor_outputs():
@@ -66,8 +63,4 @@ def test_gtractTensor_outputs():
             extensions=None,
         ),
     )
-    outputs = gtractTensor.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(gtractTensor.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..maxcurvature import maxcurvature
+from .....testing import assert_spec_metadata
 
 
 def test_maxcurvature_inputs():
@@ -26,11 +27,7 @@ def test_maxcurvature_inputs():
             argstr="--verbose ",
         ),
     )
-    inputs = maxcurvature.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(maxcurvature.input_spec(), input_map)
 
 
 def test_maxcurvature_outputs():
@@ -39,8 +36,4 @@ def test_maxcurvature_outputs():
             extensions=None,
         ),
     )
-    outputs = maxcurvature.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(maxcurvature.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..ukftractography import UKFTractography
+from ......testing import assert_spec_metadata
 
 
 def test_UKFTractography_inputs():
@@ -117,11 +118,7 @@ def test_UKFTractography_inputs():
             argstr="--writeUncompressedTracts ",
         ),
     )
-    inputs = UKFTractography.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(UKFTractography.input_spec(), input_map)
 
 
 def test_UKFTractography_outputs():
@@ -133,8 +130,4 @@ def test_UKFTractography_outputs():
             extensions=None,
         ),
     )
-    outputs = UKFTractography.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(UKFTractography.output_spec(), output_map)
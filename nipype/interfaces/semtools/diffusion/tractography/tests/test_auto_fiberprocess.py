@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..fiberprocess import fiberprocess
+from ......testing import assert_spec_metadata
 
 
 def test_fiberprocess_inputs():
@@ -60,11 +61,7 @@ def test_fiberprocess_inputs():
             argstr="--voxelize_count_fibers ",
         ),
     )
-    inputs = fiberprocess.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(fiberprocess.input_spec(), input_map)
 
 
 def test_fiberprocess_outputs():
@@ -76,8 +73,4 @@ def test_fiberprocess_outputs():
             extensions=None,
         ),
     )
-    outputs = fiberprocess.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(fiberprocess.output_spec(), output_map)
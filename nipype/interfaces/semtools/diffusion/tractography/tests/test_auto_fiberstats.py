@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..commandlineonly import fiberstats
+from ......testing import assert_spec_metadata
 
 
 def test_fiberstats_inputs():
@@ -19,17 +20,9 @@ def test_fiberstats_inputs():
             argstr="--verbose ",
         ),
     )
-    inputs = fiberstats.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(fiberstats.input_spec(), input_map)
 
 
 def test_fiberstats_outputs():
     output_map = dict()
-    outputs = fiberstats.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(fiberstats.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..fibertrack import fibertrack
+from ......testing import assert_spec_metadata
 
 
 def test_fibertrack_inputs():
@@ -54,11 +55,7 @@ def test_fibertrack_inputs():
             argstr="--whole_brain ",
         ),
     )
-    inputs = fibertrack.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(fibertrack.input_spec(), input_map)
 
 
 def test_fibertrack_outputs():
@@ -67,8 +64,4 @@ def test_fibertrack_outputs():
             extensions=None,
         ),
     )
-    outputs = fibertrack.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(fibertrack.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import CannyEdge
+from .....testing import assert_spec_metadata
 
 
 def test_CannyEdge_inputs():
@@ -29,11 +30,7 @@ def test_CannyEdge_inputs():
             argstr="--variance %f",
         ),
     )
-    inputs = CannyEdge.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CannyEdge.input_spec(), input_map)
 
 
 def test_CannyEdge_outputs():
@@ -42,8 +39,4 @@ def test_CannyEdge_outputs():
             extensions=None,
         ),
     )
-    outputs = CannyEdge.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CannyEdge.output_spec(), output_map)
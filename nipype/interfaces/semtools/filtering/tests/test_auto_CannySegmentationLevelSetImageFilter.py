@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import CannySegmentationLevelSetImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_CannySegmentationLevelSetImageFilter_inputs():
@@ -43,11 +44,7 @@ def test_CannySegmentationLevelSetImageFilter_inputs():
             hash_files=False,
         ),
     )
-    inputs = CannySegmentationLevelSetImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CannySegmentationLevelSetImageFilter.input_spec(), input_map)
 
 
 def test_CannySegmentationLevelSetImageFilter_outputs():
@@ -59,8 +56,4 @@ def test_CannySegmentationLevelSetImageFilter_outputs():
             extensions=None,
         ),
     )
-    outputs = CannySegmentationLevelSetImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CannySegmentationLevelSetImageFilter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import DumpBinaryTrainingVectors
+from .....testing import assert_spec_metadata
 
 
 def test_DumpBinaryTrainingVectors_inputs():
@@ -20,17 +21,9 @@ def test_DumpBinaryTrainingVectors_inputs():
             extensions=None,
         ),
     )
-    inputs = DumpBinaryTrainingVectors.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DumpBinaryTrainingVectors.input_spec(), input_map)
 
 
 def test_DumpBinaryTrainingVectors_outputs():
     output_map = dict()
-    outputs = DumpBinaryTrainingVectors.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DumpBinaryTrainingVectors.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import GenerateSummedGradientImage
+from .....testing import assert_spec_metadata
 
 
 def test_GenerateSummedGradientImage_inputs():
@@ -30,11 +31,7 @@ def test_GenerateSummedGradientImage_inputs():
             hash_files=False,
         ),
     )
-    inputs = GenerateSummedGradientImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateSummedGradientImage.input_spec(), input_map)
 
 
 def test_GenerateSummedGradientImage_outputs():
@@ -43,8 +40,4 @@ def test_GenerateSummedGradientImage_outputs():
             extensions=None,
         ),
     )
-    outputs = GenerateSummedGradientImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateSummedGradientImage.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import GradientAnisotropicDiffusionImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_GradientAnisotropicDiffusionImageFilter_inputs():
@@ -29,11 +30,9 @@ def test_GradientAnisotropicDiffusionImageFilter_inputs():
             argstr="--timeStep %f",
         ),
     )
-    inputs = GradientAnisotropicDiffusionImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(
+        GradientAnisotropicDiffusionImageFilter.input_spec(), input_map
+    )
 
 
 def test_GradientAnisotropicDiffusionImageFilter_outputs():
@@ -42,8 +41,6 @@ def test_GradientAnisotropicDiffusionImageFilter_outputs():
             extensions=None,
         ),
     )
-    outputs = GradientAnisotropicDiffusionImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(
+        GradientAnisotropicDiffusionImageFilter.output_spec(), output_map
+    )
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import HammerAttributeCreator
+from .....testing import assert_spec_metadata
 
 
 def test_HammerAttributeCreator_inputs():
@@ -33,17 +34,9 @@ def test_HammerAttributeCreator_inputs():
             argstr="--outputVolumeBase %s",
         ),
     )
-    inputs = HammerAttributeCreator.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(HammerAttributeCreator.input_spec(), input_map)
 
 
 def test_HammerAttributeCreator_outputs():
     output_map = dict()
-    outputs = HammerAttributeCreator.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(HammerAttributeCreator.output_spec(), output_map)
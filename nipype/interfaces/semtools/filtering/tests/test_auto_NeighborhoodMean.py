@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import NeighborhoodMean
+from .....testing import assert_spec_metadata
 
 
 def test_NeighborhoodMean_inputs():
@@ -27,11 +28,7 @@ def test_NeighborhoodMean_inputs():
             hash_files=False,
         ),
     )
-    inputs = NeighborhoodMean.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NeighborhoodMean.input_spec(), input_map)
 
 
 def test_NeighborhoodMean_outputs():
@@ -40,8 +37,4 @@ def test_NeighborhoodMean_outputs():
             extensions=None,
         ),
     )
-    outputs = NeighborhoodMean.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NeighborhoodMean.output_spec(), output_map)
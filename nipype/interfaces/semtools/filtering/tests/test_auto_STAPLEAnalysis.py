@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import STAPLEAnalysis
+from .....testing import assert_spec_metadata
 
 
 def test_STAPLEAnalysis_inputs():
@@ -22,11 +23,7 @@ def test_STAPLEAnalysis_inputs():
             hash_files=False,
         ),
     )
-    inputs = STAPLEAnalysis.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(STAPLEAnalysis.input_spec(), input_map)
 
 
 def test_STAPLEAnalysis_outputs():
@@ -35,8 +32,4 @@ def test_STAPLEAnalysis_outputs():
             extensions=None,
         ),
     )
-    outputs = STAPLEAnalysis.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(STAPLEAnalysis.output_spec(), output_map)
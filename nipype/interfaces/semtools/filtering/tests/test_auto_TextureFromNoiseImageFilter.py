@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import TextureFromNoiseImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_TextureFromNoiseImageFilter_inputs():
@@ -23,11 +24,7 @@ def test_TextureFromNoiseImageFilter_inputs():
             hash_files=False,
         ),
     )
-    inputs = TextureFromNoiseImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TextureFromNoiseImageFilter.input_spec(), input_map)
 
 
 def test_TextureFromNoiseImageFilter_outputs():
@@ -36,8 +33,4 @@ def test_TextureFromNoiseImageFilter_outputs():
             extensions=None,
         ),
     )
-    outputs = TextureFromNoiseImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TextureFromNoiseImageFilter.output_spec(), output_map)
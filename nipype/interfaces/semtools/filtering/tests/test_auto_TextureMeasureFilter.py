@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featuredetection import TextureMeasureFilter
+from .....testing import assert_spec_metadata
 
 
 def test_TextureMeasureFilter_inputs():
@@ -30,11 +31,7 @@ def test_TextureMeasureFilter_inputs():
             hash_files=False,
         ),
     )
-    inputs = TextureMeasureFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TextureMeasureFilter.input_spec(), input_map)
 
 
 def test_TextureMeasureFilter_outputs():
@@ -43,8 +40,4 @@ def test_TextureMeasureFilter_outputs():
             extensions=None,
         ),
     )
-    outputs = TextureMeasureFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TextureMeasureFilter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..denoising import UnbiasedNonLocalMeans
+from .....testing import assert_spec_metadata
 
 
 def test_UnbiasedNonLocalMeans_inputs():
@@ -39,11 +40,7 @@ def test_UnbiasedNonLocalMeans_inputs():
             argstr="--sigma %f",
         ),
     )
-    inputs = UnbiasedNonLocalMeans.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(UnbiasedNonLocalMeans.input_spec(), input_map)
 
 
 def test_UnbiasedNonLocalMeans_outputs():
@@ -53,8 +50,4 @@ def test_UnbiasedNonLocalMeans_outputs():
             position=-1,
         ),
     )
-    outputs = UnbiasedNonLocalMeans.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(UnbiasedNonLocalMeans.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import scalartransform
+from .....testing import assert_spec_metadata
 
 
 def test_scalartransform_inputs():
@@ -37,11 +38,7 @@ def test_scalartransform_inputs():
             hash_files=False,
         ),
     )
-    inputs = scalartransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(scalartransform.input_spec(), input_map)
 
 
 def test_scalartransform_outputs():
@@ -53,8 +50,4 @@ def test_scalartransform_outputs():
             extensions=None,
         ),
     )
-    outputs = scalartransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(scalartransform.output_spec(), output_map)
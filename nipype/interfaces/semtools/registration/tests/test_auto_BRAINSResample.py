@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsresample import BRAINSResample
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSResample_inputs():
@@ -51,11 +52,7 @@ def test_BRAINSResample_inputs():
             extensions=None,
         ),
     )
-    inputs = BRAINSResample.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSResample.input_spec(), input_map)
 
 
 def test_BRAINSResample_outputs():
@@ -64,8 +61,4 @@ def test_BRAINSResample_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSResample.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSResample.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsresize import BRAINSResize
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSResize_inputs():
@@ -26,11 +27,7 @@ def test_BRAINSResize_inputs():
             argstr="--scaleFactor %f",
         ),
     )
-    inputs = BRAINSResize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSResize.input_spec(), input_map)
 
 
 def test_BRAINSResize_outputs():
@@ -39,8 +36,4 @@ def test_BRAINSResize_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSResize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSResize.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BRAINSTransformFromFiducials
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSTransformFromFiducials_inputs():
@@ -36,11 +37,7 @@ def test_BRAINSTransformFromFiducials_inputs():
             argstr="--transformType %s",
         ),
     )
-    inputs = BRAINSTransformFromFiducials.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSTransformFromFiducials.input_spec(), input_map)
 
 
 def test_BRAINSTransformFromFiducials_outputs():
@@ -49,8 +46,4 @@ def test_BRAINSTransformFromFiducials_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSTransformFromFiducials.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSTransformFromFiducials.output_spec(), output_map)
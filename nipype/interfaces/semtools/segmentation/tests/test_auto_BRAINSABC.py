@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BRAINSABC
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSABC_inputs():
@@ -122,11 +123,7 @@ def test_BRAINSABC_inputs():
             argstr="--writeLess ",
         ),
     )
-    inputs = BRAINSABC.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSABC.input_spec(), input_map)
 
 
 def test_BRAINSABC_outputs():
@@ -150,8 +147,4 @@ def test_BRAINSABC_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSABC.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSABC.output_spec(), output_map)
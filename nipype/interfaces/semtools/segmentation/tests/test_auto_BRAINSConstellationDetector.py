@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BRAINSConstellationDetector
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSConstellationDetector_inputs():
@@ -154,11 +155,7 @@ def test_BRAINSConstellationDetector_inputs():
             argstr="--writedebuggingImagesLevel %d",
         ),
     )
-    inputs = BRAINSConstellationDetector.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSConstellationDetector.input_spec(), input_map)
 
 
 def test_BRAINSConstellationDetector_outputs():
@@ -192,8 +189,4 @@ def test_BRAINSConstellationDetector_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSConstellationDetector.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSConstellationDetector.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BRAINSCreateLabelMapFromProbabilityMaps
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSCreateLabelMapFromProbabilityMaps_inputs():
@@ -38,11 +39,9 @@ def test_BRAINSCreateLabelMapFromProbabilityMaps_inputs():
             sep=",",
         ),
     )
-    inputs = BRAINSCreateLabelMapFromProbabilityMaps.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(
+        BRAINSCreateLabelMapFromProbabilityMaps.input_spec(), input_map
+    )
 
 
 def test_BRAINSCreateLabelMapFromProbabilityMaps_outputs():
@@ -54,8 +53,6 @@ def test_BRAINSCreateLabelMapFromProbabilityMaps_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSCreateLabelMapFromProbabilityMaps.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(
+        BRAINSCreateLabelMapFromProbabilityMaps.output_spec(), output_map
+    )
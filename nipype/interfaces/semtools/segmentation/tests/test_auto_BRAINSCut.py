@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BRAINSCut
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSCut_inputs():
@@ -65,17 +66,9 @@ def test_BRAINSCut_inputs():
             argstr="--verbose %d",
         ),
     )
-    inputs = BRAINSCut.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSCut.input_spec(), input_map)
 
 
 def test_BRAINSCut_outputs():
     output_map = dict()
-    outputs = BRAINSCut.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSCut.output_spec(), output_map)
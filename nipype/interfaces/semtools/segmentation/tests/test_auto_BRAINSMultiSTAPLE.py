@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BRAINSMultiSTAPLE
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSMultiSTAPLE_inputs():
@@ -39,11 +40,7 @@ def test_BRAINSMultiSTAPLE_inputs():
             argstr="--skipResampling ",
         ),
     )
-    inputs = BRAINSMultiSTAPLE.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSMultiSTAPLE.input_spec(), input_map)
 
 
 def test_BRAINSMultiSTAPLE_outputs():
@@ -55,8 +52,4 @@ def test_BRAINSMultiSTAPLE_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSMultiSTAPLE.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSMultiSTAPLE.output_spec(), output_map)
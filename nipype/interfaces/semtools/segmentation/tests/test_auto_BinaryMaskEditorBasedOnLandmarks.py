@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BinaryMaskEditorBasedOnLandmarks
+from .....testing import assert_spec_metadata
 
 
 def test_BinaryMaskEditorBasedOnLandmarks_inputs():
@@ -40,11 +41,7 @@ def test_BinaryMaskEditorBasedOnLandmarks_inputs():
             sep=",",
         ),
     )
-    inputs = BinaryMaskEditorBasedOnLandmarks.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BinaryMaskEditorBasedOnLandmarks.input_spec(), input_map)
 
 
 def test_BinaryMaskEditorBasedOnLandmarks_outputs():
@@ -53,8 +50,4 @@ def test_BinaryMaskEditorBasedOnLandmarks_outputs():
             extensions=None,
         ),
     )
-    outputs = BinaryMaskEditorBasedOnLandmarks.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BinaryMaskEditorBasedOnLandmarks.output_spec(), output_map)
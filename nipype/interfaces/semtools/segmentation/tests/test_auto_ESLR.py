@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import ESLR
+from .....testing import assert_spec_metadata
 
 
 def test_ESLR_inputs():
@@ -41,11 +42,7 @@ def test_ESLR_inputs():
             argstr="--safetySize %d",
         ),
     )
-    inputs = ESLR.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ESLR.input_spec(), input_map)
 
 
 def test_ESLR_outputs():
@@ -54,8 +51,4 @@ def test_ESLR_outputs():
             extensions=None,
         ),
     )
-    outputs = ESLR.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ESLR.output_spec(), output_map)
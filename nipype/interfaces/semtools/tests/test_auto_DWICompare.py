@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..converters import DWICompare
+from ....testing import assert_spec_metadata
 
 
 def test_DWICompare_inputs():
@@ -20,17 +21,9 @@ def test_DWICompare_inputs():
             extensions=None,
         ),
     )
-    inputs = DWICompare.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWICompare.input_spec(), input_map)
 
 
 def test_DWICompare_outputs():
     output_map = dict()
-    outputs = DWICompare.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWICompare.output_spec(), output_map)
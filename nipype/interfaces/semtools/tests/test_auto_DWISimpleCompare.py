@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..converters import DWISimpleCompare
+from ....testing import assert_spec_metadata
 
 
 def test_DWISimpleCompare_inputs():
@@ -23,17 +24,9 @@ def test_DWISimpleCompare_inputs():
             extensions=None,
         ),
     )
-    inputs = DWISimpleCompare.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWISimpleCompare.input_spec(), input_map)
 
 
 def test_DWISimpleCompare_outputs():
     output_map = dict()
-    outputs = DWISimpleCompare.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWISimpleCompare.output_spec(), output_map)
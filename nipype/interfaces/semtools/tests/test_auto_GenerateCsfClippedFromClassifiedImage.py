@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..featurecreator import GenerateCsfClippedFromClassifiedImage
+from ....testing import assert_spec_metadata
 
 
 def test_GenerateCsfClippedFromClassifiedImage_inputs():
@@ -20,11 +21,7 @@ def test_GenerateCsfClippedFromClassifiedImage_inputs():
             hash_files=False,
         ),
     )
-    inputs = GenerateCsfClippedFromClassifiedImage.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateCsfClippedFromClassifiedImage.input_spec(), input_map)
 
 
 def test_GenerateCsfClippedFromClassifiedImage_outputs():
@@ -33,8 +30,6 @@ def test_GenerateCsfClippedFromClassifiedImage_outputs():
             extensions=None,
         ),
     )
-    outputs = GenerateCsfClippedFromClassifiedImage.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(
+        GenerateCsfClippedFromClassifiedImage.output_spec(), output_map
+    )
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSAlignMSP
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSAlignMSP_inputs():
@@ -52,11 +53,7 @@ def test_BRAINSAlignMSP_inputs():
             argstr="--writedebuggingImagesLevel %d",
         ),
     )
-    inputs = BRAINSAlignMSP.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSAlignMSP.input_spec(), input_map)
 
 
 def test_BRAINSAlignMSP_outputs():
@@ -66,8 +63,4 @@ def test_BRAINSAlignMSP_outputs():
         ),
         resultsDir=dict(),
     )
-    outputs = BRAINSAlignMSP.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSAlignMSP.output_spec(), output_map)
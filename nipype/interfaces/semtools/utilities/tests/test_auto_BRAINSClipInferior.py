@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSClipInferior
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSClipInferior_inputs():
@@ -29,11 +30,7 @@ def test_BRAINSClipInferior_inputs():
             hash_files=False,
         ),
     )
-    inputs = BRAINSClipInferior.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSClipInferior.input_spec(), input_map)
 
 
 def test_BRAINSClipInferior_outputs():
@@ -42,8 +39,4 @@ def test_BRAINSClipInferior_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSClipInferior.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSClipInferior.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSConstellationModeler
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSConstellationModeler_inputs():
@@ -55,11 +56,7 @@ def test_BRAINSConstellationModeler_inputs():
             argstr="--writedebuggingImagesLevel %d",
         ),
     )
-    inputs = BRAINSConstellationModeler.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSConstellationModeler.input_spec(), input_map)
 
 
 def test_BRAINSConstellationModeler_outputs():
@@ -69,8 +66,4 @@ def test_BRAINSConstellationModeler_outputs():
         ),
         resultsDir=dict(),
     )
-    outputs = BRAINSConstellationModeler.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSConstellationModeler.output_spec(), output_map)
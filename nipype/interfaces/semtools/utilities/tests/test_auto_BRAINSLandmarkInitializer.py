@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSLandmarkInitializer
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSLandmarkInitializer_inputs():
@@ -28,11 +29,7 @@ def test_BRAINSLandmarkInitializer_inputs():
             hash_files=False,
         ),
     )
-    inputs = BRAINSLandmarkInitializer.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSLandmarkInitializer.input_spec(), input_map)
 
 
 def test_BRAINSLandmarkInitializer_outputs():
@@ -41,8 +38,4 @@ def test_BRAINSLandmarkInitializer_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSLandmarkInitializer.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSLandmarkInitializer.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSLinearModelerEPCA
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSLinearModelerEPCA_inputs():
@@ -19,17 +20,9 @@ def test_BRAINSLinearModelerEPCA_inputs():
             argstr="--numberOfThreads %d",
         ),
     )
-    inputs = BRAINSLinearModelerEPCA.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSLinearModelerEPCA.input_spec(), input_map)
 
 
 def test_BRAINSLinearModelerEPCA_outputs():
     output_map = dict()
-    outputs = BRAINSLinearModelerEPCA.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSLinearModelerEPCA.output_spec(), output_map)
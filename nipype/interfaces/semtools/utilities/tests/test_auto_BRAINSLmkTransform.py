@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSLmkTransform
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSLmkTransform_inputs():
@@ -39,11 +40,7 @@ def test_BRAINSLmkTransform_inputs():
             hash_files=False,
         ),
     )
-    inputs = BRAINSLmkTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSLmkTransform.input_spec(), input_map)
 
 
 def test_BRAINSLmkTransform_outputs():
@@ -55,8 +52,4 @@ def test_BRAINSLmkTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSLmkTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSLmkTransform.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSMush
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSMush_inputs():
@@ -69,11 +70,7 @@ def test_BRAINSMush_inputs():
             argstr="--upperThresholdFactorPre %f",
         ),
     )
-    inputs = BRAINSMush.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSMush.input_spec(), input_map)
 
 
 def test_BRAINSMush_outputs():
@@ -88,8 +85,4 @@ def test_BRAINSMush_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSMush.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSMush.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSSnapShotWriter
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSSnapShotWriter_inputs():
@@ -38,11 +39,7 @@ def test_BRAINSSnapShotWriter_inputs():
             hash_files=False,
         ),
     )
-    inputs = BRAINSSnapShotWriter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSSnapShotWriter.input_spec(), input_map)
 
 
 def test_BRAINSSnapShotWriter_outputs():
@@ -51,8 +48,4 @@ def test_BRAINSSnapShotWriter_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSSnapShotWriter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSSnapShotWriter.output_spec(), output_map)
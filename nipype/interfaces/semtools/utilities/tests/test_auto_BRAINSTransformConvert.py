@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import BRAINSTransformConvert
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSTransformConvert_inputs():
@@ -34,11 +35,7 @@ def test_BRAINSTransformConvert_inputs():
             extensions=None,
         ),
     )
-    inputs = BRAINSTransformConvert.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSTransformConvert.input_spec(), input_map)
 
 
 def test_BRAINSTransformConvert_outputs():
@@ -50,8 +47,4 @@ def test_BRAINSTransformConvert_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSTransformConvert.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSTransformConvert.output_spec(), output_map)
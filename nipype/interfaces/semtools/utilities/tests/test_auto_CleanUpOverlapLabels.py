@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import CleanUpOverlapLabels
+from .....testing import assert_spec_metadata
 
 
 def test_CleanUpOverlapLabels_inputs():
@@ -19,19 +20,11 @@ def test_CleanUpOverlapLabels_inputs():
             hash_files=False,
         ),
     )
-    inputs = CleanUpOverlapLabels.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CleanUpOverlapLabels.input_spec(), input_map)
 
 
 def test_CleanUpOverlapLabels_outputs():
     output_map = dict(
         outputBinaryVolumes=dict(),
     )
-    outputs = CleanUpOverlapLabels.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CleanUpOverlapLabels.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import FindCenterOfBrain
+from .....testing import assert_spec_metadata
 
 
 def test_FindCenterOfBrain_inputs():
@@ -68,11 +69,7 @@ def test_FindCenterOfBrain_inputs():
             argstr="--otsuPercentileThreshold %f",
         ),
     )
-    inputs = FindCenterOfBrain.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FindCenterOfBrain.input_spec(), input_map)
 
 
 def test_FindCenterOfBrain_outputs():
@@ -96,8 +93,4 @@ def test_FindCenterOfBrain_outputs():
             extensions=None,
         ),
     )
-    outputs = FindCenterOfBrain.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FindCenterOfBrain.output_spec(), output_map)
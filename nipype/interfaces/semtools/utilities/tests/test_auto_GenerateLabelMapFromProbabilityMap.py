@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import GenerateLabelMapFromProbabilityMap
+from .....testing import assert_spec_metadata
 
 
 def test_GenerateLabelMapFromProbabilityMap_inputs():
@@ -22,11 +23,7 @@ def test_GenerateLabelMapFromProbabilityMap_inputs():
             hash_files=False,
         ),
     )
-    inputs = GenerateLabelMapFromProbabilityMap.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateLabelMapFromProbabilityMap.input_spec(), input_map)
 
 
 def test_GenerateLabelMapFromProbabilityMap_outputs():
@@ -35,8 +32,4 @@ def test_GenerateLabelMapFromProbabilityMap_outputs():
             extensions=None,
         ),
     )
-    outputs = GenerateLabelMapFromProbabilityMap.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GenerateLabelMapFromProbabilityMap.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import ImageRegionPlotter
+from .....testing import assert_spec_metadata
 
 
 def test_ImageRegionPlotter_inputs():
@@ -43,17 +44,9 @@ def test_ImageRegionPlotter_inputs():
             argstr="--verbose ",
         ),
     )
-    inputs = ImageRegionPlotter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageRegionPlotter.input_spec(), input_map)
 
 
 def test_ImageRegionPlotter_outputs():
     output_map = dict()
-    outputs = ImageRegionPlotter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageRegionPlotter.output_spec(), output_map)
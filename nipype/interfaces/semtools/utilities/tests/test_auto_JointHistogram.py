@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import JointHistogram
+from .....testing import assert_spec_metadata
 
 
 def test_JointHistogram_inputs():
@@ -34,17 +35,9 @@ def test_JointHistogram_inputs():
             argstr="--verbose ",
         ),
     )
-    inputs = JointHistogram.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JointHistogram.input_spec(), input_map)
 
 
 def test_JointHistogram_outputs():
     output_map = dict()
-    outputs = JointHistogram.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JointHistogram.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import ShuffleVectorsModule
+from .....testing import assert_spec_metadata
 
 
 def test_ShuffleVectorsModule_inputs():
@@ -23,11 +24,7 @@ def test_ShuffleVectorsModule_inputs():
             argstr="--resampleProportion %f",
         ),
     )
-    inputs = ShuffleVectorsModule.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ShuffleVectorsModule.input_spec(), input_map)
 
 
 def test_ShuffleVectorsModule_outputs():
@@ -36,8 +33,4 @@ def test_ShuffleVectorsModule_outputs():
             extensions=None,
         ),
     )
-    outputs = ShuffleVectorsModule.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ShuffleVectorsModule.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import fcsv_to_hdf5
+from .....testing import assert_spec_metadata
 
 
 def test_fcsv_to_hdf5_inputs():
@@ -33,11 +34,7 @@ def test_fcsv_to_hdf5_inputs():
             argstr="--versionID %s",
         ),
     )
-    inputs = fcsv_to_hdf5.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(fcsv_to_hdf5.input_spec(), input_map)
 
 
 def test_fcsv_to_hdf5_outputs():
@@ -49,8 +46,4 @@ def test_fcsv_to_hdf5_outputs():
             extensions=None,
         ),
     )
-    outputs = fcsv_to_hdf5.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(fcsv_to_hdf5.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import insertMidACPCpoint
+from .....testing import assert_spec_metadata
 
 
 def test_insertMidACPCpoint_inputs():
@@ -20,11 +21,7 @@ def test_insertMidACPCpoint_inputs():
             hash_files=False,
         ),
     )
-    inputs = insertMidACPCpoint.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(insertMidACPCpoint.input_spec(), input_map)
 
 
 def test_insertMidACPCpoint_outputs():
@@ -33,8 +30,4 @@ def test_insertMidACPCpoint_outputs():
             extensions=None,
         ),
     )
-    outputs = insertMidACPCpoint.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(insertMidACPCpoint.output_spec(), output_map)
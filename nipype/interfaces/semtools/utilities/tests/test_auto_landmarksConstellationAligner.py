@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import landmarksConstellationAligner
+from .....testing import assert_spec_metadata
 
 
 def test_landmarksConstellationAligner_inputs():
@@ -20,11 +21,7 @@ def test_landmarksConstellationAligner_inputs():
             hash_files=False,
         ),
     )
-    inputs = landmarksConstellationAligner.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(landmarksConstellationAligner.input_spec(), input_map)
 
 
 def test_landmarksConstellationAligner_outputs():
@@ -33,8 +30,4 @@ def test_landmarksConstellationAligner_outputs():
             extensions=None,
         ),
     )
-    outputs = landmarksConstellationAligner.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(landmarksConstellationAligner.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brains import landmarksConstellationWeights
+from .....testing import assert_spec_metadata
 
 
 def test_landmarksConstellationWeights_inputs():
@@ -28,11 +29,7 @@ def test_landmarksConstellationWeights_inputs():
             hash_files=False,
         ),
     )
-    inputs = landmarksConstellationWeights.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(landmarksConstellationWeights.input_spec(), input_map)
 
 
 def test_landmarksConstellationWeights_outputs():
@@ -41,8 +38,4 @@ def test_landmarksConstellationWeights_outputs():
             extensions=None,
         ),
     )
-    outputs = landmarksConstellationWeights.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(landmarksConstellationWeights.output_spec(), output_map)
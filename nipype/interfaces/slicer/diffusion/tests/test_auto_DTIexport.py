@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import DTIexport
+from .....testing import assert_spec_metadata
 
 
 def test_DTIexport_inputs():
@@ -22,11 +23,7 @@ def test_DTIexport_inputs():
             position=-1,
         ),
     )
-    inputs = DTIexport.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTIexport.input_spec(), input_map)
 
 
 def test_DTIexport_outputs():
@@ -36,8 +33,4 @@ def test_DTIexport_outputs():
             position=-1,
         ),
     )
-    outputs = DTIexport.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTIexport.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import DTIimport
+from .....testing import assert_spec_metadata
 
 
 def test_DTIimport_inputs():
@@ -25,11 +26,7 @@ def test_DTIimport_inputs():
             argstr="--testingmode ",
         ),
     )
-    inputs = DTIimport.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTIimport.input_spec(), input_map)
 
 
 def test_DTIimport_outputs():
@@ -39,8 +36,4 @@ def test_DTIimport_outputs():
             position=-1,
         ),
     )
-    outputs = DTIimport.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DTIimport.output_spec(), output_map)
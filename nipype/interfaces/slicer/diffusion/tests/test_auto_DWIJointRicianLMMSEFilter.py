@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import DWIJointRicianLMMSEFilter
+from .....testing import assert_spec_metadata
 
 
 def test_DWIJointRicianLMMSEFilter_inputs():
@@ -36,11 +37,7 @@ def test_DWIJointRicianLMMSEFilter_inputs():
             sep=",",
         ),
     )
-    inputs = DWIJointRicianLMMSEFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIJointRicianLMMSEFilter.input_spec(), input_map)
 
 
 def test_DWIJointRicianLMMSEFilter_outputs():
@@ -50,8 +47,4 @@ def test_DWIJointRicianLMMSEFilter_outputs():
             position=-1,
         ),
     )
-    outputs = DWIJointRicianLMMSEFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIJointRicianLMMSEFilter.output_spec(), output_map)
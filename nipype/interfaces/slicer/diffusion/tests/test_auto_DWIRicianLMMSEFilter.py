@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import DWIRicianLMMSEFilter
+from .....testing import assert_spec_metadata
 
 
 def test_DWIRicianLMMSEFilter_inputs():
@@ -54,11 +55,7 @@ def test_DWIRicianLMMSEFilter_inputs():
             argstr="--uav ",
         ),
     )
-    inputs = DWIRicianLMMSEFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIRicianLMMSEFilter.input_spec(), input_map)
 
 
 def test_DWIRicianLMMSEFilter_outputs():
@@ -68,8 +65,4 @@ def test_DWIRicianLMMSEFilter_outputs():
             position=-1,
         ),
     )
-    outputs = DWIRicianLMMSEFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIRicianLMMSEFilter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import DWIToDTIEstimation
+from .....testing import assert_spec_metadata
 
 
 def test_DWIToDTIEstimation_inputs():
@@ -37,11 +38,7 @@ def test_DWIToDTIEstimation_inputs():
             argstr="--shiftNeg ",
         ),
     )
-    inputs = DWIToDTIEstimation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIToDTIEstimation.input_spec(), input_map)
 
 
 def test_DWIToDTIEstimation_outputs():
@@ -55,8 +52,4 @@ def test_DWIToDTIEstimation_outputs():
             position=-2,
         ),
     )
-    outputs = DWIToDTIEstimation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIToDTIEstimation.output_spec(), output_map)
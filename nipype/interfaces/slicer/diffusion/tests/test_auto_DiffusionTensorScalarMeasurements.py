@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import DiffusionTensorScalarMeasurements
+from .....testing import assert_spec_metadata
 
 
 def test_DiffusionTensorScalarMeasurements_inputs():
@@ -25,11 +26,7 @@ def test_DiffusionTensorScalarMeasurements_inputs():
             position=-1,
         ),
     )
-    inputs = DiffusionTensorScalarMeasurements.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DiffusionTensorScalarMeasurements.input_spec(), input_map)
 
 
 def test_DiffusionTensorScalarMeasurements_outputs():
@@ -39,8 +36,4 @@ def test_DiffusionTensorScalarMeasurements_outputs():
             position=-1,
         ),
     )
-    outputs = DiffusionTensorScalarMeasurements.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DiffusionTensorScalarMeasurements.output_spec(), output_map)
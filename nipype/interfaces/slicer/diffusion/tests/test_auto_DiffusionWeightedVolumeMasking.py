@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import DiffusionWeightedVolumeMasking
+from .....testing import assert_spec_metadata
 
 
 def test_DiffusionWeightedVolumeMasking_inputs():
@@ -33,11 +34,7 @@ def test_DiffusionWeightedVolumeMasking_inputs():
             position=-1,
         ),
     )
-    inputs = DiffusionWeightedVolumeMasking.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DiffusionWeightedVolumeMasking.input_spec(), input_map)
 
 
 def test_DiffusionWeightedVolumeMasking_outputs():
@@ -51,8 +48,4 @@ def test_DiffusionWeightedVolumeMasking_outputs():
             position=-1,
         ),
     )
-    outputs = DiffusionWeightedVolumeMasking.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DiffusionWeightedVolumeMasking.output_spec(), output_map)
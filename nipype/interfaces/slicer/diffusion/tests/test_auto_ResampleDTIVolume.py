@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import ResampleDTIVolume
+from .....testing import assert_spec_metadata
 
 
 def test_ResampleDTIVolume_inputs():
@@ -101,11 +102,7 @@ def test_ResampleDTIVolume_inputs():
             argstr="--window_function %s",
         ),
     )
-    inputs = ResampleDTIVolume.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResampleDTIVolume.input_spec(), input_map)
 
 
 def test_ResampleDTIVolume_outputs():
@@ -115,8 +112,4 @@ def test_ResampleDTIVolume_outputs():
             position=-1,
         ),
     )
-    outputs = ResampleDTIVolume.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResampleDTIVolume.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..diffusion import TractographyLabelMapSeeding
+from .....testing import assert_spec_metadata
 
 
 def test_TractographyLabelMapSeeding_inputs():
@@ -69,11 +70,7 @@ def test_TractographyLabelMapSeeding_inputs():
             argstr="--writetofile ",
         ),
     )
-    inputs = TractographyLabelMapSeeding.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TractographyLabelMapSeeding.input_spec(), input_map)
 
 
 def test_TractographyLabelMapSeeding_outputs():
@@ -84,8 +81,4 @@ def test_TractographyLabelMapSeeding_outputs():
         ),
         outputdirectory=dict(),
     )
-    outputs = TractographyLabelMapSeeding.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TractographyLabelMapSeeding.output_spec(), output_map)
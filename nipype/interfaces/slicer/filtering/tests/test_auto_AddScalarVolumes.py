@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..arithmetic import AddScalarVolumes
+from .....testing import assert_spec_metadata
 
 
 def test_AddScalarVolumes_inputs():
@@ -30,11 +31,7 @@ def test_AddScalarVolumes_inputs():
             position=-1,
         ),
     )
-    inputs = AddScalarVolumes.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AddScalarVolumes.input_spec(), input_map)
 
 
 def test_AddScalarVolumes_outputs():
@@ -44,8 +41,4 @@ def test_AddScalarVolumes_outputs():
             position=-1,
         ),
     )
-    outputs = AddScalarVolumes.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AddScalarVolumes.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..arithmetic import CastScalarVolume
+from .....testing import assert_spec_metadata
 
 
 def test_CastScalarVolume_inputs():
@@ -25,11 +26,7 @@ def test_CastScalarVolume_inputs():
             argstr="--type %s",
         ),
     )
-    inputs = CastScalarVolume.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CastScalarVolume.input_spec(), input_map)
 
 
 def test_CastScalarVolume_outputs():
@@ -39,8 +36,4 @@ def test_CastScalarVolume_outputs():
             position=-1,
         ),
     )
-    outputs = CastScalarVolume.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CastScalarVolume.output_spec(), output_map)
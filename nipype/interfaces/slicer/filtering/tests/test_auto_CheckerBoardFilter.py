@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..checkerboardfilter import CheckerBoardFilter
+from .....testing import assert_spec_metadata
 
 
 def test_CheckerBoardFilter_inputs():
@@ -31,11 +32,7 @@ def test_CheckerBoardFilter_inputs():
             position=-1,
         ),
     )
-    inputs = CheckerBoardFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CheckerBoardFilter.input_spec(), input_map)
 
 
 def test_CheckerBoardFilter_outputs():
@@ -45,8 +42,4 @@ def test_CheckerBoardFilter_outputs():
             position=-1,
         ),
     )
-    outputs = CheckerBoardFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CheckerBoardFilter.output_spec(), output_map)
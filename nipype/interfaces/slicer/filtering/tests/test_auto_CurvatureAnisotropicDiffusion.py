@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..denoising import CurvatureAnisotropicDiffusion
+from .....testing import assert_spec_metadata
 
 
 def test_CurvatureAnisotropicDiffusion_inputs():
@@ -31,11 +32,7 @@ def test_CurvatureAnisotropicDiffusion_inputs():
             argstr="--timeStep %f",
         ),
     )
-    inputs = CurvatureAnisotropicDiffusion.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CurvatureAnisotropicDiffusion.input_spec(), input_map)
 
 
 def test_CurvatureAnisotropicDiffusion_outputs():
@@ -45,8 +42,4 @@ def test_CurvatureAnisotropicDiffusion_outputs():
             position=-1,
         ),
     )
-    outputs = CurvatureAnisotropicDiffusion.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CurvatureAnisotropicDiffusion.output_spec(), output_map)
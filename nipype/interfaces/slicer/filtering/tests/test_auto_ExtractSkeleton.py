@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..extractskeleton import ExtractSkeleton
+from .....testing import assert_spec_metadata
 
 
 def test_ExtractSkeleton_inputs():
@@ -34,11 +35,7 @@ def test_ExtractSkeleton_inputs():
             argstr="--type %s",
         ),
     )
-    inputs = ExtractSkeleton.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractSkeleton.input_spec(), input_map)
 
 
 def test_ExtractSkeleton_outputs():
@@ -48,8 +45,4 @@ def test_ExtractSkeleton_outputs():
             position=-1,
         ),
     )
-    outputs = ExtractSkeleton.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExtractSkeleton.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..denoising import GaussianBlurImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_GaussianBlurImageFilter_inputs():
@@ -25,11 +26,7 @@ def test_GaussianBlurImageFilter_inputs():
             argstr="--sigma %f",
         ),
     )
-    inputs = GaussianBlurImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GaussianBlurImageFilter.input_spec(), input_map)
 
 
 def test_GaussianBlurImageFilter_outputs():
@@ -39,8 +36,4 @@ def test_GaussianBlurImageFilter_outputs():
             position=-1,
         ),
     )
-    outputs = GaussianBlurImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GaussianBlurImageFilter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..denoising import GradientAnisotropicDiffusion
+from .....testing import assert_spec_metadata
 
 
 def test_GradientAnisotropicDiffusion_inputs():
@@ -31,11 +32,7 @@ def test_GradientAnisotropicDiffusion_inputs():
             argstr="--timeStep %f",
         ),
     )
-    inputs = GradientAnisotropicDiffusion.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GradientAnisotropicDiffusion.input_spec(), input_map)
 
 
 def test_GradientAnisotropicDiffusion_outputs():
@@ -45,8 +42,4 @@ def test_GradientAnisotropicDiffusion_outputs():
             position=-1,
         ),
     )
-    outputs = GradientAnisotropicDiffusion.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GradientAnisotropicDiffusion.output_spec(), output_map)
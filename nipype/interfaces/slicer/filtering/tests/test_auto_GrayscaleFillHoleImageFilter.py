@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..morphology import GrayscaleFillHoleImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_GrayscaleFillHoleImageFilter_inputs():
@@ -22,11 +23,7 @@ def test_GrayscaleFillHoleImageFilter_inputs():
             position=-1,
         ),
     )
-    inputs = GrayscaleFillHoleImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GrayscaleFillHoleImageFilter.input_spec(), input_map)
 
 
 def test_GrayscaleFillHoleImageFilter_outputs():
@@ -36,8 +33,4 @@ def test_GrayscaleFillHoleImageFilter_outputs():
             position=-1,
         ),
     )
-    outputs = GrayscaleFillHoleImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GrayscaleFillHoleImageFilter.output_spec(), output_map)
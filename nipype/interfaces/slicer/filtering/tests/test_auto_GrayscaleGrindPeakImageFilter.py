@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..morphology import GrayscaleGrindPeakImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_GrayscaleGrindPeakImageFilter_inputs():
@@ -22,11 +23,7 @@ def test_GrayscaleGrindPeakImageFilter_inputs():
             position=-1,
         ),
     )
-    inputs = GrayscaleGrindPeakImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GrayscaleGrindPeakImageFilter.input_spec(), input_map)
 
 
 def test_GrayscaleGrindPeakImageFilter_outputs():
@@ -36,8 +33,4 @@ def test_GrayscaleGrindPeakImageFilter_outputs():
             position=-1,
         ),
     )
-    outputs = GrayscaleGrindPeakImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GrayscaleGrindPeakImageFilter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..histogrammatching import HistogramMatching
+from .....testing import assert_spec_metadata
 
 
 def test_HistogramMatching_inputs():
@@ -36,11 +37,7 @@ def test_HistogramMatching_inputs():
             argstr="--threshold ",
         ),
     )
-    inputs = HistogramMatching.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(HistogramMatching.input_spec(), input_map)
 
 
 def test_HistogramMatching_outputs():
@@ -50,8 +47,4 @@ def test_HistogramMatching_outputs():
             position=-1,
         ),
     )
-    outputs = HistogramMatching.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(HistogramMatching.output_spec(), output_map)
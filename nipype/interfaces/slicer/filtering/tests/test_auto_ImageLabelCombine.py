@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..imagelabelcombine import ImageLabelCombine
+from .....testing import assert_spec_metadata
 
 
 def test_ImageLabelCombine_inputs():
@@ -30,11 +31,7 @@ def test_ImageLabelCombine_inputs():
             argstr="--first_overwrites ",
         ),
     )
-    inputs = ImageLabelCombine.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageLabelCombine.input_spec(), input_map)
 
 
 def test_ImageLabelCombine_outputs():
@@ -44,8 +41,4 @@ def test_ImageLabelCombine_outputs():
             position=-1,
         ),
     )
-    outputs = ImageLabelCombine.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ImageLabelCombine.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..arithmetic import MaskScalarVolume
+from .....testing import assert_spec_metadata
 
 
 def test_MaskScalarVolume_inputs():
@@ -33,11 +34,7 @@ def test_MaskScalarVolume_inputs():
             argstr="--replace %d",
         ),
     )
-    inputs = MaskScalarVolume.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MaskScalarVolume.input_spec(), input_map)
 
 
 def test_MaskScalarVolume_outputs():
@@ -47,8 +44,4 @@ def test_MaskScalarVolume_outputs():
             position=-1,
         ),
     )
-    outputs = MaskScalarVolume.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MaskScalarVolume.output_spec(), output_map)
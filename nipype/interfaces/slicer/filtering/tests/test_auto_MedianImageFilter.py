@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..denoising import MedianImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_MedianImageFilter_inputs():
@@ -26,11 +27,7 @@ def test_MedianImageFilter_inputs():
             position=-1,
         ),
     )
-    inputs = MedianImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedianImageFilter.input_spec(), input_map)
 
 
 def test_MedianImageFilter_outputs():
@@ -40,8 +37,4 @@ def test_MedianImageFilter_outputs():
             position=-1,
         ),
     )
-    outputs = MedianImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MedianImageFilter.output_spec(), output_map)
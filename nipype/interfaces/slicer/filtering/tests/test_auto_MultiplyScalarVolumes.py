@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..arithmetic import MultiplyScalarVolumes
+from .....testing import assert_spec_metadata
 
 
 def test_MultiplyScalarVolumes_inputs():
@@ -30,11 +31,7 @@ def test_MultiplyScalarVolumes_inputs():
             position=-1,
         ),
     )
-    inputs = MultiplyScalarVolumes.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultiplyScalarVolumes.input_spec(), input_map)
 
 
 def test_MultiplyScalarVolumes_outputs():
@@ -44,8 +41,4 @@ def test_MultiplyScalarVolumes_outputs():
             position=-1,
         ),
     )
-    outputs = MultiplyScalarVolumes.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultiplyScalarVolumes.output_spec(), output_map)
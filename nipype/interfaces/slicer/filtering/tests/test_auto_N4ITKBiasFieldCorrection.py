@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..n4itkbiasfieldcorrection import N4ITKBiasFieldCorrection
+from .....testing import assert_spec_metadata
 
 
 def test_N4ITKBiasFieldCorrection_inputs():
@@ -56,11 +57,7 @@ def test_N4ITKBiasFieldCorrection_inputs():
             extensions=None,
         ),
     )
-    inputs = N4ITKBiasFieldCorrection.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(N4ITKBiasFieldCorrection.input_spec(), input_map)
 
 
 def test_N4ITKBiasFieldCorrection_outputs():
@@ -72,8 +69,4 @@ def test_N4ITKBiasFieldCorrection_outputs():
             extensions=None,
         ),
     )
-    outputs = N4ITKBiasFieldCorrection.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(N4ITKBiasFieldCorrection.output_spec(), output_map)
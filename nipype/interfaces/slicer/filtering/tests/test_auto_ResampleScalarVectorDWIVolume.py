@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..resamplescalarvectordwivolume import ResampleScalarVectorDWIVolume
+from .....testing import assert_spec_metadata
 
 
 def test_ResampleScalarVectorDWIVolume_inputs():
@@ -95,11 +96,7 @@ def test_ResampleScalarVectorDWIVolume_inputs():
             argstr="--window_function %s",
         ),
     )
-    inputs = ResampleScalarVectorDWIVolume.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResampleScalarVectorDWIVolume.input_spec(), input_map)
 
 
 def test_ResampleScalarVectorDWIVolume_outputs():
@@ -109,8 +106,4 @@ def test_ResampleScalarVectorDWIVolume_outputs():
             position=-1,
         ),
     )
-    outputs = ResampleScalarVectorDWIVolume.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResampleScalarVectorDWIVolume.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..arithmetic import SubtractScalarVolumes
+from .....testing import assert_spec_metadata
 
 
 def test_SubtractScalarVolumes_inputs():
@@ -30,11 +31,7 @@ def test_SubtractScalarVolumes_inputs():
             position=-1,
         ),
     )
-    inputs = SubtractScalarVolumes.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SubtractScalarVolumes.input_spec(), input_map)
 
 
 def test_SubtractScalarVolumes_outputs():
@@ -44,8 +41,4 @@ def test_SubtractScalarVolumes_outputs():
             position=-1,
         ),
     )
-    outputs = SubtractScalarVolumes.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SubtractScalarVolumes.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..thresholdscalarvolume import ThresholdScalarVolume
+from .....testing import assert_spec_metadata
 
 
 def test_ThresholdScalarVolume_inputs():
@@ -37,11 +38,7 @@ def test_ThresholdScalarVolume_inputs():
             argstr="--upper %d",
         ),
     )
-    inputs = ThresholdScalarVolume.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ThresholdScalarVolume.input_spec(), input_map)
 
 
 def test_ThresholdScalarVolume_outputs():
@@ -51,8 +48,4 @@ def test_ThresholdScalarVolume_outputs():
             position=-1,
         ),
     )
-    outputs = ThresholdScalarVolume.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ThresholdScalarVolume.output_spec(), output_map)
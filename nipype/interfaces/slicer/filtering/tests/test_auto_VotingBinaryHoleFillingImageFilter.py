@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..votingbinaryholefillingimagefilter import VotingBinaryHoleFillingImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_VotingBinaryHoleFillingImageFilter_inputs():
@@ -35,11 +36,7 @@ def test_VotingBinaryHoleFillingImageFilter_inputs():
             sep=",",
         ),
     )
-    inputs = VotingBinaryHoleFillingImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(VotingBinaryHoleFillingImageFilter.input_spec(), input_map)
 
 
 def test_VotingBinaryHoleFillingImageFilter_outputs():
@@ -49,8 +46,4 @@ def test_VotingBinaryHoleFillingImageFilter_outputs():
             position=-1,
         ),
     )
-    outputs = VotingBinaryHoleFillingImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(VotingBinaryHoleFillingImageFilter.output_spec(), output_map)
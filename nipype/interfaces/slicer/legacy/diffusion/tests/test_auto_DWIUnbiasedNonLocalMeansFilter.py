@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..denoising import DWIUnbiasedNonLocalMeansFilter
+from ......testing import assert_spec_metadata
 
 
 def test_DWIUnbiasedNonLocalMeansFilter_inputs():
@@ -40,11 +41,7 @@ def test_DWIUnbiasedNonLocalMeansFilter_inputs():
             sep=",",
         ),
     )
-    inputs = DWIUnbiasedNonLocalMeansFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIUnbiasedNonLocalMeansFilter.input_spec(), input_map)
 
 
 def test_DWIUnbiasedNonLocalMeansFilter_outputs():
@@ -54,8 +51,4 @@ def test_DWIUnbiasedNonLocalMeansFilter_outputs():
             position=-1,
         ),
     )
-    outputs = DWIUnbiasedNonLocalMeansFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DWIUnbiasedNonLocalMeansFilter.output_spec(), output_map)
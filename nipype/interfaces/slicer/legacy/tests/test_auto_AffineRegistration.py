@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import AffineRegistration
+from .....testing import assert_spec_metadata
 
 
 def test_AffineRegistration_inputs():
@@ -52,11 +53,7 @@ def test_AffineRegistration_inputs():
             argstr="--translationscale %f",
         ),
     )
-    inputs = AffineRegistration.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(AffineRegistration.input_spec(), input_map)
 
 
 def test_AffineRegistration_outputs():
@@ -68,8 +65,4 @@ def test_AffineRegistration_outputs():
             extensions=None,
         ),
     )
-    outputs = AffineRegistration.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(AffineRegistration.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import BSplineDeformableRegistration
+from .....testing import assert_spec_metadata
 
 
 def test_BSplineDeformableRegistration_inputs():
@@ -59,11 +60,7 @@ def test_BSplineDeformableRegistration_inputs():
             argstr="--spatialsamples %d",
         ),
     )
-    inputs = BSplineDeformableRegistration.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BSplineDeformableRegistration.input_spec(), input_map)
 
 
 def test_BSplineDeformableRegistration_outputs():
@@ -78,8 +75,4 @@ def test_BSplineDeformableRegistration_outputs():
             extensions=None,
         ),
     )
-    outputs = BSplineDeformableRegistration.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BSplineDeformableRegistration.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..converters import BSplineToDeformationField
+from .....testing import assert_spec_metadata
 
 
 def test_BSplineToDeformationField_inputs():
@@ -24,11 +25,7 @@ def test_BSplineToDeformationField_inputs():
             extensions=None,
         ),
     )
-    inputs = BSplineToDeformationField.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BSplineToDeformationField.input_spec(), input_map)
 
 
 def test_BSplineToDeformationField_outputs():
@@ -37,8 +34,4 @@ def test_BSplineToDeformationField_outputs():
             extensions=None,
         ),
     )
-    outputs = BSplineToDeformationField.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BSplineToDeformationField.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import ExpertAutomatedRegistration
+from .....testing import assert_spec_metadata
 
 
 def test_ExpertAutomatedRegistration_inputs():
@@ -104,11 +105,7 @@ def test_ExpertAutomatedRegistration_inputs():
             argstr="--verbosityLevel %s",
         ),
     )
-    inputs = ExpertAutomatedRegistration.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExpertAutomatedRegistration.input_spec(), input_map)
 
 
 def test_ExpertAutomatedRegistration_outputs():
@@ -120,8 +117,4 @@ def test_ExpertAutomatedRegistration_outputs():
             extensions=None,
         ),
     )
-    outputs = ExpertAutomatedRegistration.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExpertAutomatedRegistration.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import LinearRegistration
+from .....testing import assert_spec_metadata
 
 
 def test_LinearRegistration_inputs():
@@ -57,11 +58,7 @@ def test_LinearRegistration_inputs():
             argstr="--translationscale %f",
         ),
     )
-    inputs = LinearRegistration.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LinearRegistration.input_spec(), input_map)
 
 
 def test_LinearRegistration_outputs():
@@ -73,8 +70,4 @@ def test_LinearRegistration_outputs():
             extensions=None,
         ),
     )
-    outputs = LinearRegistration.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LinearRegistration.output_spec(), output_map)
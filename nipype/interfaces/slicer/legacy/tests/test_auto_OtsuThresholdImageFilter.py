@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..filtering import OtsuThresholdImageFilter
+from .....testing import assert_spec_metadata
 
 
 def test_OtsuThresholdImageFilter_inputs():
@@ -31,11 +32,7 @@ def test_OtsuThresholdImageFilter_inputs():
             argstr="--outsideValue %d",
         ),
     )
-    inputs = OtsuThresholdImageFilter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(OtsuThresholdImageFilter.input_spec(), input_map)
 
 
 def test_OtsuThresholdImageFilter_outputs():
@@ -45,8 +42,4 @@ def test_OtsuThresholdImageFilter_outputs():
             position=-1,
         ),
     )
-    outputs = OtsuThresholdImageFilter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(OtsuThresholdImageFilter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..segmentation import OtsuThresholdSegmentation
+from .....testing import assert_spec_metadata
 
 
 def test_OtsuThresholdSegmentation_inputs():
@@ -34,11 +35,7 @@ def test_OtsuThresholdSegmentation_inputs():
             position=-1,
         ),
     )
-    inputs = OtsuThresholdSegmentation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(OtsuThresholdSegmentation.input_spec(), input_map)
 
 
 def test_OtsuThresholdSegmentation_outputs():
@@ -48,8 +45,4 @@ def test_OtsuThresholdSegmentation_outputs():
             position=-1,
         ),
     )
-    outputs = OtsuThresholdSegmentation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(OtsuThresholdSegmentation.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..registration import RigidRegistration
+from .....testing import assert_spec_metadata
 
 
 def test_RigidRegistration_inputs():
@@ -60,11 +61,7 @@ def test_RigidRegistration_inputs():
             argstr="--translationscale %f",
         ),
     )
-    inputs = RigidRegistration.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RigidRegistration.input_spec(), input_map)
 
 
 def test_RigidRegistration_outputs():
@@ -76,8 +73,4 @@ def test_RigidRegistration_outputs():
             extensions=None,
         ),
     )
-    outputs = RigidRegistration.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RigidRegistration.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..changequantification import IntensityDifferenceMetric
+from .....testing import assert_spec_metadata
 
 
 def test_IntensityDifferenceMetric_inputs():
@@ -42,11 +43,7 @@ def test_IntensityDifferenceMetric_inputs():
             argstr="--sensitivityThreshold %f",
         ),
     )
-    inputs = IntensityDifferenceMetric.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(IntensityDifferenceMetric.input_spec(), input_map)
 
 
 def test_IntensityDifferenceMetric_outputs():
@@ -59,8 +56,4 @@ def test_IntensityDifferenceMetric_outputs():
             extensions=None,
         ),
     )
-    outputs = IntensityDifferenceMetric.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(IntensityDifferenceMetric.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..petstandarduptakevaluecomputation import PETStandardUptakeValueComputation
+from .....testing import assert_spec_metadata
 
 
 def test_PETStandardUptakeValueComputation_inputs():
@@ -46,11 +47,7 @@ def test_PETStandardUptakeValueComputation_inputs():
             extensions=None,
         ),
     )
-    inputs = PETStandardUptakeValueComputation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PETStandardUptakeValueComputation.input_spec(), input_map)
 
 
 def test_PETStandardUptakeValueComputation_outputs():
@@ -59,8 +56,4 @@ def test_PETStandardUptakeValueComputation_outputs():
             extensions=None,
         ),
     )
-    outputs = PETStandardUptakeValueComputation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PETStandardUptakeValueComputation.output_spec(), output_map)
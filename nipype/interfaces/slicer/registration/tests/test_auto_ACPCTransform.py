@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import ACPCTransform
+from .....testing import assert_spec_metadata
 
 
 def test_ACPCTransform_inputs():
@@ -25,11 +26,7 @@ def test_ACPCTransform_inputs():
             hash_files=False,
         ),
     )
-    inputs = ACPCTransform.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ACPCTransform.input_spec(), input_map)
 
 
 def test_ACPCTransform_outputs():
@@ -38,8 +35,4 @@ def test_ACPCTransform_outputs():
             extensions=None,
         ),
     )
-    outputs = ACPCTransform.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ACPCTransform.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BRAINSDemonWarp
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSDemonWarp_inputs():
@@ -148,11 +149,7 @@ def test_BRAINSDemonWarp_inputs():
             argstr="--use_vanilla_dem ",
         ),
     )
-    inputs = BRAINSDemonWarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSDemonWarp.input_spec(), input_map)
 
 
 def test_BRAINSDemonWarp_outputs():
@@ -167,8 +164,4 @@ def test_BRAINSDemonWarp_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSDemonWarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSDemonWarp.output_spec(), output_map)
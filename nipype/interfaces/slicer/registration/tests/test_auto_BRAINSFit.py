@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..brainsfit import BRAINSFit
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSFit_inputs():
@@ -213,11 +214,7 @@ def test_BRAINSFit_inputs():
             argstr="--writeTransformOnFailure ",
         ),
     )
-    inputs = BRAINSFit.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSFit.input_spec(), input_map)
 
 
 def test_BRAINSFit_outputs():
@@ -244,8 +241,4 @@ def test_BRAINSFit_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSFit.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSFit.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import FiducialRegistration
+from .....testing import assert_spec_metadata
 
 
 def test_FiducialRegistration_inputs():
@@ -31,11 +32,7 @@ def test_FiducialRegistration_inputs():
             argstr="--transformType %s",
         ),
     )
-    inputs = FiducialRegistration.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FiducialRegistration.input_spec(), input_map)
 
 
 def test_FiducialRegistration_outputs():
@@ -44,8 +41,4 @@ def test_FiducialRegistration_outputs():
             extensions=None,
         ),
     )
-    outputs = FiducialRegistration.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FiducialRegistration.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import VBRAINSDemonWarp
+from .....testing import assert_spec_metadata
 
 
 def test_VBRAINSDemonWarp_inputs():
@@ -150,11 +151,7 @@ def test_VBRAINSDemonWarp_inputs():
             sep=",",
         ),
     )
-    inputs = VBRAINSDemonWarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(VBRAINSDemonWarp.input_spec(), input_map)
 
 
 def test_VBRAINSDemonWarp_outputs():
@@ -169,8 +166,4 @@ def test_VBRAINSDemonWarp_outputs():
             extensions=None,
         ),
     )
-    outputs = VBRAINSDemonWarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(VBRAINSDemonWarp.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import BRAINSROIAuto
+from .....testing import assert_spec_metadata
 
 
 def test_BRAINSROIAuto_inputs():
@@ -42,11 +43,7 @@ def test_BRAINSROIAuto_inputs():
             argstr="--thresholdCorrectionFactor %f",
         ),
     )
-    inputs = BRAINSROIAuto.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSROIAuto.input_spec(), input_map)
 
 
 def test_BRAINSROIAuto_outputs():
@@ -58,8 +55,4 @@ def test_BRAINSROIAuto_outputs():
             extensions=None,
         ),
     )
-    outputs = BRAINSROIAuto.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BRAINSROIAuto.output_spec(), output_map)
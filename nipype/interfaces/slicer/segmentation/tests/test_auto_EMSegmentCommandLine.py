@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import EMSegmentCommandLine
+from .....testing import assert_spec_metadata
 
 
 def test_EMSegmentCommandLine_inputs():
@@ -80,11 +81,7 @@ def test_EMSegmentCommandLine_inputs():
             argstr="--verbose ",
         ),
     )
-    inputs = EMSegmentCommandLine.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EMSegmentCommandLine.input_spec(), input_map)
 
 
 def test_EMSegmentCommandLine_outputs():
@@ -99,8 +96,4 @@ def test_EMSegmentCommandLine_outputs():
             extensions=None,
         ),
     )
-    outputs = EMSegmentCommandLine.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EMSegmentCommandLine.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..specialized import RobustStatisticsSegmenter
+from .....testing import assert_spec_metadata
 
 
 def test_RobustStatisticsSegmenter_inputs():
@@ -42,11 +43,7 @@ def test_RobustStatisticsSegmenter_inputs():
             position=-1,
         ),
     )
-    inputs = RobustStatisticsSegmenter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobustStatisticsSegmenter.input_spec(), input_map)
 
 
 def test_RobustStatisticsSegmenter_outputs():
@@ -56,8 +53,4 @@ def test_RobustStatisticsSegmenter_outputs():
             position=-1,
         ),
     )
-    outputs = RobustStatisticsSegmenter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RobustStatisticsSegmenter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..simpleregiongrowingsegmentation import SimpleRegionGrowingSegmentation
+from .....testing import assert_spec_metadata
 
 
 def test_SimpleRegionGrowingSegmentation_inputs():
@@ -43,11 +44,7 @@ def test_SimpleRegionGrowingSegmentation_inputs():
             argstr="--timestep %f",
         ),
     )
-    inputs = SimpleRegionGrowingSegmentation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimpleRegionGrowingSegmentation.input_spec(), input_map)
 
 
 def test_SimpleRegionGrowingSegmentation_outputs():
@@ -57,8 +54,4 @@ def test_SimpleRegionGrowingSegmentation_outputs():
             position=-1,
         ),
     )
-    outputs = SimpleRegionGrowingSegmentation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SimpleRegionGrowingSegmentation.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..converters import DicomToNrrdConverter
+from ....testing import assert_spec_metadata
 
 
 def test_DicomToNrrdConverter_inputs():
@@ -34,19 +35,11 @@ def test_DicomToNrrdConverter_inputs():
             argstr="--writeProtocolGradientsFile ",
         ),
     )
-    inputs = DicomToNrrdConverter.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DicomToNrrdConverter.input_spec(), input_map)
 
 
 def test_DicomToNrrdConverter_outputs():
     output_map = dict(
         outputDirectory=dict(),
     )
-    outputs = DicomToNrrdConverter.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DicomToNrrdConverter.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utilities import EMSegmentTransformToNewFormat
+from ....testing import assert_spec_metadata
 
 
 def test_EMSegmentTransformToNewFormat_inputs():
@@ -23,11 +24,7 @@ def test_EMSegmentTransformToNewFormat_inputs():
             argstr="--templateFlag ",
         ),
     )
-    inputs = EMSegmentTransformToNewFormat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EMSegmentTransformToNewFormat.input_spec(), input_map)
 
 
 def test_EMSegmentTransformToNewFormat_outputs():
@@ -36,8 +33,4 @@ def test_EMSegmentTransformToNewFormat_outputs():
             extensions=None,
         ),
     )
-    outputs = EMSegmentTransformToNewFormat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EMSegmentTransformToNewFormat.output_spec(), output_map)
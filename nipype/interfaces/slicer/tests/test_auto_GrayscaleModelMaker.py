@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..surface import GrayscaleModelMaker
+from ....testing import assert_spec_metadata
 
 
 def test_GrayscaleModelMaker_inputs():
@@ -40,11 +41,7 @@ def test_GrayscaleModelMaker_inputs():
             argstr="--threshold %f",
         ),
     )
-    inputs = GrayscaleModelMaker.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GrayscaleModelMaker.input_spec(), input_map)
 
 
 def test_GrayscaleModelMaker_outputs():
@@ -54,8 +51,4 @@ def test_GrayscaleModelMaker_outputs():
             position=-1,
         ),
     )
-    outputs = GrayscaleModelMaker.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GrayscaleModelMaker.output_spec(), output_map)
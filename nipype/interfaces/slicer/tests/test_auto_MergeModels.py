@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..surface import MergeModels
+from ....testing import assert_spec_metadata
 
 
 def test_MergeModels_inputs():
@@ -27,11 +28,7 @@ def test_MergeModels_inputs():
             usedefault=True,
         ),
     )
-    inputs = MergeModels.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeModels.input_spec(), input_map)
 
 
 def test_MergeModels_outputs():
@@ -41,8 +38,4 @@ def test_MergeModels_outputs():
             position=-1,
         ),
     )
-    outputs = MergeModels.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeModels.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..surface import ModelMaker
+from ....testing import assert_spec_metadata
 
 
 def test_ModelMaker_inputs():
@@ -71,19 +72,11 @@ def test_ModelMaker_inputs():
             argstr="--start %d",
         ),
     )
-    inputs = ModelMaker.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ModelMaker.input_spec(), input_map)
 
 
 def test_ModelMaker_outputs():
     output_map = dict(
         modelSceneFile=dict(),
     )
-    outputs = ModelMaker.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ModelMaker.output_spec(), output_map)
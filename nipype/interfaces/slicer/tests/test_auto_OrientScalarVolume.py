@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..converters import OrientScalarVolume
+from ....testing import assert_spec_metadata
 
 
 def test_OrientScalarVolume_inputs():
@@ -25,11 +26,7 @@ def test_OrientScalarVolume_inputs():
             position=-1,
         ),
     )
-    inputs = OrientScalarVolume.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(OrientScalarVolume.input_spec(), input_map)
 
 
 def test_OrientScalarVolume_outputs():
@@ -39,8 +36,4 @@ def test_OrientScalarVolume_outputs():
             position=-1,
         ),
     )
-    outputs = OrientScalarVolume.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(OrientScalarVolume.output_spec(), output_map)
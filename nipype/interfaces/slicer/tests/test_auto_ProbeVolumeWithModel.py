@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..surface import ProbeVolumeWithModel
+from ....testing import assert_spec_metadata
 
 
 def test_ProbeVolumeWithModel_inputs():
@@ -27,11 +28,7 @@ def test_ProbeVolumeWithModel_inputs():
             usedefault=True,
         ),
     )
-    inputs = ProbeVolumeWithModel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProbeVolumeWithModel.input_spec(), input_map)
 
 
 def test_ProbeVolumeWithModel_outputs():
@@ -41,8 +38,4 @@ def test_ProbeVolumeWithModel_outputs():
             position=-1,
         ),
     )
-    outputs = ProbeVolumeWithModel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ProbeVolumeWithModel.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import Analyze2nii
+from ....testing import assert_spec_metadata
 
 
 def test_Analyze2nii_inputs():
@@ -19,11 +20,7 @@ def test_Analyze2nii_inputs():
             usedefault=True,
         ),
     )
-    inputs = Analyze2nii.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Analyze2nii.input_spec(), input_map)
 
 
 def test_Analyze2nii_outputs():
@@ -42,8 +39,4 @@ def test_Analyze2nii_outputs():
             usedefault=True,
         ),
     )
-    outputs = Analyze2nii.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Analyze2nii.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ApplyDeformations
+from ....testing import assert_spec_metadata
 
 
 def test_ApplyDeformations_inputs():
@@ -32,19 +33,11 @@ def test_ApplyDeformations_inputs():
             usedefault=True,
         ),
     )
-    inputs = ApplyDeformations.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyDeformations.input_spec(), input_map)
 
 
 def test_ApplyDeformations_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = ApplyDeformations.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyDeformations.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ApplyInverseDeformation
+from ....testing import assert_spec_metadata
 
 
 def test_ApplyInverseDeformation_inputs():
@@ -42,19 +43,11 @@ def test_ApplyInverseDeformation_inputs():
             field="comp{1}.inv.comp{1}.sn2def.vox",
         ),
     )
-    inputs = ApplyInverseDeformation.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyInverseDeformation.input_spec(), input_map)
 
 
 def test_ApplyInverseDeformation_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = ApplyInverseDeformation.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyInverseDeformation.output_spec(), output_map)
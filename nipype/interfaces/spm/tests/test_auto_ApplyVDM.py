@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import ApplyVDM
+from ....testing import assert_spec_metadata
 
 
 def test_ApplyVDM_inputs():
@@ -47,11 +48,7 @@ def test_ApplyVDM_inputs():
             field="roptions.wrap",
         ),
     )
-    inputs = ApplyVDM.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyVDM.input_spec(), input_map)
 
 
 def test_ApplyVDM_outputs():
@@ -61,8 +58,4 @@ def test_ApplyVDM_outputs():
         ),
         out_files=dict(),
     )
-    outputs = ApplyVDM.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ApplyVDM.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import CalcCoregAffine
+from ....testing import assert_spec_metadata
 
 
 def test_CalcCoregAffine_inputs():
@@ -30,11 +31,7 @@ def test_CalcCoregAffine_inputs():
             usedefault=True,
         ),
     )
-    inputs = CalcCoregAffine.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CalcCoregAffine.input_spec(), input_map)
 
 
 def test_CalcCoregAffine_outputs():
@@ -46,8 +43,4 @@ def test_CalcCoregAffine_outputs():
             extensions=None,
         ),
     )
-    outputs = CalcCoregAffine.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CalcCoregAffine.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Coregister
+from ....testing import assert_spec_metadata
 
 
 def test_Coregister_inputs():
@@ -58,11 +59,7 @@ def test_Coregister_inputs():
             field="roptions.wrap",
         ),
     )
-    inputs = Coregister.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Coregister.input_spec(), input_map)
 
 
 def test_Coregister_outputs():
@@ -70,8 +67,4 @@ def test_Coregister_outputs():
         coregistered_files=dict(),
         coregistered_source=dict(),
     )
-    outputs = Coregister.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Coregister.output_spec(), output_map)
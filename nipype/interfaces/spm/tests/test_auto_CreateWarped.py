@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import CreateWarped
+from ....testing import assert_spec_metadata
 
 
 def test_CreateWarped_inputs():
@@ -34,19 +35,11 @@ def test_CreateWarped_inputs():
             usedefault=True,
         ),
     )
-    inputs = CreateWarped.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateWarped.input_spec(), input_map)
 
 
 def test_CreateWarped_outputs():
     output_map = dict(
         warped_files=dict(),
     )
-    outputs = CreateWarped.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CreateWarped.output_spec(), output_map)
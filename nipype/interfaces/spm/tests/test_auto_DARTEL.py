@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import DARTEL
+from ....testing import assert_spec_metadata
 
 
 def test_DARTEL_inputs():
@@ -33,11 +34,7 @@ def test_DARTEL_inputs():
             usedefault=True,
         ),
     )
-    inputs = DARTEL.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DARTEL.input_spec(), input_map)
 
 
 def test_DARTEL_outputs():
@@ -48,8 +45,4 @@ def test_DARTEL_outputs():
         ),
         template_files=dict(),
     )
-    outputs = DARTEL.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DARTEL.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import DARTELNorm2MNI
+from ....testing import assert_spec_metadata
 
 
 def test_DARTELNorm2MNI_inputs():
@@ -42,11 +43,7 @@ def test_DARTELNorm2MNI_inputs():
             field="mni_norm.vox",
         ),
     )
-    inputs = DARTELNorm2MNI.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DARTELNorm2MNI.input_spec(), input_map)
 
 
 def test_DARTELNorm2MNI_outputs():
@@ -56,8 +53,4 @@ def test_DARTELNorm2MNI_outputs():
         ),
         normalized_files=dict(),
     )
-    outputs = DARTELNorm2MNI.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DARTELNorm2MNI.output_spec(), output_map)
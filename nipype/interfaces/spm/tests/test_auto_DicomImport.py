@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import DicomImport
+from ....testing import assert_spec_metadata
 
 
 def test_DicomImport_inputs():
@@ -35,19 +36,11 @@ def test_DicomImport_inputs():
             usedefault=True,
         ),
     )
-    inputs = DicomImport.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DicomImport.input_spec(), input_map)
 
 
 def test_DicomImport_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = DicomImport.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DicomImport.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import EstimateModel
+from ....testing import assert_spec_metadata
 
 
 def test_EstimateModel_inputs():
@@ -29,11 +30,7 @@ def test_EstimateModel_inputs():
             field="write_residuals",
         ),
     )
-    inputs = EstimateModel.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateModel.input_spec(), input_map)
 
 
 def test_EstimateModel_outputs():
@@ -64,8 +61,4 @@ def test_EstimateModel_outputs():
             extensions=None,
         ),
     )
-    outputs = EstimateModel.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(EstimateModel.output_spec(), output_map)
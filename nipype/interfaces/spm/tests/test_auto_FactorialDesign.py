@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import FactorialDesign
+from ....testing import assert_spec_metadata
 
 
 def test_FactorialDesign_inputs():
@@ -58,11 +59,7 @@ def test_FactorialDesign_inputs():
             usedefault=True,
         ),
     )
-    inputs = FactorialDesign.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FactorialDesign.input_spec(), input_map)
 
 
 def test_FactorialDesign_outputs():
@@ -71,8 +68,4 @@ def test_FactorialDesign_outputs():
             extensions=None,
         ),
     )
-    outputs = FactorialDesign.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FactorialDesign.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import FieldMap
+from ....testing import assert_spec_metadata
 
 
 def test_FieldMap_inputs():
@@ -123,11 +124,7 @@ def test_FieldMap_inputs():
             usedefault=True,
         ),
     )
-    inputs = FieldMap.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FieldMap.input_spec(), input_map)
 
 
 def test_FieldMap_outputs():
@@ -136,8 +133,4 @@ def test_FieldMap_outputs():
             extensions=None,
         ),
     )
-    outputs = FieldMap.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FieldMap.output_spec(), output_map)
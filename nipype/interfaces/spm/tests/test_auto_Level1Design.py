@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import Level1Design
+from ....testing import assert_spec_metadata
 
 
 def test_Level1Design_inputs():
@@ -60,11 +61,7 @@ def test_Level1Design_inputs():
             field="volt",
         ),
     )
-    inputs = Level1Design.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Level1Design.input_spec(), input_map)
 
 
 def test_Level1Design_outputs():
@@ -73,8 +70,4 @@ def test_Level1Design_outputs():
             extensions=None,
         ),
     )
-    outputs = Level1Design.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Level1Design.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import MultiChannelNewSegment
+from ....testing import assert_spec_metadata
 
 
 def test_MultiChannelNewSegment_inputs():
@@ -33,11 +34,7 @@ def test_MultiChannelNewSegment_inputs():
             field="warp.write",
         ),
     )
-    inputs = MultiChannelNewSegment.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultiChannelNewSegment.input_spec(), input_map)
 
 
 def test_MultiChannelNewSegment_outputs():
@@ -52,8 +49,4 @@ def test_MultiChannelNewSegment_outputs():
         normalized_class_images=dict(),
         transformation_mat=dict(),
     )
-    outputs = MultiChannelNewSegment.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultiChannelNewSegment.output_spec(), output_map)
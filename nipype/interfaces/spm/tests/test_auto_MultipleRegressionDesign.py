@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import MultipleRegressionDesign
+from ....testing import assert_spec_metadata
 
 
 def test_MultipleRegressionDesign_inputs():
@@ -69,11 +70,7 @@ def test_MultipleRegressionDesign_inputs():
             field="des.mreg.mcov",
         ),
     )
-    inputs = MultipleRegressionDesign.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultipleRegressionDesign.input_spec(), input_map)
 
 
 def test_MultipleRegressionDesign_outputs():
@@ -82,8 +79,4 @@ def test_MultipleRegressionDesign_outputs():
             extensions=None,
         ),
     )
-    outputs = MultipleRegressionDesign.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MultipleRegressionDesign.output_spec(), output_map)
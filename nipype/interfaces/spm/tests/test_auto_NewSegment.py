@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import NewSegment
+from ....testing import assert_spec_metadata
 
 
 def test_NewSegment_inputs():
@@ -38,11 +39,7 @@ def test_NewSegment_inputs():
             field="warp.write",
         ),
     )
-    inputs = NewSegment.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(NewSegment.input_spec(), input_map)
 
 
 def test_NewSegment_outputs():
@@ -57,8 +54,4 @@ def test_NewSegment_outputs():
         normalized_class_images=dict(),
         transformation_mat=dict(),
     )
-    outputs = NewSegment.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(NewSegment.output_spec(), output_map)
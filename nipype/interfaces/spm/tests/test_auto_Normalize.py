@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Normalize
+from ....testing import assert_spec_metadata
 
 
 def test_Normalize_inputs():
@@ -89,11 +90,7 @@ def test_Normalize_inputs():
             field="roptions.wrap",
         ),
     )
-    inputs = Normalize.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Normalize.input_spec(), input_map)
 
 
 def test_Normalize_outputs():
@@ -102,8 +99,4 @@ def test_Normalize_outputs():
         normalized_files=dict(),
         normalized_source=dict(),
     )
-    outputs = Normalize.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Normalize.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Normalize12
+from ....testing import assert_spec_metadata
 
 
 def test_Normalize12_inputs():
@@ -73,11 +74,7 @@ def test_Normalize12_inputs():
             field="woptions.vox",
         ),
     )
-    inputs = Normalize12.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Normalize12.input_spec(), input_map)
 
 
 def test_Normalize12_outputs():
@@ -86,8 +83,4 @@ def test_Normalize12_outputs():
         normalized_files=dict(),
         normalized_image=dict(),
     )
-    outputs = Normalize12.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Normalize12.output_spec(), output_map)
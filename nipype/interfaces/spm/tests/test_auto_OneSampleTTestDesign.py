@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import OneSampleTTestDesign
+from ....testing import assert_spec_metadata
 
 
 def test_OneSampleTTestDesign_inputs():
@@ -62,11 +63,7 @@ def test_OneSampleTTestDesign_inputs():
             usedefault=True,
         ),
     )
-    inputs = OneSampleTTestDesign.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(OneSampleTTestDesign.input_spec(), input_map)
 
 
 def test_OneSampleTTestDesign_outputs():
@@ -75,8 +72,4 @@ def test_OneSampleTTestDesign_outputs():
             extensions=None,
         ),
     )
-    outputs = OneSampleTTestDesign.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(OneSampleTTestDesign.output_spec(), output_map)
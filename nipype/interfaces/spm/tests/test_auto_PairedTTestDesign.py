@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import PairedTTestDesign
+from ....testing import assert_spec_metadata
 
 
 def test_PairedTTestDesign_inputs():
@@ -68,11 +69,7 @@ def test_PairedTTestDesign_inputs():
             usedefault=True,
         ),
     )
-    inputs = PairedTTestDesign.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PairedTTestDesign.input_spec(), input_map)
 
 
 def test_PairedTTestDesign_outputs():
@@ -81,8 +78,4 @@ def test_PairedTTestDesign_outputs():
             extensions=None,
         ),
     )
-    outputs = PairedTTestDesign.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PairedTTestDesign.output_spec(), output_map)
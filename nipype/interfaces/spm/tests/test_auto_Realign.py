@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Realign
+from ....testing import assert_spec_metadata
 
 
 def test_Realign_inputs():
@@ -62,11 +63,7 @@ def test_Realign_inputs():
             field="roptions.wrap",
         ),
     )
-    inputs = Realign.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Realign.input_spec(), input_map)
 
 
 def test_Realign_outputs():
@@ -78,8 +75,4 @@ def test_Realign_outputs():
         realigned_files=dict(),
         realignment_parameters=dict(),
     )
-    outputs = Realign.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Realign.output_spec(), output_map)
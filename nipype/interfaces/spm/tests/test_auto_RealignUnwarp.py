@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import RealignUnwarp
+from ....testing import assert_spec_metadata
 
 
 def test_RealignUnwarp_inputs():
@@ -97,11 +98,7 @@ def test_RealignUnwarp_inputs():
             field="eoptions.ewrap",
         ),
     )
-    inputs = RealignUnwarp.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RealignUnwarp.input_spec(), input_map)
 
 
 def test_RealignUnwarp_outputs():
@@ -113,8 +110,4 @@ def test_RealignUnwarp_outputs():
         realigned_unwarped_files=dict(),
         realignment_parameters=dict(),
     )
-    outputs = RealignUnwarp.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(RealignUnwarp.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..utils import ResliceToReference
+from ....testing import assert_spec_metadata
 
 
 def test_ResliceToReference_inputs():
@@ -32,19 +33,11 @@ def test_ResliceToReference_inputs():
             field="comp{2}.idbbvox.vox",
         ),
     )
-    inputs = ResliceToReference.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResliceToReference.input_spec(), input_map)
 
 
 def test_ResliceToReference_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = ResliceToReference.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ResliceToReference.output_spec(), output_map)
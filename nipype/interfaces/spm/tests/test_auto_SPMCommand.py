@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import SPMCommand
+from ....testing import assert_spec_metadata
 
 
 def test_SPMCommand_inputs():
@@ -15,8 +16,4 @@ def test_SPMCommand_inputs():
             usedefault=True,
         ),
     )
-    inputs = SPMCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SPMCommand.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import Segment
+from ....testing import assert_spec_metadata
 
 
 def test_Segment_inputs():
@@ -63,11 +64,7 @@ def test_Segment_inputs():
             field="output.WM",
         ),
     )
-    inputs = Segment.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Segment.input_spec(), input_map)
 
 
 def test_Segment_outputs():
@@ -114,8 +111,4 @@ def test_Segment_outputs():
             extensions=None,
         ),
     )
-    outputs = Segment.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Segment.output_spec(), output_map)
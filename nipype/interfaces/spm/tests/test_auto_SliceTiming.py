@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import SliceTiming
+from ....testing import assert_spec_metadata
 
 
 def test_SliceTiming_inputs():
@@ -44,19 +45,11 @@ def test_SliceTiming_inputs():
             usedefault=True,
         ),
     )
-    inputs = SliceTiming.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SliceTiming.input_spec(), input_map)
 
 
 def test_SliceTiming_outputs():
     output_map = dict(
         timecorrected_files=dict(),
     )
-    outputs = SliceTiming.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SliceTiming.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import ThresholdStatistics
+from ....testing import assert_spec_metadata
 
 
 def test_ThresholdStatistics_inputs():
@@ -34,11 +35,7 @@ def test_ThresholdStatistics_inputs():
             usedefault=True,
         ),
     )
-    inputs = ThresholdStatistics.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ThresholdStatistics.input_spec(), input_map)
 
 
 def test_ThresholdStatistics_outputs():
@@ -50,8 +47,4 @@ def test_ThresholdStatistics_outputs():
         voxelwise_P_RF=dict(),
         voxelwise_P_uncor=dict(),
     )
-    outputs = ThresholdStatistics.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ThresholdStatistics.output_spec(), output_map)
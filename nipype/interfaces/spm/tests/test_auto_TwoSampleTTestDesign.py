@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..model import TwoSampleTTestDesign
+from ....testing import assert_spec_metadata
 
 
 def test_TwoSampleTTestDesign_inputs():
@@ -72,11 +73,7 @@ def test_TwoSampleTTestDesign_inputs():
             usedefault=True,
         ),
     )
-    inputs = TwoSampleTTestDesign.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(TwoSampleTTestDesign.input_spec(), input_map)
 
 
 def test_TwoSampleTTestDesign_outputs():
@@ -85,8 +82,4 @@ def test_TwoSampleTTestDesign_outputs():
             extensions=None,
         ),
     )
-    outputs = TwoSampleTTestDesign.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(TwoSampleTTestDesign.output_spec(), output_map)
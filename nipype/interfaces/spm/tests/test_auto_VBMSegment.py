@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..preprocess import VBMSegment
+from ....testing import assert_spec_metadata
 
 
 def test_VBMSegment_inputs():
@@ -146,11 +147,7 @@ def test_VBMSegment_inputs():
             usedefault=True,
         ),
     )
-    inputs = VBMSegment.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(VBMSegment.input_spec(), input_map)
 
 
 def test_VBMSegment_outputs():
@@ -169,8 +166,4 @@ def test_VBMSegment_outputs():
         pve_label_registered_images=dict(),
         transformation_mat=dict(),
     )
-    outputs = VBMSegment.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(VBMSegment.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import BIDSDataGrabber
+from ...testing import assert_spec_metadata
 
 
 def test_BIDSDataGrabber_inputs():
@@ -20,17 +21,9 @@ def test_BIDSDataGrabber_inputs():
             usedefault=True,
         ),
     )
-    inputs = BIDSDataGrabber.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(BIDSDataGrabber.input_spec(), input_map)
 
 
 def test_BIDSDataGrabber_outputs():
     output_map = dict()
-    outputs = BIDSDataGrabber.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(BIDSDataGrabber.output_spec(), output_map)
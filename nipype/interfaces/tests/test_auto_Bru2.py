@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..bru2nii import Bru2
+from ...testing import assert_spec_metadata
 
 
 def test_Bru2_inputs():
@@ -33,11 +34,7 @@ def test_Bru2_inputs():
             genfile=True,
         ),
     )
-    inputs = Bru2.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Bru2.input_spec(), input_map)
 
 
 def test_Bru2_outputs():
@@ -46,8 +43,4 @@ def test_Bru2_outputs():
             extensions=None,
         ),
     )
-    outputs = Bru2.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Bru2.output_spec(), output_map)
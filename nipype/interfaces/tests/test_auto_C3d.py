@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..c3 import C3d
+from ...testing import assert_spec_metadata
 
 
 def test_C3d_inputs():
@@ -54,19 +55,11 @@ def test_C3d_inputs():
             argstr="-smooth %s",
         ),
     )
-    inputs = C3d.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(C3d.input_spec(), input_map)
 
 
 def test_C3d_outputs():
     output_map = dict(
         out_files=dict(),
     )
-    outputs = C3d.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(C3d.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..c3 import C3dAffineTool
+from ...testing import assert_spec_metadata
 
 
 def test_C3dAffineTool_inputs():
@@ -36,11 +37,7 @@ def test_C3dAffineTool_inputs():
             position=3,
         ),
     )
-    inputs = C3dAffineTool.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(C3dAffineTool.input_spec(), input_map)
 
 
 def test_C3dAffineTool_outputs():
@@ -49,8 +46,4 @@ def test_C3dAffineTool_outputs():
             extensions=None,
         ),
     )
-    outputs = C3dAffineTool.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(C3dAffineTool.output_spec(), output_map)
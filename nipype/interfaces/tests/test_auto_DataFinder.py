@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import DataFinder
+from ...testing import assert_spec_metadata
 
 
 def test_DataFinder_inputs():
@@ -17,17 +18,9 @@ def test_DataFinder_inputs():
             usedefault=True,
         ),
     )
-    inputs = DataFinder.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DataFinder.input_spec(), input_map)
 
 
 def test_DataFinder_outputs():
     output_map = dict()
-    outputs = DataFinder.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DataFinder.output_spec(), output_map)
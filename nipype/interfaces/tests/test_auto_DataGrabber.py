@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import DataGrabber
+from ...testing import assert_spec_metadata
 
 
 def test_DataGrabber_inputs():
@@ -19,17 +20,9 @@ def test_DataGrabber_inputs():
         ),
         template_args=dict(),
     )
-    inputs = DataGrabber.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DataGrabber.input_spec(), input_map)
 
 
 def test_DataGrabber_outputs():
     output_map = dict()
-    outputs = DataGrabber.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DataGrabber.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import DataSink
+from ...testing import assert_spec_metadata
 
 
 def test_DataSink_inputs():
@@ -23,19 +24,11 @@ def test_DataSink_inputs():
         strip_dir=dict(),
         substitutions=dict(),
     )
-    inputs = DataSink.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DataSink.input_spec(), input_map)
 
 
 def test_DataSink_outputs():
     output_map = dict(
         out_file=dict(),
     )
-    outputs = DataSink.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DataSink.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dcm2nii import Dcm2nii
+from ...testing import assert_spec_metadata
 
 
 def test_Dcm2nii_inputs():
@@ -85,11 +86,7 @@ def test_Dcm2nii_inputs():
             xor=["nii_output"],
         ),
     )
-    inputs = Dcm2nii.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Dcm2nii.input_spec(), input_map)
 
 
 def test_Dcm2nii_outputs():
@@ -100,8 +97,4 @@ def test_Dcm2nii_outputs():
         reoriented_and_cropped_files=dict(),
         reoriented_files=dict(),
     )
-    outputs = Dcm2nii.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Dcm2nii.output_spec(), output_map)
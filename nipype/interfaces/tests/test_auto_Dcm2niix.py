@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dcm2nii import Dcm2niix
+from ...testing import assert_spec_metadata
 
 
 def test_Dcm2niix_inputs():
@@ -82,11 +83,7 @@ def test_Dcm2niix_inputs():
             usedefault=True,
         ),
     )
-    inputs = Dcm2niix.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Dcm2niix.input_spec(), input_map)
 
 
 def test_Dcm2niix_outputs():
@@ -97,8 +94,4 @@ def test_Dcm2niix_outputs():
         converted_files=dict(),
         mvecs=dict(),
     )
-    outputs = Dcm2niix.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Dcm2niix.output_spec(), output_map)
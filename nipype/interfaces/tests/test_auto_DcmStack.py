@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dcmstack import DcmStack
+from ...testing import assert_spec_metadata
 
 
 def test_DcmStack_inputs():
@@ -19,11 +20,7 @@ def test_DcmStack_inputs():
         out_format=dict(),
         out_path=dict(),
     )
-    inputs = DcmStack.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(DcmStack.input_spec(), input_map)
 
 
 def test_DcmStack_outputs():
@@ -32,8 +29,4 @@ def test_DcmStack_outputs():
             extensions=None,
         ),
     )
-    outputs = DcmStack.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(DcmStack.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import ExportFile
+from ...testing import assert_spec_metadata
 
 
 def test_ExportFile_inputs():
@@ -17,11 +18,7 @@ def test_ExportFile_inputs():
             mandatory=True,
         ),
     )
-    inputs = ExportFile.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExportFile.input_spec(), input_map)
 
 
 def test_ExportFile_outputs():
@@ -30,8 +27,4 @@ def test_ExportFile_outputs():
             extensions=None,
         ),
     )
-    outputs = ExportFile.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(ExportFile.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import FreeSurferSource
+from ...testing import assert_spec_metadata
 
 
 def test_FreeSurferSource_inputs():
@@ -14,11 +15,7 @@ def test_FreeSurferSource_inputs():
             mandatory=True,
         ),
     )
-    inputs = FreeSurferSource.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(FreeSurferSource.input_spec(), input_map)
 
 
 def test_FreeSurferSource_outputs():
@@ -161,8 +158,4 @@ def test_FreeSurferSource_outputs():
             loc="stats",
         ),
     )
-    outputs = FreeSurferSource.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(FreeSurferSource.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dcmstack import GroupAndStack
+from ...testing import assert_spec_metadata
 
 
 def test_GroupAndStack_inputs():
@@ -19,19 +20,11 @@ def test_GroupAndStack_inputs():
         out_format=dict(),
         out_path=dict(),
     )
-    inputs = GroupAndStack.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(GroupAndStack.input_spec(), input_map)
 
 
 def test_GroupAndStack_outputs():
     output_map = dict(
         out_list=dict(),
     )
-    outputs = GroupAndStack.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(GroupAndStack.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import JSONFileGrabber
+from ...testing import assert_spec_metadata
 
 
 def test_JSONFileGrabber_inputs():
@@ -9,17 +10,9 @@ def test_JSONFileGrabber_inputs():
             extensions=None,
         ),
     )
-    inputs = JSONFileGrabber.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JSONFileGrabber.input_spec(), input_map)
 
 
 def test_JSONFileGrabber_outputs():
     output_map = dict()
-    outputs = JSONFileGrabber.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JSONFileGrabber.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import JSONFileSink
+from ...testing import assert_spec_metadata
 
 
 def test_JSONFileSink_inputs():
@@ -14,11 +15,7 @@ def test_JSONFileSink_inputs():
             extensions=None,
         ),
     )
-    inputs = JSONFileSink.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(JSONFileSink.input_spec(), input_map)
 
 
 def test_JSONFileSink_outputs():
@@ -27,8 +24,4 @@ def test_JSONFileSink_outputs():
             extensions=None,
         ),
     )
-    outputs = JSONFileSink.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(JSONFileSink.output_spec(), output_map)
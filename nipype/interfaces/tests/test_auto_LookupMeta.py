@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dcmstack import LookupMeta
+from ...testing import assert_spec_metadata
 
 
 def test_LookupMeta_inputs():
@@ -12,17 +13,9 @@ def test_LookupMeta_inputs():
             mandatory=True,
         ),
     )
-    inputs = LookupMeta.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(LookupMeta.input_spec(), input_map)
 
 
 def test_LookupMeta_outputs():
     output_map = dict()
-    outputs = LookupMeta.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(LookupMeta.output_spec(), output_map)
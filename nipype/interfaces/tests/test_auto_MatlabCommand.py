@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..matlab import MatlabCommand
+from ...testing import assert_spec_metadata
 
 
 def test_MatlabCommand_inputs():
@@ -53,8 +54,4 @@ def test_MatlabCommand_inputs():
             xor=["nodesktop", "nosplash", "single_comp_thread"],
         ),
     )
-    inputs = MatlabCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MatlabCommand.input_spec(), input_map)
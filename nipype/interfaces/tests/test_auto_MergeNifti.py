@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dcmstack import MergeNifti
+from ...testing import assert_spec_metadata
 
 
 def test_MergeNifti_inputs():
@@ -15,11 +16,7 @@ def test_MergeNifti_inputs():
         out_path=dict(),
         sort_order=dict(),
     )
-    inputs = MergeNifti.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeNifti.input_spec(), input_map)
 
 
 def test_MergeNifti_outputs():
@@ -28,8 +25,4 @@ def test_MergeNifti_outputs():
             extensions=None,
         ),
     )
-    outputs = MergeNifti.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MergeNifti.output_spec(), output_map)
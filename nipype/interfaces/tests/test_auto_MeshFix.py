@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..meshfix import MeshFix
+from ...testing import assert_spec_metadata
 
 
 def test_MeshFix_inputs():
@@ -122,11 +123,7 @@ def test_MeshFix_inputs():
             argstr="--smooth %d",
         ),
     )
-    inputs = MeshFix.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MeshFix.input_spec(), input_map)
 
 
 def test_MeshFix_outputs():
@@ -135,8 +132,4 @@ def test_MeshFix_outputs():
             extensions=None,
         ),
     )
-    outputs = MeshFix.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MeshFix.output_spec(), output_map)
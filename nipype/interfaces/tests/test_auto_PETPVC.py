@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..petpvc import PETPVC
+from ...testing import assert_spec_metadata
 
 
 def test_PETPVC_inputs():
@@ -64,11 +65,7 @@ def test_PETPVC_inputs():
             usedefault=True,
         ),
     )
-    inputs = PETPVC.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(PETPVC.input_spec(), input_map)
 
 
 def test_PETPVC_outputs():
@@ -77,8 +74,4 @@ def test_PETPVC_outputs():
             extensions=None,
         ),
     )
-    outputs = PETPVC.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(PETPVC.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..r import RCommand
+from ...testing import assert_spec_metadata
 
 
 def test_RCommand_inputs():
@@ -24,8 +25,4 @@ def test_RCommand_inputs():
             usedefault=True,
         ),
     )
-    inputs = RCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(RCommand.input_spec(), input_map)
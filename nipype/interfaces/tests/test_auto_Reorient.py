@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..image import Reorient
+from ...testing import assert_spec_metadata
 
 
 def test_Reorient_inputs():
@@ -12,11 +13,7 @@ def test_Reorient_inputs():
             usedefault=True,
         ),
     )
-    inputs = Reorient.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Reorient.input_spec(), input_map)
 
 
 def test_Reorient_outputs():
@@ -28,8 +25,4 @@ def test_Reorient_outputs():
             extensions=None,
         ),
     )
-    outputs = Reorient.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Reorient.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..image import Rescale
+from ...testing import assert_spec_metadata
 
 
 def test_Rescale_inputs():
@@ -17,11 +18,7 @@ def test_Rescale_inputs():
             mandatory=True,
         ),
     )
-    inputs = Rescale.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Rescale.input_spec(), input_map)
 
 
 def test_Rescale_outputs():
@@ -30,8 +27,4 @@ def test_Rescale_outputs():
             extensions=None,
         ),
     )
-    outputs = Rescale.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Rescale.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import S3DataGrabber
+from ...testing import assert_spec_metadata
 
 
 def test_S3DataGrabber_inputs():
@@ -28,17 +29,9 @@ def test_S3DataGrabber_inputs():
         ),
         template_args=dict(),
     )
-    inputs = S3DataGrabber.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(S3DataGrabber.input_spec(), input_map)
 
 
 def test_S3DataGrabber_outputs():
     output_map = dict()
-    outputs = S3DataGrabber.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(S3DataGrabber.output_spec(), output_map)
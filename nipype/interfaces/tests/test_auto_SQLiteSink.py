@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import SQLiteSink
+from ...testing import assert_spec_metadata
 
 
 def test_SQLiteSink_inputs():
@@ -12,8 +13,4 @@ def test_SQLiteSink_inputs():
             mandatory=True,
         ),
     )
-    inputs = SQLiteSink.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SQLiteSink.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import SSHDataGrabber
+from ...testing import assert_spec_metadata
 
 
 def test_SSHDataGrabber_inputs():
@@ -35,17 +36,9 @@ def test_SSHDataGrabber_inputs():
         ),
         username=dict(),
     )
-    inputs = SSHDataGrabber.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SSHDataGrabber.input_spec(), input_map)
 
 
 def test_SSHDataGrabber_outputs():
     output_map = dict()
-    outputs = SSHDataGrabber.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SSHDataGrabber.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import SelectFiles
+from ...testing import assert_spec_metadata
 
 
 def test_SelectFiles_inputs():
@@ -15,17 +16,9 @@ def test_SelectFiles_inputs():
             usedefault=True,
         ),
     )
-    inputs = SelectFiles.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SelectFiles.input_spec(), input_map)
 
 
 def test_SelectFiles_outputs():
     output_map = dict()
-    outputs = SelectFiles.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SelectFiles.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dynamic_slicer import SlicerCommandLine
+from ...testing import assert_spec_metadata
 
 
 def test_SlicerCommandLine_inputs():
@@ -13,17 +14,9 @@ def test_SlicerCommandLine_inputs():
         ),
         module=dict(),
     )
-    inputs = SlicerCommandLine.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SlicerCommandLine.input_spec(), input_map)
 
 
 def test_SlicerCommandLine_outputs():
     output_map = dict()
-    outputs = SlicerCommandLine.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SlicerCommandLine.output_spec(), output_map)
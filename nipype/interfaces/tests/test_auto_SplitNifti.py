@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..dcmstack import SplitNifti
+from ...testing import assert_spec_metadata
 
 
 def test_SplitNifti_inputs():
@@ -15,19 +16,11 @@ def test_SplitNifti_inputs():
         out_path=dict(),
         split_dim=dict(),
     )
-    inputs = SplitNifti.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(SplitNifti.input_spec(), input_map)
 
 
 def test_SplitNifti_outputs():
     output_map = dict(
         out_list=dict(),
     )
-    outputs = SplitNifti.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(SplitNifti.output_spec(), output_map)
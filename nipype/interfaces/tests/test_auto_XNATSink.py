@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import XNATSink
+from ...testing import assert_spec_metadata
 
 
 def test_XNATSink_inputs():
@@ -39,8 +40,4 @@ def test_XNATSink_inputs():
         ),
         user=dict(),
     )
-    inputs = XNATSink.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(XNATSink.input_spec(), input_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..io import XNATSource
+from ...testing import assert_spec_metadata
 
 
 def test_XNATSource_inputs():
@@ -24,17 +25,9 @@ def test_XNATSource_inputs():
         ),
         user=dict(),
     )
-    inputs = XNATSource.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(XNATSource.input_spec(), input_map)
 
 
 def test_XNATSource_outputs():
     output_map = dict()
-    outputs = XNATSource.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(XNATSource.output_spec(), output_map)
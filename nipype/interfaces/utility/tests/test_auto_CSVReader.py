@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..csv import CSVReader
+from ....testing import assert_spec_metadata
 
 
 def test_CSVReader_inputs():
@@ -15,17 +16,9 @@ def test_CSVReader_inputs():
             mandatory=True,
         ),
     )
-    inputs = CSVReader.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CSVReader.input_spec(), input_map)
 
 
 def test_CSVReader_outputs():
     output_map = dict()
-    outputs = CSVReader.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CSVReader.output_spec(), output_map)
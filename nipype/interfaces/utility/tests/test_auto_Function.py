@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..wrappers import Function
+from ....testing import assert_spec_metadata
 
 
 def test_Function_inputs():
@@ -8,17 +9,9 @@ def test_Function_inputs():
             mandatory=True,
         ),
     )
-    inputs = Function.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Function.input_spec(), input_map)
 
 
 def test_Function_outputs():
     output_map = dict()
-    outputs = Function.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Function.output_spec(), output_map)
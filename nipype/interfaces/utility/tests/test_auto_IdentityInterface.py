@@ -1,20 +1,13 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import IdentityInterface
+from ....testing import assert_spec_metadata
 
 
 def test_IdentityInterface_inputs():
     input_map = dict()
-    inputs = IdentityInterface.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(IdentityInterface.input_spec(), input_map)
 
 
 def test_IdentityInterface_outputs():
     output_map = dict()
-    outputs = IdentityInterface.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(IdentityInterface.output_spec(), output_map)
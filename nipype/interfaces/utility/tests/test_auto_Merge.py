@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import Merge
+from ....testing import assert_spec_metadata
 
 
 def test_Merge_inputs():
@@ -14,19 +15,11 @@ def test_Merge_inputs():
             usedefault=True,
         ),
     )
-    inputs = Merge.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Merge.input_spec(), input_map)
 
 
 def test_Merge_outputs():
     output_map = dict(
         out=dict(),
     )
-    outputs = Merge.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Merge.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import Rename
+from ....testing import assert_spec_metadata
 
 
 def test_Rename_inputs():
@@ -17,11 +18,7 @@ def test_Rename_inputs():
             usedefault=True,
         ),
     )
-    inputs = Rename.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Rename.input_spec(), input_map)
 
 
 def test_Rename_outputs():
@@ -30,8 +27,4 @@ def test_Rename_outputs():
             extensions=None,
         ),
     )
-    outputs = Rename.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Rename.output_spec(), output_map)
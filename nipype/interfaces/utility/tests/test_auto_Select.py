@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import Select
+from ....testing import assert_spec_metadata
 
 
 def test_Select_inputs():
@@ -11,19 +12,11 @@ def test_Select_inputs():
             mandatory=True,
         ),
     )
-    inputs = Select.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Select.input_spec(), input_map)
 
 
 def test_Select_outputs():
     output_map = dict(
         out=dict(),
     )
-    outputs = Select.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Select.output_spec(), output_map)
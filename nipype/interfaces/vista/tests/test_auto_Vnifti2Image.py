@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..vista import Vnifti2Image
+from ....testing import assert_spec_metadata
 
 
 def test_Vnifti2Image_inputs():
@@ -32,11 +33,7 @@ def test_Vnifti2Image_inputs():
             position=-1,
         ),
     )
-    inputs = Vnifti2Image.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(Vnifti2Image.input_spec(), input_map)
 
 
 def test_Vnifti2Image_outputs():
@@ -45,8 +42,4 @@ def test_Vnifti2Image_outputs():
             extensions=None,
         ),
     )
-    outputs = Vnifti2Image.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(Vnifti2Image.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..vista import VtoMat
+from ....testing import assert_spec_metadata
 
 
 def test_VtoMat_inputs():
@@ -27,11 +28,7 @@ def test_VtoMat_inputs():
             position=-1,
         ),
     )
-    inputs = VtoMat.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(VtoMat.input_spec(), input_map)
 
 
 def test_VtoMat_outputs():
@@ -40,8 +37,4 @@ def test_VtoMat_outputs():
             extensions=None,
         ),
     )
-    outputs = VtoMat.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(VtoMat.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..cifti import CiftiSmooth
+from ....testing import assert_spec_metadata
 
 
 def test_CiftiSmooth_inputs():
@@ -91,11 +92,7 @@ def test_CiftiSmooth_inputs():
             position=2,
         ),
     )
-    inputs = CiftiSmooth.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(CiftiSmooth.input_spec(), input_map)
 
 
 def test_CiftiSmooth_outputs():
@@ -104,8 +101,4 @@ def test_CiftiSmooth_outputs():
             extensions=None,
         ),
     )
-    outputs = CiftiSmooth.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(CiftiSmooth.output_spec(), output_map)
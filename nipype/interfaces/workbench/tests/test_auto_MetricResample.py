@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..metric import MetricResample
+from ....testing import assert_spec_metadata
 
 
 def test_MetricResample_inputs():
@@ -76,11 +77,7 @@ def test_MetricResample_inputs():
             position=9,
         ),
     )
-    inputs = MetricResample.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(MetricResample.input_spec(), input_map)
 
 
 def test_MetricResample_outputs():
@@ -92,8 +89,4 @@ def test_MetricResample_outputs():
             extensions=None,
         ),
     )
-    outputs = MetricResample.output_spec()
-
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    assert_spec_metadata(MetricResample.output_spec(), output_map)
@@ -1,5 +1,6 @@
 # AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT
 from ..base import WBCommand
+from ....testing import assert_spec_metadata
 
 
 def test_WBCommand_inputs():
@@ -12,8 +13,4 @@ def test_WBCommand_inputs():
             usedefault=True,
         ),
     )
-    inputs = WBCommand.input_spec()
-
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    assert_spec_metadata(WBCommand.input_spec(), input_map)
@@ -546,7 +546,8 @@ directory. Please ensure no other concurrent workflows are racing""",
         self._get_inputs()
         if self._hashvalue is None and self._hashed_inputs is None:
             self._hashed_inputs, self._hashvalue = self.inputs.get_hashval(
-                hash_method=self.config["execution"]["hash_method"]
+                hash_method=self.config["execution"]["hash_method"],
+                hash_algorithm=self.config["execution"]["hash_algorithm"],
             )
             rm_extra = self.config["execution"]["remove_unnecessary_outputs"]
             if str2bool(rm_extra) and self.needed_outputs:
@@ -1188,7 +1189,8 @@ class MapNode(Node):
             else:
                 setattr(hashinputs, name, getattr(self._inputs, name))
         hashed_inputs, hashvalue = hashinputs.get_hashval(
-            hash_method=self.config["execution"]["hash_method"]
+            hash_method=self.config["execution"]["hash_method"],
+            hash_algorithm=self.config["execution"]["hash_algorithm"],
         )
         rm_extra = self.config["execution"]["remove_unnecessary_outputs"]
         if str2bool(rm_extra) and self.needed_outputs:
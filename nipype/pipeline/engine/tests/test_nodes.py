@@ -302,6 +302,32 @@ def test_inputs_removal(tmpdir):
     assert not tmpdir.join(n1.name, "file1.txt").check()
 
 
+def test_node_hash_algorithm(tmpdir):
+    import hashlib
+
+    file1 = tmpdir.join("file1.txt")
+    file1.write("dummy_file")
+    expected = hashlib.sha256(b"dummy_file").hexdigest()
+
+    n1 = pe.Node(UtilsTestInterface(), base_dir=tmpdir.strpath, name="testhash")
+    n1.inputs.in_file = file1.strpath
+    n1.config = {"execution": {"hash_method": "content", "hash_algorithm": "sha256"}}
+    n1.config = merge_dict(deepcopy(config._sections), n1.config)
+    hashed_inputs, _ = n1._get_hashval()
+    assert dict(hashed_inputs)["in_file"] == (file1.strpath, expected)
+
+    n2 = pe.MapNode(
+        UtilsTestInterface(),
+        iterfield=["in_file"],
+        base_dir=tmpdir.strpath,
+        name="testmaphash",
+    )
+    n2.inputs.in_file = [file1.strpath]
+    n2.config = deepcopy(n1.config)
+    hashed_inputs, _ = n2._get_hashval()
+    assert dict(hashed_inputs)["in_file"] == [(file1.strpath, expected)]
+
+
 def test_outputmultipath_collapse(tmpdir):
     """Test an OutputMultiPath whose initial value is ``[[x]]`` to ensure that
     it is returned as ``[x]``, regardless of how accessed."""
@@ -123,6 +123,40 @@ def test_clean_working_directory(tmpdir):
     config.set_default_config()
 
 
+def test_clean_working_directory_keeps_bookkeeping(tmpdir):
+    class OutputSpec(nib.TraitedSpec):
+        out_file = nib.File()
+
+    outputs = OutputSpec()
+    inputs = OutputSpec()
+    outputs.out_file = tmpdir.join("out.nii").strpath
+
+    keep = [
+        "out.nii",
+        "_0x1234.json",
+        "provenance.provn",
+        "pyscript_spm.m",
+        "pyjobs_spm.mat",
+        "command.txt",
+        "result_node.pklz",
+        "_inputs.pklz",
+        "_node.pklz",
+        ".proc-0",
+        "_nipype/sub.txt",
+        "_report/report.rst",
+    ]
+    remove = ["scratch.nii", "result_node.txt", "command.txt.bak"]
+    for filename in keep + remove:
+        tmpdir.ensure(filename).write("dummy")
+
+    config.set_default_config()
+    clean_working_directory(
+        outputs, tmpdir.strpath, inputs, ["out_file"], deepcopy(config._sections)
+    )
+    assert all(tmpdir.join(f).exists() for f in keep)
+    assert not any(tmpdir.join(f).exists() for f in remove)
+
+
 def create_wf(name):
     """Creates a workflow for the following tests"""
 
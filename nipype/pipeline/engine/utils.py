@@ -7,7 +7,7 @@ import pickle
 from collections import defaultdict
 import re
 from copy import deepcopy
-from glob import glob
+from fnmatch import translate
 from pathlib import Path
 
 from traceback import format_exception
@@ -1429,6 +1429,20 @@ def walk_files(cwd):
             yield os.path.join(path, f)
 
 
+_NEEDED_EXTRA_FILES = (
+    "_0x*.json",
+    "provenance.*",
+    "pyscript*.m",
+    "pyjobs*.mat",
+    "command.txt",
+    "result*.pklz",
+    "_inputs.pklz",
+    "_node.pklz",
+    ".proc-*",
+)
+_NEEDED_EXTRA_RE = re.compile("|".join(translate(p) for p in _NEEDED_EXTRA_FILES))
+
+
 def clean_working_directory(
     outputs, cwd, inputs, needed_outputs, config, files2keep=None, dirs2keep=None
 ):
@@ -1449,25 +1463,22 @@ def clean_working_directory(
         inputdict = inputs.trait_get()
         input_files.extend(walk_outputs(inputdict))
         needed_files += [path for path, type in input_files if type == "f"]
-    for extra in [
-        "_0x*.json",
-        "provenance.*",
-        "pyscript*.m",
-        "pyjobs*.mat",
-        "command.txt",
-        "result*.pklz",
-        "_inputs.pklz",
-        "_node.pklz",
-        ".proc-*",
-    ]:
-        needed_files.extend(glob(os.path.join(cwd, extra)))
+    # nipype's own bookkeeping files and folders, found in a single pass
+    extra_files = []
+    extra_dirs = []
+    with os.scandir(cwd) as entries:
+        for entry in entries:
+            if entry.name in ("_nipype", "_report"):
+                extra_dirs.append(entry.path)
+            elif _NEEDED_EXTRA_RE.match(entry.name):
+                extra_files.append(entry.path)
+    needed_files.extend(extra_files)
     if files2keep:
         needed_files.extend(ensure_list(files2keep))
     needed_dirs = [path for path, type in output_files if type == "d"]
     if dirs2keep:
         needed_dirs.extend(ensure_list(dirs2keep))
-    for extra in ["_nipype", "_report"]:
-        needed_dirs.extend(glob(os.path.join(cwd, extra)))
+    needed_dirs.extend(extra_dirs)
     temp = []
     for filename in needed_files:
         temp.extend(get_related_files(filename))
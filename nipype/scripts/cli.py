@@ -1,87 +1,47 @@
 #!python
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
-import click
+import argparse
+import inspect
 
-from .instance import list_interfaces
 from .utils import (
-    CONTEXT_SETTINGS,
-    UNKNOWN_OPTIONS,
     ExistingDirPath,
     ExistingFilePath,
     UnexistingFilePath,
     RegularExpression,
     PythonModule,
-    check_not_none,
 )
 
 from .. import __version__
 
 
-# declare the CLI group
-@click.group(context_settings=CONTEXT_SETTINGS)
-def cli():
-    pass
-
-
-@cli.command(context_settings=CONTEXT_SETTINGS)
-@click.argument("logdir", type=ExistingDirPath, callback=check_not_none)
-@click.option(
-    "-r",
-    "--regex",
-    type=RegularExpression(),
-    callback=check_not_none,
-    help="Regular expression to be searched in each traceback.",
-)
 def search(logdir, regex):
     """Search for tracebacks content.
 
     Search for traceback inside a folder of nipype crash log files that match
     a given regular expression.
 
-    Examples:\n
+    Examples:
     nipypecli search nipype/wd/log -r '.*subject123.*'
     """
     from .crash_files import iter_tracebacks
 
     for file, trace in iter_tracebacks(logdir):
         if regex.search(trace):
-            click.echo("-" * len(file))
-            click.echo(file)
-            click.echo("-" * len(file))
-            click.echo(trace)
+            print("-" * len(file))
+            print(file)
+            print("-" * len(file))
+            print(trace)
 
 
-@cli.command(context_settings=CONTEXT_SETTINGS)
-@click.argument("crashfile", type=ExistingFilePath, callback=check_not_none)
-@click.option(
-    "-r", "--rerun", is_flag=True, flag_value=True, help="Rerun crashed node."
-)
-@click.option(
-    "-d",
-    "--debug",
-    is_flag=True,
-    flag_value=True,
-    help="Enable Python debugger when re-executing.",
-)
-@click.option(
-    "-i",
-    "--ipydebug",
-    is_flag=True,
-    flag_value=True,
-    help="Enable IPython debugger when re-executing.",
-)
-@click.option(
-    "-w", "--dir", type=ExistingDirPath, help="Directory where to run the node in."
-)
 def crash(crashfile, rerun, debug, ipydebug, dir):
     """Display Nipype crash files.
 
     For certain crash files, one can rerun a failed node in a temp directory.
 
-    Examples:\n
-    nipypecli crash crashfile.pklz\n
-    nipypecli crash crashfile.pklz -r -i\n
+    Examples:
+    nipypecli crash crashfile.pklz
+    nipypecli crash crashfile.pklz -r -i
     """
     from .crash_files import display_crash_file
 
@@ -96,12 +56,10 @@ def crash(crashfile, rerun, debug, ipydebug, dir):
     display_crash_file(crashfile, rerun, debug, dir)
 
 
-@cli.command(context_settings=CONTEXT_SETTINGS)
-@click.argument("pklz_file", type=ExistingFilePath, callback=check_not_none)
 def show(pklz_file):
     """Print the content of Nipype node .pklz file.
 
-    Examples:\n
+    Examples:
     nipypecli show node.pklz
     """
     from pprint import pprint
@@ -111,54 +69,41 @@ def show(pklz_file):
     pprint(pkl_data)
 
 
-@cli.command(context_settings=UNKNOWN_OPTIONS)
-@click.argument("module", type=PythonModule(), required=False, callback=check_not_none)
-@click.argument("interface", type=str, required=False)
-@click.option(
-    "--list",
-    is_flag=True,
-    flag_value=True,
-    help="List the available Interfaces inside the given module.",
-)
-@click.option(
-    "-h", "--help", is_flag=True, flag_value=True, help="Show help message and exit."
-)
-@click.pass_context
-def run(ctx, module, interface, list, help):
+def run(parser, args, module, interface, list, help):
     """Run a Nipype Interface.
 
-    Examples:\n
-    nipypecli run nipype.interfaces.nipy --list\n
+    Examples:
+    nipypecli run nipype.interfaces.nipy --list
     nipypecli run nipype.interfaces.nipy ComputeMask --help
     """
-    import argparse
+    from .instance import list_interfaces
     from .utils import add_args_options
     from ..utils.nipype_cmd import run_instance
 
     # print run command help if no arguments are given
     module_given = bool(module)
     if not module_given:
-        click.echo(ctx.command.get_help(ctx))
+        parser.print_help()
 
     # print the list of available interfaces for the given module
     elif (module_given and list) or (module_given and not interface):
         iface_names = list_interfaces(module)
-        click.echo("Available Interfaces:")
+        print("Available Interfaces:")
         for if_name in iface_names:
-            click.echo(f"    {if_name}")
+            print(f"    {if_name}")
 
     # check the interface
     elif module_given and interface:
         # create the argument parser
         description = f"Run {interface}"
-        prog = " ".join([ctx.command_path, module.__name__, interface] + ctx.args)
+        prog = " ".join([parser.prog, module.__name__, interface] + args)
         iface_parser = argparse.ArgumentParser(description=description, prog=prog)
 
         # instantiate the interface
         node = getattr(module, interface)()
         iface_parser = add_args_options(iface_parser, node)
 
-        if not ctx.args:
+        if not args:
             # print the interface help
             try:
                 iface_parser.print_help()
@@ -171,87 +116,15 @@ def run(ctx, module, interface, list, help):
                 iface_parser.print_usage()
         else:
             # run the interface
-            args = iface_parser.parse_args(args=ctx.args)
+            args = iface_parser.parse_args(args=args)
             run_instance(node, args)
 
 
-@cli.command(context_settings=CONTEXT_SETTINGS)
 def version():
     """Print current version of Nipype."""
-    click.echo(__version__)
+    print(__version__)
 
 
-@cli.group()
-def convert():
-    """Export nipype interfaces to other formats."""
-    pass
-
-
-@convert.command(context_settings=CONTEXT_SETTINGS)
-@click.option(
-    "-i",
-    "--interface",
-    type=str,
-    required=True,
-    help="Name of the Nipype interface to export.",
-)
-@click.option(
-    "-m",
-    "--module",
-    type=PythonModule(),
-    required=True,
-    callback=check_not_none,
-    help="Module where the interface is defined.",
-)
-@click.option(
-    "-o",
-    "--output",
-    type=UnexistingFilePath,
-    required=True,
-    callback=check_not_none,
-    help="JSON file name where the Boutiques descriptor will be written.",
-)
-@click.option(
-    "-c",
-    "--container-image",
-    required=True,
-    type=str,
-    help="Name of the container image where the tool is installed.",
-)
-@click.option(
-    "-p",
-    "--container-type",
-    required=True,
-    type=str,
-    help="Type of container image (Docker or Singularity).",
-)
-@click.option(
-    "-x",
-    "--container-index",
-    type=str,
-    help="Optional index where the image is available (e.g. "
-    "http://index.docker.io).",
-)
-@click.option(
-    "-g",
-    "--ignore-inputs",
-    type=str,
-    multiple=True,
-    help="List of interface inputs to not include in the descriptor.",
-)
-@click.option(
-    "-v", "--verbose", is_flag=True, flag_value=True, help="Print information messages."
-)
-@click.option(
-    "-a", "--author", type=str, help="Author of the tool (required for publishing)."
-)
-@click.option(
-    "-t",
-    "--tags",
-    type=str,
-    help="JSON string containing tags to include in the descriptor,"
-    'e.g. "{"key1": "value1"}"',
-)
 def boutiques(
     module,
     interface,
@@ -284,3 +157,158 @@ def boutiques(
         ignore_inputs,
         tags,
     )
+
+
+def _add_command(subparsers, func, **kwargs):
+    """Register ``func`` as a subcommand, documented by its docstring."""
+    # docstrings are stripped under ``python -OO``
+    doc = inspect.getdoc(func) or ""
+    parser = subparsers.add_parser(
+        func.__name__,
+        help=doc.splitlines()[0] if doc else None,
+        description=doc,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        **kwargs,
+    )
+    parser.set_defaults(func=func)
+    return parser
+
+
+def get_parser():
+    """Build the argument parser of the ``nipypecli`` command."""
+    parser = argparse.ArgumentParser(prog="nipypecli")
+    subparsers = parser.add_subparsers(metavar="COMMAND")
+
+    search_parser = _add_command(subparsers, search)
+    search_parser.add_argument("logdir", type=ExistingDirPath)
+    search_parser.add_argument(
+        "-r",
+        "--regex",
+        type=RegularExpression(),
+        required=True,
+        help="Regular expression to be searched in each traceback.",
+    )
+
+    crash_parser = _add_command(subparsers, crash)
+    crash_parser.add_argument("crashfile", type=ExistingFilePath)
+    crash_parser.add_argument(
+        "-r", "--rerun", action="store_true", help="Rerun crashed node."
+    )
+    crash_parser.add_argument(
+        "-d",
+        "--debug",
+        action="store_true",
+        help="Enable Python debugger when re-executing.",
+    )
+    crash_parser.add_argument(
+        "-i",
+        "--ipydebug",
+        action="store_true",
+        help="Enable IPython debugger when re-executing.",
+    )
+    crash_parser.add_argument(
+        "-w", "--dir", type=ExistingDirPath, help="Directory where to run the node in."
+    )
+
+    show_parser = _add_command(subparsers, show)
+    show_parser.add_argument("pklz_file", type=ExistingFilePath)
+
+    # unknown options are forwarded to the interface's own parser
+    run_parser = _add_command(subparsers, run, add_help=False, allow_abbrev=False)
+    run_parser.add_argument("module", type=PythonModule(), nargs="?")
+    run_parser.add_argument("interface", nargs="?")
+    run_parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List the available Interfaces inside the given module.",
+    )
+    run_parser.add_argument(
+        "-h", "--help", action="store_true", help="Show help message and exit."
+    )
+    run_parser.set_defaults(parser=run_parser)
+
+    _add_command(subparsers, version)
+
+    convert_parser = subparsers.add_parser(
+        "convert", help="Export nipype interfaces to other formats."
+    )
+    convert_parser.set_defaults(help_parser=convert_parser)
+    convert_subparsers = convert_parser.add_subparsers(metavar="FORMAT")
+    boutiques_parser = _add_command(convert_subparsers, boutiques)
+    boutiques_parser.add_argument(
+        "-i",
+        "--interface",
+        required=True,
+        help="Name of the Nipype interface to export.",
+    )
+    boutiques_parser.add_argument(
+        "-m",
+        "--module",
+        type=PythonModule(),
+        required=True,
+        help="Module where the interface is defined.",
+    )
+    boutiques_parser.add_argument(
+        "-o",
+        "--output",
+        type=UnexistingFilePath,
+        required=True,
+        help="JSON file name where the Boutiques descriptor will be written.",
+    )
+    boutiques_parser.add_argument(
+        "-c",
+        "--container-image",
+        required=True,
+        help="Name of the container image where the tool is installed.",
+    )
+    boutiques_parser.add_argument(
+        "-p",
+        "--container-type",
+        required=True,
+        help="Type of container image (Docker or Singularity).",
+    )
+    boutiques_parser.add_argument(
+        "-x",
+        "--container-index",
+        help="Optional index where the image is available (e.g. "
+        "http://index.docker.io).",
+    )
+    boutiques_parser.add_argument(
+        "-g",
+        "--ignore-inputs",
+        action="append",
+        default=[],
+        help="List of interface inputs to not include in the descriptor.",
+    )
+    boutiques_parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Print information messages."
+    )
+    boutiques_parser.add_argument(
+        "-a", "--author", help="Author of the tool (required for publishing)."
+    )
+    boutiques_parser.add_argument(
+        "-t",
+        "--tags",
+        help="JSON string containing tags to include in the descriptor,"
+        'e.g. "{"key1": "value1"}"',
+    )
+
+    return parser
+
+
+def cli(argv=None):
+    """Entry point of the ``nipypecli`` command."""
+    parser = get_parser()
+    opts, extra = parser.parse_known_args(argv)
+    kwargs = vars(opts)
+    func = kwargs.pop("func", None)
+    help_parser = kwargs.pop("help_parser", parser)
+    if func is None:
+        # no (sub)command given: show the available ones
+        help_parser.print_help()
+        return
+    if func is run:
+        kwargs["args"] = extra
+    elif extra:
+        parser.error("unrecognized arguments: %s" % " ".join(extra))
+    return func(**kwargs)
@@ -5,8 +5,6 @@ Import lib and class meta programming utilities.
 import inspect
 import importlib
 
-from ..interfaces.base import Interface
-
 
 def import_module(module_path):
     """Import any module to the global Python environment.
@@ -38,6 +36,8 @@ def list_interfaces(module):
     """Return a list with the names of the Interface subclasses inside
     the given module.
     """
+    from ..interfaces.base import Interface
+
     iface_names = []
     for k, v in sorted(module.__dict__.items()):
         if inspect.isclass(v) and issubclass(v, Interface):
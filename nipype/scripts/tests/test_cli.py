@@ -0,0 +1,82 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+from argparse import ArgumentTypeError
+from unittest import mock
+
+import pytest
+
+from ... import __version__
+from .. import cli as cli_module
+from ..cli import cli, get_parser
+from ..utils import ExistingDirPath, ExistingFilePath, UnexistingFilePath
+
+
+def _cli_error(argv, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli(argv)
+    assert excinfo.value.code == 2
+    return capsys.readouterr().err
+
+
+def test_no_command(capsys):
+    cli([])
+    assert "COMMAND" in capsys.readouterr().out
+
+
+def test_version(capsys):
+    cli(["version"])
+    assert capsys.readouterr().out.strip() == __version__
+
+
+def test_no_docstrings(monkeypatch, capsys):
+    # as under ``python -OO``
+    for command in ("search", "crash", "show", "run", "version", "boutiques"):
+        monkeypatch.setattr(getattr(cli_module, command), "__doc__", None)
+    get_parser()
+    cli(["version"])
+    assert capsys.readouterr().out.strip() == __version__
+
+
+def test_search_args(tmpdir, capsys):
+    assert "-r/--regex" in _cli_error(["search", tmpdir.strpath], capsys)
+    err = _cli_error(["search", tmpdir.strpath, "-r", "("], capsys)
+    assert "not a valid regular expression" in err
+
+
+@pytest.mark.parametrize("command", ["show", "crash"])
+def test_missing_path(tmpdir, capsys, command):
+    missing = tmpdir.join("missing.pklz").strpath
+    assert "does not exist" in _cli_error([command, missing], capsys)
+
+
+def test_path_types(tmpdir):
+    fname = tmpdir.ensure("file.txt")
+    assert ExistingDirPath(tmpdir.strpath) == tmpdir.realpath().strpath
+    assert ExistingFilePath(fname.strpath) == fname.realpath().strpath
+    with pytest.raises(ArgumentTypeError):
+        ExistingDirPath(fname.strpath)
+    with pytest.raises(ArgumentTypeError):
+        ExistingFilePath(tmpdir.strpath)
+    with pytest.raises(ArgumentTypeError):
+        UnexistingFilePath(tmpdir.strpath)
+    new = tmpdir.join("new.json").strpath
+    assert UnexistingFilePath(new) == new
+
+
+def test_run_list(capsys):
+    cli(["run", "nipype.interfaces.utility", "--list"])
+    out = capsys.readouterr().out
+    assert out.startswith("Available Interfaces:")
+    assert "    Rename" in out.splitlines()
+
+
+def test_run_forwards_arguments():
+    argv = ["run", "nipype.interfaces.utility", "Rename"]
+    argv += ["%(subject)s.nii", "in.nii", "--parse_string", "(?P<subject>\\w+)"]
+    with mock.patch("nipype.utils.nipype_cmd.run_instance") as run_instance:
+        cli(argv)
+    node, args = run_instance.call_args[0]
+    assert type(node).__name__ == "Rename"
+    assert args.format_string == "%(subject)s.nii"
+    assert args.in_file == "in.nii"
+    assert args.parse_string == "(?P<subject>\\w+)"
@@ -2,58 +2,63 @@
 Utilities for the CLI functions.
 """
 
+import os
 import re
-import click
 import json
+from argparse import ArgumentTypeError
 
 from .instance import import_module
-from ..interfaces.base import InputMultiPath, traits
-from ..interfaces.base.support import get_trait_desc
 
-# different context options
-CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
-UNKNOWN_OPTIONS = dict(allow_extra_args=True, ignore_unknown_options=True)
 
-# specification of existing ParamTypes
-ExistingDirPath = click.Path(exists=True, file_okay=False, resolve_path=True)
-ExistingFilePath = click.Path(exists=True, dir_okay=False, resolve_path=True)
-UnexistingFilePath = click.Path(dir_okay=False, resolve_path=True)
+# declare custom argument types
+class PathType:
+    """Validate a path argument and return its resolved form."""
 
+    def __init__(self, exists=False, file_okay=True, dir_okay=True):
+        self.exists = exists
+        self.file_okay = file_okay
+        self.dir_okay = dir_okay
 
-# validators
-def check_not_none(ctx, param, value):
-    if value is None:
-        raise click.BadParameter(f"got {value}.")
-    return value
+    def __call__(self, value):
+        path = os.path.realpath(value)
+        if not os.path.exists(path):
+            if self.exists:
+                raise ArgumentTypeError(f"path {value!r} does not exist.")
+            return path
+        if not self.file_okay and not os.path.isdir(path):
+            raise ArgumentTypeError(f"path {value!r} is a file.")
+        if not self.dir_okay and os.path.isdir(path):
+            raise ArgumentTypeError(f"path {value!r} is a directory.")
+        return path
 
 
-# declare custom click.ParamType
-class RegularExpression(click.ParamType):
-    name = "regex"
+# specification of existing path types
+ExistingDirPath = PathType(exists=True, file_okay=False)
+ExistingFilePath = PathType(exists=True, dir_okay=False)
+UnexistingFilePath = PathType(dir_okay=False)
 
-    def convert(self, value, param, ctx):
-        try:
-            rex = re.compile(value, re.IGNORECASE)
-        except ValueError:
-            self.fail("%s is not a valid regular expression." % value, param, ctx)
-        else:
-            return rex
 
+class RegularExpression:
+    def __call__(self, value):
+        try:
+            return re.compile(value, re.IGNORECASE)
+        except re.error:
+            raise ArgumentTypeError("%s is not a valid regular expression." % value)
 
-class PythonModule(click.ParamType):
-    name = "Python module path"
 
-    def convert(self, value, param, ctx):
+class PythonModule:
+    def __call__(self, value):
         try:
-            module = import_module(value)
-        except ValueError:
-            self.fail("%s is not a valid Python module." % value, param, ctx)
-        else:
-            return module
+            return import_module(value)
+        except ImportError:
+            raise ArgumentTypeError("%s is not a valid Python module." % value)
 
 
 def add_args_options(arg_parser, interface):
     """Add arguments to `arg_parser` to create a CLI for `interface`."""
+    from ..interfaces.base import InputMultiPath, traits
+    from ..interfaces.base.support import get_trait_desc
+
     inputs = interface.input_spec()
     for name, spec in sorted(interface.inputs.traits(transient=None).items()):
         desc = "\n".join(get_trait_desc(inputs, name, spec))[len(name) + 2 :]
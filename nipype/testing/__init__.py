@@ -15,7 +15,7 @@ anatfile = os.path.join(basedir, "data", "structural.nii")
 template = funcfile
 transfm = funcfile
 
-from .utils import package_check, TempFATFS
+from .utils import package_check, TempFATFS, assert_spec_metadata
 
 
 def example_data(infile="functional.nii"):
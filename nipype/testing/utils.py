@@ -93,3 +93,16 @@ def save_toy_nii(ndarray, filename):
     toy = nb.Nifti1Image(ndarray, np.eye(4))
     nb.nifti1.save(toy, filename)
     return filename
+
+
+def assert_spec_metadata(spec, spec_map):
+    """Check the trait metadata of ``spec`` against ``spec_map``.
+
+    Used by the ``test_auto_*.py`` files generated by ``tools/checkspecs.py``.
+    """
+    traits = spec.traits()
+    for key, metadata in spec_map.items():
+        trait = traits[key]
+        for metakey, value in metadata.items():
+            actual = getattr(trait, metakey)
+            assert actual == value, f"{key}.{metakey}: {actual!r} != {value!r}"
@@ -5,6 +5,7 @@ Created on 20 Apr 2010
 
 logging options : INFO, DEBUG
 hash_method : content, timestamp
+hash_algorithm : md5, sha256, or any other hashlib algorithm
 
 @author: Chris Filo Gorgolewski
 """
@@ -41,6 +42,7 @@ log_rotate = 4
 create_report = true
 crashdump_dir = {crashdump_dir}
 hash_method = timestamp
+hash_algorithm = md5
 job_finished_timeout = 5
 keep_inputs = false
 local_hash_check = true
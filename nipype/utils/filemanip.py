@@ -14,6 +14,7 @@ import os.path as op
 import re
 import shutil
 import contextlib
+from functools import lru_cache, partial
 import posixpath
 from pathlib import Path
 import simplejson as json
@@ -27,18 +28,24 @@ fmlogger = logging.getLogger("nipype.utils")
 
 related_filetype_sets = [(".hdr", ".img", ".mat"), (".nii", ".mat"), (".BRIK", ".HEAD")]
 
+_HASH_RE = re.compile(r"(_0x[a-z0-9]{32})")
+# Multi-dot extensions that ``split_filename`` must keep whole
+_SPECIAL_EXTENSIONS = (".nii.gz", ".tar.gz", ".niml.dset")
+_SPECIAL_EXTENSIONS_BYTES = tuple(ext.encode() for ext in _SPECIAL_EXTENSIONS)
+
 
 # Previously a patch, not worth deprecating
 path_resolve = Path.resolve
 
 
+@lru_cache(maxsize=4096)
 def split_filename(fname):
     """Split a filename into parts: path, base filename and extension.
 
     Parameters
     ----------
-    fname : str
-        file or path name
+    fname : str or bytes
+        file or path name; the returned parts have the same type
 
     Returns
     -------
@@ -64,21 +71,20 @@ def split_filename(fname):
 
     """
 
-    special_extensions = [".nii.gz", ".tar.gz", ".niml.dset"]
-
     pth = op.dirname(fname)
     fname = op.basename(fname)
 
-    ext = None
-    for special_ext in special_extensions:
-        ext_len = len(special_ext)
-        if (len(fname) > ext_len) and (fname[-ext_len:].lower() == special_ext.lower()):
-            ext = fname[-ext_len:]
-            fname = fname[:-ext_len]
-            break
-    if not ext:
-        fname, ext = op.splitext(fname)
-
+    special_extensions = (
+        _SPECIAL_EXTENSIONS_BYTES if isinstance(fname, bytes) else _SPECIAL_EXTENSIONS
+    )
+    lower = fname.lower()
+    if lower.endswith(special_extensions):
+        for special_ext in special_extensions:
+            ext_len = len(special_ext)
+            if len(fname) > ext_len and lower.endswith(special_ext):
+                return pth, fname[:-ext_len], fname[-ext_len:]
+
+    fname, ext = op.splitext(fname)
     return pth, fname, ext
 
 
@@ -126,6 +132,9 @@ def fname_presuffix(fname, prefix="", suffix="", newpath=None, use_ext=True):
 
 def fnames_presuffix(fnames, prefix="", suffix="", newpath=None, use_ext=True):
     """Calls fname_presuffix for a list of files."""
+    # Resolve a relative newpath against the cwd once for the whole list
+    if newpath:
+        newpath = op.abspath(newpath)
     return [
         fname_presuffix(fname, prefix, suffix, newpath, use_ext) for fname in fnames
     ]
@@ -145,17 +154,46 @@ def check_forhash(filename):
     if isinstance(filename, list):
         filename = filename[0]
     path, name = op.split(filename)
-    if re.search("(_0x[a-z0-9]{32})", name):
-        hashvalue = re.findall("(_0x[a-z0-9]{32})", name)
+    hashvalue = _HASH_RE.findall(name)
+    if hashvalue:
         return True, hashvalue
-    else:
-        return False, None
+    return False, None
+
+
+@lru_cache(maxsize=None)
+def _hasher_for(algorithm):
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Unknown hash algorithm: {algorithm}")
+    constructor = getattr(hashlib, algorithm, partial(hashlib.new, algorithm))
+    if not constructor().digest_size:
+        raise ValueError(f"Variable-length hash algorithm not supported: {algorithm}")
+    return constructor
 
 
-def hash_infile(afile, chunk_len=8192, crypto=hashlib.md5, raise_notfound=False):
+def get_file_hasher(algorithm=None):
+    """Return the hash constructor used to fingerprint files.
+
+    If ``algorithm`` is not given, the ``execution.hash_algorithm``
+    configuration option is read. MD5 remains the default so that existing
+    working directories keep their hashes; ``sha256`` is usually faster on
+    CPUs with SHA extensions. Resolve it once and pass it as ``crypto`` to
+    :func:`hash_infile` and :func:`hash_timestamp` when hashing many files.
+    """
+    if algorithm is None:
+        algorithm = config.get("execution", "hash_algorithm", "md5")
+    return _hasher_for(algorithm.lower())
+
+
+def hash_infile(afile, chunk_len=None, crypto=None, raise_notfound=False):
     """
     Computes hash of a file using 'crypto' module
 
+    If ``crypto`` is not given, the algorithm set by the
+    ``execution.hash_algorithm`` configuration option is used. If
+    ``chunk_len`` is given, the file is read in blocks of that many bytes.
+    Otherwise the read loop is delegated to :func:`hashlib.file_digest` on
+    Python 3.11+, and blocks of 1 MiB are read on older versions.
+
     >>> hash_infile('smri_ants_registration_settings.json')
     'f225785dfb0db9032aa5a0e4f2c730ad'
 
@@ -175,26 +213,41 @@ def hash_infile(afile, chunk_len=8192, crypto=hashlib.md5, raise_notfound=False)
             raise RuntimeError('File "%s" not found.' % afile)
         return None
 
-    crypto_obj = crypto()
+    if crypto is None:
+        crypto = get_file_hasher()
     with open(afile, "rb") as fp:
+        if chunk_len is None:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(fp, crypto).hexdigest()
+            chunk_len = 2**20
+
+        crypto_obj = crypto()
+        buf = bytearray(chunk_len)
+        view = memoryview(buf)
         while True:
-            data = fp.read(chunk_len)
-            if not data:
+            nbytes = fp.readinto(buf)
+            if not nbytes:
                 break
-            crypto_obj.update(data)
+            crypto_obj.update(view[:nbytes])
     return crypto_obj.hexdigest()
 
 
-def hash_timestamp(afile):
-    """Computes md5 hash of the timestamp of a file"""
-    md5hex = None
+def hash_timestamp(afile, crypto=None):
+    """Computes hash of the timestamp of a file
+
+    If ``crypto`` is not given, the algorithm set by the
+    ``execution.hash_algorithm`` configuration option is used (MD5 by
+    default).
+    """
+    hexdigest = None
     if op.isfile(afile):
-        md5obj = md5()
         stat = os.stat(afile)
-        md5obj.update(str(stat.st_size).encode())
-        md5obj.update(str(stat.st_mtime).encode())
-        md5hex = md5obj.hexdigest()
-    return md5hex
+        # Equivalent to updating with size and mtime separately
+        stamp = f"{stat.st_size}{stat.st_mtime}".encode()
+        if crypto is None:
+            crypto = get_file_hasher()
+        hexdigest = crypto(stamp).hexdigest()
+    return hexdigest
 
 
 def _parse_mount_table(exit_code, output):
@@ -276,6 +329,30 @@ def on_cifs(fname):
     return False
 
 
+def _copy_file_data(originalfile, newfile):
+    """Copy the contents of ``originalfile`` into a new file ``newfile``.
+
+    Where available (Linux), :func:`os.copy_file_range` is tried first: on
+    copy-on-write filesystems (e.g., Btrfs, XFS) it shares the data extents
+    (reflink) instead of duplicating them, and otherwise copies within the
+    kernel. Falls back to :func:`shutil.copyfile`.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(originalfile, "rb") as fsrc, open(newfile, "xb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(originalfile, newfile)
+
+
 def copyfile(
     originalfile,
     newfile,
@@ -368,11 +445,12 @@ def copyfile(
                 hashfn = hash_infile
             else:
                 raise AttributeError("Unknown hash method found:", hashmethod)
-            newhash = hashfn(newfile)
+            crypto = get_file_hasher()
+            newhash = hashfn(newfile, crypto=crypto)
             fmlogger.debug(
                 "File: %s already exists,%s, copy:%d", newfile, newhash, copy
             )
-            orighash = hashfn(originalfile)
+            orighash = hashfn(originalfile, crypto=crypto)
             keep = newhash == orighash
         if keep:
             fmlogger.debug(
@@ -408,7 +486,7 @@ def copyfile(
     if not keep:
         try:
             fmlogger.debug("Copying File: %s->%s", newfile, originalfile)
-            shutil.copyfile(originalfile, newfile)
+            _copy_file_data(originalfile, newfile)
         except shutil.Error as e:
             fmlogger.warning(str(e))
 
@@ -498,7 +576,9 @@ def ensure_list(filename):
         return [filename]
     elif isinstance(filename, list):
         return filename
-    elif is_container(filename):
+    elif filename is None:
+        return None
+    elif isinstance(filename, tuple) or is_container(filename):
         return list(filename)
     else:
         return None
@@ -13,6 +13,9 @@ from ...utils.filemanip import (
     fname_presuffix,
     fnames_presuffix,
     hash_rename,
+    hash_infile,
+    hash_timestamp,
+    get_file_hasher,
     check_forhash,
     _parse_mount_table,
     _cifs_table,
@@ -43,6 +46,10 @@ def _ignore_atime(stat):
         ("foo.nii", ("", "foo", ".nii")),
         ("foo.nii.gz", ("", "foo", ".nii.gz")),
         ("foo.niml.dset", ("", "foo", ".niml.dset")),
+        ("foo.NII.GZ", ("", "foo", ".NII.GZ")),
+        (".nii.gz", ("", ".nii", ".gz")),
+        (b"/a/foo.nii.gz", (b"/a", b"foo", b".nii.gz")),
+        (b"/a/foo.nii", (b"/a", b"foo", b".nii")),
         ("/usr/local/foo.nii.gz", ("/usr/local", "foo", ".nii.gz")),
         ("../usr/local/foo.nii", ("../usr/local", "foo", ".nii")),
         ("/usr/local/foo.a.b.c.d", ("/usr/local", "foo.a.b.c", ".d")),
@@ -69,6 +76,8 @@ def test_fnames_presuffix():
     fnames = ["foo.nii", "bar.nii"]
     pths = fnames_presuffix(fnames, "pre_", "_post", "/tmp")
     assert pths == ["/tmp/pre_foo_post.nii", "/tmp/pre_bar_post.nii"]
+    pths = fnames_presuffix(fnames, newpath="out")
+    assert pths == [os.path.abspath(os.path.join("out", f)) for f in fnames]
 
 
 @pytest.mark.parametrize(
@@ -95,6 +104,51 @@ def test_check_forhash():
     assert hash is None
 
 
+@pytest.mark.parametrize("algorithm", ["md5", "sha256"])
+def test_hash_algorithm(tmpdir, algorithm):
+    import hashlib
+    from ... import config
+
+    tmpdir.chdir()
+    Path("data.txt").write_bytes(b"nipype" * 1000)
+    with mock.patch.object(config, "get", return_value=algorithm):
+        content_hash = hash_infile("data.txt")
+        stamp_hash = hash_timestamp("data.txt")
+    expected = hashlib.new(algorithm, b"nipype" * 1000).hexdigest()
+    assert content_hash == expected
+    assert len(stamp_hash) == len(expected)
+
+
+def test_hash_infile_chunk_len(tmpdir):
+    import hashlib
+
+    tmpdir.chdir()
+    Path("data.txt").write_bytes(b"nipype" * 1000)
+    expected = hash_infile("data.txt")
+    with mock.patch.object(hashlib, "file_digest", create=True) as file_digest:
+        assert hash_infile("data.txt", chunk_len=7) == expected
+    file_digest.assert_not_called()
+
+
+@pytest.mark.parametrize("algorithm", ["shake_128", "nosuchhash"])
+def test_hash_algorithm_invalid(algorithm):
+    with pytest.raises(ValueError):
+        get_file_hasher(algorithm)
+
+
+def test_hash_timestamp_stable(tmpdir):
+    import hashlib
+
+    fname = tmpdir.join("data.txt")
+    fname.write("nipype")
+    stat = os.stat(fname.strpath)
+    # Must match the digest computed by earlier nipype versions
+    md5obj = hashlib.md5()
+    md5obj.update(str(stat.st_size).encode())
+    md5obj.update(str(stat.st_mtime).encode())
+    assert hash_timestamp(fname.strpath) == md5obj.hexdigest()
+
+
 @pytest.fixture()
 def _temp_analyze_files(tmpdir):
     """Generate temporary analyze file pair."""
@@ -136,6 +190,20 @@ def test_copyfile_true(_temp_analyze_files):
     assert os.path.exists(new_hdr)
 
 
+@pytest.mark.parametrize("fail_fastpath", [False, True])
+def test_copyfile_data(tmpdir, fail_fastpath):
+    orig = tmpdir.join("orig.nii")
+    orig.write_binary(os.urandom(3 * 2**20))
+    new = tmpdir.join("new.nii").strpath
+    if fail_fastpath:
+        with mock.patch("os.copy_file_range", side_effect=OSError, create=True):
+            copyfile(orig.strpath, new, copy=True)
+    else:
+        copyfile(orig.strpath, new, copy=True)
+    assert not os.path.islink(new)
+    assert Path(new).read_bytes() == orig.read_binary()
+
+
 def test_copyfiles(_temp_analyze_files, _temp_analyze_files_prime):
     orig_img1, orig_hdr1 = _temp_analyze_files
     orig_img2, orig_hdr2 = _temp_analyze_files_prime
@@ -286,6 +354,8 @@ def test_get_related_files_noninclusive(_temp_analyze_files):
         (["foo.nii"], ["foo.nii"]),
         (("foo", "bar"), ["foo", "bar"]),
         (12.34, None),
+        (None, None),
+        ({"foo.nii"}, ["foo.nii"]),
     ],
 )
 def test_ensure_list(filename, expected):
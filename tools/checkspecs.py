@@ -246,6 +246,9 @@ class InterfaceChecker:
                 cmd = [
                     "# AUTO-GENERATED by tools/checkspecs.py - DO NOT EDIT",
                     "from ..{} import {}".format(uri.split(".")[-1], c),
+                    "from {}testing import assert_spec_metadata".format(
+                        "." * len(uri.split("."))
+                    ),
                     "",
                 ]
                 cmd.append("\ndef test_%s_inputs():" % c)
@@ -263,13 +266,7 @@ class InterfaceChecker:
                         )
                     input_fields += "),\n    "
                 cmd += ["    input_map = dict(%s)" % input_fields]
-                cmd += ["    inputs = %s.input_spec()" % c]
-                cmd += [
-                    """
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value"""
-                ]
+                cmd += ["    assert_spec_metadata(%s.input_spec(), input_map)" % c]
 
                 fmt_cmd = black.format_str("\n".join(cmd), mode=black.FileMode())
                 with open(testfile, "w") as fp:
@@ -354,13 +351,7 @@ class InterfaceChecker:
                         )
                     input_fields += "),\n    "
                 cmd += ["    output_map = dict(%s)" % input_fields]
-                cmd += ["    outputs = %s.output_spec()" % c]
-                cmd += [
-                    """
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value"""
-                ]
+                cmd += ["    assert_spec_metadata(%s.output_spec(), output_map)" % c]
                 fmt_cmd = black.format_str("\n".join(cmd), mode=black.FileMode())
                 with open(testfile, "a") as fp:
                     fp.writelines("\n\n" + fmt_cmd)